@@ -22,6 +22,7 @@ import enum
 import six
 import re
 import sys
+from operator import attrgetter
 from textwrap import wrap
 import logging
 import pickle
@@ -727,6 +728,11 @@ def _picklable(field,obj):
 
 _picklable.known = {}
 
+# Cache of the __slots__ getter and setters (including inherited slots)
+# for each ConfigBase subclass (used by ConfigBase._derive())
+_class_slots = {}
+
+
 class ConfigBase(object):
     __slots__ = ('_parent', '_name', '_userSet', '_userAccessed', '_data',
                  '_default', '_domain', '_description', '_doc', '_visibility',
@@ -857,6 +863,47 @@ class ConfigBase(object):
             ans.set_value(value)
         return ans
 
+    def derive(self, value=NoArgument, preserve_implicit=False):
+        """Return a copy of this configuration object for a single use.
+
+        This is equivalent to calling the object (``self(value)``),
+        except that the stored values of the template are reused as the
+        defaults of the copy *without* passing them through their domains
+        again.  Only the entries provided in `value` are validated.  This
+        makes it suitable for deriving per-call configurations from a
+        solver's class-level ``CONFIG`` template.
+
+        Note that stored values are shared with (and not copied from)
+        the template.
+
+        """
+        ans = self._derive(preserve_implicit)
+        if value is not ConfigBase.NoArgument:
+            ans.set_value(value)
+        return ans
+
+    def _derive(self, preserve_implicit):
+        # Allocate a new instance and copy the (slot and dict)
+        # attributes without calling the constructor
+        cls = self.__class__
+        slots = _class_slots.get(cls, None)
+        if slots is None:
+            names = tuple(key for c in cls.__mro__
+                          for key in c.__dict__.get('__slots__', ()))
+            slots = _class_slots[cls] = (
+                attrgetter(*names),
+                tuple(getattr(cls, key).__set__ for key in names))
+        ans = cls.__new__(cls)
+        for setter, val in zip(slots[1], slots[0](self)):
+            setter(ans, val)
+        _dict = getattr(self, '__dict__', None)
+        if _dict:
+            ans.__dict__.update(_dict)
+        ans._parent = None
+        ans._userSet = False
+        ans._userAccessed = False
+        return ans
+
     def name(self, fully_qualified=False):
         # Special case for the top-level dict
         if self._name is None:
@@ -1261,6 +1308,14 @@ class ConfigValue(ConfigBase):
         self._data = self._cast(value)
         self._userSet = True
 
+    def _derive(self, preserve_implicit):
+        ans = super(ConfigValue, self)._derive(preserve_implicit)
+        # As with __call__(), the current value becomes the new default
+        ans._default = self._data
+        if isinstance(self._data, ConfigBase):
+            ans._data = self._data._derive(preserve_implicit)
+        return ans
+
     def _data_collector(self, level, prefix, visibility=None, docMode=False):
         if visibility is not None and visibility < self._visibility:
             return
@@ -1453,6 +1508,17 @@ class ConfigList(ConfigBase):
         for val in self.user_values():
             val._userSet = False
 
+    def _derive(self, preserve_implicit):
+        ans = super(ConfigList, self)._derive(preserve_implicit)
+        ans._default = self.value(False)
+        ans._data = []
+        for v in self._data:
+            _tmp = v._derive(preserve_implicit)
+            _tmp._parent = ans
+            _tmp._name = v._name
+            ans._data.append(_tmp)
+        return ans
+
     def append(self, value=ConfigBase.NoArgument):
         val = self._cast(value)
         if val is None:
@@ -1780,6 +1846,30 @@ class ConfigDict(ConfigBase):
         self._userSet = True
         return self
 
+    def _derive(self, preserve_implicit):
+        ans = super(ConfigDict, self)._derive(preserve_implicit)
+        ans._data = {}
+        ans._decl_order = []
+        ans._declared = set(self._declared)
+        for k in self._decl_order:
+            if preserve_implicit or k in self._declared:
+                v = self._data[k]
+                ans._data[k] = _tmp = v._derive(preserve_implicit)
+                ans._decl_order.append(k)
+                _tmp._parent = ans
+                _tmp._name = v._name
+        return ans
+
+    def snapshot(self):
+        """Return a read-only :py:class:`ConfigSnapshot` of the current values
+
+        The snapshot stores the values as plain instance attributes, so
+        (repeatedly) reading them does not go through
+        :py:meth:`__getattr__`.  This is intended for hot loops that
+        only need to read the configuration.
+        """
+        return ConfigSnapshot(self)
+
     def reset(self):
         # Reset the values in the order they were declared.  This
         # allows reset functions to have a deterministic ordering.
@@ -1810,6 +1900,99 @@ class ConfigDict(ConfigBase):
 # Backwards compatibility: ConfigDict was originally named ConfigBlock.
 ConfigBlock = ConfigDict
 
+
+def _snapshot_value(config):
+    if isinstance(config, ConfigDict):
+        return ConfigSnapshot(config)
+    elif isinstance(config, ConfigList):
+        return tuple(_snapshot_value(v) for v in config._data)
+    val = config.value(False)
+    if isinstance(val, ConfigBase):
+        return _snapshot_value(val)
+    return val
+
+
+class ConfigSnapshot(object):
+    """A frozen copy of the values stored in a :py:class:`ConfigDict`.
+
+    Values are stored as regular instance attributes (with spaces in
+    the key names replaced by underscores), nested ConfigDicts are
+    converted to nested snapshots and ConfigLists to tuples.  The
+    snapshot supports the read-only parts of the ConfigDict mapping
+    interface, and rejects any attempt to modify it.
+
+    Note that creating a snapshot does not mark the values of the source
+    ConfigDict as accessed.
+
+    Parameters
+    ----------
+    config: ConfigDict
+        The configuration to copy the values from
+
+    """
+
+    __slots__ = ('_decl_order', '__dict__')
+
+    def __init__(self, config):
+        object.__setattr__(self, '_decl_order', tuple(config._decl_order))
+        data = self.__dict__
+        for key in self._decl_order:
+            data[key.replace(' ', '_')] = _snapshot_value(config._data[key])
+
+    def __getstate__(self):
+        return (self._decl_order, self.__dict__)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_decl_order', state[0])
+        self.__dict__.update(state[1])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "cannot set '%s': ConfigSnapshot is read-only" % (name,))
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            "cannot delete '%s': ConfigSnapshot is read-only" % (name,))
+
+    def __getitem__(self, key):
+        return self.__dict__[str(key).replace(' ', '_')]
+
+    def get(self, key, default=None):
+        return self.__dict__.get(str(key).replace(' ', '_'), default)
+
+    def __contains__(self, key):
+        return str(key).replace(' ', '_') in self.__dict__
+
+    def __len__(self):
+        return len(self._decl_order)
+
+    def __iter__(self):
+        return iter(self._decl_order)
+
+    def keys(self):
+        return list(self._decl_order)
+
+    def values(self):
+        return [ConfigSnapshot.__getitem__(self, k) for k in self._decl_order]
+
+    def items(self):
+        return [(k, ConfigSnapshot.__getitem__(self, k))
+                for k in self._decl_order]
+
+    def value(self):
+        """Return the snapshot as a (nested) dict"""
+        def _value(val):
+            if isinstance(val, ConfigSnapshot):
+                return val.value()
+            elif type(val) is tuple:
+                return tuple(_value(v) for v in val)
+            return val
+        return dict((k, _value(ConfigSnapshot.__getitem__(self, k)))
+                    for k in self._decl_order)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.value())
+
 # In Python3, the items(), etc methods of dict-like things return
 # generator-like objects.
 if six.PY3:
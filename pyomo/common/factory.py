@@ -16,17 +16,30 @@
 #  ___________________________________________________________________________
 
 
+import importlib
+import logging
+
+logger = logging.getLogger('pyomo.common')
+
+
 class Factory(object):
     """
     A class that is used to define a factory for objects.
 
     Factory objects may be cached for future use.
+
+    Names may also be registered "lazily" (see :py:meth:`register_lazy`)
+    by declaring the module that implements (and registers) the object.
+    The module is only imported the first time the name is used.
     """
 
     def __init__(self, description=None):
         self._description = description
         self._cls = {}
         self._doc = {}
+        # name -> (module, doc) for names that have been declared, but
+        # whose implementing module has not been imported yet
+        self._lazy = {}
 
     def __call__(self, name, **kwds):
         if 'exception' in kwds:
@@ -35,6 +48,7 @@ class Factory(object):
         else:
             exception = False
         name = str(name)
+        self._import(name)
         if not name in self._cls:
             if not exception:
                 return None
@@ -44,27 +58,63 @@ class Factory(object):
         return self._cls[name](**kwds)
 
     def __iter__(self):
-        for name in self._cls:
+        # Note: iterating may import lazily registered modules, so
+        # take a snapshot of the names first
+        for name in list(self._cls) + list(self._lazy):
             yield name
 
     def __contains__(self, name):
-        return str(name) in self._cls
+        name = str(name)
+        return name in self._cls or name in self._lazy
 
     def get_class(self, name):
+        self._import(name)
         return self._cls[name]
 
     def doc(self, name):
+        if name in self._lazy:
+            return self._lazy[name][1]
         return self._doc[name]
 
     def unregister(self, name):
         name = str(name)
+        self._lazy.pop(name, None)
         if name in self._cls:
             del self._cls[name]
             del self._doc[name]
     
     def register(self, name, doc=None):
         def fn(cls):
+            self._lazy.pop(name, None)
             self._cls[name] = cls
             self._doc[name] = doc
             return cls
         return fn
+
+    def register_lazy(self, name, module, doc=None):
+        """Declare a name that is registered when a module is imported
+
+        The module is not imported until the name is first used (e.g.,
+        to create an object or retrieve the class).  Importing the
+        module is expected to register the name through
+        :py:meth:`register`.  Names that are already registered are
+        not affected.
+        """
+        if name not in self._cls:
+            self._lazy[name] = (module, doc)
+
+    def _import(self, name):
+        """Import the module implementing a lazily registered name"""
+        if name not in self._lazy:
+            return
+        module = self._lazy[name][0]
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            logger.warning(
+                "Failed to import '%s' while loading the %s '%s':\n\t%s"
+                % (module, self._description or 'factory object', name, e))
+        finally:
+            # If the module did not register the name, then forget
+            # about it (so that we do not try to import it again)
+            self._lazy.pop(name, None)
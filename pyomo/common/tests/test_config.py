@@ -27,6 +27,7 @@ import argparse
 import os
 import sys
 import os.path
+import pickle
 import re
 import pyutilib.th as unittest
 
@@ -41,7 +42,7 @@ from pyomo.common.config import (
     ConfigList, MarkImmutable,
     PositiveInt, NegativeInt, NonPositiveInt, NonNegativeInt,
     PositiveFloat, NegativeFloat, NonPositiveFloat, NonNegativeFloat,
-    In, Path, PathList, ConfigEnum
+    In, Path, PathList, ConfigEnum, ConfigSnapshot
 )
 
 
@@ -1867,6 +1868,87 @@ c: 1.0
         self.assertEqual(mod_copy._description, "new description")
         self.assertEqual(mod_copy._visibility, 0)
 
+    def test_derive(self):
+        calls = []
+        def domain(x):
+            calls.append(x)
+            return int(x)
+
+        config = ConfigDict(implicit=True)
+        config.declare('a', ConfigValue(1, domain))
+        config.declare('b', ConfigValue(2, domain))
+        config.declare('sub', ConfigDict(implicit=True))
+        config.sub.declare('c', ConfigValue(3, domain))
+        config.declare('l', ConfigList([4], domain))
+        config.b = 20
+        config.extra = 5
+        del calls[:]
+
+        copy = config.derive({'a': '10', 'sub': {'c': 30}})
+        # Only the overridden values were passed through the domain
+        self.assertEqual(calls, ['10', 30])
+        self.assertEqual(copy.value(), {
+            'a': 10, 'b': 20, 'sub': {'c': 30}, 'l': [4]})
+        self.assertEqual(config.value(), {
+            'a': 1, 'b': 20, 'sub': {'c': 3}, 'l': [4],
+            'extra': 5})
+        # The copy is independent of the template
+        self.assertIsNot(copy.get('sub'), config.get('sub'))
+        self.assertIs(copy.get('sub')._parent, copy)
+        self.assertIsNone(copy._parent)
+        # ... and matches the result of __call__()
+        self.assertEqual(copy.value(),
+                         config({'a': '10', 'sub': {'c': 30}}).value())
+        copy.l.append(6)
+        self.assertEqual(config.l.value(), [4])
+        self.assertEqual(list(copy.user_values()),
+                         [copy, copy.get('a'), copy.get('sub'),
+                          copy.sub.get('c'), copy.get('l'), copy.l.get(1)])
+        # The current values become the new defaults
+        copy.reset()
+        self.assertEqual(copy.value(), {
+            'a': 1, 'b': 20, 'sub': {'c': 3}, 'l': [4]})
+
+        copy = config.derive(preserve_implicit=True)
+        self.assertEqual(copy.extra, 5)
+        with self.assertRaisesRegex(ValueError, 'invalid value'):
+            config.derive({'a': 'x'})
+
+    def test_snapshot(self):
+        config = ConfigDict()
+        config.declare('a', ConfigValue(1, int))
+        config.declare('b c', ConfigValue(2, int))
+        config.declare('sub', ConfigDict())
+        config.sub.declare('d', ConfigValue('x', str))
+        config.declare('l', ConfigList([1, 2], int))
+
+        snap = config.snapshot()
+        self.assertIs(type(snap), ConfigSnapshot)
+        self.assertEqual(snap.a, 1)
+        self.assertEqual(snap.b_c, 2)
+        self.assertEqual(snap['b c'], 2)
+        self.assertEqual(snap.sub.d, 'x')
+        self.assertEqual(snap.l, (1, 2))
+        self.assertEqual(list(snap), ['a', 'b c', 'sub', 'l'])
+        self.assertIn('b c', snap)
+        self.assertEqual(len(snap), 4)
+        self.assertIsNone(snap.get('missing'))
+        self.assertEqual(snap.value(), {
+            'a': 1, 'b c': 2, 'sub': {'d': 'x'}, 'l': (1, 2)})
+        self.assertFalse(config.get('a')._userAccessed)
+
+        with self.assertRaisesRegex(AttributeError, 'read-only'):
+            snap.a = 5
+        with self.assertRaisesRegex(AttributeError, 'read-only'):
+            del snap.a
+        # Changes to the ConfigDict are not reflected in the snapshot
+        config.a = 5
+        self.assertEqual(snap.a, 1)
+
+        snap = pickle.loads(pickle.dumps(snap))
+        self.assertEqual(snap.value(), {
+            'a': 1, 'b c': 2, 'sub': {'d': 'x'}, 'l': (1, 2)})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+from six import StringIO
+
+from pyomo.common.factory import Factory
+from pyomo.common.log import LoggingIntercept
+
+
+class Foo(object):
+    pass
+
+
+class TestFactory(unittest.TestCase):
+
+    def test_register(self):
+        f = Factory('test object')
+        f.register('foo', doc='The foo')(Foo)
+        self.assertIn('foo', f)
+        self.assertIs(type(f('foo')), Foo)
+        self.assertIs(f.get_class('foo'), Foo)
+        self.assertEqual(f.doc('foo'), 'The foo')
+        self.assertIsNone(f('bar'))
+        with self.assertRaisesRegex(ValueError, "Unknown test object: 'bar'"):
+            f('bar', exception=True)
+        f.unregister('foo')
+        self.assertNotIn('foo', f)
+
+    def test_register_lazy(self):
+        f = Factory('test object')
+        f.register('foo')(Foo)
+        f.register_lazy('foo', 'pyomo.common.tests.dep_mod', 'ignored')
+        f.register_lazy('lazy', 'pyomo.common.tests.dep_mod', 'A lazy object')
+        self.assertEqual(list(f), ['foo', 'lazy'])
+        self.assertIn('lazy', f)
+        self.assertEqual(f.doc('lazy'), 'A lazy object')
+        self.assertIsNone(f.doc('foo'))
+
+        # Registering the name resolves the lazy entry
+        f.register('lazy', doc='registered')(Foo)
+        self.assertEqual(list(f), ['foo', 'lazy'])
+        self.assertEqual(f.doc('lazy'), 'registered')
+
+        f.unregister('lazy')
+        f.register_lazy('lazy', 'pyomo.common.tests.dep_mod')
+        f.unregister('lazy')
+        self.assertNotIn('lazy', f)
+
+    def test_lazy_module_does_not_register(self):
+        f = Factory('test object')
+        f.register_lazy('bar', 'pyomo.common.tests.dep_mod')
+        self.assertIn('bar', f)
+        # The module is imported, but does not register the name
+        self.assertIsNone(f('bar'))
+        self.assertNotIn('bar', f)
+
+    def test_lazy_module_import_error(self):
+        f = Factory('test object')
+        f.register_lazy('bar', 'pyomo.common.tests.bogus_nonexisting_module')
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.common'):
+            with self.assertRaises(KeyError):
+                f.get_class('bar')
+        self.assertIn("Failed to import "
+                      "'pyomo.common.tests.bogus_nonexisting_module' "
+                      "while loading the test object 'bar'", OUT.getvalue())
+        self.assertNotIn('bar', f)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,15 +10,20 @@
 
 import pyomo.common.unittest as unittest
 from pyutilib.misc.redirect_io import capture_output
+from pyutilib.services import TempfileManager
 
 from six import StringIO
+import json
 import sys
 import time
 
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.timing import (ConstructionTimer, report_timing,
-                                 TicTocTimer, HierarchicalTimer)
-from pyomo.environ import ConcreteModel, RangeSet, Var, TransformationFactory
+                                 TicTocTimer, HierarchicalTimer,
+                                 HierarchicalProfiler, start_stage,
+                                 stop_stage, record_counts)
+from pyomo.environ import (ConcreteModel, RangeSet, Var, Constraint,
+                           Objective, TransformationFactory)
 
 class TestTiming(unittest.TestCase):
     def test_raw_construction_timer(self):
@@ -206,3 +211,74 @@ all                    1     [0-9.]+ +[0-9.]+ +100.0
         self.assertEqual(100., timer.get_relative_percent_time('all'))
         self.assertTrue(100. > timer.get_relative_percent_time('all.a'))
         self.assertTrue(50. < timer.get_relative_percent_time('all.a'))
+
+    def test_HierarchicalProfiler_stages(self):
+        # Instrumentation is a no-op when no profiler is active
+        self.assertIsNone(start_stage('a'))
+        stop_stage(None, n=1)
+        record_counts(n=1)
+
+        with HierarchicalProfiler(memory=False) as profiler:
+            for i in range(3):
+                a = start_stage('a')
+                with profiler.stage('aa') as counts:
+                    counts['items'] = 2
+                    record_counts(items=1)
+                stop_stage(a, items=i)
+            # A stage left open is closed by its parent
+            b = start_stage('b')
+            start_stage('ba')
+            stop_stage(b)
+        self.assertIsNone(start_stage('a'))
+
+        report = profiler.report()
+        self.assertNotIn('memory', report)
+        self.assertEqual([s['name'] for s in report['stages']], ['a', 'b'])
+        a, b = report['stages']
+        self.assertEqual(a['calls'], 3)
+        self.assertEqual(a['counts'], {'items': 3})
+        self.assertEqual(len(a['stages']), 1)
+        self.assertEqual(a['stages'][0]['name'], 'aa')
+        self.assertEqual(a['stages'][0]['calls'], 3)
+        self.assertEqual(a['stages'][0]['counts'], {'items': 9})
+        self.assertEqual(b['stages'][0]['name'], 'ba')
+        self.assertGreaterEqual(report['time'], a['time'] + b['time'])
+        self.assertGreaterEqual(a['time'], a['stages'][0]['time'])
+        self.assertEqual(json.loads(profiler.to_json()), report)
+
+        self.assertRegex(str(profiler).splitlines()[2],
+                         r'^a +3 +[0-9.]+ +n/a +n/a +items=3$')
+        self.assertRegex(str(profiler).splitlines()[3],
+                         r'^  aa +3 +[0-9.]+ +n/a +n/a +items=9$')
+
+    def test_HierarchicalProfiler_model(self):
+        with HierarchicalProfiler() as profiler:
+            m = ConcreteModel()
+            m.x = Var([1, 2, 3])
+            m.c = Constraint([1, 2], rule=lambda m, i: m.x[i] <= m.x[i+1])
+            m.o = Objective(expr=m.x[1])
+            TransformationFactory('core.relax_integer_vars').apply_to(m)
+            m.write(TempfileManager.create_tempfile(suffix='.lp'))
+        TempfileManager.clear_tempfiles()
+
+        report = profiler.report()
+        stages = {s['name']: s for s in report['stages']}
+        self.assertEqual(stages['construct Var x']['counts'],
+                         {'components': 1, 'data_objects': 3})
+        self.assertEqual(stages['construct Constraint c']['counts'],
+                         {'components': 1, 'data_objects': 2})
+        self.assertIn('transformation RelaxIntegerVars (in-place)', stages)
+        self.assertEqual(stages['write cpxlp']['counts'],
+                         {'constraints': 2, 'symbols': 6})
+        c = stages['construct Constraint c']
+        self.assertGreater(c['memory'], 0)
+        self.assertGreaterEqual(c['peak_memory'], c['memory'])
+        self.assertGreaterEqual(report['peak_memory'], c['peak_memory'])
+
+        fname = TempfileManager.create_tempfile(suffix='.json')
+        try:
+            profiler.to_json(fname)
+            with open(fname) as FILE:
+                self.assertEqual(json.load(FILE), report)
+        finally:
+            TempfileManager.clear_tempfiles()
@@ -15,11 +15,25 @@
 #  the U.S. Government retains certain rights in this software.
 #  ___________________________________________________________________________
 
+import json
 import sys
 import logging
 import time
 import traceback
 
+import six
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+# tracemalloc.reset_peak() was added in Python 3.9
+_reset_peak = getattr(tracemalloc, 'reset_peak', None)
+
+# The stack of active HierarchicalProfiler objects
+_active_profilers = []
+
 _logger = logging.getLogger('pyomo.common.timing')
 _logger.propagate = False
 _logger.setLevel(logging.WARNING)
@@ -48,33 +62,50 @@ class ConstructionTimer(object):
     fmt = "%%6.%df seconds to construct %s %s; %d %s total"
     def __init__(self, obj):
         self.obj = obj
+        if _active_profilers:
+            self.stage = start_stage(
+                "construct %s %s" % (self._type(), self._name()))
+        else:
+            self.stage = None
         self.timer = TicTocTimer()
 
     def report(self):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the messge string
         self.timer = self.timer.toc(msg=None)
+        if self.stage is not None:
+            try:
+                n = len(self.obj)
+            except (TypeError, AttributeError, RuntimeError):
+                n = 1
+            stop_stage(self.stage, components=1, data_objects=n)
         _construction_logger.info(self)
 
-    def __str__(self):
-        total_time = self.timer
+    def _name(self):
         try:
-            idx = len(self.obj.index_set())
-        except AttributeError:
-            idx = 1
-        try:
-            name = self.obj.name
+            return self.obj.name
         except RuntimeError:
             try:
-                name = self.obj.local_name
+                return self.obj.local_name
             except RuntimeError:
-                name = '(unknown)'
+                return '(unknown)'
         except AttributeError:
-            name = '(unknown)'
+            return '(unknown)'
+
+    def _type(self):
         try:
-            _type = self.obj.ctype.__name__
+            return self.obj.ctype.__name__
         except AttributeError:
-            _type = type(self.obj).__name__
+            return type(self.obj).__name__
+
+    def __str__(self):
+        total_time = self.timer
+        try:
+            idx = len(self.obj.index_set())
+        except AttributeError:
+            idx = 1
+        name = self._name()
+        _type = self._type()
         try:
             return self.fmt % ( 2 if total_time>=0.005 else 0,
                                 _type,
@@ -100,12 +131,15 @@ class TransformationTimer(object):
             self.mode = ''
         else:
             self.mode = " (%s)" % (mode,)
+        self.stage = start_stage("transformation %s%s" % (
+            obj.__class__.__name__, self.mode))
         self.timer = TicTocTimer()
 
     def report(self):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the message string
         self.timer = self.timer.toc(msg=None)
+        stop_stage(self.stage)
         _transform_logger.info(self)
 
     def __str__(self):
@@ -648,3 +682,292 @@ class HierarchicalTimer(object):
             res.append(name)
             timer.get_timers(res, name)
         return res
+
+
+#
+# Hierarchical time / memory profiling of the model pipeline
+#
+def start_stage(name):
+    """Start a stage in the currently active HierarchicalProfiler
+
+    This is the (inexpensive) instrumentation hook used throughout
+    Pyomo.  If no profiler is active, this returns None.  Otherwise, it
+    returns a handle that must be passed to :func:`stop_stage`.
+    """
+    if not _active_profilers:
+        return None
+    return _active_profilers[-1].start(name)
+
+
+def stop_stage(stage, **counts):
+    """Stop a stage started with :func:`start_stage`
+
+    Any keyword arguments are added to the counts recorded for the
+    stage (e.g., ``constraints=100``).
+    """
+    if stage is not None:
+        stage.profiler.stop(stage, counts)
+
+
+def record_counts(**counts):
+    """Add counts to the current stage of the active profiler (if any)"""
+    if _active_profilers:
+        _active_profilers[-1].add_counts(counts)
+
+
+class _ProfilerNode(object):
+    """The accumulated data for one stage in the profile tree"""
+    __slots__ = ('name', 'calls', 'time', 'memory', 'peak_memory',
+                 'counts', 'stages')
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.time = 0.
+        self.memory = 0
+        self.peak_memory = 0
+        self.counts = {}
+        self.stages = {}
+
+    def child(self, name):
+        try:
+            return self.stages[name]
+        except KeyError:
+            ans = self.stages[name] = _ProfilerNode(name)
+            return ans
+
+    def to_dict(self, memory):
+        ans = {'name': self.name, 'calls': self.calls, 'time': self.time}
+        if memory:
+            ans['memory'] = self.memory
+            ans['peak_memory'] = self.peak_memory
+        ans['counts'] = dict(self.counts)
+        ans['stages'] = [s.to_dict(memory) for s in self.stages.values()]
+        return ans
+
+
+class _ActiveStage(object):
+    """A handle for a stage that is currently running"""
+    __slots__ = ('profiler', 'node', 'start_time', 'start_memory', 'peak')
+
+    def __init__(self, profiler, node, start_memory, peak):
+        self.profiler = profiler
+        self.node = node
+        self.start_memory = start_memory
+        self.peak = peak
+        self.start_time = default_timer()
+
+
+class HierarchicalProfiler(object):
+    """Record nested wall-clock time and memory for the model pipeline
+
+    While a profiler is active (used as a context manager), Pyomo
+    records a stage for each component construction, transformation,
+    problem write, and the presolve / solver execution / postsolve /
+    results loading steps of a solve.  Stages started while another
+    stage is running are recorded as its children, and stages with the
+    same name under the same parent are accumulated.  Stages carry
+    counts (e.g., the number of constraints processed).  User code may
+    add its own stages with :meth:`stage`.
+
+    If `memory` is True, memory is tracked with :py:mod:`tracemalloc`
+    (which is started, and stopped on exit, if it is not already
+    tracing).  For each stage, `memory` is the net change in traced
+    memory and `peak_memory` the peak traced memory above the value at
+    the start of the stage.  Note that tracemalloc slows down Python
+    significantly, so the times are only comparable between runs with
+    the same setting.  Before Python 3.9 (which added
+    tracemalloc.reset_peak()), `peak_memory` is a lower bound when the
+    peak for the stage did not exceed an earlier peak.
+
+    Examples
+    --------
+    >>> from pyomo.common.timing import HierarchicalProfiler
+    >>> from pyomo.environ import ConcreteModel, Var, Constraint
+    >>> with HierarchicalProfiler() as profiler:
+    ...     m = ConcreteModel()
+    ...     m.x = Var(range(10))
+    ...     m.c = Constraint(range(10), rule=lambda m, i: m.x[i] >= i)
+    ...     m.write('model.lp')
+    >>> report = profiler.report()
+    >>> profiler.to_json('profile.json')
+    """
+
+    def __init__(self, memory=True):
+        self.memory = memory and tracemalloc is not None
+        self.root = _ProfilerNode(None)
+        self._stack = []
+        self._start_time = None
+        self._stop_tracing = False
+
+    def __enter__(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._stop_tracing = True
+        self._start_time = default_timer()
+        _active_profilers.append(self)
+        return self
+
+    def __exit__(self, et, ev, tb):
+        if self._stack:
+            # Close any stages abandoned by an exception
+            self.stop(self._stack[0], {})
+        self.root.time += default_timer() - self._start_time
+        _active_profilers.remove(self)
+        if self._stop_tracing:
+            tracemalloc.stop()
+            self._stop_tracing = False
+
+    def start(self, name):
+        """Start a (possibly nested) stage and return its handle"""
+        if self._stack:
+            node = self._stack[-1].node.child(name)
+        else:
+            node = self.root.child(name)
+        node.calls += 1
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if _reset_peak is not None:
+                if self._stack:
+                    parent = self._stack[-1]
+                    parent.peak = max(parent.peak, peak)
+                _reset_peak()
+                peak = current
+            stage = _ActiveStage(self, node, current, peak)
+        else:
+            stage = _ActiveStage(self, node, 0, 0)
+        self._stack.append(stage)
+        return stage
+
+    def stop(self, stage, counts):
+        """Stop a stage (and any of its nested stages still running)"""
+        end_time = default_timer()
+        if stage not in self._stack:
+            # The stage was already closed when a parent stage was
+            # stopped (e.g., after an exception)
+            self._add_counts(stage.node, counts)
+            return
+        while self._stack:
+            _stage = self._stack.pop()
+            node = _stage.node
+            node.time += end_time - _stage.start_time
+            if self.memory:
+                current, peak = tracemalloc.get_traced_memory()
+                if _reset_peak is not None:
+                    peak = max(peak, _stage.peak)
+                    if self._stack:
+                        parent = self._stack[-1]
+                        parent.peak = max(parent.peak, peak)
+                elif peak <= _stage.peak:
+                    # The global peak was not exceeded in this stage
+                    peak = max(current, _stage.start_memory)
+                node.memory += current - _stage.start_memory
+                node.peak_memory = max(node.peak_memory,
+                                       peak - _stage.start_memory)
+            if _stage is stage:
+                break
+        self._add_counts(stage.node, counts)
+
+    def add_counts(self, counts):
+        """Add counts to the currently running stage"""
+        if self._stack:
+            self._add_counts(self._stack[-1].node, counts)
+        else:
+            self._add_counts(self.root, counts)
+
+    @staticmethod
+    def _add_counts(node, counts):
+        for key, val in counts.items():
+            node.counts[key] = node.counts.get(key, 0) + val
+
+    def stage(self, name):
+        """Return a context manager that records a stage with this profiler
+
+        The context manager yields the dict of counts for the stage,
+        which may be updated within the stage.
+        """
+        return _ProfilerStageContext(self, name)
+
+    def reset(self):
+        """Discard all recorded data"""
+        self.root = _ProfilerNode(None)
+        self._stack = []
+
+    def report(self):
+        """Return the recorded profile as a nested dict
+
+        The dict contains the total `time` (and `memory` / `peak_memory`,
+        if tracked), any `counts` recorded outside of a stage, and the
+        list of top-level `stages`.  Each stage is a dict with its
+        `name`, number of `calls`, `time`, memory, `counts`, and the
+        list of nested `stages`.
+        """
+        ans = self.root.to_dict(self.memory)
+        del ans['name']
+        del ans['calls']
+        if self.memory:
+            ans['memory'] = sum(s['memory'] for s in ans['stages'])
+            ans['peak_memory'] = max(
+                [s['peak_memory'] for s in ans['stages']] or [0])
+        return ans
+
+    def to_json(self, ostream=None, indent=2):
+        """Export the report as JSON
+
+        Args:
+            ostream: an open file-like object or a file name to write
+                the report to.  If None, the JSON string is returned.
+            indent (int): the JSON indentation level
+        """
+        ans = json.dumps(self.report(), indent=indent)
+        if ostream is None:
+            return ans
+        if isinstance(ostream, six.string_types):
+            with open(ostream, 'w') as FILE:
+                FILE.write(ans)
+        else:
+            ostream.write(ans)
+
+    def __str__(self):
+        rows = []
+
+        def _collect(node, indent):
+            for s in node.stages.values():
+                rows.append((' ' * indent + str(s.name), s))
+                _collect(s, indent + 2)
+
+        _collect(self.root, 0)
+        width = max([len(name) for name, s in rows] + [len('Stage')])
+        fmt = "%%-%ds %%8s %%10s %%12s %%12s  %%s" % (width,)
+        lines = [fmt % ('Stage', 'ncalls', 'time', 'memory', 'peak_memory',
+                        'counts')]
+        lines.append('-' * len(lines[0]))
+        for name, s in rows:
+            if self.memory:
+                mem = (s.memory, s.peak_memory)
+            else:
+                mem = ('n/a', 'n/a')
+            lines.append(fmt % (
+                name, s.calls, '%.3f' % s.time, mem[0], mem[1],
+                ', '.join('%s=%s' % (k, v)
+                          for k, v in sorted(s.counts.items()))))
+        lines.append('=' * len(lines[1]))
+        return '\n'.join(lines) + '\n'
+
+
+class _ProfilerStageContext(object):
+    __slots__ = ('profiler', 'name', 'counts', '_stage')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.counts = {}
+        self._stage = None
+
+    def __enter__(self):
+        self._stage = self.profiler.start(self.name)
+        return self.counts
+
+    def __exit__(self, et, ev, tb):
+        self.profiler.stop(self._stage, self.counts)
+
@@ -1234,7 +1234,7 @@ def _fbbt_con(con, config):
     ----------
     con: pyomo.core.base.constraint.Constraint
         constraint on which to perform fbbt
-    config: ConfigBlock
+    config: ConfigBlock or ConfigSnapshot
         see documentation for fbbt
 
     Returns
@@ -1311,7 +1311,7 @@ def _fbbt_block(m, config):
     Parameters
     ----------
     m: pyomo.core.base.block.Block or pyomo.core.base.PyomoModel.ConcreteModel
-    config: ConfigBlock
+    config: ConfigBlock or ConfigSnapshot
         See the docs for fbbt
 
     Returns
@@ -1388,6 +1388,22 @@ def _fbbt_block(m, config):
     return new_var_bounds
 
 
+# Template for the fbbt() options.  Each call derives its own
+# (read-only) configuration from this template, so only the passed
+# options are validated.
+_fbbt_config = ConfigBlock()
+_fbbt_config.declare('deactivate_satisfied_constraints', ConfigValue(
+    default=False, domain=In({True, False})))
+_fbbt_config.declare('integer_tol', ConfigValue(
+    default=1e-5, domain=NonNegativeFloat))
+_fbbt_config.declare('feasibility_tol', ConfigValue(
+    default=1e-8, domain=NonNegativeFloat))
+_fbbt_config.declare('max_iter', ConfigValue(
+    default=10, domain=NonNegativeInt))
+_fbbt_config.declare('improvement_tol', ConfigValue(
+    default=1e-4, domain=NonNegativeFloat))
+
+
 def fbbt(comp, deactivate_satisfied_constraints=False, integer_tol=1e-5, feasibility_tol=1e-8, max_iter=10,
          improvement_tol=1e-4):
     """
@@ -1431,17 +1447,13 @@ def fbbt(comp, deactivate_satisfied_constraints=False, integer_tol=1e-5, feasibi
         A ComponentMap mapping from variables a tuple containing the lower and upper bounds, respectively, computed
         from FBBT.
     """
-    config = ConfigBlock()
-    dsc_config = ConfigValue(default=deactivate_satisfied_constraints, domain=In({True, False}))
-    integer_tol_config = ConfigValue(default=integer_tol, domain=NonNegativeFloat)
-    ft_config = ConfigValue(default=feasibility_tol, domain=NonNegativeFloat)
-    mi_config = ConfigValue(default=max_iter, domain=NonNegativeInt)
-    improvement_tol_config = ConfigValue(default=improvement_tol, domain=NonNegativeFloat)
-    config.declare('deactivate_satisfied_constraints', dsc_config)
-    config.declare('integer_tol', integer_tol_config)
-    config.declare('feasibility_tol', ft_config)
-    config.declare('max_iter', mi_config)
-    config.declare('improvement_tol', improvement_tol_config)
+    config = _fbbt_config.derive({
+        'deactivate_satisfied_constraints': deactivate_satisfied_constraints,
+        'integer_tol': integer_tol,
+        'feasibility_tol': feasibility_tol,
+        'max_iter': max_iter,
+        'improvement_tol': improvement_tol,
+    }).snapshot()
 
     new_var_bounds = ComponentMap()
     if comp.ctype == Constraint:
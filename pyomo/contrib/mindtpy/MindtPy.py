@@ -87,7 +87,7 @@ class MindtPySolver(object):
         Args:
             model (Block): a Pyomo model or block to be solved
         """
-        config = self.CONFIG(kwds.pop('options', {}))
+        config = self.CONFIG.derive(kwds.pop('options', {}))
         config.set_value(kwds)
 
         # configuration confirmation
@@ -93,6 +93,7 @@ from pyomo.core.base.objective import (simple_objective_rule,
 from pyomo.core.base.connector import Connector
 from pyomo.core.base.sos import SOSConstraint
 from pyomo.core.base.piecewise import Piecewise
+from pyomo.core.base.matrix_constraint import MatrixConstraint
 from pyomo.core.base.suffix import (active_export_suffix_generator,
                                     active_import_suffix_generator,
                                     Suffix)
@@ -28,10 +28,10 @@ from pyutilib.misc.indent_io import StreamIndenter
 
 from pyomo.common.collections import ComponentMap, Mapping
 from pyomo.common.deprecation import deprecated, deprecation_warning
-from pyomo.common.timing import ConstructionTimer
+from pyomo.common.timing import ConstructionTimer, start_stage, stop_stage
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import (
-    Component, ActiveComponentData,
+    Component, ActiveComponentData, ModelStructure,
 )
 from pyomo.core.base.componentuid import ComponentUID
 from pyomo.core.base.set import GlobalSetBase, _SetDataBase
@@ -967,6 +967,8 @@ component, use the block del_component() and add_component() methods.
                 "Cannot assign the top-level block as a subblock of one of "
                 "its children (%s): creates a circular hierarchy"
                 % (self,))
+        if isinstance(val, Block):
+            ModelStructure.reparented(val)
         #
         # Set the name and parent pointer of this component.
         #
@@ -989,6 +991,7 @@ component, use the block del_component() and add_component() methods.
         _new_idx = len(self._decl_order)
         self._decl[name] = _new_idx
         self._decl_order.append((val, None))
+        ModelStructure.changed(self)
         #
         # Add the component as an attribute.  Note that
         #
@@ -1092,6 +1095,8 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                     str(val.name), str(data).strip(),
                     type(err).__name__, err)
                 raise
+            # Construction populates the component data
+            ModelStructure.changed(self)
             if __debug__ and logger.isEnabledFor(logging.DEBUG):
                 if _blockName[-1] == "'":
                     _blockName = _blockName[:-1] + '.' + val.name + "'"
@@ -1129,7 +1134,10 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             del self._ctypes[obj.ctype]
 
         # Clear the _parent attribute
+        ModelStructure.changed(self)
         obj._parent = None
+        if isinstance(obj, Block):
+            ModelStructure.reparented(obj)
 
         # Now that this component is not in the _decl map, we can call
         # delattr as usual.
@@ -1795,10 +1803,12 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
 
         if solver_capability is None:
             def solver_capability(x): return True
+        stage = start_stage("write %s" % (format,))
         (filename, smap) = problem_writer(self,
                                           filename,
                                           solver_capability,
                                           io_options)
+        stop_stage(stage, symbols=len(smap.bySymbol))
         smap_id = id(smap)
         if not hasattr(self, 'solutions'):
             # This is a bit of a hack.  The write() method was moved
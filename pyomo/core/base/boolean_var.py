@@ -8,7 +8,7 @@ from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr.boolean_value import BooleanValue
 from pyomo.core.expr.numvalue import value
 from pyomo.core.base.plugin import ModelComponentFactory
-from pyomo.core.base.component import ComponentData
+from pyomo.core.base.component import ComponentData, ModelStructure
 from pyomo.core.base.indexed_component import IndexedComponent, UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule
 from pyomo.core.base.set import Set, BooleanSet
@@ -382,10 +382,12 @@ class BooleanVar(IndexedComponent):
         """
         obj = self._getitem_when_not_present(index)
         try:
-            return obj.set_value(value)
+            ans = obj.set_value(value)
         except:
             del self._data[index]
             raise
+        ModelStructure.changed(self)
+        return ans
 
     def _initialize_members(self, init_set):
         """Initialize variable data for all indices in a set."""
@@ -13,8 +13,8 @@ import six
 import sys
 from copy import deepcopy
 from pickle import PickleError
-from six import iteritems, string_types
-from weakref import ref as weakref_ref
+from six import iteritems, itervalues, string_types
+from weakref import ref as weakref_ref, WeakKeyDictionary
 
 from pyutilib.misc.indent_io import StreamIndenter
 
@@ -78,6 +78,103 @@ def cname(*args, **kwds):
 class CloneError(pyomo.common.errors.PyomoException):
     pass
 
+
+class ModelStructure(object):
+    """
+    This class holds the structure version of a single model (top-level
+    block).  The version is incremented every time a component is added
+    to, removed from, or constructed in a block in the model, renamed,
+    or a data object is added to or deleted from an indexed component.
+    Caches that are derived from the model hierarchy (e.g., the
+    ComponentUID index, the fully qualified name cache and compiled
+    Reference slices) record the version of their model when they are
+    populated and are discarded when it changes.
+
+    ModelStructure objects are created on demand (see :py:meth:`get`):
+    changes to models that nothing has asked about are not recorded.
+    """
+    __slots__ = ('version', '_name_buffer', '_name_buffer_version',
+                 '__weakref__')
+
+    # model -> ModelStructure.  Weak keys so that the structures do not
+    # keep models alive.
+    _structures = WeakKeyDictionary()
+
+    def __init__(self):
+        self.version = 0
+        self._name_buffer = None
+        self._name_buffer_version = None
+
+    @staticmethod
+    def get(model):
+        """Return the ModelStructure for a model
+
+        Returns None if `model` is None.
+        """
+        if model is None:
+            return None
+        try:
+            return ModelStructure._structures[model]
+        except KeyError:
+            ans = ModelStructure._structures[model] = ModelStructure()
+            return ans
+
+    @staticmethod
+    def changed(component):
+        """Record a change to the model that contains `component`"""
+        if not ModelStructure._structures:
+            return
+        try:
+            model = component.model()
+        except AttributeError:
+            # Derived blocks (e.g., Disjunct) may add components before
+            # the Component base class is initialized (in which case
+            # the block is not yet attached to anything)
+            return
+        if model is None:
+            return
+        ans = ModelStructure._structures.get(model, None)
+        if ans is not None:
+            ans.version += 1
+
+    @staticmethod
+    def reparented(component):
+        """Record that a (block) component was attached to or detached
+        from a parent block
+
+        Block data that are not attached to a parent block are the
+        models of their own hierarchies, so changing the parent of a
+        block changes the model of every one of its data objects.
+        """
+        if not ModelStructure._structures:
+            return
+        if component.is_indexed():
+            _iter = itervalues(component._data)
+        else:
+            _iter = (component,)
+        for data in _iter:
+            ans = ModelStructure._structures.get(data, None)
+            if ans is not None:
+                ans.version += 1
+
+    @staticmethod
+    def name_buffer(model):
+        """Return the shared fully qualified name buffer for a model
+
+        The buffer is a ``name_buffer`` dict (as accepted by
+        :py:meth:`getname`) that is shared by all callers requesting
+        fully qualified names for components in `model`.  Returns None
+        if `model` is None.
+        """
+        structure = ModelStructure.get(model)
+        if structure is None:
+            return None
+        if structure._name_buffer_version != structure.version:
+            structure._name_buffer = {}
+            structure._name_buffer_version = structure.version
+        return structure._name_buffer
+
+
 class _ComponentBase(PyomoObject):
     """A base class for Component and ComponentData
 
@@ -490,6 +587,7 @@ class Component(_ComponentBase):
         """Re-construct model expressions"""
         self._constructed = False
         self.construct(data=data)
+        ModelStructure.changed(self)
 
     def valid_model_component(self):
         """Return True if this can be used as a model component."""
@@ -565,7 +663,17 @@ class Component(_ComponentBase):
 
         relative_to: Block
             Generate fully_qualified names reletive to the specified block.
+
+        Fully qualified names relative to the model are cached in a
+        model-wide buffer (see :py:meth:`ModelStructure.name_buffer`)
+        when no ``name_buffer`` is provided.
         """
+        if fully_qualified and name_buffer is None and relative_to is None:
+            name_buffer = ModelStructure.name_buffer(self.model())
+            if name_buffer is not None:
+                ans = name_buffer.get(id(self), None)
+                if ans is not None:
+                    return ans
         if fully_qualified:
             pb = self.parent_block()
             if relative_to is None:
@@ -596,6 +704,7 @@ class Component(_ComponentBase):
     def name(self, val):
         if self.parent_block() is None:
             self._name = val
+            ModelStructure.reparented(self)
         else:
             raise ValueError(
                 "The .name attribute is not settable when the component "
@@ -867,6 +976,12 @@ class ComponentData(_ComponentBase):
     def getname(self, fully_qualified=False, name_buffer=None, relative_to=None):
         """Return a string with the component name and index"""
         #
+        # Fully qualified names relative to the model use the model-wide
+        # name buffer unless the caller provided their own
+        #
+        if fully_qualified and name_buffer is None and relative_to is None:
+            name_buffer = ModelStructure.name_buffer(self.model())
+        #
         # Using the buffer, which is a dictionary:  id -> string
         #
         if name_buffer is not None and id(self) in name_buffer:
@@ -11,6 +11,7 @@
 import bisect
 import codecs
 import re
+import weakref
 import ply.lex
 
 from six import PY2, string_types, iteritems
@@ -18,6 +19,7 @@ from six import PY2, string_types, iteritems
 from pyomo.common.collections import ComponentMap
 from pyomo.common.dependencies import pickle
 from pyomo.common.deprecation import deprecated
+from pyomo.core.base.component import _ComponentBase, ModelStructure
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
 from pyomo.core.base.reference import Reference
 
@@ -440,8 +442,11 @@ class ComponentUID(object):
         a wildcard in the last component, then returns that component.  If
         there are wildcards elsewhere (or the last component was a partial
         slice), then returns a reference.  See also list_components below.
+
+        Lookups of fully specified CUIDs (no wildcards) are cached in the
+        :py:class:`ComponentUIDIndex` for `block`.
         """
-        obj = self._resolve_cuid(block)
+        obj = ComponentUIDIndex.get(block).find_component(self, block)
         if isinstance(obj, IndexedComponent_slice):
             # Suppress slice iteration exceptions
             obj.key_errors_generate_exceptions = False
@@ -504,6 +509,80 @@ class ComponentUID(object):
         return i+1 == len(self._cids)
 
 
+class ComponentUIDIndex(object):
+    """A cache of ComponentUID lookups for a single block
+
+    The index maps fully specified CUIDs to the components they resolve
+    to.  Entries are computed lazily, the first time a CUID is resolved,
+    so the cost of a repeated :py:meth:`ComponentUID.find_component_on`
+    call is a single dict lookup.  The index is shared by all lookups on
+    the same block (see :py:meth:`get`).
+
+    The index is discarded whenever the structure of the model that
+    contains the block changes (see :py:class:`ModelStructure`):
+    changes to other models do not affect it.
+    """
+
+    # block -> ComponentUIDIndex.  Weak keys so that the cache does not
+    # keep models alive.
+    _indices = weakref.WeakKeyDictionary()
+
+    __slots__ = ('_structure', '_version', '_components')
+
+    def __init__(self):
+        self._structure = None
+        self._version = None
+        self.clear()
+
+    @staticmethod
+    def get(block):
+        """Return the (shared) ComponentUIDIndex for the specified block"""
+        try:
+            return ComponentUIDIndex._indices[block]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable / non-weakref-able blocks get a private index
+            return ComponentUIDIndex()
+        ans = ComponentUIDIndex._indices[block] = ComponentUIDIndex()
+        return ans
+
+    def clear(self):
+        """Discard all cached components"""
+        self._components = {}
+
+    def _check_version(self, block):
+        # The block may have moved to a different model since the index
+        # was populated (which changed the structure of its old model).
+        # Blocks that are not part of a model (e.g., unattached indexed
+        # blocks) are never cached.
+        structure = self._structure
+        if structure is None or self._version != structure.version:
+            self.clear()
+            structure = self._structure = ModelStructure.get(block.model())
+            if structure is not None:
+                self._version = structure.version
+
+    def find_component(self, cuid, block):
+        """Resolve a ComponentUID on `block`, using the cache if possible"""
+        self._check_version(block)
+        try:
+            return self._components[cuid._cids]
+        except KeyError:
+            cacheable = True
+        except TypeError:
+            # unhashable indices (slices) cannot be cached
+            cacheable = False
+        obj = cuid._resolve_cuid(block)
+        # Resolving the CUID may implicitly create data (e.g., Var)
+        self._check_version(block)
+        # Only cache actual components (not slices or the raw values
+        # returned by immutable Params)
+        if cacheable and isinstance(obj, _ComponentBase):
+            self._components[cuid._cids] = obj
+        return obj
+
+
 def _int_or_float(n):
     _num = float(n)
     try:
@@ -15,7 +15,9 @@ import logging
 from pyomo.core.expr.expr_errors import TemplateExpressionError
 from pyomo.core.expr.numvalue import native_types
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
-from pyomo.core.base.component import Component, ActiveComponent
+from pyomo.core.base.component import (
+    Component, ActiveComponent, ModelStructure,
+)
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.global_set import UnindexedComponent_set
 from pyomo.common import DeveloperError
@@ -129,7 +131,10 @@ def _get_indexed_component_data_name(component, index):
             component._data[index] = component._ComponentDataClass(
                 component=component)
         try:
-            ans = component._data[index].name
+            # Use a private name buffer so that the temporary object is
+            # not recorded in the model's name cache
+            ans = component._data[index].getname(
+                fully_qualified=True, name_buffer={})
         except:
             ans = component.name + '[{unknown index}]'
         finally:
@@ -240,11 +245,13 @@ class IndexedComponent(Component):
         for idx in self._index:
             if idx not in self._data:
                 self._getitem_when_not_present(idx)
+        ModelStructure.changed(self)
 
     def clear(self):
         """Clear the data in this component"""
         if self.is_indexed():
             self._data = {}
+            ModelStructure.changed(self)
         else:
             raise DeveloperError(
                 "Derived scalar component %s failed to define clear()."
@@ -413,7 +420,10 @@ You can silence this warning by one of three ways:
             # the default value
             #
             if obj is _NotFound:
-                return self._getitem_when_not_present(index)
+                obj = self._getitem_when_not_present(index)
+                if index in self._data:
+                    # The (derived class) default created the data
+                    ModelStructure.changed(self)
 
         return obj
 
@@ -501,6 +511,7 @@ You can silence this warning by one of three ways:
                 # Remove reference to this object
                 self._data[index]._component = None
             del self._data[index]
+            ModelStructure.changed(self)
 
     def _not_constructed_error(self, idx):
         # Generate an error because the component is not constructed
@@ -770,6 +781,7 @@ value() function.""" % ( self.name, i ))
         except:
             del self._data[index]
             raise
+        ModelStructure.changed(self)
         return obj
 
     def set_value(self, value):
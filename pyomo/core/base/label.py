@@ -20,6 +20,7 @@ else:
     import string
     _translate = string.translate
 
+from pyomo.core.base.component import ModelStructure
 from pyomo.core.base.componentuid import ComponentUID
 
 # This module provides some basic functionality for generating labels
@@ -121,36 +122,31 @@ class NumericLabeler(object):
 # (particularly PySP), and I don't know how much depends on the labels
 # actually being LP-compliant.
 #
+# Note: the following labelers rely on the model-wide fully qualified
+# name cache maintained by getname() (see ModelStructure.name_buffer),
+# so they do not need to keep their own name buffers.
+#
 class CNameLabeler(object):
-    def __init__(self):
-        self.name_buffer = {}
-
     def __call__(self, obj):
-        return obj.getname(True, self.name_buffer)
+        return obj.getname(True)
 
 class TextLabeler(object):
-    def __init__(self):
-        self.name_buffer = {}
-
     def __call__(self, obj):
-        return cpxlp_label_from_name(obj.getname(True, self.name_buffer))
+        return cpxlp_label_from_name(obj.getname(True))
 
     def remove_obj(self, obj):
-        self.name_buffer.pop(id(obj))
+        # Release the name cached for obj by its model
+        name_buffer = ModelStructure.name_buffer(obj.model())
+        if name_buffer is not None:
+            name_buffer.pop(id(obj), None)
 
 class AlphaNumericTextLabeler(object):
-    def __init__(self):
-        self.name_buffer = {}
-
     def __call__(self, obj):
-        return alphanum_label_from_name(obj.getname(True, self.name_buffer))
+        return alphanum_label_from_name(obj.getname(True))
 
 class NameLabeler(object):
-    def __init__(self):
-        self.name_buffer = {}
-
     def __call__(self, obj):
-        return obj.getname(True, self.name_buffer)
+        return obj.getname(True)
 
 class ShortNameLabeler(object):
     def __init__(self, limit, suffix, start=0, labeler=None,
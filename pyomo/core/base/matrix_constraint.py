@@ -11,12 +11,15 @@
 
 import logging
 import weakref
+from operator import itemgetter
 
+from pyomo.common.dependencies import (
+    numpy, numpy_available, scipy, scipy_available,
+)
 from pyomo.core.base.set_types import Any
 from pyomo.core.expr.numvalue import value
 from pyomo.core.expr.numeric_expr import LinearExpression
 from pyomo.core.base.plugin import ModelComponentFactory
-from pyomo.repn.standard_repn import StandardRepn
 from pyomo.core.base.constraint import (IndexedConstraint,
                                         _ConstraintData)
 from pyomo.common.gc_manager import PauseGC
@@ -32,6 +35,109 @@ else:
 
 logger = logging.getLogger('pyomo.core')
 
+_inf = float('inf')
+
+
+def _bound_array(bound, m, default):
+    """Convert a scalar or list of bounds to an array (None is +/-inf)"""
+    if bound is None:
+        return numpy.full(m, default)
+    if numpy.isscalar(bound):
+        return numpy.full(m, float(bound))
+    if isinstance(bound, numpy.ndarray):
+        bound = numpy.array(bound, dtype=float)
+    else:
+        bound = numpy.array([default if b is None else value(b)
+                             for b in bound], dtype=float)
+    if bound.shape != (m,):
+        raise ValueError(
+            "MatrixConstraint bound array has shape %s (expected (%s,))"
+            % (bound.shape, m))
+    return bound
+
+
+def _csr_arrays(A):
+    """Return the (data, indices, indptr) CSR arrays and shape of A"""
+    if hasattr(A, 'tocsr'):
+        # A scipy sparse matrix.  We copy the matrix so that later
+        # changes by the user are not reflected in the model.
+        A = scipy.sparse.csr_matrix(A, dtype=float, copy=True)
+        A.sum_duplicates()
+        return A.data, A.indices, A.indptr, A.shape
+    A = numpy.array(A, dtype=float)
+    if A.ndim != 2:
+        raise ValueError(
+            "MatrixConstraint requires a 2-dimensional matrix "
+            "(got %s dimensions)" % (A.ndim,))
+    rows, cols = numpy.nonzero(A)
+    indptr = numpy.zeros(A.shape[0] + 1, dtype=int)
+    numpy.cumsum(numpy.bincount(rows, minlength=A.shape[0]),
+                 out=indptr[1:])
+    return A[rows, cols], cols, indptr, A.shape
+
+
+class _MatrixCanonicalForms(object):
+    """The canonical forms of all rows of a MatrixConstraint.
+
+    The contribution of the fixed variables is computed for all rows at
+    once and the (remaining) coefficients are read directly from the
+    CSR arrays.  Indexing this object with a row index returns the
+    StandardRepn for that row.
+    """
+
+    __slots__ = ('_x', '_data', '_indices', '_indptr', '_constant',
+                 '_StandardRepn')
+
+    def __init__(self, comp):
+        from pyomo.repn.standard_repn import StandardRepn
+        self._StandardRepn = StandardRepn
+        x = comp._x
+        data = comp._A_data
+        indices = comp._A_indices
+        indptr = comp._A_indptr
+        constant = None
+        fixed = numpy.fromiter((v.fixed for v in x), dtype=bool,
+                               count=len(x))
+        if fixed.any():
+            m = len(indptr) - 1
+            fixed_values = numpy.fromiter(
+                (v.value if v.fixed else 0 for v in x), dtype=float,
+                count=len(x))
+            rows = numpy.repeat(numpy.arange(m), numpy.diff(indptr))
+            fixed_nz = fixed[indices]
+            constant = numpy.bincount(
+                rows[fixed_nz],
+                weights=data[fixed_nz] * fixed_values[indices[fixed_nz]],
+                minlength=m).tolist()
+            free_nz = ~fixed_nz
+            indices = indices[free_nz]
+            data = data[free_nz]
+            indptr = numpy.zeros(m + 1, dtype=int)
+            numpy.cumsum(numpy.bincount(rows[free_nz], minlength=m),
+                         out=indptr[1:])
+        self._x = x
+        self._data = data.tolist()
+        self._indices = indices.tolist()
+        self._indptr = indptr.tolist()
+        self._constant = constant
+
+    def __len__(self):
+        return len(self._indptr) - 1
+
+    def __getitem__(self, index):
+        start = self._indptr[index]
+        end = self._indptr[index+1]
+        repn = self._StandardRepn()
+        if end - start == 1:
+            repn.linear_vars = (self._x[self._indices[start]],)
+        elif end > start:
+            repn.linear_vars = itemgetter(
+                *self._indices[start:end])(self._x)
+        repn.linear_coefs = tuple(self._data[start:end])
+        if self._constant is not None:
+            repn.constant = self._constant[index]
+        return repn
+
 class _MatrixConstraintData(_ConstraintData):
     """
     This class defines the data for a single linear constraint
@@ -74,31 +180,26 @@ class _MatrixConstraintData(_ConstraintData):
     def canonical_form(self, compute_values=True):
         """Build a canonical representation of the body of
         this constraints"""
+        from pyomo.repn.standard_repn import StandardRepn
         comp = self.parent_component()
         index = self._index
-        data = comp._A_data
-        indices = comp._A_indices
-        indptr = comp._A_indptr
+        start = comp._A_indptr[index]
+        end = comp._A_indptr[index+1]
         x = comp._x
 
         variables = []
         coefficients = []
         constant = 0
-        for p in xrange(indptr[index],
-                        indptr[index+1]):
-            v = x[indices[p]]
-            c = data[p]
+        for i, c in zip(comp._A_indices[start:end].tolist(),
+                        comp._A_data[start:end].tolist()):
+            v = x[i]
             if not v.fixed:
                 variables.append(v)
-                if compute_values:
-                    coefficients.append(value(c))
-                else:
-                    coefficients.append(c)
+                coefficients.append(c)
+            elif compute_values:
+                constant += c * v.value
             else:
-                if compute_values:
-                    constant += value(c) * v.value
-                else:
-                    constant += c * v
+                constant += c * v
         repn = StandardRepn()
         repn.linear_vars = tuple(variables)
         repn.linear_coefs = tuple(coefficients)
@@ -140,15 +241,13 @@ class _MatrixConstraintData(_ConstraintData):
         """Compute the value of the body of this constraint."""
         comp = self.parent_component()
         index = self._index
-        data = comp._A_data
-        indices = comp._A_indices
-        indptr = comp._A_indptr
+        start = comp._A_indptr[index]
+        end = comp._A_indptr[index+1]
         x = comp._x
-        ptrs = xrange(indptr[index],
-                      indptr[index+1])
         try:
-            return sum(x[indices[p]].value * data[p]
-                       for p in ptrs)
+            return sum(x[i].value * c for i, c in zip(
+                comp._A_indices[start:end].tolist(),
+                comp._A_data[start:end].tolist()))
         except (ValueError, TypeError):
             if exception:
                 raise
@@ -227,15 +326,12 @@ class _MatrixConstraintData(_ConstraintData):
         """Access the body of a constraint expression."""
         comp = self.parent_component()
         index = self._index
-        data = comp._A_data
-        indices = comp._A_indices
-        indptr = comp._A_indptr
+        start = comp._A_indptr[index]
+        end = comp._A_indptr[index+1]
         x = comp._x
-        ptrs = xrange(indptr[index],
-                      indptr[index+1])
         return LinearExpression(
-            linear_vars=[x[indices[p]] for p in ptrs],
-            linear_coefs=[data[p] for p in ptrs],
+            linear_vars=[x[i] for i in comp._A_indices[start:end].tolist()],
+            linear_coefs=comp._A_data[start:end].tolist(),
             constant=0
         )
 
@@ -243,28 +339,27 @@ class _MatrixConstraintData(_ConstraintData):
     def lower(self):
         """Access the lower bound of a constraint
         expression."""
-        comp = self.parent_component()
-        index = self._index
-        return comp._lower[index]
+        lb = self.parent_component()._lower.item(self._index)
+        if lb == -_inf:
+            return None
+        return lb
 
     @property
     def upper(self):
         """Access the upper bound of a constraint
         expression."""
-        comp = self.parent_component()
-        index = self._index
-        return comp._upper[index]
+        ub = self.parent_component()._upper.item(self._index)
+        if ub == _inf:
+            return None
+        return ub
 
     @property
     def equality(self):
         """A boolean indicating whether this is an equality
         constraint."""
         comp = self.parent_component()
-        index = self._index
-        if (comp._lower[index] is None) or \
-           (comp._upper[index] is None):
-            return False
-        return comp._lower[index] == comp._upper[index]
+        lb = comp._lower.item(self._index)
+        return lb == comp._upper.item(self._index) and abs(lb) != _inf
 
     @property
     def strict_lower(self):
@@ -294,62 +389,94 @@ class MatrixConstraint(collections_Mapping,
 
        lb <= Ax <= ub
 
-    where A is specified in the standard compressed sparse
-    row (CSR) format. Variables must be provided as a list,
-    whose ordering maps the variables to their column index
-    in the associated coefficient matrix. This modeling
-    component allows for fast construction of large linear
-    constraint sets as it bypasses Pyomo's expression
-    system.
+    where A is a (scipy) sparse matrix or a dense 2-dimensional
+    array. Variables must be provided as a list, whose
+    ordering maps the variables to their column index in the
+    coefficient matrix. The bounds may be scalars or arrays,
+    where None or an infinite value indicates that the bound
+    is not present. This modeling component allows for fast
+    construction of large linear constraint sets as it
+    bypasses Pyomo's expression system: the rows are stored
+    in compressed sparse row (CSR) format and the model
+    writers and persistent solvers read the canonical form of
+    all rows in bulk.
+
+    For backwards compatibility, the CSR arrays may also be
+    passed explicitly, i.e., MatrixConstraint(A_data,
+    A_indices, A_indptr, lb, ub, x).
 
     Parameters
     ----------
-    A_data : list
-        The values of the CSR format sparse matrix
-    A_indices : list
-        The column indices of the CSR format sparse matrix
-    A_indptr : list
-        The row start-stop pointers of the CSR format sparse matrix
-    lb : list
-        The list of constraint lower bounds
-    ub : list
-        The list of constraint upper bounds
+    A : scipy.sparse matrix or 2-dimensional array
+        The constraint coefficient matrix
+    lb : scalar or list
+        The constraint lower bounds
+    ub : scalar or list
+        The constraint upper bounds
     x : list
         The list of pyomo variables mapped to their appropriate column
 
     Example
     -------
+    >>> import scipy.sparse
     >>> from pyomo.environ import *
-    >>> from pyomo.core.base.matrix_constraint import MatrixConstraint
     >>> model = ConcreteModel()
     >>>
     >>> # x_{i} <= x_{i+1}   (for i in {1,2})
     >>> model.v = Var(RangeSet(0,2))
-    >>> data    = [1.0, -1.0, 1.0, -1.0]
-    >>> indices = [  0,    1,   1,    2]
-    >>> indptr  = [0, 2, 4]
-    >>> lb      = [None, None]
-    >>> ub      = [ 0.0,  0.0]
-    >>> x       = [model.v[0], model.v[1], model.v[2]]
-    >>> model.c = MatrixConstraint(data, indices, indptr, lb, ub, x)
+    >>> A = scipy.sparse.csr_matrix([[1.0, -1.0, 0.0],
+    ...                              [0.0, 1.0, -1.0]])
+    >>> x = [model.v[0], model.v[1], model.v[2]]
+    >>> model.c = MatrixConstraint(A, lb=None, ub=0.0, x=x)
     """
 
-    def __init__(self, A_data, A_indices, A_indptr, lb, ub, x):
-
-        m = len(lb)
-        n = len(x)
-        nnz = len(A_data)
-        assert len(A_indices) == nnz
-        assert len(A_indptr) == m + 1
-        assert len(ub) == m
+    def __init__(self, *args, **kwds):
+        if not numpy_available:
+            raise ValueError("MatrixConstraint requires numpy")
+        if len(args) + len(kwds) > 4 or 'A_data' in kwds:
+            A_data, A_indices, A_indptr, lb, ub, x \
+                = self._csr_arguments(*args, **kwds)
+            m = len(A_indptr) - 1
+            n = len(x)
+            A_data = numpy.array(A_data, dtype=float)
+            A_indices = numpy.array(A_indices, dtype=int)
+            A_indptr = numpy.array(A_indptr, dtype=int)
+            if len(A_indices) != len(A_data) or A_indptr[-1] != len(A_data):
+                raise ValueError(
+                    "MatrixConstraint: inconsistent CSR arrays "
+                    "(len(A_data)=%s, len(A_indices)=%s, A_indptr[-1]=%s)"
+                    % (len(A_data), len(A_indices), A_indptr[-1]))
+        else:
+            A, lb, ub, x = self._matrix_arguments(*args, **kwds)
+            A_data, A_indices, A_indptr, (m, n) = _csr_arrays(A)
+        x = tuple(x)
+        if len(x) != n:
+            raise ValueError(
+                "MatrixConstraint: the matrix has %s columns, but %s "
+                "variables were provided" % (n, len(x)))
+        if len(A_indices) and A_indices.max() >= n:
+            raise ValueError(
+                "MatrixConstraint: column index %s is out of range for "
+                "%s variables" % (A_indices.max(), n))
         IndexedConstraint.__init__(self, Any)
 
         self._A_data = A_data
         self._A_indices = A_indices
         self._A_indptr = A_indptr
-        self._lower = lb
-        self._upper = ub
-        self._x = tuple(x)
+        self._lower = _bound_array(lb, m, -_inf)
+        self._upper = _bound_array(ub, m, _inf)
+        self._x = x
+
+    @staticmethod
+    def _csr_arguments(A_data, A_indices, A_indptr, lb, ub, x):
+        return A_data, A_indices, A_indptr, lb, ub, x
+
+    @staticmethod
+    def _matrix_arguments(A, lb=None, ub=None, x=None):
+        if x is None:
+            raise ValueError("MatrixConstraint requires the list of "
+                             "variables (x) for the matrix columns")
+        return A, lb, ub, x
 
     def construct(self, data=None):
         """Construct the expression(s) for this constraint."""
@@ -365,6 +492,47 @@ class MatrixConstraint(collections_Mapping,
             self._data = tuple(_MatrixConstraintData(i, ref)
                                for i in xrange(len(self._lower)))
 
+    @property
+    def A(self):
+        """The constraint matrix (as a scipy CSR matrix)"""
+        if not scipy_available:
+            raise ValueError("MatrixConstraint.A requires scipy")
+        return scipy.sparse.csr_matrix(
+            (self._A_data, self._A_indices, self._A_indptr),
+            shape=(len(self._A_indptr) - 1, len(self._x)))
+
+    @property
+    def lb(self):
+        """A read-only view of the array of constraint lower
+        bounds (-inf indicates no lower bound)"""
+        ans = self._lower.view()
+        ans.setflags(write=False)
+        return ans
+
+    @property
+    def ub(self):
+        """A read-only view of the array of constraint upper
+        bounds (inf indicates no upper bound)"""
+        ans = self._upper.view()
+        ans.setflags(write=False)
+        return ans
+
+    @property
+    def x(self):
+        """The tuple of variables associated with the columns
+        of the constraint matrix"""
+        return self._x
+
+    def canonical_forms(self):
+        """Return the canonical forms of all rows of this constraint
+
+        This is the bulk equivalent of calling canonical_form() on
+        each row: the returned object is indexed by the row index and
+        returns the StandardRepn of that row.  The fixed variables
+        are folded into the row constants when this method is called.
+        """
+        return _MatrixCanonicalForms(self)
+
     #
     # Override some IndexedComponent methods
     #
@@ -15,15 +15,19 @@ import types
 import logging
 from weakref import ref as weakref_ref
 
+from pyomo.common.dependencies import numpy, pandas
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.modeling import NoArgumentGiven
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.plugin import ModelComponentFactory
-from pyomo.core.base.component import ComponentData
+from pyomo.core.base.component import ComponentData, ModelStructure
 from pyomo.core.base.indexed_component import IndexedComponent, \
     UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
-from pyomo.core.base.numvalue import NumericValue, native_types, value
+from pyomo.core.base.numvalue import (
+    NumericValue, native_types, native_integer_types, value,
+)
+from pyomo.core.base.set import _array_domain_mask, _pandas_index_mask
 from pyomo.core.base.set_types import Any, Reals
 
 from six import iteritems, iterkeys, next, itervalues
@@ -89,6 +93,134 @@ class _NotValid(object):
     pass
 
 
+class _DenseParamValues(object):
+    """An array-backed mapping that holds the values of an immutable Param.
+
+    Params that are initialized in bulk (from a NumPy array or a pandas
+    Series / DataFrame) keep their values in a single NumPy array
+    instead of expanding them into a dict of Python objects.  Values
+    are returned as native Python types.  Values that are subsequently
+    set (e.g., from the construction data) are written into the array
+    if they fit its dtype and are otherwise held in a (sparse) dict.
+    """
+
+    __slots__ = ('_keys', '_values', '_positions', '_removed', '_extra')
+
+    def __init__(self, keys, values):
+        self._keys = keys
+        self._values = values
+        # The key -> position map is only built when it is first needed
+        self._positions = None
+        self._removed = set()
+        self._extra = {}
+
+    def __getstate__(self):
+        """
+        This method must be defined because this class uses slots.
+        """
+        return {'_keys': self._keys,
+                '_values': self._values,
+                '_removed': self._removed,
+                '_extra': self._extra}
+
+    def __setstate__(self, state):
+        for key, val in iteritems(state):
+            setattr(self, key, val)
+        self._positions = None
+
+    def _position(self, key):
+        if self._positions is None:
+            self._positions = {k: i for i, k in enumerate(self._keys)}
+        return self._positions.get(key)
+
+    def _accepts(self, value):
+        kind = self._values.dtype.kind
+        if kind == 'O':
+            return True
+        elif kind == 'f':
+            return type(value) is float
+        elif kind in 'iu':
+            return type(value) in native_integer_types \
+                and type(value) is not bool
+        elif kind == 'b':
+            return type(value) is bool
+        return False
+
+    def get(self, key, default=None):
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        pos = self._position(key)
+        if pos is None or pos in self._removed:
+            return default
+        return self._values.item(pos)
+
+    def __getitem__(self, key):
+        ans = self.get(key, _NotValid)
+        if ans is _NotValid:
+            raise KeyError(key)
+        return ans
+
+    def __setitem__(self, key, value):
+        pos = self._position(key)
+        if pos is not None:
+            if self._accepts(value):
+                try:
+                    self._values[pos] = value
+                except OverflowError:
+                    pass
+                else:
+                    self._removed.discard(pos)
+                    self._extra.pop(key, None)
+                    return
+            self._removed.add(pos)
+        self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._extra:
+            del self._extra[key]
+            return
+        pos = self._position(key)
+        if pos is None or pos in self._removed:
+            raise KeyError(key)
+        self._removed.add(pos)
+
+    def __contains__(self, key):
+        if key in self._extra:
+            return True
+        pos = self._position(key)
+        return pos is not None and pos not in self._removed
+
+    def __len__(self):
+        return len(self._keys) - len(self._removed) + len(self._extra)
+
+    def __iter__(self):
+        if self._removed:
+            _removed = self._removed
+            for i, key in enumerate(self._keys):
+                if i not in _removed:
+                    yield key
+        else:
+            for key in self._keys:
+                yield key
+        for key in self._extra:
+            yield key
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        for key, val in self.items():
+            yield val
+
+    def items(self):
+        _removed = self._removed
+        for i, (key, val) in enumerate(zip(self._keys, self._values.tolist())):
+            if i not in _removed:
+                yield key, val
+        for item in iteritems(self._extra):
+            yield item
+
+
 class _ParamData(ComponentData, NumericValue):
     """
     This class defines the data for a mutable parameter.
@@ -621,20 +753,22 @@ class Param(IndexedComponent):
             if index is None and not self.is_indexed():
                 self._data[None] = self
                 self.set_value(value, index)
-                return self
+                ans = self
             elif self._mutable:
                 obj = self._data[index] = _ParamData(self)
                 obj.set_value(value, index)
-                return obj
+                ans = obj
             else:
                 self._data[index] = value
                 # Because we do not have a _ParamData, we cannot rely on the
                 # validation that occurs in _ParamData.set_value()
                 self._validate_value(index, value, _check_domain)
-                return value
+                ans = value
         except:
             del self._data[index]
             raise
+        ModelStructure.changed(self)
+        return ans
 
 
     def _validate_value(self, index, value, validate_domain=True):
@@ -794,6 +928,19 @@ This has resulted in the conversion of the source to dense form.
             _init = tmp
             _isDict = True
 
+        elif _init_type.__module__.split('.', 1)[0] in ('numpy', 'pandas'):
+            #
+            # Bulk initialization from NumPy / pandas data.  Note that
+            # we test the module name so that other initializers never
+            # trigger the (deferred) import of numpy or pandas.
+            #
+            if getattr(_init, 'ndim', None) == 0:
+                # NumPy scalars (and 0-d arrays) are treated as constants
+                _init = _init.item()
+            else:
+                self._initialize_from_bulk_data(_init)
+                return
+
         #
         # If the _init is not a native dictionary, but it
         # behaves like one (that is, it could be converted to a
@@ -857,6 +1004,112 @@ This has resulted in the conversion of the source to dense form.
                 #
                 pass
 
+    def _initialize_from_bulk_data(self, data):
+        """
+        Initialize data from a NumPy array or a pandas Series / DataFrame
+
+        A NumPy array is aligned with the (ordered) index set: its
+        values are taken in C (row-major) order, so a multidimensional
+        array must have the shape of the product index set.  The index
+        of a pandas Series provides the keys (a MultiIndex provides
+        tuple keys).  A single-column DataFrame is treated as a Series,
+        otherwise the (row, column) pairs are the keys and missing (NaN)
+        entries are skipped.  The domain is checked for all values at
+        once.  Immutable Params store the values in an array-backed
+        mapping.
+        """
+        if not self.is_indexed():
+            raise ValueError(
+                "Cannot initialize scalar Param %s from a %s with %s "
+                "dimensions" % (self.name, type(data).__name__, data.ndim))
+        if isinstance(data, numpy.ndarray):
+            keys = self._get_array_keys(data)
+            values = data.flatten()
+        else:
+            if isinstance(data, pandas.DataFrame):
+                if len(data.columns) == 1:
+                    data = data.iloc[:, 0]
+                else:
+                    data = data.stack()
+            if not isinstance(data, pandas.Series):
+                raise TypeError(
+                    "Cannot initialize Param %s from a %s"
+                    % (self.name, type(data).__name__))
+            keys = self._get_pandas_keys(data.index)
+            values = data.to_numpy(copy=True)
+        #
+        # Check the domain of all values before storing anything
+        #
+        domain = self.domain
+        if domain is not Any and not (
+                domain.__class__ is _ImplicitAny
+                and values.dtype.kind in 'biuf'):
+            mask = _array_domain_mask(domain, values)
+            if mask is None:
+                mask = numpy.array(
+                    [val in domain for val in values.tolist()], dtype=bool)
+            if not mask.all():
+                i = int(numpy.argmin(mask))
+                self._validate_value(keys[i], values.item(i))
+        #
+        # Store the values.  Mutable Params need the _ParamData objects,
+        # but we can bypass the per-value set_value() checks.
+        #
+        if self._mutable:
+            _data = self._data
+            for key, val in zip(keys, values.tolist()):
+                obj = _data[key] = _ParamData(self)
+                obj._value = val
+        elif self._data:
+            self._data.update(zip(keys, values.tolist()))
+        else:
+            self._data = _DenseParamValues(keys, values)
+        #
+        # Validation rules may refer to other values of this Param, so
+        # they are applied after the values are stored.
+        #
+        if self._validate:
+            for key, val in zip(keys, values.tolist()):
+                self._validate_value(key, val, validate_domain=False)
+
+    def _get_array_keys(self, data):
+        """Return the index keys aligned with the values of a NumPy array"""
+        index = self._index
+        if not index.isordered():
+            raise ValueError(
+                "Cannot initialize Param %s from a NumPy array: the index "
+                "set %s is not ordered" % (self.name, index.name))
+        if data.ndim == 1:
+            shape = (len(index),)
+        else:
+            shape = tuple(len(s) for s in
+                          index.subsets(expand_all_set_operators=False))
+        if data.shape != shape:
+            raise ValueError(
+                "Cannot initialize Param %s from a NumPy array: the array "
+                "shape %s does not match the shape %s of the index set %s"
+                % (self.name, data.shape, shape, index.name))
+        return list(index)
+
+    def _get_pandas_keys(self, index):
+        """Return the Param keys of a pandas Index (or MultiIndex)"""
+        if index.has_duplicates:
+            raise ValueError(
+                "Cannot initialize Param %s from a pandas object with "
+                "duplicate index entries" % (self.name,))
+        keys = index.tolist()
+        mask = _pandas_index_mask(self._index, index)
+        if mask is None:
+            _index = self._index
+            invalid = [i for i, key in enumerate(keys) if key not in _index]
+        else:
+            invalid = numpy.flatnonzero(~mask).tolist()
+        for i in invalid:
+            # This raises the appropriate exception for invalid keys
+            # (or returns the normalized key)
+            keys[i] = self._validate_index(keys[i])
+        return keys
+
     def construct(self, data=None):
         """
         Initialize this component.
@@ -47,6 +47,7 @@ import enum
 
 from pyutilib.misc import flatten_tuple
 
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.block import Block, _BlockData
@@ -55,6 +56,7 @@ from pyomo.core.base.sos import SOSConstraint
 from pyomo.core.base.var import Var, _VarData, IndexedVar
 from pyomo.core.base.set_types import PositiveReals, NonNegativeReals, Binary
 from pyomo.core.base.numvalue import value
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 from six import iterkeys, advance_iterator
 from six.moves import xrange, zip
@@ -81,6 +83,35 @@ class Bound(str, enum.Enum):
 # IF THIS GETS CHANGED
 _WARNING_TOLERANCE = 1e-8
 
+# Functions with at least this many breakpoints are characterized
+# using NumPy (when it is available)
+_VECTORIZE_MIN_POINTS = 32
+
+def _is_ndarray(obj):
+    return numpy_available and isinstance(obj, numpy.ndarray)
+
+def _to_list(vals):
+    """
+    converts a list of breakpoints or range values to a list of raw
+    numbers (and not Pyomo Params or Expressions)
+    """
+    if _is_ndarray(vals):
+        return vals.tolist()
+    return [value(_p) for _p in vals]
+
+def _linear_row(coefs, variables, constant=0):
+    """
+    builds the (compiled) linear expression
+    constant + sum(coefs[i]*variables[i])
+    """
+    if 0 in coefs:
+        # drop zero terms (as generating the expression would)
+        variables = [v for c,v in zip(coefs,variables) if c != 0]
+        coefs = [c for c in coefs if c != 0]
+    return LinearExpression(constant=constant,
+                            linear_coefs=coefs,
+                            linear_vars=variables)
+
 
 def _isNonDecreasing(vals):
     """
@@ -143,7 +174,7 @@ def _characterize_function(name, tol, f_rule, model, points, *index):
     # numbers and not Pyomo Params or Expressions.
     # Failing to do this can generate strange
     # expression generation errors in the checks below
-    points = [value(_p) for _p in points]
+    points = _to_list(points)
 
     # we use future division to protect against the case where
     # the user supplies integer type points for return values
@@ -160,7 +191,11 @@ def _characterize_function(name, tol, f_rule, model, points, *index):
     # numbers and not Pyomo Params or Expressions.
     # Failing to do this can generate strange
     # expression generation errors in the checks below
-    values = [value(_p) for _p in values]
+    values = _to_list(values)
+
+    if numpy_available and len(points) >= _VECTORIZE_MIN_POINTS:
+        return _characterize_function_vectorized(
+            name, tol, points, values, index)
 
     step = False
     try:
@@ -196,6 +231,44 @@ def _characterize_function(name, tol, f_rule, model, points, *index):
         return -1,values,False
     return 0,values,False
 
+def _characterize_function_vectorized(name, tol, points, values, index):
+    """
+    NumPy implementation of the slope computation and
+    convexity/concavity checks in _characterize_function
+    """
+    dx = numpy.diff(numpy.array(points, dtype=float))
+    dy = numpy.diff(numpy.array(values, dtype=float))
+    is_step = dx == 0
+    step = bool(is_step.any())
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        # vertical (step) segments produce inf/nan slopes; these are
+        # excluded from the checks below
+        slopes = dy / dx
+        dslopes = numpy.diff(slopes)
+
+    # Warn about consecutive segments with nearly equal slopes
+    # (ignoring the vertical segments of step functions)
+    close = numpy.abs(dslopes) <= tol
+    if step:
+        close &= ~(is_step[1:] | is_step[:-1])
+    if close.any():
+        msg = "**WARNING: Piecewise component '%s[%s]' has detected slopes of consecutive piecewise "\
+              "segments to be within "+str(tol)+" of one another. Refer to the Piecewise help "\
+              "documentation for information on how to disable this warning."
+        if index == ():
+            index = None
+        print(msg % (name, flatten_tuple(index)))
+
+    if step:
+        return 0,values,True
+    if (dslopes >= 0).all():
+        # convex
+        return 1,values,False
+    if (dslopes <= 0).all():
+        # concave
+        return -1,values,False
+    return 0,values,False
+
 
 class _PiecewiseData(_BlockData):
     """
@@ -218,7 +291,12 @@ class _PiecewiseData(_BlockData):
     def updatePoints(self, domain_pts, range_pts):
         # ***Note: most (if not all) piecewise constraint generators
         #          assume the list of domain points is sorted.
-        if not _isNonDecreasing(domain_pts):
+        if len(domain_pts) >= _VECTORIZE_MIN_POINTS and numpy_available:
+            nondecreasing = bool(
+                (numpy.diff(numpy.array(domain_pts, dtype=float)) >= 0).all())
+        else:
+            nondecreasing = _isNonDecreasing(domain_pts)
+        if not nondecreasing:
             msg = "'%s' does not have a list of domain points "\
                   "that is non-decreasing"
             raise ValueError(msg % (self.name,))
@@ -351,24 +429,26 @@ class _SOS2Piecewise(object):
         # create vars
         sos2_y = pblock.SOS2_y = Var(sos2_index,within=NonNegativeReals)
 
+        sos2_y_list = [sos2_y[i] for i in sos2_index]
+
         # create piecewise constraints
         conlist = pblock.SOS2_constraint = ConstraintList()
-        conlist.add( (x_var-sum(sos2_y[i]*x_pts[i] for i in sos2_index),0) )
+        conlist.add( (_linear_row([1]+[-x for x in x_pts],
+                                  [x_var]+sos2_y_list),0) )
 
-        LHS = y_var
-        RHS = sum(sos2_y[i]*y_pts[i] for i in sos2_index)
-        expr = None
+        LHS_MINUS_RHS = _linear_row([1]+[-y for y in y_pts],
+                                    [y_var]+sos2_y_list)
         if bound_type == Bound.Upper:
-            conlist.add( (None,LHS-RHS,0) )
+            conlist.add( (None,LHS_MINUS_RHS,0) )
         elif bound_type == Bound.Lower:
-            conlist.add( (0,LHS-RHS,None) )
+            conlist.add( (0,LHS_MINUS_RHS,None) )
         elif bound_type == Bound.Equal:
-            conlist.add( (LHS-RHS,0) )
+            conlist.add( (LHS_MINUS_RHS,0) )
         else:
             raise ValueError("Invalid Bound for _SOS2Piecewise object")
-        conlist.add( (sum(sos2_y[j] for j in sos2_index),1) )
+        conlist.add( (_linear_row([1]*len_x_pts, sos2_y_list),1) )
         def SOS2_rule(model):
-            return [sos2_y[i] for i in sos2_index]
+            return sos2_y_list
         pblock.SOS2_sosconstraint = SOSConstraint(initialize=SOS2_rule, sos=2)
 
 
@@ -395,23 +475,26 @@ class _DCCPiecewise(object):
         # create vars
         pblock.DCC_lambda = Var(polytopes,vertices,within=PositiveReals)
         lmda = pblock.DCC_lambda
+        # the (polytope, vertex) pairs used in the constraints
+        lmda_index = [(p,v) for p in polytopes for v in polytope_verts(p)]
+        lmda_list = [lmda[p,v] for p,v in lmda_index]
         pblock.DCC_bin_y = Var(polytopes,within=Binary)
         bin_y = pblock.DCC_bin_y
 
         # create piecewise constraints
-        pblock.DCC_constraint1 = Constraint(expr=x_var==sum(lmda[p,v]*x_pts[v-1] \
-                                                         for p in polytopes \
-                                                         for v in polytope_verts(p)))
+        pblock.DCC_constraint1 = Constraint(expr=_linear_row(
+            [1]+[-x_pts[v-1] for p,v in lmda_index],
+            [x_var]+lmda_list) == 0)
 
-        LHS = y_var
-        RHS = sum(lmda[p,v]*y_pts[v-1] for p in polytopes for v in polytope_verts(p))
+        LHS_MINUS_RHS = _linear_row([1]+[-y_pts[v-1] for p,v in lmda_index],
+                                    [y_var]+lmda_list)
         expr = None
         if bound_type == Bound.Upper:
-            expr= LHS <= RHS
+            expr= LHS_MINUS_RHS <= 0
         elif bound_type == Bound.Lower:
-            expr= LHS >= RHS
+            expr= LHS_MINUS_RHS >= 0
         elif bound_type == Bound.Equal:
-            expr= LHS == RHS
+            expr= LHS_MINUS_RHS == 0
         else:
             raise ValueError("Invalid Bound for _DCCPiecewise object")
         pblock.DCC_constraint2 = Constraint(expr=expr)
@@ -445,11 +528,8 @@ class _DLOGPiecewise(object):
         biglist = xrange(1,MAX+1)
         mylists2 = {}
         for i in sorted(mylists1.keys()):
-            mylists2[i] = []
-            for j in biglist:
-                if j not in mylists1[i]:
-                    mylists2[i].append(j)
-            mylists2[i] = sorted(mylists2[i])
+            _list1 = set(mylists1[i])
+            mylists2[i] = [j for j in biglist if j not in _list1]
 
         return mylists1, mylists2
 
@@ -480,37 +560,37 @@ class _DLOGPiecewise(object):
         # create vars
         pblock.DLOG_lambda = Var(polytopes,vertices,within=PositiveReals)
         lmda = pblock.DLOG_lambda
+        # the (polytope, vertex) pairs used in the constraints
+        lmda_index = [(p,v) for p in polytopes for v in polytope_verts(p)]
+        lmda_list = [lmda[p,v] for p,v in lmda_index]
         pblock.DLOG_bin_y = Var(bin_y_index,within=Binary)
         bin_y = pblock.DLOG_bin_y
         # create piecewise constraints
-        pblock.DLOG_constraint1 = Constraint(expr=x_var==sum(lmda[p,v]*x_pts[v-1] \
-                                                         for p in polytopes \
-                                                         for v in polytope_verts(p)))
+        pblock.DLOG_constraint1 = Constraint(expr=_linear_row(
+            [1]+[-x_pts[v-1] for p,v in lmda_index],
+            [x_var]+lmda_list) == 0)
 
-        LHS = y_var
-        RHS = sum(lmda[p,v]*y_pts[v-1] for p in polytopes for v in polytope_verts(p))
+        LHS_MINUS_RHS = _linear_row([1]+[-y_pts[v-1] for p,v in lmda_index],
+                                    [y_var]+lmda_list)
         expr = None
         if bound_type == Bound.Upper:
-            expr= LHS <= RHS
+            expr= LHS_MINUS_RHS <= 0
         elif bound_type == Bound.Lower:
-            expr= LHS >= RHS
+            expr= LHS_MINUS_RHS >= 0
         elif bound_type == Bound.Equal:
-            expr= LHS == RHS
+            expr= LHS_MINUS_RHS == 0
         else:
             raise ValueError("Invalid Bound for _DLOGPiecewise object")
         pblock.DLOG_constraint2 = Constraint(expr=expr)
-        pblock.DLOG_constraint3 = Constraint(expr=sum(lmda[p,v] \
-                                                  for p in polytopes \
-                                                  for v in polytope_verts(p)) == 1)
+        pblock.DLOG_constraint3 = Constraint(expr=_linear_row(
+            [1]*len(lmda_list), lmda_list) == 1)
         def con4_rule(model,l):
-            return sum(lmda[p,v] for p in B_ZERO[l] \
-                                 for v in polytope_verts(p)) \
-                   <= bin_y[l]
+            _vars = [lmda[p,v] for p in B_ZERO[l] for v in polytope_verts(p)]
+            return _linear_row([1]*len(_vars)+[-1], _vars+[bin_y[l]]) <= 0
         pblock.DLOG_constraint4 = Constraint(bin_y_index,rule=con4_rule)
         def con5_rule(model,l):
-            return sum(lmda[p,v] for p in B_ONE[l] \
-                                 for v in polytope_verts(p)) \
-                   <= (1-bin_y[l])
+            _vars = [lmda[p,v] for p in B_ONE[l] for v in polytope_verts(p)]
+            return _linear_row([1]*len(_vars)+[1], _vars+[bin_y[l]]) <= 1
         pblock.DLOG_constraint5 = Constraint(bin_y_index,rule=con5_rule)
 
 
@@ -544,24 +624,25 @@ class _CCPiecewise(object):
         lmda = pblock.CC_lambda
         pblock.CC_bin_y = Var(polytopes,within=Binary)
         bin_y = pblock.CC_bin_y
+        lmda_list = [lmda[v] for v in vertices]
         # create piecewise constraints
-        pblock.CC_constraint1 = Constraint(expr=x_var==sum(lmda[v]*x_pts[v-1] \
-                                                         for v in vertices))
+        pblock.CC_constraint1 = Constraint(expr=_linear_row(
+            [1]+[-x for x in x_pts], [x_var]+lmda_list) == 0)
 
-        LHS = y_var
-        RHS = sum(lmda[v]*y_pts[v-1] for v in vertices)
+        LHS_MINUS_RHS = _linear_row([1]+[-y for y in y_pts],
+                                    [y_var]+lmda_list)
         expr = None
         if bound_type == Bound.Upper:
-            expr= LHS <= RHS
+            expr= LHS_MINUS_RHS <= 0
         elif bound_type == Bound.Lower:
-            expr= LHS >= RHS
+            expr= LHS_MINUS_RHS >= 0
         elif bound_type == Bound.Equal:
-            expr= LHS == RHS
+            expr= LHS_MINUS_RHS == 0
         else:
             raise ValueError("Invalid Bound for _CCPiecewise object")
         pblock.CC_constraint2 = Constraint(expr=expr)
-        pblock.CC_constraint3 = Constraint(expr=sum(lmda[v] \
-                                                  for v in vertices) == 1)
+        pblock.CC_constraint3 = Constraint(expr=_linear_row(
+            [1]*len_x_pts, lmda_list) == 1)
         def con4_rule(model,v):
             return lmda[v] <= sum(bin_y[p] for p in vertex_polys(v))
         pblock.CC_constraint4 = Constraint(vertices,rule=con4_rule)
@@ -620,29 +701,32 @@ class _LOGPiecewise(object):
         lmda = pblock.LOG_lambda
         pblock.LOG_bin_y = Var(bin_y_index,within=Binary)
         bin_y = pblock.LOG_bin_y
+        lmda_list = [lmda[v] for v in vertices]
         # create piecewise constraints
-        pblock.LOG_constraint1 = Constraint(expr=x_var==sum(lmda[v]*x_pts[v-1] \
-                                                         for v in vertices))
+        pblock.LOG_constraint1 = Constraint(expr=_linear_row(
+            [1]+[-x for x in x_pts], [x_var]+lmda_list) == 0)
 
-        LHS = y_var
-        RHS = sum(lmda[v]*y_pts[v-1] for v in vertices)
+        LHS_MINUS_RHS = _linear_row([1]+[-y for y in y_pts],
+                                    [y_var]+lmda_list)
         expr = None
         if bound_type == Bound.Upper:
-            expr= LHS <= RHS
+            expr= LHS_MINUS_RHS <= 0
         elif bound_type == Bound.Lower:
-            expr= LHS >= RHS
+            expr= LHS_MINUS_RHS >= 0
         elif bound_type == Bound.Equal:
-            expr= LHS == RHS
+            expr= LHS_MINUS_RHS == 0
         else:
             raise ValueError("Invalid Bound for _LOGPiecewise object")
         pblock.LOG_constraint2 = Constraint(expr=expr)
-        pblock.LOG_constraint3 = Constraint(expr=sum(lmda[v] \
-                                                  for v in vertices) == 1)
+        pblock.LOG_constraint3 = Constraint(expr=_linear_row(
+            [1]*len_x_pts, lmda_list) == 1)
         def con4_rule(model,s):
-            return sum(lmda[v] for v in B_LEFT[s]) <= bin_y[s]
+            _vars = [lmda[v] for v in B_LEFT[s]]
+            return _linear_row([1]*len(_vars)+[-1], _vars+[bin_y[s]]) <= 0
         pblock.LOG_constraint4 = Constraint(bin_y_index,rule=con4_rule)
         def con5_rule(model,s):
-            return sum(lmda[v] for v in B_RIGHT[s]) <= (1-bin_y[s])
+            _vars = [lmda[v] for v in B_RIGHT[s]]
+            return _linear_row([1]*len(_vars)+[1], _vars+[bin_y[s]]) <= 1
         pblock.LOG_constraint5 = Constraint(bin_y_index,rule=con5_rule)
 
 
@@ -723,20 +807,22 @@ class _INCPiecewise(object):
         delta[len_x_pts-1].setlb(0)
         pblock.INC_bin_y = Var(bin_y_index,within=Binary)
         bin_y = pblock.INC_bin_y
+        delta_list = [delta[p] for p in polytopes]
         # create piecewise constraints
-        pblock.INC_constraint1 = Constraint(expr=x_var==x_pts[0] + \
-                                                  sum(delta[p]*(x_pts[p]-x_pts[p-1]) \
-                                                  for p in polytopes))
+        pblock.INC_constraint1 = Constraint(expr=_linear_row(
+            [1]+[x_pts[p-1]-x_pts[p] for p in polytopes],
+            [x_var]+delta_list, -x_pts[0]) == 0)
 
-        LHS = y_var
-        RHS = y_pts[0] + sum(delta[p]*(y_pts[p]-y_pts[p-1]) for p in polytopes)
+        LHS_MINUS_RHS = _linear_row(
+            [1]+[y_pts[p-1]-y_pts[p] for p in polytopes],
+            [y_var]+delta_list, -y_pts[0])
         expr = None
         if bound_type == Bound.Upper:
-            expr= LHS <= RHS
+            expr= LHS_MINUS_RHS <= 0
         elif bound_type == Bound.Lower:
-            expr= LHS >= RHS
+            expr= LHS_MINUS_RHS >= 0
         elif bound_type == Bound.Equal:
-            expr= LHS == RHS
+            expr= LHS_MINUS_RHS == 0
         else:
             raise ValueError("Invalid Bound for _INCPiecewise object")
         pblock.INC_constraint2 = Constraint(expr=expr)
@@ -913,7 +999,8 @@ class Piecewise(Block):
           (for the non-indexed case or when an identical set of
           breakpoints is used across all indices) defining the set of
           domain breakpoints for the piecewise linear
-          function. **ALWAYS REQUIRED**
+          function. NumPy arrays may be used in place of lists.
+          **ALWAYS REQUIRED**
 
 -pw_repn=''
           Indicates the type of piecewise representation to use. This
@@ -958,7 +1045,8 @@ class Piecewise(Block):
           Otherwise, the object can be a dictionary of lists/tuples
           (with keys the same as the indexing set) or a singe
           list/tuple (when no indexing set is used or when all indices
-          use an identical piecewise function).
+          use an identical piecewise function). NumPy arrays may be
+          used in place of lists/tuples.
           Examples:
 
                    # A function which changes with index
@@ -1119,9 +1207,10 @@ class Piecewise(Block):
             raise TypeError(msg % (repr(self._range_var),))
 
         # Test that the keyword values make sense
-        if f_rule.__class__ not in [type(lambda: None),dict,list,tuple]:
+        if f_rule.__class__ not in [type(lambda: None),dict,list,tuple] \
+           and not _is_ndarray(f_rule):
             msg = "Piecewise component keyword 'f_rule' must "\
-                  "be a function, dict, list, or tuple"
+                  "be a function, dict, list, tuple, or numpy array"
             raise ValueError(msg)
         if bound_type not in Bound:
             msg = "Invalid value for Piecewise component "\
@@ -1150,22 +1239,26 @@ class Piecewise(Block):
 
         if self.is_indexed() is False:
             if not ( isinstance(pw_points, list) or \
-                     isinstance(pw_points,tuple) ):
+                     isinstance(pw_points,tuple) or \
+                     _is_ndarray(pw_points) ):
                 msg = "Invalid type '%s' for Piecewise component "\
                       "keyword 'pw_pts', which must be of type "\
-                      "'list' or 'tuple' for non-indexed Piecewise component"
+                      "'list', 'tuple', or numpy array for non-indexed "\
+                      "Piecewise component"
                 raise TypeError(msg % (type(pw_points),))
             self._domain_points = {None:pw_points}
         else:
             if isinstance(pw_points, list) or \
-               isinstance(pw_points,tuple):
+               isinstance(pw_points,tuple) or \
+               _is_ndarray(pw_points):
                 self._domain_points = {None:pw_points}
             elif isinstance(pw_points,dict):
                 self._domain_points = pw_points
             else:
                 msg = "Invalid type '%s' for Piecewise component "\
                       "keyword 'pw_pts', which must be of type "\
-                      "'dict', 'list', or 'tuple' for indexed Piecewise component"
+                      "'dict', 'list', 'tuple', or numpy array for "\
+                      "indexed Piecewise component"
                 raise TypeError(msg % (type(pw_points),))
 
     def construct(self, *args, **kwds):
@@ -1238,6 +1331,8 @@ class Piecewise(Block):
                 # hence the assert below
                 assert not (_is_indexed and (index is None))
                 _self_domain_pts_index = self._domain_points[None]
+        if _is_ndarray(_self_domain_pts_index):
+            _self_domain_pts_index = _self_domain_pts_index.tolist()
 
         if self._unbounded_domain_var is False:
             # We add the requirment that the domain variable used by Piecewise is
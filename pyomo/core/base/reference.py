@@ -15,12 +15,14 @@ from pyomo.common.collections import (
     Set as collections_Set, Sequence,
 )
 from pyomo.core.base.set import SetOf, OrderedSetOf, _SetDataBase
-from pyomo.core.base.component import Component, ComponentData
+from pyomo.core.base.component import (
+    Component, ComponentData, ModelStructure, _ComponentBase,
+)
 from pyomo.core.base.indexed_component import (
-    IndexedComponent, UnindexedComponent_set
+    IndexedComponent, UnindexedComponent_set, normalize_index
 )
 from pyomo.core.base.indexed_component_slice import (
-    IndexedComponent_slice, _IndexedComponent_slice_iter
+    IndexedComponent_slice, _IndexedComponent_slice_iter, _slice_generator
 )
 
 import six
@@ -163,6 +165,113 @@ class _fill_in_known_wildcards(object):
 class SliceEllipsisLookupError(LookupError):
     pass
 
+
+class _record_sliced_components(object):
+    """Variant of "six.advance_iterator" that records the sliced components
+
+    Used as the `advance_iter` of a :py:class:`_IndexedComponent_slice_iter`
+    to collect every component whose index is walked by the slice
+    (including those that turn out not to match anything).
+    """
+    def __init__(self):
+        self.components = {}
+
+    def __call__(self, _slice):
+        self.components[id(_slice.component)] = _slice.component
+        return advance_iterator(_slice)
+
+    def check_complete(self):
+        pass
+
+
+class _CompiledSlice(object):
+    """The resolved wildcard keys and data matched by a component slice
+
+    Walking a slice matches every index of every sliced component
+    against the slice template.  This object records the result of one
+    walk (an ordered map of wildcard keys to data), so that repeated
+    lookups, ``len()`` and iteration become dict operations.  The
+    compiled slice is current until the structure of the model
+    containing the sliced components changes (see
+    :py:class:`ModelStructure`), which includes adding data to or
+    deleting data from any of them.
+
+    Slices through components that do not store their data in a plain
+    dict (e.g., other References, whose data may belong to another
+    model) cannot be tracked; for those, :py:meth:`compile` returns
+    None.
+    """
+    __slots__ = ('data', 'ordered', '_structure', '_version')
+
+    def __init__(self, data, structure):
+        self.data = data
+        self.ordered = True
+        self._structure = structure
+        self._version = structure.version
+
+    @staticmethod
+    def structure(component_slice):
+        """Return the ModelStructure of the model containing the slice
+
+        Returns None if the sliced component is not part of a model.
+        """
+        # The first entry in the call stack is the slice_info of the
+        # base component
+        return ModelStructure.get(component_slice._call_stack[0][1][0].model())
+
+    @staticmethod
+    def compile(component_slice, structure):
+        # Keys are only canonical (hashable, flat tuples) when indices
+        # are flattened.  The results of method calls may change at any
+        # time, and if lookup errors are suppressed, data that is later
+        # added at a fixed index would not be detected.
+        if not normalize_index.flatten \
+           or not component_slice.key_errors_generate_exceptions \
+           or not component_slice.attribute_errors_generate_exceptions \
+           or any(call[0] == IndexedComponent_slice.call
+                  for call in component_slice._call_stack):
+            return None
+        data = OrderedDict()
+        recorder = _record_sliced_components()
+        _iter = _IndexedComponent_slice_iter(component_slice, recorder)
+        try:
+            for obj in _iter:
+                if not isinstance(obj, _ComponentBase):
+                    # Attribute values (e.g., Var.value) may change
+                    # without the model structure changing
+                    return None
+                data[_iter.get_last_index_wildcards()] = obj
+        except (LookupError, AttributeError, TypeError):
+            # Slices that cannot be fully iterated cannot be compiled
+            return None
+        for comp in itervalues(recorder.components):
+            if comp._data.__class__ is not dict:
+                return None
+        return _CompiledSlice(data, structure)
+
+    def is_current(self):
+        return self._version == self._structure.version
+
+    def refresh(self, key, obj):
+        """Record data that the caller just added through the slice
+
+        The data is only recorded if creating it was the only change to
+        the model structure since the slice was compiled (otherwise the
+        slice is left to be recompiled).
+        """
+        if self._structure.version == self._version + 1:
+            self.data[key] = obj
+            self.ordered = False
+            self._version = self._structure.version
+
+    @staticmethod
+    def normalize_key(key):
+        if key.__class__ in (tuple, list):
+            key = flatten_tuple(tuple(key))
+            if len(key) == 1:
+                return key[0]
+        return key
+
 class _ReferenceDict(MutableMapping):
     """A dict-like object whose values are defined by a slice.
 
@@ -176,11 +285,58 @@ class _ReferenceDict(MutableMapping):
     ----------
     component_slice : :py:class:`IndexedComponent_slice`
         The slice object that defines the "members" of this mutable mapping.
+
+    The matching keys and data are resolved once into a
+    :py:class:`_CompiledSlice` that is reused until the underlying
+    components change.
     """
     def __init__(self, component_slice):
         self._slice = component_slice
+        self._compiled = None
+        # The (ModelStructure, version) when the slice last failed to
+        # compile (None if it did not fail)
+        self._compile_failed = None
+
+    def __getstate__(self):
+        # The compiled slice refers to the structure of the original
+        # model: copies (and unpickled objects) compile their own
+        state = dict(self.__dict__)
+        state['_compiled'] = None
+        state['_compile_failed'] = None
+        return state
+
+    def _get_compiled(self, ordered=False):
+        # Return the current compiled slice (recompiling if necessary),
+        # or None if this slice cannot be compiled.  A slice that could
+        # not be compiled is only compiled again once the model
+        # structure changes.
+        ans = self._compiled
+        if ans is not None and ans.is_current() and (
+                ans.ordered or not ordered):
+            return ans
+        self._compiled = None
+        structure = _CompiledSlice.structure(self._slice)
+        if structure is None:
+            # Slices of components that are not part of a model are
+            # never compiled
+            return None
+        if self._compile_failed is not None:
+            if self._compile_failed == (structure, structure.version):
+                return None
+            self._compile_failed = None
+        ans = self._compiled = _CompiledSlice.compile(self._slice, structure)
+        if ans is None:
+            self._compile_failed = (structure, structure.version)
+        return ans
 
     def __contains__(self, key):
+        compiled = self._get_compiled()
+        if compiled is not None:
+            try:
+                return _CompiledSlice.normalize_key(key) in compiled.data
+            except TypeError:
+                # unhashable keys fall through to the slice lookup
+                pass
         try:
             advance_iterator(self._get_iter(self._slice, key))
             # This calls IC_slice_iter.__next__, which calls
@@ -204,12 +360,24 @@ class _ReferenceDict(MutableMapping):
             return False
 
     def __getitem__(self, key):
+        compiled = self._get_compiled()
+        if compiled is not None:
+            try:
+                return compiled.data[_CompiledSlice.normalize_key(key)]
+            except KeyError:
+                pass
+            except TypeError:
+                compiled = None
         try:
             # This calls IC_slice_iter.__next__, which calls
             # _fill_in_known_wildcards.
-            return advance_iterator(
-                self._get_iter(self._slice, key, get_if_not_present=True)
-            )
+            _iter = self._get_iter(self._slice, key, get_if_not_present=True)
+            ans = advance_iterator(_iter)
+            if compiled is not None and not compiled.is_current():
+                # The lookup added this data to the underlying
+                # component: record it without recompiling the slice
+                compiled.refresh(_iter.get_last_index_wildcards(), ans)
+            return ans
         except SliceEllipsisLookupError:
             if type(key) is tuple and len(key) == 1:
                 key = key[0]
@@ -285,11 +453,17 @@ class _ReferenceDict(MutableMapping):
             pass
 
     def __iter__(self):
+        compiled = self._get_compiled(ordered=True)
+        if compiled is not None:
+            return iter(tuple(compiled.data))
         return self._slice.wildcard_keys()
 
     def __len__(self):
-        # Note that unlike for regular dicts, len() of a _ReferenceDict
-        # is very slow (linear time).
+        compiled = self._get_compiled()
+        if compiled is not None:
+            return len(compiled.data)
+        # Note that unlike for regular dicts, len() of an uncompiled
+        # _ReferenceDict is very slow (linear time).
         return sum(1 for i in self._slice)
 
     def iteritems(self):
@@ -305,6 +479,9 @@ class _ReferenceDict(MutableMapping):
         still be linear and not quadratic time.
 
         """
+        compiled = self._get_compiled(ordered=True)
+        if compiled is not None:
+            return iter(tuple(iteritems(compiled.data)))
         return self._slice.wildcard_items()
 
     def itervalues(self):
@@ -320,6 +497,9 @@ class _ReferenceDict(MutableMapping):
         still be linear and not quadratic time.
 
         """
+        compiled = self._get_compiled(ordered=True)
+        if compiled is not None:
+            return iter(tuple(itervalues(compiled.data)))
         return iter(self._slice)
 
     def _get_iter(self, _slice, key, get_if_not_present=False):
@@ -19,6 +19,7 @@ import weakref
 from six import iteritems
 from six.moves import xrange
 
+from pyomo.common.dependencies import numpy, pandas
 from pyomo.common.deprecation import deprecated, deprecation_warning
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.common.timing import ConstructionTimer
@@ -413,6 +414,21 @@ class TuplizeValuesInitializer(InitializerBase):
             return _val
         elif _val is None:
             return _val
+        elif _pandas_index(_val) is not None:
+            # pandas indices are not tuplized (MultiIndex members are
+            # already tuples)
+            return _val
+        elif _is_ndarray(_val) and _val.ndim == 1 \
+                and _val.dtype.kind != 'O':
+            # The rows of the reshaped array are the tuples
+            if len(_val) % self._dimen:
+                raise TuplizeError(
+                    "Cannot tuplize list data for set %%s%%s because its "
+                    "length %s is not a multiple of dimen=%s"
+                    % (len(_val), self._dimen))
+            return _val.reshape(-1, self._dimen)
+        elif _is_ndarray(_val) and _val.ndim == 2:
+            return _val
 
         if not isinstance(_val, collections_Sequence):
             _val = tuple(_val)
@@ -441,6 +457,165 @@ class TuplizeValuesInitializer(InitializerBase):
         return list(tuple(_val[d*i:d*(i+1)]) for i in xrange(len(_val)//d))
 
 
+def _array_domain_mask(domain, values):
+    """Vectorized test of the membership of array values in a Set
+
+    Returns a boolean array flagging the entries of the (1-dimensional)
+    NumPy array `values` that are in `domain`, or None if the test could
+    not be vectorized (in which case the caller should test the
+    individual values).  Numeric arrays are tested against the domain
+    interval.  Otherwise, each unique value is tested only once.
+
+    """
+    if values.dtype.kind in 'biuf':
+        try:
+            lb, ub, step = domain.get_interval()
+        except AttributeError:
+            step = None
+        if step is not None:
+            if values.dtype.kind == 'b':
+                values = values.astype(int)
+            mask = numpy.ones(values.shape, dtype=bool)
+            # Note: get_interval() does not distinguish open bounds
+            # (e.g., PositiveReals), so we explicitly test the bounds
+            if lb is not None:
+                mask &= values >= lb
+                if lb not in domain:
+                    mask &= values != lb
+            if ub is not None:
+                mask &= values <= ub
+                if ub not in domain:
+                    mask &= values != ub
+            if step:
+                ref = lb if lb is not None else (ub if ub is not None else 0)
+                with numpy.errstate(invalid='ignore'):
+                    mask &= numpy.remainder(values - ref, step) == 0
+            return mask
+    try:
+        unique = numpy.unique(values)
+    except TypeError:
+        # Unorderable (mixed type) values
+        return None
+    invalid = [v for v in unique.tolist() if v not in domain]
+    if not invalid:
+        return numpy.ones(values.shape, dtype=bool)
+    mask = ~numpy.isin(values, invalid)
+    if mask.all():
+        # The invalid values do not compare equal to themselves (NaN)
+        return None
+    return mask
+
+
+def _columns_domain_mask(domain, columns):
+    """Vectorized test of the membership of tuples in a Set
+
+    The tuples are given by a list of (1-dimensional) NumPy arrays, one
+    for each tuple position.  Returns a boolean array flagging the
+    tuples that are in `domain`, or None if the test could not be
+    vectorized.  Each column is tested against the corresponding subset
+    of a SetProduct domain.
+
+    """
+    if len(columns) == 1:
+        return _array_domain_mask(domain, columns[0])
+    try:
+        subsets = list(domain.subsets(expand_all_set_operators=False))
+    except AttributeError:
+        return None
+    if len(subsets) != len(columns) \
+       or any(s.dimen != 1 for s in subsets):
+        return None
+    mask = numpy.ones(len(columns[0]), dtype=bool)
+    for subset, column in zip(subsets, columns):
+        column_mask = _array_domain_mask(subset, column)
+        if column_mask is None:
+            return None
+        mask &= column_mask
+    return mask
+
+
+def _pandas_index_mask(domain, index):
+    """Vectorized test of the membership of a pandas Index in a Set
+
+    Returns a boolean array flagging the members of `index` that are in
+    `domain`, or None if the test could not be vectorized.  Each level
+    of a MultiIndex is tested against the corresponding subset of a
+    SetProduct domain.
+
+    """
+    return _columns_domain_mask(
+        domain, [index.get_level_values(i).to_numpy()
+                 for i in range(index.nlevels)])
+
+
+def _find_invalid_member(domain, members, dimen):
+    """Return the first of a list of (normalized) members not in domain
+
+    Returns _NotFound if all members are in the domain.  If the members
+    are tuples of length `dimen` and the domain is a product of
+    dimen-1 sets, the unique values in each tuple position are tested
+    only once against the corresponding subset of the product.
+
+    """
+    subsets = None
+    if dimen.__class__ is int and dimen > 1:
+        try:
+            subsets = list(domain.subsets(expand_all_set_operators=False))
+        except AttributeError:
+            pass
+        if subsets is not None and (
+                len(subsets) != dimen or any(s.dimen != 1 for s in subsets)):
+            subsets = None
+    if subsets is None:
+        for m in members:
+            if m not in domain:
+                return m
+        return _NotFound
+    for i, subset in enumerate(subsets):
+        invalid = set(v for v in set(m[i] for m in members)
+                      if v not in subset)
+        if invalid:
+            for m in members:
+                if m[i] in invalid:
+                    return m
+    return _NotFound
+
+
+def _pandas_index(data):
+    """Return the pandas Index that holds the Set members in `data`
+
+    The members of a pandas Series or DataFrame are the entries of its
+    index.  Returns None if `data` is not a pandas object.
+
+    """
+    if data.__class__.__module__.split('.', 1)[0] != 'pandas':
+        return None
+    if isinstance(data, (pandas.Series, pandas.DataFrame)):
+        return data.index
+    if isinstance(data, pandas.Index):
+        return data
+    return None
+
+
+def _is_ndarray(data):
+    """Return True if `data` is a NumPy ndarray"""
+    return data.__class__.__module__ == 'numpy' \
+        and isinstance(data, numpy.ndarray)
+
+
+def _ndarray_members(values):
+    """Return the members of a (1- or 2-dimensional) NumPy array as
+    Python objects: the scalars of a 1-dimensional array (or of an
+    array with a single column) and the row tuples otherwise"""
+    if values.ndim == 2 and values.shape[1] == 1:
+        values = values[:, 0]
+    if values.ndim == 1:
+        return values.tolist()
+    # Converting the columns is much faster than converting the rows
+    # to lists
+    return list(zip(*[c.tolist() for c in values.T]))
+
+
 class _NotFound(object):
     "Internal type flag used to indicate if an object is not found in a set"
     pass
@@ -1362,6 +1537,260 @@ class _FiniteSetData(_FiniteSetMixin, _SetData):
     def _add_impl(self, value):
         self._values.add(value)
 
+    def _update_impl(self, values, warn_duplicates,
+                     init_filter=None, stop_at_end=False):
+        """Add the members of an iterable to this Set in a single pass
+
+        This is equivalent to calling add() for each value, except that
+        the values are checked in one pass and (unless `values` is an
+        iterator or the Set has filter or validate callbacks) the new
+        members are stored with a single call to _bulk_add_impl(), so
+        no member is added if any value fails the domain or dimen
+        checks.  Members from iterators (e.g., generators) and members
+        that pass through filter or validate callbacks are added as
+        they are accepted, as the iterator or callbacks may refer to
+        the earlier members of the Set.  Values already in the Set are
+        skipped (with a warning if `warn_duplicates` is True).  When
+        initializing the Set, `init_filter` is called on each raw value
+        and iteration stops at Set.End if `stop_at_end` is True.
+        pandas objects and NumPy arrays are checked and added in bulk
+        when there are no callbacks.  Returns the number of members
+        added.
+
+        """
+        _filter = self._filter
+        _validate = self._validate
+        callbacks = init_filter is not None or _filter is not None \
+            or _validate is not None
+        # The members of pandas objects are the entries of their
+        # (Multi)Index
+        index = _pandas_index(values)
+        if index is not None:
+            if not callbacks:
+                return self._add_pandas_index(index, warn_duplicates)
+            values = index.tolist()
+        elif _is_ndarray(values) and values.ndim in (1, 2):
+            if not callbacks:
+                return self._add_array(values, warn_duplicates)
+            # The callbacks are passed Python members (and not NumPy
+            # scalars or rows)
+            values = _ndarray_members(values)
+
+        _block = self.parent_block()
+        _domain = self._domain
+        if _domain is Any:
+            _domain = None
+        incremental = callbacks or iter(values) is values
+        # If there are no filter or validation callbacks (that could
+        # be passed values outside the domain), then we can test the
+        # domain once for the final set of new members
+        defer_domain = _domain is not None and not incremental
+        if defer_domain:
+            _domain = None
+        _values = self._values
+        _dimen = self._dimen
+        flatten = normalize_index.flatten
+        End = Set.End
+        seen = set()
+        members = []
+        count = 0
+        for value in values:
+            if stop_at_end and value is End:
+                break
+            if init_filter is not None and not init_filter(_block, value):
+                continue
+            if not flatten:
+                # If we are not normalizing indices, then we cannot
+                # reliably infer the set dimen
+                _value = value
+                _d = None
+            elif value.__class__ in native_types:
+                _value = value
+                _d = 1
+            else:
+                _value = normalize_index(value)
+                if _value.__class__ is tuple:
+                    _d = len(_value)
+                else:
+                    _d = 1
+            if _domain is not None and _value not in _domain:
+                raise ValueError("Cannot add value %s to Set %s.\n"
+                                 "\tThe value is not in the domain %s"
+                                 % (value, self.name, self._domain))
+
+            # We wrap this check in a try-except because some values
+            #  (like lists) are not hashable and can raise exceptions.
+            try:
+                if incremental:
+                    # Note: sorting the Set replaces the _values dict
+                    duplicate = _value in self._values
+                else:
+                    duplicate = _value in seen or _value in _values
+                if duplicate:
+                    if warn_duplicates:
+                        logger.warning(
+                            "Element %s already exists in Set %s; "
+                            "no action taken" % (value, self.name))
+                    continue
+            except:
+                exc = sys.exc_info()
+                raise TypeError("Unable to insert '%s' into Set %s:\n\t%s: %s"
+                                % (value, self.name, exc[0].__name__, exc[1]))
+
+            if _filter is not None and not _filter(_block, _value):
+                continue
+
+            if _validate is not None:
+                try:
+                    flag = _validate(_block, _value)
+                except:
+                    logger.error(
+                        "Exception raised while validating element '%s' "
+                        "for Set %s" % (value, self.name))
+                    raise
+                if not flag:
+                    raise ValueError(
+                        "The value=%s violates the validation rule of Set %s"
+                        % (value, self.name))
+
+            if _dimen is not None and _d != _dimen:
+                if _dimen is UnknownSetDimen:
+                    # The first thing added to a Set with unknown
+                    # dimension sets its dimension
+                    _dimen = self._dimen = _d
+                else:
+                    raise ValueError(
+                        "The value=%s has dimension %s and is not "
+                        "valid for Set %s which has dimen=%s"
+                        % (value, _d, self.name, _dimen))
+
+            if incremental:
+                self._add_impl(_value)
+                count += 1
+            else:
+                seen.add(_value)
+                members.append(_value)
+
+        if incremental:
+            return count
+        if defer_domain:
+            invalid = _find_invalid_member(self._domain, members, _dimen)
+            if invalid is not _NotFound:
+                raise ValueError("Cannot add value %s to Set %s.\n"
+                                 "\tThe value is not in the domain %s"
+                                 % (invalid, self.name, self._domain))
+        self._bulk_add_impl(members)
+        return len(members)
+
+    def _add_pandas_index(self, index, warn_duplicates=True):
+        """Add the members of a pandas Index (or MultiIndex) in bulk
+
+        This is equivalent to add(*index), except that the domain,
+        duplicate and dimen checks are vectorized and the (already
+        flat) members are not passed through normalize_index().
+        Returns the number of members added.
+
+        """
+        members = index.tolist()
+        _d = index.nlevels
+        if not normalize_index.flatten or (
+                _d == 1 and index.dtype.kind == 'O'
+                and any(m.__class__ is tuple for m in members)):
+            return self._update_impl(members, warn_duplicates)
+
+        if self._domain is Any:
+            mask = None
+        else:
+            mask = _pandas_index_mask(self._domain, index)
+        return self._add_flat_members(
+            members, _d, mask, index.duplicated(), warn_duplicates)
+
+    def _add_array(self, values, warn_duplicates=True):
+        """Add the rows of a (1- or 2-dimensional) NumPy array in bulk
+
+        The members of a 2-dimensional array are the tuples formed by
+        its rows.  As for _add_pandas_index(), the domain, duplicate
+        and dimen checks are vectorized.  Returns the number of members
+        added.
+
+        """
+        if values.ndim == 2 and values.shape[1] == 1:
+            values = values[:, 0]
+        if values.ndim == 1:
+            columns = [values]
+        else:
+            columns = list(values.T)
+        members = _ndarray_members(values)
+        if not normalize_index.flatten or values.dtype.kind == 'O':
+            return self._update_impl(members, warn_duplicates)
+
+        if self._domain is Any:
+            mask = None
+        else:
+            mask = _columns_domain_mask(self._domain, columns)
+        return self._add_flat_members(
+            members, len(columns), mask, None, warn_duplicates)
+
+    def _add_flat_members(self, members, _d, mask, duplicated,
+                          warn_duplicates):
+        """Check and add a list of normalized members with dimension _d
+
+        `mask` flags the members that are in the domain (None if they
+        should be tested individually) and `duplicated` the members that
+        repeat an earlier member of the list (None if they should be
+        found by hashing the members).
+
+        """
+        if self._domain is not Any:
+            if mask is None:
+                invalid = _find_invalid_member(self._domain, members, _d)
+            elif mask.all():
+                invalid = _NotFound
+            else:
+                invalid = members[numpy.flatnonzero(~mask)[0]]
+            if invalid is not _NotFound:
+                raise ValueError("Cannot add value %s to Set %s.\n"
+                                 "\tThe value is not in the domain %s"
+                                 % (invalid, self.name, self._domain))
+
+        if duplicated is None:
+            duplicated = numpy.zeros(len(members), dtype=bool)
+            if len(set(members)) != len(members):
+                seen = set()
+                for i, m in enumerate(members):
+                    if m in seen:
+                        duplicated[i] = True
+                    else:
+                        seen.add(m)
+        if self._values:
+            _values = self._values
+            duplicated |= numpy.fromiter(
+                (m in _values for m in members), dtype=bool,
+                count=len(members))
+        if duplicated.any():
+            if warn_duplicates:
+                for i in numpy.flatnonzero(duplicated).tolist():
+                    logger.warning(
+                        "Element %s already exists in Set %s; "
+                        "no action taken" % (members[i], self.name))
+            members = [m for m, dup in zip(members, duplicated.tolist())
+                       if not dup]
+
+        if self._dimen is not None and members and _d != self._dimen:
+            if self._dimen is UnknownSetDimen:
+                self._dimen = _d
+            else:
+                raise ValueError(
+                    "The value=%s has dimension %s and is not "
+                    "valid for Set %s which has dimen=%s"
+                    % (members[0], _d, self.name, self._dimen))
+
+        self._bulk_add_impl(members)
+        return len(members)
+
+    def _bulk_add_impl(self, values):
+        self._values.update(values)
+
     def remove(self, val):
         self._values.remove(val)
 
@@ -1373,13 +1802,10 @@ class _FiniteSetData(_FiniteSetMixin, _SetData):
 
     def set_value(self, val):
         self.clear()
-        for x in val:
-            self.add(x)
+        self._update_impl(val, True)
 
     def update(self, values):
-        for v in values:
-            if v not in self:
-                self.add(v)
+        self._update_impl(values, False)
 
     def pop(self):
         return self._values.pop()
@@ -1542,6 +1968,11 @@ class _OrderedSetData(_OrderedSetMixin, _FiniteSetData):
         self._values[value] = len(self._values)
         self._ordered_values.append(value)
 
+    def _bulk_add_impl(self, values):
+        n = len(self._values)
+        self._values.update(zip(values, xrange(n, n + len(values))))
+        self._ordered_values.extend(values)
+
     def remove(self, val):
         idx = self._values.pop(val)
         self._ordered_values.pop(idx)
@@ -1692,6 +2123,11 @@ class _SortedSetData(_SortedSetMixin, _OrderedSetData):
         self._ordered_values.append(value)
         self._is_sorted = False
 
+    def _bulk_add_impl(self, values):
+        super(_SortedSetData, self)._bulk_add_impl(values)
+        if values:
+            self._is_sorted = False
+
     # Note: removing data does not affect the sorted flag
     #def remove(self, val):
     #def discard(self, val):
@@ -2098,7 +2534,7 @@ class Set(IndexedComponent):
             if isinstance(_values, SetOperator):
                 _values.construct()
             try:
-                val_iter = iter(_values)
+                iter(_values)
             except TypeError:
                 logger.error(
                     "Initializer for Set %s%s returned non-iterable object "
@@ -2108,11 +2544,7 @@ class Set(IndexedComponent):
                         _values if _values.__class__ is type
                         else type(_values).__name__ ))
                 raise
-            for val in val_iter:
-                if val is Set.End:
-                    break
-                if _filter is None or _filter(_block, val):
-                    obj.add(val)
+            obj._update_impl(_values, True, _filter, stop_at_end=True)
         # We defer adding the filter until now so that add() doesn't
         # call it a second time.
         obj._filter = _filter
@@ -13,9 +13,14 @@ __all__ = ('Suffix',
            'active_import_suffix_generator')
 
 import logging
+from itertools import chain, compress
 
 from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy
 from pyomo.common.timing import ConstructionTimer
+from pyomo.core.expr.numvalue import (
+    native_numeric_types, native_integer_types,
+)
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import ActiveComponent
 
@@ -176,6 +181,12 @@ class Suffix(ComponentMap, ActiveComponent):
         self._datatype = None
         self._rule = None
 
+        # Dense (array-backed) storage; see set_values()
+        self._dense_order = None
+        self._dense_index = None
+        self._dense_values = None
+        self._dense_mask = None
+
         # The suffix direction
         direction = kwds.pop('direction', Suffix.LOCAL)
 
@@ -207,6 +218,16 @@ class Suffix(ComponentMap, ActiveComponent):
         """
         ActiveComponent.__setstate__(self, state)
         ComponentMap.__setstate__(self, state)
+        # object id() may have changed after unpickling, so we rebuild
+        # the dense index
+        if self._dense_order is not None:
+            self._dense_index = {
+                id(obj): i for i, obj in enumerate(self._dense_order)}
+
+    def __getstate__(self):
+        state = super(Suffix, self).__getstate__()
+        state['_dense_index'] = None
+        return state
 
     def construct(self, data=None):
         """
@@ -306,7 +327,7 @@ class Suffix(ComponentMap, ActiveComponent):
         """
         Sets the value of this suffix on all components.
         """
-        for ndx in self:
+        for ndx in list(self):
             self[ndx] = value
 
     @deprecated('Suffix.clearValue is replaced with Suffix.clear_value.',
@@ -342,6 +363,175 @@ class Suffix(ComponentMap, ActiveComponent):
         """
         self.clear()
 
+    def set_values(self, components, values):
+        """
+        Sets the values of this suffix for a sequence of component
+        data objects in bulk.
+
+        The values are stored in a NumPy array aligned with the
+        sequence of components (e.g., the variable or constraint order
+        used by a writer or solver interface).  Repeated calls with the
+        same component order overwrite the array in place.  Calling
+        set_values() with a different order moves any values stored
+        for the previous order back into the (sparse) mapping storage.
+
+        The array dtype is determined by the suffix datatype (float
+        for Suffix.FLOAT, int for Suffix.INT and object otherwise).
+        Suffixes with a numeric datatype cannot store None: values for
+        components that should not have a value raise a ValueError
+        (they can be removed from the suffix after the call).
+        Individual values can still be read and modified through the
+        usual mapping interface.
+
+        Args:
+            components: a sequence of component data objects
+            values: an array-like of values (the same length as
+                components), or a single value to assign to all
+                components
+        """
+        values = self._to_array(values)
+        if not self._is_dense_order(components) \
+           or self._dense_values.dtype != values.dtype:
+            self._set_dense_order(components)
+        n = len(self._dense_order)
+        if values.ndim == 0:
+            self._dense_values.fill(values.item())
+        elif values.shape != (n,):
+            raise ValueError(
+                "Suffix '%s': the number of values (%s) does not match "
+                "the number of components (%s)"
+                % (self.name, values.shape[0], n))
+        else:
+            self._dense_values[:] = values
+        self._dense_mask.fill(True)
+
+    def get_values(self, components, default=0):
+        """
+        Returns the values of this suffix for a sequence of component
+        data objects as a NumPy array.
+
+        This is a vectorized copy when components matches the order
+        used in the last call to set_values(), and falls back on the
+        mapping interface otherwise.
+
+        Args:
+            components: a sequence of component data objects
+            default: the value returned for components that do not
+                have a value for this suffix
+        """
+        if self._is_dense_order(components):
+            ans = self._dense_values.copy()
+            mask = self._dense_mask
+            if not mask.all():
+                ans[~mask] = default
+            return ans
+        components = list(components)
+        ans = numpy.empty(len(components),
+                          dtype=self._dense_dtype())
+        for i, obj in enumerate(components):
+            ans[i] = self.get(obj, default)
+        return ans
+
+    def bulk_items(self):
+        """
+        Returns an iterator over the (component, value) pairs of this
+        suffix.
+
+        This yields the same pairs as items(), but the values stored
+        with set_values() are read from the array in bulk rather than
+        one at a time through the mapping interface.
+        """
+        if self._dense_order is None:
+            return iteritems(self)
+        return chain(
+            compress(zip(self._dense_order, self._dense_values.tolist()),
+                     self._dense_mask.tolist()),
+            itervalues(self._dict))
+
+    def _dense_dtype(self):
+        if self._datatype is Suffix.FLOAT:
+            return float
+        elif self._datatype is Suffix.INT:
+            return int
+        return object
+
+    def _to_array(self, values):
+        dtype = self._dense_dtype()
+        if dtype is object:
+            return numpy.array(values, dtype=object)
+        ans = numpy.array(values)
+        # NumPy would silently convert None to NaN
+        if ans.dtype.kind == 'O' and any(v is None for v in ans.flat):
+            raise ValueError(
+                "Suffix '%s' has datatype Suffix.%s: cannot store None "
+                "(components without a value must not be passed to "
+                "set_values())" % (self.name, 'FLOAT' if dtype is float
+                                   else 'INT'))
+        if dtype is float:
+            return ans.astype(float, copy=False)
+        _int = ans.astype(int)
+        if ans.dtype.kind not in 'biu' and (_int != ans).any():
+            raise ValueError(
+                "Suffix '%s' has datatype Suffix.INT: cannot store "
+                "non-integer values" % (self.name,))
+        return _int
+
+    def _is_dense_order(self, components):
+        order = self._dense_order
+        if order is None:
+            return False
+        if components is order:
+            return True
+        try:
+            if len(components) != len(order):
+                return False
+        except TypeError:
+            return False
+        return all(a is b for a, b in zip(components, order))
+
+    def _set_dense_order(self, components):
+        self._sparsify()
+        order = tuple(components)
+        index = {id(obj): i for i, obj in enumerate(order)}
+        if len(index) != len(order):
+            raise ValueError(
+                "Suffix '%s': set_values() was passed duplicate components"
+                % (self.name,))
+        # Remove (sparse) entries for these components, as they will be
+        # stored in the array
+        _dict = self._dict
+        if _dict:
+            for key in index:
+                _dict.pop(key, None)
+        self._dense_order = order
+        self._dense_index = index
+        self._dense_values = numpy.zeros(len(order),
+                                         dtype=self._dense_dtype())
+        self._dense_mask = numpy.zeros(len(order), dtype=bool)
+
+    def _sparsify(self):
+        # Move all values from the dense storage into the (sparse) dict
+        order = self._dense_order
+        if order is None:
+            return
+        _dict = self._dict
+        values = self._dense_values
+        for i in numpy.flatnonzero(self._dense_mask).tolist():
+            obj = order[i]
+            _dict[id(obj)] = (obj, values.item(i))
+        self._dense_order = None
+        self._dense_index = None
+        self._dense_values = None
+        self._dense_mask = None
+
+    def _dense_accepts(self, val):
+        dtype = self._dense_values.dtype.kind
+        if dtype == 'O':
+            return True
+        elif dtype == 'f':
+            return type(val) in native_numeric_types
+        return type(val) in native_integer_types
+
     @deprecated('Suffix.setDatatype is replaced with Suffix.set_datatype.',
                 version='4.1.10486')
     def setDatatype(self, datatype):
@@ -411,7 +601,7 @@ class Suffix(ComponentMap, ActiveComponent):
             [('Direction', self.SuffixDirectionToStr[self._direction]),
              ('Datatype', self.SuffixDatatypeToStr[self._datatype]),
              ],
-            ((str(k), v) for k, v in itervalues(self._dict)),
+            ((str(k), v) for k, v in iteritems(self)),
             ("Value",),
             lambda k, v: [v]
         )
@@ -452,6 +642,66 @@ class Suffix(ComponentMap, ActiveComponent):
     def __str__(self):
         return ActiveComponent.__str__(self)
 
+    #
+    # Override the ComponentMap methods to support the dense storage
+    #
+
+    def __getitem__(self, obj):
+        if self._dense_index is not None:
+            i = self._dense_index.get(id(obj), None)
+            if i is not None and self._dense_mask[i]:
+                return self._dense_values.item(i)
+        return ComponentMap.__getitem__(self, obj)
+
+    def __setitem__(self, obj, val):
+        if self._dense_index is not None:
+            i = self._dense_index.get(id(obj), None)
+            if i is not None:
+                if self._dense_accepts(val):
+                    self._dense_values[i] = val
+                    self._dense_mask[i] = True
+                    return
+                # The value cannot be stored in the array: revert to
+                # the (sparse) mapping storage
+                self._sparsify()
+        self._dict[id(obj)] = (obj, val)
+
+    def __delitem__(self, obj):
+        if self._dense_index is not None:
+            i = self._dense_index.get(id(obj), None)
+            if i is not None and self._dense_mask[i]:
+                self._dense_mask[i] = False
+                return
+        ComponentMap.__delitem__(self, obj)
+
+    def __contains__(self, obj):
+        if self._dense_index is not None:
+            i = self._dense_index.get(id(obj), None)
+            if i is not None:
+                return bool(self._dense_mask[i])
+        return id(obj) in self._dict
+
+    def __iter__(self):
+        if self._dense_order is None:
+            return ComponentMap.__iter__(self)
+        return chain(
+            (obj for obj, m in zip(self._dense_order,
+                                   self._dense_mask.tolist()) if m),
+            ComponentMap.__iter__(self))
+
+    def __len__(self):
+        ans = len(self._dict)
+        if self._dense_mask is not None:
+            ans += int(self._dense_mask.sum())
+        return ans
+
+    def clear(self):
+        ComponentMap.clear(self)
+        self._dense_order = None
+        self._dense_index = None
+        self._dense_values = None
+        self._dense_mask = None
+
     #
     # Override NotImplementedError messages on ComponentMap base class
     #
@@ -464,6 +464,18 @@ class UnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         self._pyomo_units_container = pyomo_units_container
         self._pint_registry = self._pyomo_units_container._pint_registry
         self._units_equivalence_tolerance = units_equivalence_tolerance
+        # Results of previous comparisons of pint units are shared by
+        # all visitors created from the same units container
+        self._pint_equivalence_cache = \
+            pyomo_units_container._pint_equivalence_cache
+        self._pint_dimensionless = pyomo_units_container._pint_dimensionless
+        self._pint_unit_type = type(self._pint_dimensionless)
+        # The units of leaf components (Vars, Params) and named
+        # Expressions are cached for the lifetime of this visitor.  The
+        # caches are keyed by id() and also hold a reference to the
+        # object so that the ids cannot be reused.
+        self._leaf_units_cache = {}
+        self._named_expression_cache = {}
 
     def _pint_unit_equivalent_to_dimensionless(self, pint_unit):
         """
@@ -483,7 +495,7 @@ class UnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         """
         if pint_unit is None:
             return True
-        return self._pint_units_equivalent(pint_unit, self._pint_registry.dimensionless)
+        return self._pint_units_equivalent(pint_unit, self._pint_dimensionless)
 
     def _pint_units_equivalent(self, lhs, rhs):
         """
@@ -513,16 +525,79 @@ class UnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             # check if lhs is equivalent to dimensionless (e.g. dimensionless or radians)
             return self._pint_unit_equivalent_to_dimensionless(lhs)
 
-        # Units are not the same objects, and they are both not None
+        # Units are not the same objects, and they are both not None.
+        # The conversion to base units is expensive, so remember the
+        # result for pairs of pint units (Quantity objects are not cached)
+        key = None
+        if type(lhs) is self._pint_unit_type \
+                and type(rhs) is self._pint_unit_type:
+            key = (lhs, rhs, self._units_equivalence_tolerance)
+            ans = self._pint_equivalence_cache.get(key, None)
+            if ans is not None:
+                return ans
+
         # Now, use pint mechanisms to check by converting to Quantity objects
         lhsq = (1.0 * lhs).to_base_units()
         rhsq = (1.0 * rhs).to_base_units()
 
-        if lhsq.dimensionality == rhsq.dimensionality and \
-               abs(lhsq.magnitude/rhsq.magnitude - 1.0) < self._units_equivalence_tolerance:
-            return True
+        ans = lhsq.dimensionality == rhsq.dimensionality and \
+            abs(lhsq.magnitude/rhsq.magnitude - 1.0) \
+            < self._units_equivalence_tolerance
+        if key is not None:
+            self._pint_equivalence_cache[key] = ans
+        return ans
 
-        return False
+    def _pint_unit_is_dimensionless(self, pint_unit):
+        """
+        Check if a pint unit is truly dimensionless (i.e., equivalent to
+        dimensionless and printed as an empty string, which excludes
+        units like radians)
+
+        Parameters
+        ----------
+        pint_unit : pint unit
+           The pint unit you want to check
+
+        Returns
+        -------
+        : bool
+           Returns True if pint_unit should be reported as no units
+        """
+        key = None
+        if type(pint_unit) is self._pint_unit_type:
+            key = (pint_unit, None)
+            ans = self._pint_equivalence_cache.get(key, None)
+            if ans is not None:
+                return ans
+        # but radians are also equivalent to dimensionless
+        # For now, this test works, but we need to find a better approach
+        ans = self._pint_unit_equivalent_to_dimensionless(pint_unit) \
+            and '{:!~s}'.format(pint_unit) == ''
+        if key is not None:
+            self._pint_equivalence_cache[key] = ans
+        return ans
+
+    def _get_units_for_leaf(self, units):
+        """
+        Return the (cached) units tuple for the units expression
+        returned by the get_units() method of a leaf component
+
+        Parameters
+        ----------
+        units : Pyomo units expression (or None)
+            The units assigned to a Var or Param
+
+        Returns
+        -------
+        : tuple (PyomoUnit, pint unit)
+        """
+        if units is None:
+            return (None, None)
+        ans = self._leaf_units_cache.get(id(units), None)
+        if ans is None:
+            ans = self._leaf_units_cache[id(units)] = (
+                units, self._pyomo_units_container._get_units_tuple(units))
+        return ans[1]
 
     def _get_unit_for_equivalent_children(self, node, list_of_unit_tuples):
         """
@@ -898,6 +973,43 @@ class UnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
 
         return (None, None)
 
+    def _get_unit_for_getitem(self, node, list_of_unit_tuples):
+        """
+        Return (and test) the units corresponding to a GetItemExpression
+        node (e.g., ``m.x[i]`` in a templatized expression).  The indices
+        must be dimensionless, and the units are those of the indexed
+        component.
+
+        Parameters
+        ----------
+        node : Pyomo expression node
+            The parent node of the children
+
+        list_of_unit_tuples : list
+           This is a list of tuples (one for each of the children) where each tuple
+           is a PyomoUnit, pint unit pair
+
+        Returns
+        -------
+        : tuple (PyomoUnit, pint unit)
+        """
+        for (pyomo_unit, pint_unit) in list_of_unit_tuples[1:]:
+            if not self._pint_unit_equivalent_to_dimensionless(pint_unit):
+                raise UnitsError('Expected no units or dimensionless units in the index of {}, but found {}.'.format(str(node), str(pyomo_unit)))
+
+        base = node.arg(0)
+        if hasattr(base, '_units'):
+            # Var and Param components store the units of all their data
+            return self._get_units_for_leaf(base._units)
+        elif hasattr(base, 'ctype'):
+            # e.g., an indexed Expression, where the units may differ
+            # between the data objects
+            raise TypeError('Cannot determine the units of {}: units are '
+                            'not defined for the indexed component {}'
+                            ''.format(str(node), base.name))
+        return self._get_dimensionless_with_dimensionless_children(
+            node, list_of_unit_tuples[:1])
+
     def _get_unit_for_unary_function(self, node, list_of_unit_tuples):
         """
         Return (and test) the units corresponding to a unary function expression node
@@ -1078,7 +1190,8 @@ class UnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         EXPR.NPV_UnaryFunctionExpression: _get_unit_for_unary_function,
         EXPR.Expr_ifExpression: _get_unit_for_expr_if,
         IndexTemplate: _get_dimensionless_no_children,
-        EXPR.GetItemExpression: _get_dimensionless_with_dimensionless_children,
+        EXPR.GetItemExpression: _get_unit_for_getitem,
+        EXPR.TemplateSumExpression: _get_unit_for_single_child,
         EXPR.ExternalFunctionExpression: _get_units_ExternalFunction,
         EXPR.NPV_ExternalFunctionExpression: _get_units_ExternalFunction,
         EXPR.LinearExpression: _get_unit_for_linear_expression
@@ -1105,6 +1218,30 @@ class UnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         'floor': _get_unit_for_single_child
     }
 
+    def enterNode(self, node):
+        """ Callback for :class:`pyomo.core.current.StreamBasedExpressionVisitor`. This
+        method is called when entering a node in a depth first search."""
+        if type(node) is EXPR.TemplateSumExpression:
+            # All terms in the sum share the units of the template, so
+            # do not expand the sum over the index sets
+            return node._local_args_, []
+        return None, []
+
+    def beforeChild(self, node, child, child_idx):
+        """ Callback for :class:`pyomo.core.current.StreamBasedExpressionVisitor`. This
+        method is called before descending into a child node."""
+        if type(child) in native_numeric_types:
+            # this is a number - return dimensionless
+            return False, (None, None)
+        if hasattr(child, 'is_named_expression_type') \
+                and child.is_named_expression_type():
+            # named expressions are frequently shared between
+            # constraints: only walk each one once
+            ans = self._named_expression_cache.get(id(child), None)
+            if ans is not None:
+                return False, ans[1]
+        return True, None
+
     def exitNode(self, node, data):
         """ Callback for :class:`pyomo.core.current.StreamBasedExpressionVisitor`. This
         method is called when moving back up the tree in a depth first search."""
@@ -1123,28 +1260,25 @@ class UnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             #    pyomo_unit, pint_unit = self._pyomo_units_container._get_units_tuple(node.get_units())
             #    return (pyomo_unit, pint_unit)
             elif hasattr(node, 'get_units'):
-                pyomo_unit, pint_unit = self._pyomo_units_container._get_units_tuple(node.get_units())
-                return (pyomo_unit, pint_unit)
+                return self._get_units_for_leaf(node.get_units())
             
             # I have a leaf, but this is not a PyomoUnit - (treat as dimensionless)
             return (None, None)
 
         # not a leaf - check if it is a named expression
         if hasattr(node, 'is_named_expression_type') and node.is_named_expression_type():
-            return self._get_unit_for_single_child(node, data)
+            ans = self._get_unit_for_single_child(node, data)
+            self._named_expression_cache[id(node)] = (node, ans)
+            return ans
 
         # not a leaf - get the appropriate function for type of the node
         node_func = self.node_type_method_map.get(type(node), None)
         if node_func is not None:
             pyomo_unit, pint_unit = node_func(self, node, data)
             if pint_unit is not None and \
-                 self._pint_unit_equivalent_to_dimensionless(pint_unit):
+                 self._pint_unit_is_dimensionless(pint_unit):
                 # I want to return None instead of dimensionless
-                # but radians are also equivalent to dimensionless
-                # For now, this test works, but we need to find a better approach
-                teststr = '{:!~s}'.format(pint_unit)
-                if teststr == '':
-                    return (None, None)
+                return (None, None)
 
             return (pyomo_unit, pint_unit)
 
@@ -1179,6 +1313,12 @@ class PyomoUnitsContainer(object):
     def __init__(self):
         """Create a PyomoUnitsContainer instance."""
         self._pint_registry = pint_module.UnitRegistry()
+        # Looking up units on the registry parses the unit name, so
+        # keep a reference to the units used when extracting units
+        self._pint_dimensionless = self._pint_registry.dimensionless
+        # Memoized results of comparing pint units (see
+        # UnitExtractionVisitor._pint_units_equivalent)
+        self._pint_equivalence_cache = {}
 
     def load_definitions_from_file(self, definition_file):
         """Load new units definitions from a file
@@ -1215,6 +1355,7 @@ class PyomoUnitsContainer(object):
 
         """
         self._pint_registry.load_definitions(definition_file)
+        self._pint_equivalence_cache.clear()
 
     def load_definitions_from_strings(self, definition_string_list):
         """Load new units definitions from a string
@@ -1245,6 +1386,7 @@ class PyomoUnitsContainer(object):
 
         """
         self._pint_registry.load_definitions(definition_string_list)
+        self._pint_equivalence_cache.clear()
 
     def __getattr__(self, item):
         """
@@ -1342,7 +1484,7 @@ class PyomoUnitsContainer(object):
     #                                                                  float(conv_offset))
     #     self._pint_registry.define(defn_str)
 
-    def _get_units_tuple(self, expr):
+    def _get_units_tuple(self, expr, visitor=None):
         """
         Return a tuple of the PyomoUnit, and pint_unit corresponding to the expression in expr.
 
@@ -1351,6 +1493,12 @@ class PyomoUnitsContainer(object):
         expr : Pyomo expression
            the input expression for extracting units
 
+        visitor : UnitExtractionVisitor (optional)
+           the visitor used to walk the expression.  Reusing a single
+           visitor across many expressions (e.g., when checking all the
+           constraints on a model) allows the units of Vars, Params,
+           and named Expressions to be computed only once.
+
         Returns
         -------
         : tuple (PyomoUnit, pint unit)
@@ -1358,15 +1506,17 @@ class PyomoUnitsContainer(object):
         if expr is None:
             return (None, None)
 
-        pyomo_unit, pint_unit = UnitExtractionVisitor(self).walk_expression(expr=expr)
-        if pint_unit == self._pint_registry.dimensionless:
+        if visitor is None:
+            visitor = UnitExtractionVisitor(self)
+        pyomo_unit, pint_unit = visitor.walk_expression(expr=expr)
+        if pint_unit == self._pint_dimensionless:
             pint_unit = None
         if pyomo_unit is self.dimensionless:
             pyomo_unit = None
             
         if pint_unit is not None:
             assert pyomo_unit is not None
-            if type(pint_unit) != type(self._pint_registry.kg):
+            if type(pint_unit) != type(self._pint_dimensionless):
                 pint_unit = pint_unit.units
             return (_PyomoUnit(pint_unit, self._pint_registry), pint_unit)
 
@@ -18,7 +18,7 @@ from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.numvalue import NumericValue, value, is_fixed
 from pyomo.core.base.set_types import Reals, Binary
 from pyomo.core.base.plugin import ModelComponentFactory
-from pyomo.core.base.component import ComponentData
+from pyomo.core.base.component import ComponentData, ModelStructure
 from pyomo.core.base.indexed_component import IndexedComponent, UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule
 from pyomo.core.base.set import Set, _SetDataBase
@@ -652,10 +652,12 @@ class Var(IndexedComponent):
         """
         obj = self._getitem_when_not_present(index)
         try:
-            return obj.set_value(value)
+            ans = obj.set_value(value)
         except:
             del self._data[index]
             raise
+        ModelStructure.changed(self)
+        return ans
 
     def _initialize_members(self, init_set):
         """Initialize variable data for all indices in a set."""
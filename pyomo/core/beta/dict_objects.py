@@ -13,6 +13,7 @@ __all__ = ()
 import logging
 from weakref import ref as weakref_ref
 
+from pyomo.core.base.component import ModelStructure
 from pyomo.core.base.set_types import Any
 from pyomo.core.base.var import (IndexedVar,
                                  _VarData)
@@ -113,6 +114,7 @@ class ComponentDict(collections_MutableMapping):
                     # release the current component
                     # * see __delitem__ for explanation
                     self._data[key]._component = None
+                    ModelStructure.changed(self)
                 self._data[key] = val
                 return
             elif (key in self._data) and (self._data[key] is val):
@@ -152,6 +154,7 @@ class ComponentDict(collections_MutableMapping):
         obj = self._data[key]
         obj._component = None
         del self._data[key]
+        ModelStructure.changed(self)
 
     def __getitem__(self, key): return self._data[key]
     def __iter__(self): return self._data.__iter__()
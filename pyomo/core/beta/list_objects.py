@@ -13,6 +13,7 @@ __all__ = ()
 import logging
 from weakref import ref as weakref_ref
 
+from pyomo.core.base.component import ModelStructure
 from pyomo.core.base.set_types import Any
 from pyomo.core.base.var import (IndexedVar,
                                  _VarData)
@@ -102,6 +103,7 @@ class ComponentList(collections_MutableSequence):
                     self._active |= getattr(item, '_active', True)
                 self._data[i]._component = None
                 self._data[i] = item
+                ModelStructure.changed(self)
                 return
             elif self._data[i] is item:
                 # a very special case that makes sense to handle
@@ -137,6 +139,8 @@ class ComponentList(collections_MutableSequence):
                 if hasattr(self, "_active"):
                     self._active |= getattr(item, '_active', True)
                 self._data.insert(i, item)
+                # inserting shifts the index (and name) of later items
+                ModelStructure.changed(self)
                 return
             # see note about allowing components to live in more than
             # one container
@@ -167,6 +171,7 @@ class ComponentList(collections_MutableSequence):
         obj = self._data[i]
         obj._component = None
         del self._data[i]
+        ModelStructure.changed(self)
 
     def __getitem__(self, i): return self._data[i]
     def __len__(self): return self._data.__len__()
@@ -218,6 +223,7 @@ class ComponentList(collections_MutableSequence):
         data = self._data
         for i in range(n//2):
             data[i], data[n-i-1] = data[n-i-1], data[i]
+        ModelStructure.changed(self)
 
 #
 # ComponentList needs to come before IndexedComponent
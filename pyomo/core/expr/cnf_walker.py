@@ -226,3 +226,311 @@ def _sympy2pyomo_expression(expr, object_map):
     if not is_expr:
         return ans
     return visitor.walk_expression(expr)
+
+
+def _negate(literal):
+    """Return the negation of a literal (BooleanVar, lnot(BooleanVar) or bool)"""
+    if literal.__class__ is bool:
+        return not literal
+    if literal.__class__ is NotExpression:
+        return literal.args[0]
+    return NotExpression((literal,))
+
+
+def _is_literal(expr):
+    if type(expr) in native_types or not expr.is_expression_type():
+        return True
+    return expr.__class__ is NotExpression and _is_literal(expr.args[0])
+
+
+class TseitinCNFVisitor(StreamBasedExpressionVisitor):
+    """Convert Pyomo logical expressions to CNF without sympy.
+
+    Unlike :py:func:`to_cnf`, which distributes the expression into an
+    equivalent CNF (and may therefore grow exponentially), this visitor
+    performs a Tseitin transformation: every non-literal subexpression
+    is replaced by an auxiliary Boolean variable (added to
+    ``bool_varlist``) that is defined through a small set of clauses.
+    The resulting CNF is equisatisfiable with the original statement
+    and grows linearly with the size of the expression.
+
+    Conjunctions, disjunctions, implications and negations at the root
+    of a statement are asserted directly, so simple statements (e.g.,
+    ``Y[1].implies(Y[2] | Y[3])``) do not introduce any auxiliary
+    variables.  Special atoms (atleast / atmost / exactly) appearing at
+    the root are returned with literal arguments so that they may be
+    mapped directly to linear sums; nested special atoms are replaced
+    by indicator variables and recorded in ``bool_var_to_special_atoms``
+    (just as with :py:func:`to_cnf`).
+
+    Subexpressions shared between statements converted by the same
+    visitor are only encoded once.
+
+    """
+
+    def __init__(self, bool_varlist=None, bool_var_to_special_atoms=None):
+        super(TseitinCNFVisitor, self).__init__()
+        self.bool_varlist = bool_varlist
+        self.special_atom_map = ComponentMap() \
+            if bool_var_to_special_atoms is None else bool_var_to_special_atoms
+        # id(expr) -> (expr, literal)
+        self._literal_cache = {}
+        self._statements = None
+
+    def to_cnf(self, expr):
+        """Return the list of CNF statements asserting that expr is True.
+
+        Each statement is a literal, a disjunction of literals, or a
+        special atom whose logical arguments are all literals.
+        """
+        self._statements = []
+        try:
+            self._assert(expr, True)
+            return self._statements
+        finally:
+            self._statements = None
+
+    def beforeChild(self, node, child, child_idx):
+        if type(child) in native_types:
+            return False, bool(child)
+        if not child.is_expression_type():
+            return False, self._leaf_literal(child)
+        cached = self._literal_cache.get(id(child), None)
+        if cached is not None:
+            return False, cached[1]
+        if child.__class__ in special_boolean_atom_types:
+            return False, self._special_atom_literal(child)
+        return True, None
+
+    def exitNode(self, node, values):
+        ans = self._gate(node, values)
+        self._literal_cache[id(node)] = (node, ans)
+        return ans
+
+    def _new_var(self):
+        if self.bool_varlist is None:
+            raise ValueError(
+                "Conversion of a logical expression to CNF requires "
+                "augmented variables, but no BooleanVarList was provided.")
+        return self.bool_varlist.add()
+
+    def _leaf_literal(self, expr):
+        if type(expr) in native_types or expr.is_constant():
+            return bool(value(expr))
+        if expr.is_potentially_variable():
+            return expr
+        return bool(value(expr))
+
+    def _literal(self, expr):
+        """Return a literal equivalent to expr, defining aux vars as needed"""
+        if type(expr) in native_types:
+            return bool(expr)
+        if not expr.is_expression_type():
+            return self._leaf_literal(expr)
+        cached = self._literal_cache.get(id(expr), None)
+        if cached is not None:
+            return cached[1]
+        if expr.__class__ in special_boolean_atom_types:
+            return self._special_atom_literal(expr)
+        return self.walk_expression(expr)
+
+    def _special_atom_literal(self, atom):
+        indicator = self._new_var()
+        self._literal_cache[id(atom)] = (atom, indicator)
+        self.special_atom_map[indicator] = self._special_atom_with_literals(atom)
+        return indicator
+
+    def _special_atom_with_literals(self, atom):
+        new_args = [atom.args[0]]
+        need_new_expression = False
+        for child in atom.args[1:]:
+            if _is_literal(child):
+                new_args.append(child)
+                continue
+            need_new_expression = True
+            new_indicator = self._new_var()
+            if child.__class__ in special_boolean_atom_types:
+                self.special_atom_map[new_indicator] = \
+                    self._special_atom_with_literals(child)
+            else:
+                self._define(new_indicator, child)
+            new_args.append(new_indicator)
+        if need_new_expression:
+            return atom.__class__(new_args)
+        return atom
+
+    def _add_clause(self, literals):
+        clause = []
+        for lit in literals:
+            if lit.__class__ is bool:
+                if lit:
+                    return
+                continue
+            clause.append(lit)
+        if not clause:
+            self._statements.append(False)
+        elif len(clause) == 1:
+            self._statements.append(clause[0])
+        else:
+            self._statements.append(OrExpression(clause))
+
+    def _equate(self, out, literal):
+        """Add the clauses for out <=> literal"""
+        if literal.__class__ is bool:
+            self._add_clause((out if literal else _negate(out),))
+        else:
+            self._add_clause((_negate(out), literal))
+            self._add_clause((out, _negate(literal)))
+
+    def _define(self, out, expr):
+        """Add the clauses for out <=> expr (out is a literal)"""
+        if _is_literal(expr) or expr.__class__ in special_boolean_atom_types:
+            self._equate(out, self._literal(expr))
+        else:
+            self._gate(expr, [self._literal(arg) for arg in expr.args], out)
+
+    def _gate(self, node, args, out=None):
+        """Return a literal for node(*args), adding its defining clauses.
+
+        If out is provided, it is used as the literal for the result
+        (instead of creating a new auxiliary variable).
+        """
+        cls = node.__class__
+        if cls is ImplicationExpression:
+            cls, args = OrExpression, (_negate(args[0]), args[1])
+        if cls is NotExpression:
+            ans = _negate(args[0])
+        elif cls is AndExpression:
+            return self._and_gate(args, out)
+        elif cls is OrExpression:
+            if out is not None:
+                out = _negate(out)
+            return _negate(self._and_gate([_negate(a) for a in args], out))
+        elif cls is EquivalenceExpression:
+            return self._equivalence_gate(args[0], args[1], out)
+        elif cls is XorExpression:
+            if out is not None:
+                out = _negate(out)
+            return _negate(self._equivalence_gate(args[0], args[1], out))
+        else:
+            raise ValueError(
+                "Unsupported expression type '%s' encountered while "
+                "converting logical expression to CNF" % (cls.__name__,))
+        if out is not None:
+            self._equate(out, ans)
+            return out
+        return ans
+
+    def _and_gate(self, args, out):
+        literals = []
+        for arg in args:
+            if arg.__class__ is bool:
+                if not arg:
+                    literals = [False]
+                    break
+            else:
+                literals.append(arg)
+        if len(literals) <= 1:
+            ans = literals[0] if literals else True
+            if out is None:
+                return ans
+            self._equate(out, ans)
+            return out
+        if out is None:
+            out = self._new_var()
+        not_out = _negate(out)
+        for lit in literals:
+            self._add_clause((not_out, lit))
+        self._add_clause([out] + [_negate(lit) for lit in literals])
+        return out
+
+    def _equivalence_gate(self, a, b, out):
+        if a.__class__ is bool:
+            a, b = b, a
+        if b.__class__ is bool:
+            ans = a if b else _negate(a)
+            if out is None:
+                return ans
+            self._equate(out, ans)
+            return out
+        if out is None:
+            out = self._new_var()
+        not_out, not_a, not_b = _negate(out), _negate(a), _negate(b)
+        self._add_clause((not_out, not_a, b))
+        self._add_clause((not_out, a, not_b))
+        self._add_clause((out, a, b))
+        self._add_clause((out, not_a, not_b))
+        return out
+
+    def _assert(self, expr, positive):
+        """Add the CNF statements asserting that expr is (not) True"""
+        if _is_literal(expr) and type(expr) is not NotExpression:
+            lit = self._literal(expr)
+            self._add_clause((lit if positive else _negate(lit),))
+            return
+        cls = expr.__class__
+        if cls is NotExpression:
+            self._assert(expr.args[0], not positive)
+        elif cls is (AndExpression if positive else OrExpression):
+            for arg in expr.args:
+                self._assert(arg, positive)
+        elif cls is (OrExpression if positive else AndExpression) \
+                or (positive and cls is ImplicationExpression):
+            clause = []
+            self._collect_clause(expr, positive, clause)
+            self._add_clause(clause)
+        elif cls is ImplicationExpression:
+            self._assert(expr.args[0], True)
+            self._assert(expr.args[1], False)
+        elif cls is EquivalenceExpression or cls is XorExpression:
+            a, b = expr.args
+            if (cls is EquivalenceExpression) is not positive:
+                # a xor b  <=>  a <=> ~b
+                if _is_literal(a):
+                    self._define(_negate(self._literal(a)), b)
+                else:
+                    lit_a, lit_b = self._literal(a), self._literal(b)
+                    self._add_clause((lit_a, lit_b))
+                    self._add_clause((_negate(lit_a), _negate(lit_b)))
+            elif _is_literal(a):
+                self._define(self._literal(a), b)
+            elif _is_literal(b):
+                self._define(self._literal(b), a)
+            else:
+                self._equate(self._literal(a), self._literal(b))
+        elif cls in special_boolean_atom_types:
+            if positive:
+                self._statements.append(self._special_atom_with_literals(expr))
+            else:
+                self._add_clause((_negate(self._special_atom_literal(expr)),))
+        else:
+            raise ValueError(
+                "Unsupported expression type '%s' encountered while "
+                "converting logical expression to CNF" % (cls.__name__,))
+
+
+    def _collect_clause(self, expr, positive, clause):
+        """Flatten nested disjunctions of expr (or ~expr) into a clause"""
+        cls = expr.__class__
+        if cls is NotExpression:
+            self._collect_clause(expr.args[0], not positive, clause)
+        elif cls is (OrExpression if positive else AndExpression):
+            for arg in expr.args:
+                self._collect_clause(arg, positive, clause)
+        elif positive and cls is ImplicationExpression:
+            self._collect_clause(expr.args[0], False, clause)
+            self._collect_clause(expr.args[1], True, clause)
+        else:
+            lit = self._literal(expr)
+            clause.append(lit if positive else _negate(lit))
+
+
+def tseitin_cnf(expr, bool_varlist=None, bool_var_to_special_atoms=None):
+    """Converts a Pyomo logical constraint to CNF using a Tseitin transformation.
+
+    This has the same interface and return type as :py:func:`to_cnf`,
+    but does not require sympy.  See :py:class:`TseitinCNFVisitor`.
+
+    """
+    return TseitinCNFVisitor(
+        bool_varlist, bool_var_to_special_atoms).to_cnf(expr)
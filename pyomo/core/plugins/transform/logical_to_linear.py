@@ -1,10 +1,11 @@
 """Transformation from BooleanVar and LogicalConstraint to Binary and Constraints."""
 from pyomo.common.collections import ComponentMap
+from pyomo.common.config import ConfigBlock, ConfigValue, In
 from pyomo.common.modeling import unique_component_name
 from pyomo.contrib.fbbt.fbbt import compute_bounds_on_expr
 from pyomo.core import TransformationFactory, BooleanVar, VarList, Binary, LogicalConstraint, Block, ConstraintList, \
     native_types, BooleanVarList
-from pyomo.core.expr.cnf_walker import to_cnf
+from pyomo.core.expr.cnf_walker import to_cnf, TseitinCNFVisitor
 from pyomo.core.expr.logical_expr import AndExpression, OrExpression, NotExpression, AtLeastExpression, \
     AtMostExpression, ExactlyExpression, special_boolean_atom_types, EqualityExpression, InequalityExpression, \
     RangedExpression
@@ -21,7 +22,25 @@ class LogicalToLinear(IsomorphicTransformation):
     converting Boolean variables to binary.
     """
 
+    CONFIG = ConfigBlock("core.logical_to_linear")
+    CONFIG.declare('cnf_method', ConfigValue(
+        default='tseitin',
+        domain=In(['tseitin', 'sympy']),
+        description="Method used to convert logical constraints to CNF",
+        doc="""
+        'tseitin' (default) introduces auxiliary Boolean variables for
+        nested subexpressions, giving a CNF whose size is linear in the
+        size of the logical expression and does not require sympy.
+        'sympy' uses sympy.to_cnf() to distribute the expression into
+        an equivalent CNF without auxiliary variables (aside from those
+        needed for nested atleast / atmost / exactly atoms), which may
+        grow exponentially."""
+    ))
+
     def _apply_to(self, model, **kwds):
+        config = self.CONFIG(kwds.pop('options', {}))
+        config.set_value(kwds)
+
         for boolean_var in model.component_objects(ctype=BooleanVar, descend_into=(Block, Disjunct)):
             new_varlist = None
             for bool_vardata in boolean_var.values():
@@ -39,10 +58,10 @@ class LogicalToLinear(IsomorphicTransformation):
                         new_binary_vardata.fix()
 
         # Process statements in global (entire model) context
-        _process_logical_constraints_in_logical_context(model)
+        _process_logical_constraints_in_logical_context(model, config.cnf_method)
         # Process statements that appear in disjuncts
         for disjunct in model.component_data_objects(Disjunct, descend_into=(Block, Disjunct), active=True):
-            _process_logical_constraints_in_logical_context(disjunct)
+            _process_logical_constraints_in_logical_context(disjunct, config.cnf_method)
 
 
 def update_boolean_vars_from_binary(model, integer_tolerance=1e-5):
@@ -59,7 +78,7 @@ def update_boolean_vars_from_binary(model, integer_tolerance=1e-5):
             boolean_var.stale = binary_var.stale
 
 
-def _process_logical_constraints_in_logical_context(context):
+def _process_logical_constraints_in_logical_context(context, cnf_method='tseitin'):
     new_xfrm_block_name = unique_component_name(context, 'logic_to_linear')
     new_xfrm_block = Block(doc="Transformation objects for logic_to_linear")
     setattr(context, new_xfrm_block_name, new_xfrm_block)
@@ -70,9 +89,14 @@ def _process_logical_constraints_in_logical_context(context):
 
     indicator_map = ComponentMap()
     cnf_statements = []
+    if cnf_method == 'tseitin':
+        convert = TseitinCNFVisitor(new_boolvarlist, indicator_map).to_cnf
+    else:
+        def convert(expr):
+            return to_cnf(expr, new_boolvarlist, indicator_map)
     # Convert all logical constraints to CNF
     for logical_constraint in context.component_data_objects(ctype=LogicalConstraint, active=True):
-        cnf_statements.extend(to_cnf(logical_constraint.body, new_boolvarlist, indicator_map))
+        cnf_statements.extend(convert(logical_constraint.body))
         logical_constraint.deactivate()
 
     # Associate new Boolean vars to new binary variables
@@ -81,8 +105,9 @@ def _process_logical_constraints_in_logical_context(context):
         bool_vardata.associate_binary_var(new_binary_vardata)
 
     # Add constraints associated with each CNF statement
+    visitor = CnfToLinearVisitor(None, None)
     for cnf_statement in cnf_statements:
-        for linear_constraint in _cnf_to_linear_constraint_list(cnf_statement):
+        for linear_constraint in _cnf_to_linear_constraint_list(cnf_statement, visitor=visitor):
             new_constrlist.add(expr=linear_constraint)
 
     # Add bigM associated with special atoms
@@ -118,7 +143,7 @@ def _process_logical_constraints_in_logical_context(context):
         context.del_component(new_xfrm_block)
 
 
-def _cnf_to_linear_constraint_list(cnf_expr, indicator_var=None, binary_varlist=None):
+def _cnf_to_linear_constraint_list(cnf_expr, indicator_var=None, binary_varlist=None, visitor=None):
     # Screen for constants
     if type(cnf_expr) in native_types or cnf_expr.is_constant():
         if value(cnf_expr) is True:
@@ -128,7 +153,9 @@ def _cnf_to_linear_constraint_list(cnf_expr, indicator_var=None, binary_varlist=
                 "Cannot build linear constraint for logical expression with constant value False: %s"
                 % cnf_expr)
     if cnf_expr.is_expression_type():
-        return CnfToLinearVisitor(indicator_var, binary_varlist).walk_expression(cnf_expr)
+        if visitor is None:
+            visitor = CnfToLinearVisitor(indicator_var, binary_varlist)
+        return visitor.walk_expression(cnf_expr)
     else:
         return [cnf_expr.get_associated_binary() == 1]  # Assume that cnf_expr is a BooleanVar
 
@@ -15,6 +15,10 @@ import pyutilib.th as unittest
 
 from pyomo.common import DeveloperError
 import pyomo.core.base._pyomo
+from pyomo.core.base.component import ModelStructure
+from pyomo.core.base.indexed_component import (
+    _get_indexed_component_data_name,
+)
 from pyomo.environ import (
     ConcreteModel, Component, Block, Var, Set, Param,
 )
@@ -84,6 +88,64 @@ class TestComponent(unittest.TestCase):
             m.b[2].c[1,3].getname(fully_qualified=True, name_buffer=cache),
             "b[2].c[1,3]")
 
+    def test_getname_model_cache(self):
+        m = ConcreteModel()
+        m.b = Block([1,2])
+        m.b[2].c = Var([1,2],[3,4])
+
+        self.assertEqual(m.b[2].c[2,4].getname(fully_qualified=True),
+                         "b[2].c[2,4]")
+        cache = ModelStructure.name_buffer(m)
+        self.assertEqual(cache[id(m.b[2].c[2,4])], "b[2].c[2,4]")
+        self.assertEqual(cache[id(m.b[2].c[1,3])], "b[2].c[1,3]")
+        self.assertEqual(cache[id(m.b[1])], "b[1]")
+        # Subsequent lookups are served from the cache
+        cache[id(m.b[2].c[1,3])] = "cached"
+        self.assertEqual(m.b[2].c[1,3].name, "cached")
+        # ... but not for relative names or explicit buffers
+        self.assertEqual(
+            m.b[2].c[1,3].getname(fully_qualified=True, relative_to=m.b[2]),
+            "c[1,3]")
+        self.assertEqual(
+            m.b[2].c[1,3].getname(fully_qualified=True, name_buffer={}),
+            "b[2].c[1,3]")
+
+        # Moving (renaming) a component invalidates the cache
+        c = m.b[2].c
+        m.b[2].del_component(c)
+        self.assertIsNot(ModelStructure.name_buffer(m), cache)
+        m.b[1].d = c
+        self.assertEqual(c[1,3].name, "b[1].d[1,3]")
+        self.assertEqual(c.name, "b[1].d")
+
+        # Renaming the model invalidates its cache
+        self.assertEqual(m.name, "unknown")
+        m.name = "foo"
+        self.assertEqual(m.name, "foo")
+
+        # Changes to other models do not invalidate the cache
+        m.v = Var([1,2], dense=False)
+        cache = ModelStructure.name_buffer(m)
+        self.assertEqual(m.b[1].name, "b[1]")
+        n = ConcreteModel()
+        n.x = Var()
+        del n.x
+        self.assertIs(ModelStructure.name_buffer(m), cache)
+
+        # Names of temporary data objects are neither cached nor
+        # invalidate the cache
+        names = dict(cache)
+        self.assertEqual(_get_indexed_component_data_name(m.v, 2), "v[2]")
+        self.assertNotIn(2, m.v._data)
+        self.assertIs(ModelStructure.name_buffer(m), cache)
+        self.assertEqual(cache, names)
+
+        # Unattached components are not cached
+        v = Var([1,2])
+        v.construct()
+        self.assertEqual(v[1].name, "IndexedVar[1]")
+        self.assertIsNone(ModelStructure.name_buffer(v.model()))
+
     def test_component_data_pprint(self):
         m = ConcreteModel()
         m.a = Set(initialize=[1, 2, 3], ordered=True)
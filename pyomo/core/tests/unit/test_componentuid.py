@@ -20,6 +20,7 @@ import pyutilib.th as unittest
 from pyomo.environ import (
     ConcreteModel, Block, Var, Set, Param, Constraint, Any, ComponentUID,
 )
+from pyomo.core.base.componentuid import ComponentUIDIndex
 from pyomo.core.base.indexed_component import IndexedComponent
 from pyomo.common.log import LoggingIntercept
 
@@ -867,6 +868,58 @@ class TestComponentUID(unittest.TestCase):
 
         self.assertEqual(len(m.b), 3)
 
+    def test_cuid_index_find_component(self):
+        m = ConcreteModel()
+        m.b = Block([1, 2])
+        m.b[1].x = Var([1, 2])
+        cuid = ComponentUID('b[1].x[2]')
+        idx = ComponentUIDIndex.get(m)
+        self.assertIs(ComponentUIDIndex.get(m), idx)
+        self.assertIs(cuid.find_component_on(m), m.b[1].x[2])
+        self.assertIn(cuid._cids, idx._components)
+        # Cached hits do not re-walk the hierarchy
+        idx._components[cuid._cids] = m.b[2]
+        self.assertIs(cuid.find_component_on(m), m.b[2])
+        idx._components[cuid._cids] = m.b[1].x[2]
+
+        # Misses are not cached
+        self.assertIsNone(ComponentUID('b[2].x').find_component_on(m))
+        self.assertEqual(len(idx._components), 1)
+
+        # Structural changes invalidate the cache
+        m.b[2].x = Var()
+        self.assertIs(ComponentUID('b[2].x').find_component_on(m), m.b[2].x)
+        self.assertNotIn(cuid._cids, idx._components)
+        x = m.b[1].x
+        m.b[1].del_component(x)
+        m.b[1].x = Var(x.index_set())
+        self.assertIsNot(cuid.find_component_on(m), x[2])
+        self.assertIs(cuid.find_component_on(m), m.b[1].x[2])
+        x = m.b[1].x[2]
+        del m.b[1].x[2]
+        self.assertIsNot(cuid.find_component_on(m), x)
+
+        # Wildcards are resolved (but not cached)
+        ref = ComponentUID('b[*].x').find_component_on(m)
+        self.assertEqual(len(ref), 2)
+        self.assertEqual(len(idx._components), 1)
+
+        # Changes to other models do not invalidate the cache
+        n = ConcreteModel()
+        n.y = Var()
+        del n.y
+        self.assertIn(cuid._cids, idx._components)
+
+        # Attaching a block to another model tracks the new model
+        x_cuid = ComponentUID('x')
+        c = Block(concrete=True)
+        c.x = Var()
+        self.assertIs(x_cuid.find_component_on(c), c.x)
+        n.c = c
+        self.assertIs(x_cuid.find_component_on(c), c.x)
+        c.del_component(c.x)
+        self.assertIsNone(x_cuid.find_component_on(c))
+
     def test_deprecated_ComponentUID_location(self):
         import pyomo.core.base.component as comp
         self.assertNotIn('ComponentUID', dir(comp))
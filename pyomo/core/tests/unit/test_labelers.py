@@ -10,6 +10,7 @@
 
 
 import pyutilib.th as unittest
+from pyomo.core.base.component import ModelStructure
 from pyomo.environ import ConcreteModel, Var, RangeSet, Block, Constraint, CounterLabeler, NumericLabeler, TextLabeler, ComponentUID, ShortNameLabeler, CNameLabeler, CuidLabeler, AlphaNumericTextLabeler, NameLabeler
 
 
@@ -92,6 +93,19 @@ class LabelerTests(unittest.TestCase):
         self.assertEqual(lbl(m.ind[10]), 'ind(10)')
         self.assertEqual(lbl(m.ind[1]), 'ind(1)')
 
+    def test_textlabeler_remove_obj(self):
+        m = self.m
+        lbl = TextLabeler()
+        self.assertEqual(lbl(m.ind[3]), 'ind(3)')
+        name_buffer = ModelStructure.name_buffer(m)
+        self.assertIn(id(m.ind[3]), name_buffer)
+        # Removing an object releases the name cached by the model
+        lbl.remove_obj(m.ind[3])
+        self.assertNotIn(id(m.ind[3]), name_buffer)
+        self.assertIs(ModelStructure.name_buffer(m), name_buffer)
+        lbl.remove_obj(m.ind[3])
+        self.assertEqual(lbl(m.ind[3]), 'ind(3)')
+
     def test_alphanumerictextlabeler(self):
         m = self.m
         lbl = AlphaNumericTextLabeler()
@@ -1,10 +1,14 @@
+import itertools
+
 import pyutilib.th as unittest
 
+from pyomo.core.expr.cnf_walker import tseitin_cnf
 from pyomo.core.expr.sympy_tools import sympy_available
 from pyomo.core.plugins.transform.logical_to_linear import update_boolean_vars_from_binary
 from pyomo.environ import (
     ConcreteModel, BooleanVar, LogicalConstraint, lor, TransformationFactory, RangeSet,
-    Var, Constraint, ComponentMap, value, BooleanSet, atleast, atmost, exactly)
+    Var, Constraint, ComponentMap, value, BooleanSet, atleast, atmost, exactly,
+    BooleanVarList, land, lnot, xor)
 from pyomo.gdp import Disjunct, Disjunction
 from pyomo.repn import generate_standard_repn
 
@@ -309,5 +313,90 @@ class TestLogicalToLinearBackmap(unittest.TestCase):
             update_boolean_vars_from_binary(m)
 
 
+class TestTseitinCNF(unittest.TestCase):
+    def _check_equisatisfiable(self, m, expr):
+        """Check that expr is True iff the CNF has a satisfying aux assignment"""
+        m.aux = BooleanVarList()
+        statements = tseitin_cnf(expr, m.aux)
+        orig_vars = list(m.Y.values())
+        aux_vars = list(m.aux.values())
+        for orig_vals in itertools.product((True, False), repeat=len(orig_vars)):
+            for v, val in zip(orig_vars, orig_vals):
+                v.value = val
+            satisfiable = False
+            for aux_vals in itertools.product((True, False), repeat=len(aux_vars)):
+                for v, val in zip(aux_vars, aux_vals):
+                    v.value = val
+                if all(value(s) for s in statements):
+                    satisfiable = True
+                    break
+            self.assertEqual(bool(value(expr)), satisfiable)
+        return statements
+
+    def test_equisatisfiable(self):
+        m = _generate_boolean_model(4)
+        Y = m.Y
+        for expr in (
+                lor(land(Y[1], Y[2]), land(Y[3], Y[4])),
+                lnot(lor(Y[1], Y[2].implies(Y[3]))),
+                Y[1].equivalent_to(lor(Y[2], lnot(Y[3]))),
+                lor(Y[1], Y[2]).equivalent_to(land(Y[3], Y[4])),
+                xor(Y[1], land(Y[2], Y[3])).implies(Y[4]),
+                lnot(Y[1].equivalent_to(xor(Y[2], Y[3]))),
+        ):
+            m.del_component('aux')
+            m.del_component('aux_index')
+            self._check_equisatisfiable(m, expr)
+
+    def test_no_aux_for_clauses(self):
+        m = _generate_boolean_model(4)
+        statements = self._check_equisatisfiable(
+            m, land(m.Y[1].implies(lor(m.Y[2], lnot(m.Y[3]))), m.Y[4]))
+        self.assertEqual(len(m.aux), 0)
+        self.assertEqual(len(statements), 2)
+
+    def test_linear_growth(self):
+        # Distributing this DNF into CNF produces 2**n clauses
+        n = 12
+        m = _generate_boolean_model(2 * n)
+        m.p = LogicalConstraint(expr=lor(
+            *[land(m.Y[2 * i - 1], m.Y[2 * i]) for i in range(1, n + 1)]))
+        TransformationFactory('core.logical_to_linear').apply_to(m)
+        self.assertEqual(len(m.logic_to_linear.augmented_vars), n)
+        self.assertEqual(len(m.logic_to_linear.transformed_constraints),
+                         3 * n + 1)
+
+    def test_shared_subexpression(self):
+        m = _generate_boolean_model(3)
+        e = land(m.Y[1], m.Y[2])
+        m.p = LogicalConstraint(expr=lor(e, m.Y[3]))
+        m.q = LogicalConstraint(expr=lor(e, lnot(m.Y[3])))
+        TransformationFactory('core.logical_to_linear').apply_to(m)
+        self.assertEqual(len(m.logic_to_linear.augmented_vars), 1)
+
+    def test_constants(self):
+        m = _generate_boolean_model(2)
+        m.p = LogicalConstraint(expr=xor(m.Y[1], True))
+        m.q = LogicalConstraint(expr=m.Y[2].implies(land(m.Y[1], True)))
+        TransformationFactory('core.logical_to_linear').apply_to(m)
+        self.assertIsNone(m.logic_to_linear.component('augmented_vars'))
+        _constrs_contained_within(
+            self, [
+                (1, 1 - m.Y[1].get_associated_binary(), 1),
+                (1, 1 - m.Y[2].get_associated_binary()
+                 + m.Y[1].get_associated_binary(), None),
+            ], m.logic_to_linear.transformed_constraints)
+
+    @unittest.skipUnless(sympy_available, "Sympy not available")
+    def test_sympy_method(self):
+        m = _generate_boolean_model(4)
+        m.p = LogicalConstraint(expr=lor(land(m.Y[1], m.Y[2]),
+                                         land(m.Y[3], m.Y[4])))
+        TransformationFactory('core.logical_to_linear').apply_to(
+            m, cnf_method='sympy')
+        self.assertIsNone(m.logic_to_linear.component('augmented_vars'))
+        self.assertEqual(len(m.logic_to_linear.transformed_constraints), 4)
+
+
 if __name__ == "__main__":
     unittest.main()
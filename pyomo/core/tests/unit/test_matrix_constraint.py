@@ -9,9 +9,14 @@
 #  ___________________________________________________________________________
 
 import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
 import pyomo.environ as pyo
 
+from pyomo.common.dependencies import (
+    numpy as np, numpy_available, scipy, scipy_available,
+)
 from pyomo.core.base.matrix_constraint import MatrixConstraint
+from pyomo.repn.util import canonical_form_data_objects
 
 
 def _create_variable_list(size, **kwds):
@@ -96,5 +101,117 @@ class TestMatrixConstraint(unittest.TestCase):
             self.assertEqual(c.upper, 1)
             self.assertEqual(c.equality, True)
 
+    @unittest.skipIf(not scipy_available, "scipy is not available")
+    def test_init_sparse(self):
+        m = pyo.ConcreteModel()
+        m.v = _create_variable_list(3, initialize=2)
+        A = scipy.sparse.csr_matrix([[1.0, -1.0, 0.0],
+                                     [0.0, 2.0, 3.0]])
+        m.c = MatrixConstraint(A, lb=[None, 1], ub=0, x=list(m.v.values()))
+        self.assertIs(pyo.MatrixConstraint, MatrixConstraint)
+        self.assertEqual(len(m.c), 2)
+        self.assertEqual(m.c[0].lower, None)
+        self.assertEqual(m.c[0].upper, 0)
+        self.assertEqual(m.c[1].lower, 1)
+        self.assertEqual(m.c[1].upper, 0)
+        self.assertEqual(m.c[0](), 0)
+        self.assertEqual(m.c[1](), 10)
+        self.assertEqual(list(m.c.lb), [-float('inf'), 1])
+        self.assertEqual(list(m.c.ub), [0, 0])
+        self.assertEqual((m.c.A != A).nnz, 0)
+        self.assertEqual(m.c.x, tuple(m.v.values()))
+        # The matrix is copied
+        A[0, 0] = 5
+        self.assertEqual(m.c[0](), 0)
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_init_dense(self):
+        m = pyo.ConcreteModel()
+        m.v = _create_variable_list(3, initialize=1)
+        A = np.array([[0.0, 1.0, 2.0],
+                      [0.0, 0.0, 0.0],
+                      [4.0, 0.0, 0.0]])
+        m.c = MatrixConstraint(A, lb=np.array([0, -np.inf, 1]),
+                               ub=np.array([0, np.inf, np.inf]),
+                               x=list(m.v.values()))
+        self.assertEqual(len(m.c), 3)
+        self.assertEqual([c() for c in m.c.values()], [3, 0, 4])
+        self.assertEqual([c.equality for c in m.c.values()],
+                         [True, False, False])
+        self.assertEqual([c.has_lb() for c in m.c.values()],
+                         [True, False, True])
+        self.assertEqual([c.has_ub() for c in m.c.values()],
+                         [True, False, False])
+        self.assertEqual(str(m.c[0].body), "v[1] + 2.0*v[2]")
+
+        with self.assertRaisesRegexp(ValueError, "3 columns, but 2"):
+            MatrixConstraint(A, ub=0, x=[m.v[0], m.v[1]])
+        with self.assertRaisesRegexp(ValueError, "shape \\(2,\\)"):
+            MatrixConstraint(A, ub=[0, 0], x=list(m.v.values()))
+        with self.assertRaisesRegexp(ValueError, "requires the list"):
+            MatrixConstraint(A, ub=0)
+        with self.assertRaisesRegexp(ValueError, "2-dimensional"):
+            MatrixConstraint(A[0], ub=0, x=list(m.v.values()))
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_canonical_forms(self):
+        m = pyo.ConcreteModel()
+        m.v = _create_variable_list(4, initialize=3)
+        m.v[1].fix(2)
+        A = np.array([[1.0, 2.0, 0.0, 0.0],
+                      [0.0, 5.0, 0.0, 0.0],
+                      [0.0, 0.0, 0.0, 0.0],
+                      [0.0, 1.0, 6.0, 7.0]])
+        m.c = MatrixConstraint(A, ub=10, x=list(m.v.values()))
+        m.d = pyo.Constraint(expr=m.v[0] <= 1)
+        repns = m.c.canonical_forms()
+        self.assertEqual(len(repns), 4)
+        for i, c in m.c.items():
+            ref = c.canonical_form()
+            repn = repns[i]
+            self.assertEqual(repn.linear_vars, ref.linear_vars)
+            self.assertEqual(repn.linear_coefs, ref.linear_coefs)
+            self.assertEqual(repn.constant, ref.constant)
+        self.assertEqual(repns[0].linear_vars, (m.v[0],))
+        self.assertEqual(repns[0].constant, 4)
+        self.assertTrue(repns[1].is_fixed())
+        self.assertEqual(repns[1].constant, 10)
+        self.assertEqual(repns[3].linear_coefs, (6, 7))
+
+        data = list(canonical_form_data_objects(m))
+        self.assertEqual([c for c, repn in data],
+                         list(m.c.values()) + [m.d])
+        self.assertEqual([repn.linear_coefs for c, repn in data[:4]],
+                         [(1,), (), (), (6, 7)])
+        # The body of m.d is not a linear canonical form
+        self.assertIsNone(data[4][1])
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_write_lp(self):
+        def _write(m):
+            fname = TempfileManager.create_tempfile(suffix='.lp')
+            m.write(fname, io_options={'symbolic_solver_labels': True})
+            with open(fname) as FILE:
+                return FILE.read()
+
+        ref = pyo.ConcreteModel()
+        ref.v = _create_variable_list(3, bounds=(0, 1))
+        ref.c = pyo.Constraint([0, 1])
+        ref.c[0] = ref.v[0] - ref.v[1] <= 0
+        ref.c[1] = pyo.inequality(1, 2*ref.v[1] + 3*ref.v[2], 4)
+        ref.o = pyo.Objective(expr=sum(ref.v.values()))
+
+        m = pyo.ConcreteModel()
+        m.v = _create_variable_list(3, bounds=(0, 1))
+        m.c = MatrixConstraint(np.array([[1.0, -1.0, 0.0],
+                                         [0.0, 2.0, 3.0]]),
+                               lb=[None, 1], ub=[0, 4],
+                               x=list(m.v.values()))
+        m.o = pyo.Objective(expr=sum(m.v.values()))
+        try:
+            self.assertEqual(_write(m), _write(ref))
+        finally:
+            TempfileManager.clear_tempfiles()
+
 if __name__ == "__main__":
     unittest.main()
@@ -19,6 +19,7 @@
 #
 
 import math
+import pickle
 import os
 import sys
 
@@ -26,8 +27,10 @@ from pyutilib.services import TempfileManager
 import pyutilib.th as unittest
 
 from pyomo.environ import Set, RangeSet, Param, ConcreteModel, AbstractModel, Constraint, Var, NonNegativeIntegers, Integers, NonNegativeReals, Boolean, Reals, Any, display, value, set_options, sin, cos, tan, log, log10, exp, sqrt, ceil, floor, asin, acos, atan, sinh, cosh, tanh, asinh, acosh, atanh
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.dependencies import pandas as pd, pandas_available
 from pyomo.common.log import LoggingIntercept
-from pyomo.core.base.param import _NotValid, _ParamData 
+from pyomo.core.base.param import _NotValid, _ParamData, _DenseParamValues
 
 from six import iteritems, itervalues, StringIO
 
@@ -2018,5 +2021,171 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
 assignTestsIndexedParamTests(MiscIndexedParamBehaviorTests,instrinsic_test_list)
 
 
+@unittest.skipIf(not numpy_available, "NumPy is not available")
+class TestParamBulkInit(unittest.TestCase):
+
+    def test_numpy_1d(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.p = Param(m.I, initialize=np.array([1.5, 2.5, 3.5]))
+        self.assertIs(type(m.p._data), _DenseParamValues)
+        self.assertEqual(len(m.p), 3)
+        self.assertEqual(list(m.p.items()), [(3, 1.5), (1, 2.5), (2, 3.5)])
+        self.assertIs(type(m.p[1]), float)
+        self.assertEqual(m.p.extract_values(), {3: 1.5, 1: 2.5, 2: 3.5})
+        self.assertIn(2, m.p)
+        self.assertNotIn(4, m.p)
+
+        # The array is copied
+        a = np.array([1, 2, 3])
+        m.q = Param(m.I, initialize=a, within=NonNegativeIntegers)
+        a[0] = 10
+        self.assertEqual(m.q[3], 1)
+        self.assertIs(type(m.q[3]), int)
+
+    def test_numpy_multidimensional(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.J = Set(initialize=['a', 'b'])
+        m.p = Param(m.I, m.J, initialize=np.arange(6).reshape(3, 2))
+        self.assertEqual(m.p[1, 'a'], 0)
+        self.assertEqual(m.p[1, 'b'], 1)
+        self.assertEqual(m.p[3, 'b'], 5)
+
+        m.q = Param(m.I, m.J, initialize=np.arange(6))
+        self.assertEqual(m.q[2, 'a'], 2)
+
+        with self.assertRaisesRegexp(
+                ValueError, r"the array shape \(2, 3\) does not match the "
+                r"shape \(3, 2\) of the index set"):
+            m.r = Param(m.I, m.J, initialize=np.arange(6).reshape(2, 3))
+        with self.assertRaisesRegexp(
+                ValueError, r"the array shape \(4,\) does not match"):
+            m.s = Param(m.I, initialize=np.arange(4))
+
+    def test_numpy_unordered_index(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2], ordered=False)
+        with self.assertRaisesRegexp(
+                ValueError, "the index set I is not ordered"):
+            m.p = Param(m.I, initialize=np.array([1, 2]))
+
+    def test_numpy_scalar(self):
+        m = ConcreteModel()
+        m.p = Param(initialize=np.array(2.5))
+        self.assertEqual(m.p.value, 2.5)
+        self.assertIs(type(m.p.value), float)
+        with self.assertRaisesRegexp(
+                ValueError, "Cannot initialize scalar Param q from a "
+                "ndarray with 1 dimensions"):
+            m.q = Param(initialize=np.array([2.5]))
+
+    def test_numpy_domain(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        m.p = Param(m.I, initialize=np.array([0, 1, 1, 0]), within=Boolean)
+        self.assertEqual(m.p[2], 1)
+        with self.assertRaisesRegexp(
+                ValueError, r"Invalid parameter value: q\[3\] = '-1.0'"):
+            m.q = Param(m.I, initialize=np.array([0., 1, -1, 2]),
+                        within=NonNegativeReals)
+        with self.assertRaisesRegexp(
+                ValueError, r"Invalid parameter value: r\[2\] = '0.5'"):
+            m.r = Param(m.I, initialize=np.array([0., 0.5, 1, 2]),
+                        within=Integers)
+        m.A = Set(initialize=['a', 'b'])
+        with self.assertRaisesRegexp(
+                ValueError, r"Invalid parameter value: s\[4\] = 'c'"):
+            m.s = Param(m.I, initialize=np.array(['a', 'b', 'a', 'c']),
+                        within=m.A)
+
+    def test_numpy_validate(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.p = Param(m.I, initialize=np.array([1, 2, 3]),
+                    validate=lambda m, v, i: v == i)
+        self.assertEqual(m.p[3], 3)
+        with self.assertRaisesRegexp(
+                ValueError, r"q\[2\] = '3'.*\n.*failed parameter validation"):
+            m.q = Param(m.I, initialize=np.array([1, 3, 3]),
+                        validate=lambda m, v, i: v == i)
+
+    def test_numpy_mutable(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.p = Param(m.I, initialize=np.array([1., 2, 3]), mutable=True)
+        self.assertIs(type(m.p._data), dict)
+        self.assertIs(type(m.p[1]), _ParamData)
+        self.assertIs(type(m.p[1].value), float)
+        m.p[1] = 5
+        self.assertEqual(value(m.p[1]), 5)
+
+    def test_dense_storage_updates(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.p = Param(m.I, initialize=np.array([1., 2, 3]), default=0)
+        m.p.construct()
+        _data = m.p._data
+        # Setting values (as construct() does for the model data)
+        _data[1] = 10.
+        _data[2] = 'a'
+        self.assertEqual(m.p[1], 10.)
+        self.assertEqual(m.p[2], 'a')
+        self.assertEqual(sorted(_data.keys()), [1, 2, 3])
+        del _data[2]
+        del _data[3]
+        self.assertEqual(len(_data), 1)
+        self.assertEqual(list(_data.items()), [(1, 10.)])
+        self.assertEqual(m.p[3], 0)
+        _data[4] = 4.
+        self.assertEqual(list(_data), [1, 4])
+
+        m.q = Param(m.I, initialize=np.array([1, 2, 3]))
+        i = m.clone()
+        self.assertIs(type(i.q._data), _DenseParamValues)
+        self.assertEqual(list(i.q.items()), [(1, 1), (2, 2), (3, 3)])
+        i = pickle.loads(pickle.dumps(m))
+        self.assertEqual(list(i.q.items()), [(1, 1), (2, 2), (3, 3)])
+        self.assertEqual(i.p[1], 10.)
+
+    @unittest.skipIf(not pandas_available, "pandas is not available")
+    def test_pandas_series(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2])
+        m.J = Set(initialize=['a', 'b'])
+        s = pd.Series([1., 2., 3.], index=pd.MultiIndex.from_tuples(
+            [(1, 'a'), (2, 'a'), (2, 'b')]))
+        m.p = Param(m.I, m.J, initialize=s, default=0)
+        self.assertIs(type(m.p._data), _DenseParamValues)
+        self.assertEqual(m.p.sparse_keys(), [(1, 'a'), (2, 'a'), (2, 'b')])
+        self.assertEqual(m.p[2, 'b'], 3.)
+        self.assertEqual(m.p[1, 'b'], 0)
+
+        m.q = Param(m.I, initialize=pd.Series([5, 6], index=[2, 1]))
+        self.assertEqual(m.q.extract_values(), {1: 6, 2: 5})
+
+        with self.assertRaisesRegexp(
+                KeyError, "Index '3' is not valid for indexed component 'r'"):
+            m.r = Param(m.I, initialize=pd.Series([5, 6], index=[1, 3]))
+        with self.assertRaisesRegexp(
+                ValueError, "duplicate index entries"):
+            m.s = Param(m.I, initialize=pd.Series([5, 6], index=[1, 1]))
+
+    @unittest.skipIf(not pandas_available, "pandas is not available")
+    def test_pandas_dataframe(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2])
+        m.J = Set(initialize=['a', 'b'])
+        df = pd.DataFrame([[1., 2.], [3., float('nan')]],
+                          index=[1, 2], columns=['a', 'b'])
+        m.p = Param(m.I, m.J, initialize=df, mutable=True)
+        self.assertEqual(
+            {k: value(v) for k, v in m.p.items()},
+            {(1, 'a'): 1., (1, 'b'): 2., (2, 'a'): 3.})
+
+        m.q = Param(m.I, initialize=df[['a']], within=NonNegativeIntegers)
+        self.assertEqual(m.q.extract_values(), {1: 1., 2: 3.})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -16,7 +16,11 @@ from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
 import pyutilib.th as unittest
+from pyutilib.misc.redirect_io import capture_output
 
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.core.base import piecewise
+from pyomo.core.expr.numeric_expr import LinearExpression
 from pyomo.environ import AbstractModel, ConcreteModel, Set, Var, Piecewise, Constraint 
 
 class TestMiscPiecewise(unittest.TestCase):
@@ -136,6 +140,73 @@ class TestMiscPiecewise(unittest.TestCase):
         model.con = Piecewise(*args,**keywords)
 
 
+@unittest.skipIf(not numpy_available, "NumPy is not available")
+class TestVectorizedPiecewise(unittest.TestCase):
+
+    def _rows(self, pw):
+        return [(str(c.lower), str(c.body), str(c.upper))
+                for b in pw.values()
+                for c in b.component_data_objects(Constraint)]
+
+    def _build(self, repn, pw_pts, f_rule):
+        model = ConcreteModel()
+        model.s = Set(initialize=[1, 2])
+        model.x = Var(model.s, bounds=(0, 64))
+        model.y = Var(model.s)
+        model.c = Piecewise(
+            model.s, model.y, model.x, pw_pts=pw_pts, pw_repn=repn,
+            pw_constr_type='EQ', f_rule=f_rule)
+        return model
+
+    def test_numpy_breakpoints(self):
+        pts = [float(i) for i in range(65)]
+        for repn in ('SOS2', 'CC', 'DCC', 'DLOG', 'LOG', 'MC', 'INC'):
+            ref = self._build(repn, pts, [(x - 8)**2 for x in pts])
+            model = self._build(repn, np.array(pts), {
+                i: (np.array(pts) - 8)**2 for i in (1, 2)})
+            self.assertEqual(self._rows(ref.c), self._rows(model.c))
+            self.assertEqual(model.c[1](3.5), ref.c[1](3.5))
+
+    def test_linear_rows(self):
+        model = ConcreteModel()
+        model.x = Var(bounds=(0, 4))
+        model.y = Var()
+        model.c = Piecewise(model.y, model.x, pw_pts=[0, 1, 2, 3, 4],
+                            pw_constr_type='EQ',
+                            f_rule=lambda m, x: x**3)
+        for c in model.c.SOS2_constraint.values():
+            self.assertIs(type(c.body), LinearExpression)
+        # zero coefficients are not included in the rows
+        self.assertEqual(
+            [v.name for v in model.c.SOS2_constraint[1].body.linear_vars],
+            ['x', 'c.SOS2_y[1]', 'c.SOS2_y[2]',
+             'c.SOS2_y[3]', 'c.SOS2_y[4]'])
+
+    def test_vectorized_characterization(self):
+        x = [0, 1, 2, 2, 3] + list(range(4, 39))
+        cases = [
+            [float(i)**2 for i in range(40)],
+            [-float(i)**2 for i in range(40)],
+            [float(i) for i in range(40)],
+            [float(i % 3) for i in range(40)],
+        ]
+        tmp = piecewise._VECTORIZE_MIN_POINTS
+        try:
+            for pts in (list(range(40)), x):
+                for vals in cases:
+                    piecewise._VECTORIZE_MIN_POINTS = 10**9
+                    with capture_output() as OUT:
+                        ref = piecewise._characterize_function(
+                            'c', 1e-8, vals, None, pts)
+                    piecewise._VECTORIZE_MIN_POINTS = 2
+                    with capture_output() as OUT2:
+                        ans = piecewise._characterize_function(
+                            'c', 1e-8, np.array(vals), None, np.array(pts))
+                    self.assertEqual(ref, ans)
+                    self.assertEqual(OUT.getvalue(), OUT2.getvalue())
+        finally:
+            piecewise._VECTORIZE_MIN_POINTS = tmp
+
 class TestInvalidPiecewise(unittest.TestCase):
 
 
@@ -22,6 +22,7 @@ from pyomo.environ import (
     ConcreteModel, Block, Var, Set, RangeSet, Param, value,
 )
 from pyomo.common.collections import OrderedDict, ComponentSet
+from pyomo.core.base.component import ModelStructure
 from pyomo.core.base.var import IndexedVar
 from pyomo.core.base.set import SetProduct, UnorderedSetOf
 from pyomo.core.base.indexed_component import (
@@ -280,6 +281,117 @@ class TestReferenceDict(unittest.TestCase):
         self.assertFalse( hasattr(m.b[2,5], 'z') )
         self.assertEqual(len(list(x.value for x in itervalues(rd))), 2-1)
 
+    def test_compiled_lookup(self):
+        m = self.m
+
+        rd = _ReferenceDict(m.b[:,4].x[8,:])
+        self.assertIsNone(rd._compiled)
+        self.assertEqual(len(rd), 2*2)
+        compiled = rd._compiled
+        self.assertIsNotNone(compiled)
+        self.assertEqual(list(compiled.data),
+                         [(1,10), (1,11), (2,10), (2,11)])
+        # Lookups, len, and iteration reuse the compiled slice
+        self.assertIs(rd[1,11], m.b[1,4].x[8,11])
+        self.assertIs(rd[(2,10)], m.b[2,4].x[8,10])
+        self.assertIn((2,11), rd)
+        self.assertNotIn((3,11), rd)
+        self.assertEqual(list(iterkeys(rd)),
+                         [(1,10), (1,11), (2,10), (2,11)])
+        self.assertIs(rd._compiled, compiled)
+        # Structural changes force a recompile
+        del m.b[1,4].x[8,10]
+        self.assertEqual(len(rd), 3)
+        self.assertIsNot(rd._compiled, compiled)
+        self.assertNotIn((1,10), rd)
+
+    def test_compiled_sparse_data(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1,2])
+        m.b = Block(m.I)
+        for i in m.I:
+            m.b[i].x = Var(m.I, dense=False)
+        rd = _ReferenceDict(m.b[:].x[:])
+        self.assertEqual(len(rd), 0)
+        compiled = rd._compiled
+        # Data created through the reference is recorded...
+        self.assertIs(rd[1,2], m.b[1].x[2])
+        self.assertIs(rd._compiled, compiled)
+        self.assertEqual(len(rd), 1)
+        self.assertIs(rd._compiled, compiled)
+        # ... and data created directly is detected
+        m.b[2].x[1] = 5
+        self.assertEqual(len(rd), 2)
+        self.assertIsNot(rd._compiled, compiled)
+        self.assertEqual(list(iterkeys(rd)), [(1,2), (2,1)])
+        # Deleting data forces a recompile
+        del m.b[1].x[2]
+        self.assertEqual(list(iterkeys(rd)), [(2,1)])
+
+    def test_compile_failure_retried(self):
+        m = ConcreteModel()
+        m.b = Block([1,2])
+        m.b[1].x = Var()
+        rd = _ReferenceDict(m.b[:].x)
+        # b[2] has no x: the slice cannot be compiled...
+        self.assertIsNone(rd._get_compiled())
+        self.assertIsNone(rd._compiled)
+        structure = ModelStructure.get(m)
+        self.assertEqual(rd._compile_failed, (structure, structure.version))
+        self.assertIsNone(rd._get_compiled())
+        # ... until the model structure changes
+        m.b[2].x = Var()
+        self.assertEqual(len(rd), 2)
+        self.assertIsNotNone(rd._compiled)
+        self.assertIsNone(rd._compile_failed)
+
+    def test_compiled_slice_model_scope(self):
+        m = ConcreteModel()
+        m.b = Block([1,2])
+        for i in m.b:
+            m.b[i].x = Var([1,2])
+        rd = _ReferenceDict(m.b[:].x[:])
+        self.assertEqual(len(rd), 4)
+        compiled = rd._compiled
+        self.assertIs(compiled._structure, ModelStructure.get(m))
+        # Changes to other models do not invalidate the compiled slice
+        n = ConcreteModel()
+        n.x = Var([1,2], dense=False)
+        n.x[1] = 5
+        del n.x[1]
+        self.assertTrue(compiled.is_current())
+        self.assertEqual(len(rd), 4)
+        self.assertIs(rd._compiled, compiled)
+        # ... but adding data to this model does
+        m.y = Var([1,2], dense=False)
+        m.y[1] = 5
+        self.assertFalse(compiled.is_current())
+
+        # Copies of the model compile their own slices
+        m.r = Reference(m.b[:].x[:])
+        self.assertEqual(len(m.r), 4)
+        self.assertIsNotNone(m.r._data._compiled)
+        i = m.clone()
+        self.assertIsNone(i.r._data._compiled)
+        self.assertEqual(len(i.r), 4)
+        self.assertIs(i.r._data._compiled._structure, ModelStructure.get(i))
+        del i.b[1].x[1]
+        self.assertEqual(list(iterkeys(i.r)), [(1,2), (2,1), (2,2)])
+        self.assertEqual(len(m.r), 4)
+
+    def test_uncompiled_slices(self):
+        m = self.m
+        # Attribute values are not cached
+        rd = _ReferenceDict(m.b[:,4].x[8,:].value)
+        self.assertEqual(len(rd), 4)
+        self.assertIsNone(rd._get_compiled())
+        # Nor are slices that suppress lookup errors
+        rd = _ReferenceDict(m.b[:,:].z)
+        rd._slice.attribute_errors_generate_exceptions = False
+        self.assertEqual(len(rd), 4)
+        self.assertIsNone(rd._get_compiled())
+
+
 class TestReferenceSet(unittest.TestCase):
     def test_lookup_and_iter_dense_data(self):
         m = ConcreteModel()
@@ -4912,6 +4912,166 @@ I : Size=2, Index=I_index, Ordered=Insertion
         finally:
             normalize_index.flatten = _oldFlatten
 
+    @unittest.skipIf(not pandas_available, "pandas is not available")
+    def test_pandas_init(self):
+        index = pd.MultiIndex.from_product([[1, 2], ['a', 'b']])
+        s = pd.Series(range(4), index=index)
+        m = ConcreteModel()
+        m.I = Set(initialize=s)
+        self.assertEqual(list(m.I), [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')])
+        self.assertEqual(m.I.dimen, 2)
+        self.assertEqual(m.I.ord((2, 'a')), 3)
+        m.J = Set(initialize=s.to_frame(), within=PositiveIntegers*Any)
+        self.assertEqual(list(m.J), list(m.I))
+        m.K = Set(initialize=pd.Index([3, 1, 2]), ordered=Set.SortedOrder)
+        self.assertEqual(list(m.K), [1, 2, 3])
+        self.assertEqual(m.K.dimen, 1)
+        m.L = Set(initialize=pd.Index([3, 1, 2]), ordered=False)
+        self.assertEqual(sorted(m.L), [1, 2, 3])
+        m.M = Set(initialize=pd.Index([1, 2, 3, 4]),
+                  filter=lambda m, i: i % 2)
+        self.assertEqual(list(m.M), [1, 3])
+        m.N = Set(initialize=pd.Index(['a', 'b']), validate=lambda m, i: True)
+        self.assertEqual(list(m.N), ['a', 'b'])
+
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.core'):
+            m.O = Set(initialize=pd.Index([1, 2, 1]))
+        self.assertEqual(list(m.O), [1, 2])
+        self.assertIn("Element 1 already exists in Set O; no action taken",
+                      output.getvalue())
+
+        with self.assertRaisesRegexp(
+                ValueError, "Cannot add value -1 to Set P.\n"
+                "\tThe value is not in the domain NonNegativeIntegers"):
+            m.P = Set(initialize=pd.Index([1, -1]), within=NonNegativeIntegers)
+        with self.assertRaisesRegexp(
+                ValueError, r"Cannot add value \(3, 'a'\) to Set Q.*\n.*"
+                r"not in the domain I"):
+            m.Q = Set(initialize=pd.Index([(1, 'a'), (3, 'a')]), within=m.I)
+        with self.assertRaisesRegexp(
+                ValueError, "The value=\\(1, 'a'\\) has dimension 2 and is "
+                "not valid for Set R which has dimen=3"):
+            m.R = Set(initialize=s, dimen=3)
+        with self.assertRaisesRegexp(
+                ValueError, "The value=b violates the validation rule"):
+            m.S = Set(initialize=pd.Index(['a', 'b']),
+                      validate=lambda m, i: i == 'a')
+
+    def test_bulk_update(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=(i % 3 for i in range(5)),
+                  ordered=Set.SortedOrder)
+        self.assertEqual(list(m.I), [0, 1, 2])
+        m.I.update(i for i in (5, 4, 1, 4))
+        self.assertEqual(list(m.I), [0, 1, 2, 4, 5])
+        self.assertEqual(m.I.ord(4), 4)
+
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.core'):
+            m.J = Set(initialize=[(1, 'a'), (2, 'b'), (1, 'a'), ((2,), 'c')],
+                      within=NonNegativeIntegers*Any)
+        self.assertEqual(list(m.J), [(1, 'a'), (2, 'b'), (2, 'c')])
+        self.assertEqual(
+            output.getvalue(),
+            "Element (1, 'a') already exists in Set J; no action taken\n")
+
+        # Nothing is added if any value fails the checks
+        with self.assertRaisesRegexp(
+                ValueError, r"Cannot add value \(-1, 'c'\) to Set J.*\n"
+                r"\tThe value is not in the domain "):
+            m.J.update([(3, 'c'), (-1, 'c')])
+        with self.assertRaisesRegexp(
+                ValueError, "The value=\\(3, 'c', 1\\) has dimension 3 and "
+                "is not valid for Set J which has dimen=2"):
+            m.J.update([(3, 'c'), (3, 'c', 1)])
+        self.assertEqual(list(m.J), [(1, 'a'), (2, 'b'), (2, 'c')])
+
+        m.K = Set(initialize=[1, 2, 3, 4], filter=lambda m, i: i % 2)
+        m.K.update([5, 6, 1])
+        self.assertEqual(list(m.K), [1, 3, 5])
+        m.K.set_value(range(10, 4, -1))
+        self.assertEqual(list(m.K), [9, 7, 5])
+
+        # Members are added as they are accepted by the callbacks
+        with self.assertRaisesRegexp(
+                ValueError, "The value=2 violates the validation rule"):
+            m.L = Set(initialize=[1, Set.End, 3], validate=lambda m, i: i < 2)
+            m.L.update([0, 2])
+        self.assertEqual(list(m.L), [1, 0])
+
+        # Callbacks see the members that were already accepted
+        m.T = Set(initialize=[1, 2, 3], filter=lambda m, x: len(m.T) < 2)
+        self.assertEqual(list(m.T), [1, 2])
+        m.U = Set(initialize=[1, 2, 3],
+                  validate=lambda m, x: len(m.U) == x - 1)
+        self.assertEqual(list(m.U), [1, 2, 3])
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_numpy_init(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=np.array([3, 1, 2]), ordered=Set.SortedOrder)
+        self.assertEqual(list(m.I), [1, 2, 3])
+        self.assertIs(type(m.I.first()), int)
+        m.J = Set(initialize=np.array([[1, 2], [3, 4]]),
+                  within=NonNegativeIntegers*NonNegativeIntegers)
+        self.assertEqual(list(m.J), [(1, 2), (3, 4)])
+        self.assertEqual(m.J.dimen, 2)
+        m.K = Set(initialize=np.array([1, 2, 3, 4]), dimen=2)
+        self.assertEqual(list(m.K), [(1, 2), (3, 4)])
+        m.L = Set(initialize=np.array([[1], [2]]))
+        self.assertEqual(list(m.L), [1, 2])
+        self.assertEqual(m.L.dimen, 1)
+        m.M = Set(initialize=np.array(['a', 'b']))
+        self.assertEqual(list(m.M), ['a', 'b'])
+        m.J.update(np.array([[3, 4], [5, 6]]))
+        self.assertEqual(list(m.J), [(1, 2), (3, 4), (5, 6)])
+
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.core'):
+            m.N = Set(initialize=np.array([[1, 2], [1, 2]]))
+        self.assertEqual(list(m.N), [(1, 2)])
+        self.assertIn("Element (1, 2) already exists in Set N",
+                      output.getvalue())
+
+        with self.assertRaisesRegexp(
+                ValueError, r"Cannot add value \(1, -2\) to Set O.*\n"
+                r"\tThe value is not in the domain "):
+            m.O = Set(initialize=np.array([[1, 2], [1, -2]]),
+                      within=NonNegativeIntegers*NonNegativeIntegers)
+        with self.assertRaisesRegexp(
+                ValueError, "length 3 is not a multiple of dimen=2"):
+            m.P = Set(initialize=np.array([1, 2, 3]), dimen=2)
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_numpy_init_callbacks(self):
+        # Filter and validate callbacks are passed Python members
+        m = ConcreteModel()
+        seen = []
+        def _filter(m, i, j):
+            seen.append((i, j))
+            return i < 3
+        m.I = Set(initialize=np.array([[1, 2], [3, 4]]), filter=_filter)
+        self.assertEqual(list(m.I), [(1, 2)])
+        self.assertEqual([tuple(type(x) for x in s) for s in seen],
+                         [(int, int), (int, int)])
+        m.J = Set(initialize=np.array([3, 1, 2]), filter=lambda m, i: i > 1)
+        self.assertEqual(list(m.J), [3, 2])
+        self.assertIs(type(m.J.first()), int)
+        m.K = Set(initialize=np.array([1, 2, 3, 4]), dimen=2,
+                  filter=lambda m, i, j: j == 4)
+        self.assertEqual(list(m.K), [(3, 4)])
+        m.L = Set(initialize=np.array([[1], [2]]),
+                  validate=lambda m, i: type(i) is int)
+        self.assertEqual(list(m.L), [1, 2])
+        m.J.update(np.array([5, 0]))
+        self.assertEqual(list(m.J), [3, 2, 5])
+        self.assertIs(type(m.J.last()), int)
+        with self.assertRaisesRegexp(
+                ValueError, "The value=\\(3, 4\\) violates the validation"):
+            m.M = Set(initialize=np.array([[1, 2], [3, 4]]),
+                      validate=lambda m, i, j: i < 3)
+
 
 class TestAbstractSetAPI(unittest.TestCase):
     def test_SetData(self):
@@ -18,6 +18,7 @@ from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
 import pyutilib.th as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.core.base.suffix import \
     (active_export_suffix_generator,
      export_suffix_generator,
@@ -1543,5 +1544,156 @@ class TestSuffixPickleUsage(unittest.TestCase):
         self.assertEqual(inst.junk.get(model),None)
         self.assertEqual(inst.junk.get(inst),1.0)
 
+@unittest.skipIf(not numpy_available, "NumPy is not available")
+class TestSuffixDenseStorage(unittest.TestCase):
+
+    def _build_model(self):
+        model = ConcreteModel()
+        model.x = Var([1, 2, 3, 4])
+        model.y = Var()
+        model.junk = Suffix()
+        return model
+
+    def test_set_get_values(self):
+        model = self._build_model()
+        xs = list(model.x.values())
+        model.junk[model.y] = 10.0
+        model.junk[model.x[1]] = 5.0
+        model.junk.set_values(xs, [1, 2, 3, 4])
+        self.assertEqual(len(model.junk), 5)
+        self.assertEqual(model.junk[model.x[1]], 1.0)
+        self.assertIs(type(model.junk[model.x[1]]), float)
+        self.assertEqual(model.junk[model.y], 10.0)
+        self.assertEqual(
+            [id(c) for c in model.junk], [id(c) for c in xs + [model.y]])
+        self.assertEqual(
+            model.junk.get_values(xs).tolist(), [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(
+            model.junk.get_values([model.y, model.x[2]]).tolist(),
+            [10.0, 2.0])
+
+        # In-place update for the same order
+        model.junk.set_values(xs, np.arange(4) * 2.0)
+        self.assertEqual(model.junk[model.x[4]], 6.0)
+        # ... and broadcasting a single value
+        model.junk.set_values(xs, 7)
+        self.assertEqual(model.junk.get_values(xs).tolist(), [7.0] * 4)
+
+        with self.assertRaisesRegex(ValueError, "number of values"):
+            model.junk.set_values(xs, [1, 2])
+        with self.assertRaisesRegex(ValueError, "duplicate components"):
+            model.junk.set_values([model.y, model.y], [1, 2])
+
+    def test_mapping_interface(self):
+        model = self._build_model()
+        xs = list(model.x.values())
+        model.junk.set_values(xs, [1, 2, 3, 4])
+        model.junk[model.x[2]] = 20
+        self.assertEqual(model.junk[model.x[2]], 20.0)
+        del model.junk[model.x[3]]
+        self.assertNotIn(model.x[3], model.junk)
+        self.assertIsNone(model.junk.get(model.x[3]))
+        self.assertEqual(len(model.junk), 3)
+        with self.assertRaises(KeyError):
+            model.junk[model.x[3]]
+        with self.assertRaises(KeyError):
+            del model.junk[model.x[3]]
+        self.assertEqual(
+            model.junk.get_values(xs, default=-1).tolist(),
+            [1.0, 20.0, -1.0, 4.0])
+        model.junk[model.x[3]] = 30
+        self.assertEqual(model.junk[model.x[3]], 30.0)
+
+        # Values that do not fit in the array revert the suffix to the
+        # mapping storage
+        model.junk[model.x[1]] = 'a'
+        self.assertIsNone(model.junk._dense_order)
+        self.assertEqual(model.junk[model.x[1]], 'a')
+        self.assertEqual(model.junk[model.x[4]], 4.0)
+        self.assertEqual(len(model.junk), 4)
+
+        model.junk.set_values(xs, 0)
+        model.junk.clear()
+        self.assertEqual(len(model.junk), 0)
+        self.assertEqual(list(model.junk), [])
+
+    def test_bulk_items(self):
+        model = self._build_model()
+        xs = list(model.x.values())
+        model.junk[model.y] = 10.0
+        self.assertEqual(list(model.junk.bulk_items()),
+                         [(model.y, 10.0)])
+        model.junk.set_values(xs, [1, 2, 3, 4])
+        del model.junk[model.x[3]]
+        items = list(model.junk.bulk_items())
+        self.assertEqual(items, list(model.junk.items()))
+        self.assertEqual([(c.name, v) for c, v in items],
+                         [('x[1]', 1.0), ('x[2]', 2.0), ('x[4]', 4.0),
+                          ('y', 10.0)])
+        self.assertIs(type(items[0][1]), float)
+
+    def test_new_order(self):
+        model = self._build_model()
+        xs = list(model.x.values())
+        model.junk.set_values(xs, [1, 2, 3, 4])
+        model.junk.set_values([model.x[4], model.y], [40, 50])
+        self.assertEqual(len(model.junk), 5)
+        self.assertEqual(model.junk.get_values(xs).tolist(),
+                         [1.0, 2.0, 3.0, 40.0])
+        self.assertEqual(model.junk[model.y], 50.0)
+
+    def test_int_datatype(self):
+        model = self._build_model()
+        model.junk.set_datatype(Suffix.INT)
+        xs = list(model.x.values())
+        model.junk.set_values(xs, [1.0, 2, 3, 4])
+        self.assertIs(type(model.junk[model.x[1]]), int)
+        with self.assertRaisesRegex(ValueError, "non-integer"):
+            model.junk.set_values(xs, [1.5, 2, 3, 4])
+        model.junk.set_datatype(None)
+        model.junk.set_values(xs, ['a', None, 3, 4])
+        self.assertIsNone(model.junk[model.x[2]])
+
+    def test_missing_values(self):
+        model = self._build_model()
+        xs = list(model.x.values())
+        # None is not silently converted to NaN
+        with self.assertRaisesRegex(ValueError, "Suffix.FLOAT: cannot "
+                                    "store None"):
+            model.junk.set_values(xs, [1, None, 3, 4])
+        with self.assertRaisesRegex(ValueError, "cannot store None"):
+            model.junk.set_values(xs, None)
+        self.assertEqual(len(model.junk), 0)
+        model.junk.set_datatype(Suffix.INT)
+        with self.assertRaisesRegex(ValueError, "Suffix.INT: cannot "
+                                    "store None"):
+            model.junk.set_values(xs, [1, 2, 3, None])
+        # Missing entries are removed after the bulk assignment
+        model.junk.set_datatype(Suffix.FLOAT)
+        model.junk.set_values(xs, [1, 0, 3, 4])
+        del model.junk[model.x[2]]
+        self.assertNotIn(model.x[2], model.junk)
+        self.assertEqual(model.junk.get_values(xs, default=-1).tolist(),
+                         [1.0, -1.0, 3.0, 4.0])
+        # NaN values are stored as given
+        model.junk.set_values(xs, [1, float('nan'), 3, 4])
+        self.assertIn(model.x[2], model.junk)
+        self.assertTrue(np.isnan(model.junk[model.x[2]]))
+
+    def test_clone_pickle(self):
+        model = self._build_model()
+        xs = list(model.x.values())
+        model.junk.set_values(xs, [1, 2, 3, 4])
+        del model.junk[model.x[2]]
+        for inst in (model.clone(), pickle.loads(pickle.dumps(model))):
+            self.assertEqual(len(inst.junk), 3)
+            self.assertIsNone(inst.junk.get(model.x[1]))
+            self.assertEqual(inst.junk[inst.x[1]], 1.0)
+            self.assertNotIn(inst.x[2], inst.junk)
+            self.assertEqual(
+                inst.junk.get_values(list(inst.x.values())).tolist(),
+                [1.0, 0, 3.0, 4.0])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -41,6 +41,7 @@ class DataManagerFactoryClass(Factory):
         if _name is None:
             return self
         _name=str(_name)
+        self._import(_name)
         if _name in self._cls:
             dm = self._cls[_name](**kwds)
             if not dm.available():
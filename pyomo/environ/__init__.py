@@ -23,20 +23,23 @@ else:
 #
 _packages = [
     'pyomo.common',
-    'pyomo.core',
     'pyomo.opt',
-    'pyomo.dataportal',
-    'pyomo.duality',
     'pyomo.checker',
-    'pyomo.repn',
     'pyomo.pysp',
     'pyomo.neos',
     'pyomo.solvers',
+    'pyomo.scripting',
+]
+#
+# These packages define modeling components (that are registered with
+# the ModelComponentFactory when the package is imported).  All of
+# their plugins are registered lazily (see plugin_manifest).
+#
+_component_packages = [
     'pyomo.gdp',
     'pyomo.mpec',
     'pyomo.dae',
     'pyomo.bilevel',
-    'pyomo.scripting',
     'pyomo.network',
 ]
 #
@@ -46,22 +49,39 @@ _packages = [
 # packages are optional and/or under development.
 #
 _optional_packages = set([
-    'pyomo.contrib.example',
-    'pyomo.contrib.fme',
-    'pyomo.contrib.gdpbb',
-    'pyomo.contrib.gdpopt',
-    'pyomo.contrib.gdp_bounds',
     'pyomo.contrib.mcpp',
-    'pyomo.contrib.mindtpy',
-    'pyomo.contrib.multistart',
     'pyomo.contrib.petsc',
-    'pyomo.contrib.preprocessing',
     'pyomo.contrib.pynumero',
-    'pyomo.contrib.trustregion',
 ])
 
 
+def _register_lazy_plugins():
+    #
+    # Declare the solvers, writers, transformations and data managers
+    # from the plugin manifest.  The implementing modules are imported
+    # the first time the plugin is requested from the factory.
+    #
+    from pyomo.common.download import DownloadFactory
+    from pyomo.core.base.plugin import TransformationFactory
+    from pyomo.dataportal.factory import DataManagerFactory
+    from pyomo.opt.base.problem import WriterFactory
+    from pyomo.opt.base.solvers import SolverFactory
+    from pyomo.environ.plugin_manifest import plugins
+    factories = {
+        'solver': SolverFactory,
+        'writer': WriterFactory,
+        'transformation': TransformationFactory,
+        'data manager': DataManagerFactory,
+        'downloader': DownloadFactory,
+    }
+    for key, entries in plugins.items():
+        factory = factories[key]
+        for name, module, doc in entries:
+            factory.register_lazy(name, module, doc)
+
+
 def _import_packages():
+    _register_lazy_plugins()
     #
     # Import required packages
     #
@@ -84,6 +104,8 @@ def _import_packages():
 
         pkg = _sys.modules[pname]
         pkg.load()
+    for _package in _component_packages:
+        _do_import(_package)
     #
     # Import optional packages
     #
@@ -143,7 +165,8 @@ from pyomo.core import (numvalue, numeric_expr, boolean_value,
                              LogicalConstraintList, simple_objective_rule,
                              simple_objectivelist_rule, Objective,
                              ObjectiveList, Connector, SOSConstraint,
-                             Piecewise, active_export_suffix_generator,
+                             Piecewise, MatrixConstraint,
+                             active_export_suffix_generator,
                              active_import_suffix_generator, Suffix, 
                              ExternalFunction, symbol_map_from_instance, 
                              Reference, Reals, PositiveReals, NonPositiveReals,
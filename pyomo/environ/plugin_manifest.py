@@ -0,0 +1,395 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Static manifest of the plugins that pyomo.environ registers lazily
+
+Importing the modules that implement all the solvers, problem writers,
+transformations and data managers makes ``import pyomo.environ``
+noticeably slower.  Instead, :py:mod:`pyomo.environ` declares the names
+listed here with the corresponding factories (see
+:py:meth:`pyomo.common.factory.Factory.register_lazy`), and the
+implementing module is only imported the first time a name is used.
+
+Each entry is a ``(name, module, doc)`` tuple, where ``module`` is the
+module that registers ``name`` with the factory when it is imported.
+When adding (or renaming) a plugin in one of these modules, the
+manifest must be updated accordingly (this is verified by
+pyomo/environ/tests/test_environ.py).
+"""
+
+plugins = {
+    'solver': (
+        ('_cbc_shell',
+         'pyomo.solvers.plugins.solvers.CBCplugin',
+         'Shell interface to the CBC LP/MIP solver'),
+        ('_cplex_shell',
+         'pyomo.solvers.plugins.solvers.CPLEX',
+         'Shell interface to the CPLEX LP/MIP solver'),
+        ('_gams_direct',
+         'pyomo.solvers.plugins.solvers.GAMS',
+         'Direct python interface to the GAMS modeling language'),
+        ('_gams_shell',
+         'pyomo.solvers.plugins.solvers.GAMS',
+         'Shell interface to the GAMS modeling language'),
+        ('_glpk_direct',
+         'pyomo.solvers.plugins.solvers.glpk_direct',
+         'Direct Python interface to the GLPK LP/MIP solver.'),
+        ('_glpk_shell',
+         'pyomo.solvers.plugins.solvers.GLPK',
+         'Shell interface to the GNU Linear Programming Kit'),
+        ('_glpk_shell_4_42',
+         'pyomo.solvers.plugins.solvers.GLPK_old',
+         'Shell interface to the GNU Linear Programming Kit (4.42-4.59)'),
+        ('_glpk_shell_old',
+         'pyomo.solvers.plugins.solvers.GLPK_old',
+         'Shell interface to the GNU Linear Programming Kit (before 4.42)'),
+        ('_gurobi_shell',
+         'pyomo.solvers.plugins.solvers.GUROBI',
+         'Shell interface to the GUROBI LP/MIP solver'),
+        ('_mock_asl',
+         'pyomo.solvers.plugins.solvers.ASL',
+         None),
+        ('_mock_cbc',
+         'pyomo.solvers.plugins.solvers.CBCplugin',
+         None),
+        ('_mock_cplex',
+         'pyomo.solvers.plugins.solvers.CPLEX',
+         None),
+        ('_mock_glpk',
+         'pyomo.solvers.plugins.solvers.GLPK_old',
+         None),
+        ('_mock_pico',
+         'pyomo.solvers.plugins.solvers.PICO',
+         None),
+        ('_mock_xpress',
+         'pyomo.solvers.plugins.solvers.XPRESS',
+         None),
+        ('_neos',
+         'pyomo.neos.plugins.NEOS',
+         'Interface for solvers hosted on NEOS'),
+        ('_pico_shell',
+         'pyomo.solvers.plugins.solvers.PICO',
+         'Shell interface to the PICO MIP solver'),
+        ('_xpress_shell',
+         'pyomo.solvers.plugins.solvers.XPRESS',
+         'Shell interface to the XPRESS LP/MIP solver'),
+        ('asl',
+         'pyomo.solvers.plugins.solvers.ASL',
+         'Interface for solvers using the AMPL Solver Library'),
+        ('baron',
+         'pyomo.solvers.plugins.solvers.BARON',
+         'The BARON MINLP solver'),
+        ('bilevel_blp_global',
+         'pyomo.bilevel.plugins.solver2',
+         'Global solver for continuous bilevel linear problems'),
+        ('bilevel_blp_local',
+         'pyomo.bilevel.plugins.solver3',
+         'Local solver for continuous bilevel linear problems'),
+        ('bilevel_bqp',
+         'pyomo.bilevel.plugins.solver4',
+         'Global solver for bilevel quadratic problems'),
+        ('bilevel_ld',
+         'pyomo.bilevel.plugins.solver1',
+         'Solver for bilevel problems using linear duality'),
+        ('cbc',
+         'pyomo.solvers.plugins.solvers.CBCplugin',
+         'The CBC LP/MIP solver'),
+        ('conopt',
+         'pyomo.solvers.plugins.solvers.CONOPT',
+         'The CONOPT NLP solver'),
+        ('contrib.gjh',
+         'pyomo.contrib.trustregion.plugins',
+         'Interface to the AMPL GJH "solver"'),
+        ('cplex',
+         'pyomo.solvers.plugins.solvers.CPLEX',
+         'The CPLEX LP/MIP solver'),
+        ('cplex_direct',
+         'pyomo.solvers.plugins.solvers.cplex_direct',
+         'Direct python interface to CPLEX'),
+        ('cplex_persistent',
+         'pyomo.solvers.plugins.solvers.cplex_persistent',
+         'Persistent python interface to CPLEX'),
+        ('gams',
+         'pyomo.solvers.plugins.solvers.GAMS',
+         'The GAMS modeling language'),
+        ('gdpbb',
+         'pyomo.contrib.gdpbb.GDPbb',
+         'Branch and Bound based GDP Solver'),
+        ('gdpopt',
+         'pyomo.contrib.gdpopt.GDPopt',
+         'The GDPopt decomposition-based Generalized Disjunctive Programming (GDP) solver'),
+        ('glpk',
+         'pyomo.solvers.plugins.solvers.GLPK',
+         'The GLPK LP/MIP solver'),
+        ('gurobi',
+         'pyomo.solvers.plugins.solvers.GUROBI',
+         'The GUROBI LP/MIP solver'),
+        ('gurobi_direct',
+         'pyomo.solvers.plugins.solvers.gurobi_direct',
+         'Direct python interface to Gurobi'),
+        ('gurobi_persistent',
+         'pyomo.solvers.plugins.solvers.gurobi_persistent',
+         'Persistent python interface to Gurobi'),
+        ('ipopt',
+         'pyomo.solvers.plugins.solvers.IPOPT',
+         'The Ipopt NLP solver'),
+        ('mindtpy',
+         'pyomo.contrib.mindtpy.MindtPy',
+         'MindtPy: Mixed-Integer Nonlinear Decomposition Toolbox in Pyomo'),
+        ('mosek',
+         'pyomo.solvers.plugins.solvers.mosek_direct',
+         'The MOSEK LP/QP/SOCP/MIP solver'),
+        ('mosek_direct',
+         'pyomo.solvers.plugins.solvers.mosek_direct',
+         'Direct python interface to MOSEK'),
+        ('mosek_persistent',
+         'pyomo.solvers.plugins.solvers.mosek_persistent',
+         'Persistent python interface to MOSEK.'),
+        ('mpec_minlp',
+         'pyomo.mpec.plugins.solver2',
+         'MPEC solver transforms to a MINLP'),
+        ('mpec_nlp',
+         'pyomo.mpec.plugins.solver1',
+         'MPEC solver that optimizes a nonlinear transformation'),
+        ('multistart',
+         'pyomo.contrib.multistart.multi',
+         'MultiStart solver for NLPs'),
+        ('path',
+         'pyomo.mpec.plugins.pathampl',
+         'Nonlinear MCP solver'),
+        ('pico',
+         'pyomo.solvers.plugins.solvers.PICO',
+         'The PICO LP/MIP solver'),
+        ('ps',
+         'pyomo.solvers.plugins.solvers.ps',
+         "Pyomo's simple pattern search optimizer"),
+        ('py',
+         'pyomo.solvers.plugins.solvers.pywrapper',
+         'Direct python solver interfaces'),
+        ('scip',
+         'pyomo.solvers.plugins.solvers.SCIPAMPL',
+         'The SCIP LP/MIP solver'),
+        ('trustregion',
+         'pyomo.contrib.trustregion.plugins',
+         'Trust region filter method for black box/glass box optimization'),
+        ('xpress',
+         'pyomo.solvers.plugins.solvers.XPRESS',
+         'The XPRESS LP/MIP solver'),
+        ('xpress_direct',
+         'pyomo.solvers.plugins.solvers.xpress_direct',
+         'Direct python interface to XPRESS'),
+        ('xpress_persistent',
+         'pyomo.solvers.plugins.solvers.xpress_persistent',
+         'Persistent python interface to Xpress'),
+    ),
+    'writer': (
+        ('bar',
+         'pyomo.repn.plugins.baron_writer',
+         'Generate the corresponding BARON BAR file.'),
+        ('cpxlp',
+         'pyomo.repn.plugins.cpxlp',
+         'Generate the corresponding CPLEX LP file'),
+        ('gams',
+         'pyomo.repn.plugins.gams_writer',
+         'Generate the corresponding GAMS file'),
+        ('lp',
+         'pyomo.repn.plugins.cpxlp',
+         'Generate the corresponding CPLEX LP file'),
+        ('mps',
+         'pyomo.repn.plugins.mps',
+         'Generate the corresponding MPS file'),
+        ('nl',
+         'pyomo.repn.plugins.ampl.ampl_',
+         'Generate the corresponding AMPL NL file.'),
+    ),
+    'transformation': (
+        ('bilevel.linear_dual',
+         'pyomo.bilevel.plugins.dual',
+         'Dualize a SubModel block'),
+        ('bilevel.linear_mpec',
+         'pyomo.bilevel.plugins.lcp',
+         'Generate a linear MPEC from the optimality conditions of the submodel'),
+        ('contrib.aggregate_vars',
+         'pyomo.contrib.preprocessing.plugins.var_aggregator',
+         'Aggregate model variables that are linked by equality constraints.'),
+        ('contrib.compute_disj_var_bounds',
+         'pyomo.contrib.gdp_bounds.compute_bounds',
+         'Compute disjunctive bounds in a given model.'),
+        ('contrib.constraints_to_var_bounds',
+         'pyomo.contrib.preprocessing.plugins.bounds_to_vars',
+         'Change constraints to be a bound on the variable.'),
+        ('contrib.deactivate_trivial_constraints',
+         'pyomo.contrib.preprocessing.plugins.deactivate_trivial_constraints',
+         'Deactivate trivial constraints.'),
+        ('contrib.detect_fixed_vars',
+         'pyomo.contrib.preprocessing.plugins.detect_fixed_vars',
+         'Detect variables that are de-facto fixed but not considered fixed.'),
+        ('contrib.example.xfrm',
+         'pyomo.contrib.example.plugins.ex_plugin',
+         'An example of a transformation in a pyomo.contrib package'),
+        ('contrib.fourier_motzkin_elimination',
+         'pyomo.contrib.fme.fourier_motzkin_elimination',
+         'Project out specified (continuous) variables from a linear model.'),
+        ('contrib.induced_linearity',
+         'pyomo.contrib.preprocessing.plugins.induced_linearity',
+         'Reformulate nonlinear constraints with induced linearity.'),
+        ('contrib.init_vars_midpoint',
+         'pyomo.contrib.preprocessing.plugins.init_vars',
+         'Initialize non-fixed variables to the midpoint of their bounds.'),
+        ('contrib.init_vars_zero',
+         'pyomo.contrib.preprocessing.plugins.init_vars',
+         'Initialize non-fixed variables to zero.'),
+        ('contrib.integer_to_binary',
+         'pyomo.contrib.preprocessing.plugins.int_to_binary',
+         'Reformulate integer variables into binary variables.'),
+        ('contrib.propagate_eq_var_bounds',
+         'pyomo.contrib.preprocessing.plugins.equality_propagate',
+         'Propagate variable bounds for equalities of type x = y.'),
+        ('contrib.propagate_fixed_vars',
+         'pyomo.contrib.preprocessing.plugins.equality_propagate',
+         'Propagate variable fixing for equalities of type x = y.'),
+        ('contrib.propagate_zero_sum',
+         'pyomo.contrib.preprocessing.plugins.zero_sum_propagator',
+         'Propagate fixed-to-zero for sums of only positive (or negative) vars.'),
+        ('contrib.remove_zero_terms',
+         'pyomo.contrib.preprocessing.plugins.remove_zero_terms',
+         'Remove terms 0 * var in constraints'),
+        ('contrib.strip_var_bounds',
+         'pyomo.contrib.preprocessing.plugins.strip_bounds',
+         'Strip bounds from varaibles.'),
+        ('core.add_slack_variables',
+         'pyomo.core.plugins.transform.add_slack_vars',
+         'Create a model where we add slack variables to every constraint and add new objective penalizing the sum of the slacks'),
+        ('core.expand_connectors',
+         'pyomo.core.plugins.transform.expand_connectors',
+         'Expand all connectors in the model to simple constraints'),
+        ('core.fix_discrete',
+         'pyomo.core.plugins.transform.discrete_vars',
+         '[DEPRECATED] Fix all integer variables to their current values'),
+        ('core.fix_integer_vars',
+         'pyomo.core.plugins.transform.discrete_vars',
+         'Fix all integer variables to their current values'),
+        ('core.logical_to_linear',
+         'pyomo.core.plugins.transform.logical_to_linear',
+         'Convert logic to linear constraints'),
+        ('core.nonnegative_vars',
+         'pyomo.core.plugins.transform.nonnegative_transform',
+         'Create an equivalent model in which all variables lie in the nonnegative orthant.'),
+        ('core.radix_linearization',
+         'pyomo.core.plugins.transform.radix_linearization',
+         'Linearize bilinear and quadratic terms through radix discretization (multiparametric disaggregation)'),
+        ('core.relax_discrete',
+         'pyomo.core.plugins.transform.discrete_vars',
+         '[DEPRECATED] Relax integer variables to continuous counterparts'),
+        ('core.relax_integer_vars',
+         'pyomo.core.plugins.transform.discrete_vars',
+         'Relax integer variables to continuous counterparts'),
+        ('core.relax_integrality',
+         'pyomo.core.plugins.transform.relax_integrality',
+         '[DEPRECATED] Create a model where integer variables are replaced with real variables.'),
+        ('core.scale_model',
+         'pyomo.core.plugins.transform.scaling',
+         'Scale model variables, constraints, and objectives.'),
+        ('core.tighten_constraints_from_vars',
+         'pyomo.contrib.preprocessing.plugins.constraint_tightener',
+         'Tightens upper and lower bound on linear constraints.'),
+        ('dae.collocation',
+         'pyomo.dae.plugins.colloc',
+         'Discretizes a DAE model using orthogonal collocation over finite elements transforming the model into an NLP.'),
+        ('dae.finite_difference',
+         'pyomo.dae.plugins.finitedifference',
+         'Discretizes a DAE model using a finite difference method transforming the model into an NLP.'),
+        ('duality.linear_dual',
+         'pyomo.duality.plugins',
+         'Dualize a linear model'),
+        ('gdp.bigm',
+         'pyomo.gdp.plugins.bigm',
+         'Relax disjunctive model using big-M terms.'),
+        ('gdp.bilinear',
+         'pyomo.gdp.plugins.bilinear',
+         'Creates a disjunctive model where bilinear terms are replaced with disjunctive expressions.'),
+        ('gdp.chull',
+         'pyomo.gdp.plugins.hull',
+         "Deprecated name for the hull reformulation. Please use 'gdp.hull'."),
+        ('gdp.cuttingplane',
+         'pyomo.gdp.plugins.cuttingplane',
+         'Relaxes a linear disjunctive model by adding cuts from convex hull to Big-M reformulation.'),
+        ('gdp.fix_disjuncts',
+         'pyomo.gdp.plugins.fix_disjuncts',
+         'Fix disjuncts to their current Boolean values.'),
+        ('gdp.hull',
+         'pyomo.gdp.plugins.hull',
+         'Relax disjunctive model by forming the hull reformulation.'),
+        ('gdp.reclassify',
+         'pyomo.gdp.plugins.gdp_var_mover',
+         'Reclassify Disjuncts to Blocks.'),
+        ('mpec.nl',
+         'pyomo.mpec.plugins.mpec4',
+         'Transform a MPEC into a form suitable for the NL writer'),
+        ('mpec.simple_disjunction',
+         'pyomo.mpec.plugins.mpec2',
+         'Disjunctive transformations of complementarity conditions when all variables are non-negative'),
+        ('mpec.simple_nonlinear',
+         'pyomo.mpec.plugins.mpec1',
+         'Nonlinear transformations of complementarity conditions when all variables are non-negative'),
+        ('mpec.standard_form',
+         'pyomo.mpec.plugins.mpec3',
+         'Standard reformulation of complementarity condition'),
+        ('network.expand_arcs',
+         'pyomo.network.plugins.expand_arcs',
+         'Expand all Arcs in the model to simple constraints'),
+    ),
+    'data manager': (
+        ('csv',
+         'pyomo.dataportal.plugins.csv_table',
+         'CSV file interface'),
+        ('dat',
+         'pyomo.dataportal.plugins.datacommands',
+         'Pyomo data command file interface'),
+        ('json',
+         'pyomo.dataportal.plugins.json_dict',
+         'JSON file interface'),
+        ('pymysql',
+         'pyomo.dataportal.plugins.db_table',
+         'pymysql database interface'),
+        ('pyodbc',
+         'pyomo.dataportal.plugins.db_table',
+         'pyodbc database interface'),
+        ('pypyodbc',
+         'pyomo.dataportal.plugins.db_table',
+         'pypyodbc database interface'),
+        ('sqlite3',
+         'pyomo.dataportal.plugins.db_table',
+         'sqlite3 database interface'),
+        ('tab',
+         'pyomo.dataportal.plugins.text',
+         'TAB file interface'),
+        ('xls',
+         'pyomo.dataportal.plugins.sheet',
+         'Excel XLS file interface'),
+        ('xlsm',
+         'pyomo.dataportal.plugins.sheet',
+         'Excel XLSM file interface'),
+        ('xlsx',
+         'pyomo.dataportal.plugins.sheet',
+         'Excel XLSX file interface'),
+        ('xml',
+         'pyomo.dataportal.plugins.xml_table',
+         'XML file interface'),
+        ('yaml',
+         'pyomo.dataportal.plugins.json_dict',
+         'YAML file interface'),
+    ),
+    'downloader': (
+        ('gjh',
+         'pyomo.contrib.trustregion.plugins',
+         None),
+    ),
+}
@@ -11,6 +11,7 @@
 # Unit Tests for pyomo.base.misc
 #
 
+import os
 import re
 import sys
 import subprocess
@@ -34,10 +35,21 @@ class ImportData(object):
         self.pyomo.update(other.pyomo)
         self.pyutilib.update(other.pyutilib)
 
+def subprocess_kwds():
+    # Run the child interpreters from the directory containing this
+    # pyomo package (and with that directory on the path), so they
+    # import the same pyomo as the test process
+    import pyomo
+    root = os.path.dirname(os.path.dirname(os.path.abspath(pyomo.__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [root] + [p for p in [env.get('PYTHONPATH')] if p])
+    return {'cwd': root, 'env': env}
+
 def collect_import_time(module):
         output = subprocess.check_output(
             [sys.executable, '-X', 'importtime', '-c', 'import %s' % (module,)],
-            stderr=subprocess.STDOUT)
+            stderr=subprocess.STDOUT, **subprocess_kwds())
         # Note: test only runs in PY3
         output = output.decode()
         line_re = re.compile(r'.*:\s*(\d+) \|\s*(\d+) \| ( *)([^ ]+)')
@@ -167,6 +179,89 @@ class TestPyomoEnviron(unittest.TestCase):
             diff, set(),
             "Unexpected module found in 5 slowest-loading TPL modules")
 
+    def test_lazy_plugins_not_imported(self):
+        # Importing pyomo.environ should only declare the plugins from
+        # the manifest, and not import the implementing modules
+        from pyomo.environ.plugin_manifest import plugins
+        modules = sorted(set(
+            module for entries in itervalues(plugins)
+            for name, module, doc in entries))
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import pyomo.environ, sys; '
+            'print("\\n".join(m for m in %r if m in sys.modules))'
+            % (modules,)], **subprocess_kwds())
+        self.assertEqual(output.decode().strip(), '')
+
+    def test_plugin_manifest(self):
+        import importlib
+        import pyomo.environ as pyo
+        from pyomo.dataportal.factory import DataManagerFactory
+        from pyomo.common.download import DownloadFactory
+        from pyomo.opt.base.problem import WriterFactory
+        from pyomo.environ.plugin_manifest import plugins
+        factories = {
+            'solver': pyo.SolverFactory,
+            'writer': WriterFactory,
+            'transformation': pyo.TransformationFactory,
+            'data manager': DataManagerFactory,
+            'downloader': DownloadFactory,
+        }
+        self.assertEqual(sorted(plugins), sorted(factories))
+        modules = set()
+        for key, entries in iteritems(plugins):
+            factory = factories[key]
+            for name, module, doc in entries:
+                importlib.import_module(module)
+                modules.add(module)
+                self.assertNotIn(name, factory._lazy)
+                # Some modules only register their plugins if the
+                # required dependencies are available (e.g., glpk_direct)
+                if name in factory:
+                    self.assertEqual(factory.doc(name), doc)
+        # Every plugin implemented in one of the lazily imported modules
+        # must appear in the manifest
+        for key, factory in iteritems(factories):
+            declared = set(name for name, module, doc in plugins[key])
+            for name in factory:
+                if factory.get_class(name).__module__ in modules:
+                    self.assertIn(name, declared, "%s '%s' is missing from "
+                                  "the plugin manifest" % (key, name))
+
+    @unittest.skipIf(sys.version_info[:2] < (3,7),
+                     "Import timing introduced in python 3.7")
+    def test_lazy_plugin_import_time(self):
+        # Compare the time to import pyomo.environ with the time to
+        # import pyomo.environ plus all the lazily registered modules
+        from pyomo.environ.plugin_manifest import plugins
+        modules = sorted(set(
+            module for entries in itervalues(plugins)
+            for name, module, doc in entries))
+        lazy_time = eager_time = None
+        # Use the fastest of a few imports to reduce the timing noise
+        for i in range(3):
+            lazy = collect_import_time('pyomo.environ')
+            eager = collect_import_time(
+                ', '.join(['pyomo.environ'] + modules))
+            _lazy = sum(itervalues(lazy.pyomo)) \
+                    + sum(itervalues(lazy.pyutilib))
+            _eager = sum(itervalues(eager.pyomo)) \
+                     + sum(itervalues(eager.pyutilib))
+            lazy_time = _lazy if lazy_time is None else min(lazy_time, _lazy)
+            eager_time = _eager if eager_time is None \
+                         else min(eager_time, _eager)
+        # At the time of writing, the lazy import took ~70% of the time
+        # required to import all plugins; the threshold leaves a
+        # generous margin for platform variability.
+        self.assertLess(
+            lazy_time / float(eager_time), 0.9,
+            "Importing pyomo.environ took %d us (%d us when importing all "
+            "plugin modules)" % (lazy_time, eager_time))
+        # The lazily registered modules are not part of the
+        # pyomo.environ import
+        self.assertEqual(set(modules).intersection(lazy.pyomo), set())
+        self.assertEqual(set(modules).difference(eager.pyomo), set())
+
 
 if __name__ == "__main__":
     # Running this file as a script will print out the package timing
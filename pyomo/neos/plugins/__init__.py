@@ -9,6 +9,8 @@
 #  ___________________________________________________________________________
 
 def load():
-    import pyomo.neos.plugins.NEOS
+    # Note: the NEOS solver interface (pyomo.neos.plugins.NEOS) is
+    # registered lazily by pyomo.environ (see
+    # pyomo.environ.plugin_manifest)
     import pyomo.neos.plugins.kestrel_plugin
 
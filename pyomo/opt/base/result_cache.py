@@ -0,0 +1,186 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['SolverResultCache', 'solver_result_cache']
+
+import hashlib
+import logging
+import os
+import tempfile
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from pyomo.common.config import PYOMO_CONFIG_DIR
+
+logger = logging.getLogger('pyomo.opt')
+
+
+def result_cache_digest(*parts):
+    """Return a hashlib digest initialized with the string
+    representation of each part"""
+    digest = hashlib.sha256()
+    for part in parts:
+        update_digest(digest, part)
+    return digest
+
+
+def update_digest(digest, part):
+    """Add the string representation of part to a hashlib digest"""
+    # Prefix each part with its length so that the boundaries between
+    # the parts are part of the digest
+    part = str(part).encode('utf-8')
+    digest.update(str(len(part)).encode('utf-8'))
+    digest.update(b':')
+    digest.update(part)
+
+
+def update_digest_from_file(digest, filename):
+    """Add the contents of a file to a hashlib digest"""
+    update_digest(digest, os.path.getsize(filename))
+    with open(filename, 'rb') as FILE:
+        while True:
+            data = FILE.read(1 << 20)
+            if not data:
+                break
+            digest.update(data)
+
+
+class SolverResultCache(object):
+    """An on-disk, content-addressed cache of solver results
+
+    Solvers look up the results of a solve with a key that hashes the
+    problem sent to the solver (e.g., the problem file written for a
+    shell solver) together with the solver name, version and options,
+    so that repeated solves of identical problems (e.g., in bootstrap
+    or multistart loops) return the stored results instead of running
+    the solver.  The results are stored before they are loaded into
+    the model, so the primal and dual values, solver status and
+    termination condition of the original solve are reported.
+
+    Each entry is a pickle file in the cache directory.  When the total
+    size of the entries exceeds max_size, the least recently used
+    entries are removed.  The cache is opt-in: pass result_cache=True
+    (for solver_result_cache) or a SolverResultCache to solve().
+
+    Args:
+        directory (str): the directory that stores the cached results
+        max_size (int): the maximum total size (in bytes) of the
+            cached results
+    """
+
+    def __init__(self, directory, max_size=256*1024*1024):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the results stored for a key (or None)"""
+        fname = self._filename(key)
+        try:
+            with open(fname, 'rb') as FILE:
+                results = pickle.load(FILE)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        except Exception:
+            # e.g., the results were pickled by an incompatible
+            # version of Pyomo
+            logger.debug("Could not read the cached results '%s'"
+                         % (fname,), exc_info=True)
+            self.misses += 1
+            return None
+        # Record the access for the LRU eviction
+        try:
+            os.utime(fname, None)
+        except OSError:
+            pass
+        self.hits += 1
+        return results
+
+    def set(self, key, results):
+        """Store the results for a key"""
+        fname = self._filename(key)
+        tmpname = None
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            # Write to a temporary file and move it into place so that
+            # other processes never read a partially written entry
+            fd, tmpname = tempfile.mkstemp(
+                dir=self.directory, prefix='.results', suffix='.tmp')
+            with os.fdopen(fd, 'wb') as FILE:
+                pickle.dump(results, FILE, pickle.HIGHEST_PROTOCOL)
+            getattr(os, 'replace', os.rename)(tmpname, fname)
+            tmpname = None
+        except (IOError, OSError):
+            logger.debug("Could not write the result cache entry '%s'"
+                         % (fname,), exc_info=True)
+            return
+        finally:
+            if tmpname is not None and os.path.exists(tmpname):
+                os.remove(tmpname)
+        self.evict()
+
+    def evict(self, max_size=None):
+        """Remove the least recently used entries until the total size
+        of the cache is at most max_size (default: self.max_size)"""
+        if max_size is None:
+            max_size = self.max_size
+        entries = []
+        total = 0
+        for fname, info in self._entries():
+            entries.append((info.st_mtime, fname, info.st_size))
+            total += info.st_size
+        entries.sort()
+        for mtime, fname, size in entries:
+            if total <= max_size:
+                break
+            try:
+                os.remove(fname)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        """Remove all entries from the cache"""
+        self.evict(0)
+
+    def size(self):
+        """Return the total size (in bytes) of the cached results"""
+        return sum(info.st_size for fname, info in self._entries())
+
+    def __len__(self):
+        return sum(1 for entry in self._entries())
+
+    def _filename(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def _entries(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith('.pickle'):
+                continue
+            fname = os.path.join(self.directory, name)
+            try:
+                yield fname, os.stat(fname)
+            except OSError:
+                pass
+
+
+solver_result_cache = SolverResultCache(
+    os.path.join(PYOMO_CONFIG_DIR, 'result_cache'))
+"""The result cache used when solve() is called with result_cache=True"""
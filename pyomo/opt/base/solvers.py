@@ -22,11 +22,15 @@ from pyomo.common.config import ConfigBlock, ConfigList, ConfigValue
 from pyomo.common import Factory
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import Options
+from pyomo.common.timing import start_stage, stop_stage
 from pyutilib.misc import quote_split
 
 from pyomo.opt.base.problem import ProblemConfigFactory
 from pyomo.opt.base.convert import convert_problem
 from pyomo.opt.base.formats import ResultsFormat, ProblemFormat
+from pyomo.opt.base.result_cache import (
+    solver_result_cache, result_cache_digest, update_digest_from_file)
+from pyomo.opt.results.solver import SolverStatus
 import pyomo.opt.base.results
 
 import six
@@ -149,6 +153,7 @@ class SolverFactoryClass(Factory):
             subsolver = None
         opt = None
         try:
+            self._import(_name)
             if _name in self._cls:
                 opt = self._cls[_name](**kwds)
             else:
@@ -159,6 +164,7 @@ class SolverFactoryClass(Factory):
                 if "executable" not in kwds:
                     kwds["executable"] = _name
                 if mode in _implicit_solvers:
+                    self._import(_implicit_solvers[mode])
                     if _implicit_solvers[mode] not in self._cls:
                         raise RuntimeError(
                             "  The solver plugin was not registered.\n"
@@ -510,8 +516,32 @@ class OptSolver(object):
 
     def solve(self, *args, **kwds):
         """ Solve the problem """
+        steps = self._solve_steps(args, kwds)
+        if next(steps):
+            # The results were found in the result cache
+            return steps.send(None)
+        try:
+            _status = self._apply_solver()
+        except:
+            steps.close()
+            raise
+        return steps.send(_status)
 
+    def _solve_steps(self, args, kwds):
+        """
+        A generator implementing solve().  The generator stops after
+        the presolve, yielding True if the results were found in the
+        result cache.  Otherwise, the caller runs the solver and sends
+        the status returned by _apply_solver().  It then yields the
+        results.  Closing the generator before the results are
+        generated restores the solver options.
+        """
         self.available(exception_flag=True)
+        result_cache = kwds.pop('result_cache', None)
+        if result_cache is True:
+            result_cache = solver_result_cache
+        elif result_cache is False:
+            result_cache = None
         #
         # If the inputs are models, then validate that they have been
         # constructed! Collect suffix names to try and import from solution.
@@ -563,12 +593,15 @@ class OptSolver(object):
         self.options.update(kwds.pop('options', {}))
         self.options.update(
             self._options_string_to_dict(kwds.pop('options_string', '')))
+        solve_stage = start_stage("solve %s" % (self.name,))
         try:
 
             # we're good to go.
             initial_time = time.time()
 
+            stage = start_stage("presolve")
             self._presolve(*args, **kwds)
+            stop_stage(stage)
 
             presolve_completion_time = time.time()
             if self._report_timing:
@@ -577,15 +610,25 @@ class OptSolver(object):
             if not _model is None:
                 self._initialize_callbacks(_model)
 
-            _status = self._apply_solver()
+            cache_key = cached = None
+            if result_cache is not None:
+                cache_key = self._result_cache_key()
+                if cache_key is not None:
+                    cached = result_cache.get(cache_key)
+
+            stage = start_stage("apply_solver")
+            _status = yield cached is not None
+            stop_stage(stage)
             if hasattr(self, '_transformation_data'):
                 del self._transformation_data
-            if not hasattr(_status, 'rc'):
+            if cached is not None:
+                pass
+            elif not hasattr(_status, 'rc'):
                 logger.warning(
                     "Solver (%s) did not return a solver status code.\n"
                     "This is indicative of an internal solver plugin error.\n"
                     "Please report this to the Pyomo developers." )
-            elif _status.rc:
+            elif _status.rc and not getattr(_status, 'interrupted', False):
                 logger.error(
                     "Solver (%s) returned non-zero return code (%s)"
                     % (self.name, _status.rc,))
@@ -600,7 +643,15 @@ class OptSolver(object):
             if self._report_timing:
                 print("      %6.2f seconds required for solver" % (solve_completion_time - presolve_completion_time))
 
-            result = self._postsolve()
+            stage = start_stage("postsolve")
+            if cached is not None:
+                result = self._postsolve_cached(cached)
+            else:
+                result = self._postsolve()
+                if cache_key is not None and \
+                   self._cacheable_results(_status, result):
+                    result_cache.set(cache_key, result)
+            stop_stage(stage)
             result._smap_id = self._smap_id
             result._smap = None
             if _model:
@@ -625,10 +676,12 @@ class OptSolver(object):
                         logger.error("No solution is available")
                 else:
                     if self._load_solutions:
+                        stage = start_stage("load_results")
                         _model.solutions.load_from(
                             result,
                             select=self._select_index,
                             default_variable_value=self._default_variable_value)
+                        stop_stage(stage)
                         result._smap_id = None
                         result.solution.clear()
                     else:
@@ -645,8 +698,55 @@ class OptSolver(object):
             # Reset the options dict
             #
             self.options = orig_options
+            stop_stage(solve_stage)
+
+        yield result
 
-        return result
+    def _result_cache_key(self):
+        """
+        Returns the key of the current solve in the result cache, or
+        None if its results cannot be cached.  The default key hashes
+        the problem files together with the solver, its version and
+        options and the requested suffixes.
+        """
+        problem_files = getattr(self, '_problem_files', None)
+        if not problem_files:
+            return None
+        digest = self._result_cache_digest()
+        for filename in problem_files:
+            update_digest_from_file(digest, filename)
+        return digest.hexdigest()
+
+    def _result_cache_digest(self):
+        """
+        Returns a hashlib digest of the solver, its version and options
+        and the requested suffixes, to which subclasses add the
+        problem.
+        """
+        return result_cache_digest(
+            self.type,
+            self.version(),
+            sorted((str(key), repr(val)) for key, val in self.options.items()),
+            sorted(self._suffixes),
+            self._problem_format,
+            self._results_format)
+
+    def _cacheable_results(self, status, results):
+        """
+        Returns True if the results of a solve can be stored in the
+        result cache.
+        """
+        if results is None or getattr(status, 'interrupted', False):
+            return False
+        return results.solver.status not in (SolverStatus.aborted,
+                                             SolverStatus.error)
+
+    def _postsolve_cached(self, results):
+        """
+        Called instead of _apply_solver() and _postsolve() when the
+        results are found in the result cache.
+        """
+        return results
 
     def _presolve(self, *args, **kwds):
 
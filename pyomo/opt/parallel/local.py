@@ -19,12 +19,15 @@ except ImportError:                         #pragma:nocover
     from ordereddict import OrderedDict
 
 import pyomo.opt
+from pyomo.common.dependencies import attempt_import
 from pyomo.opt.parallel.manager import (ActionManagerError,
                                         ActionStatus,
                                         ActionHandle)
 from pyomo.opt.parallel.async_solver import AsynchronousSolverManager, SolverManagerFactory
 
-from six import string_types
+from six import string_types, iteritems
+
+futures, futures_available = attempt_import('concurrent.futures')
 
 
 @SolverManagerFactory.register("serial", doc="Synchronously execute solvers locally")
@@ -79,3 +82,149 @@ class SolverManager_Serial(AsynchronousSolverManager):
                             explanation=("No queued evaluations available in "
                                          "the 'serial' solver manager, which "
                                          "executes solvers synchronously"))
+
+
+def _solve_in_subprocess(model, solver, solver_io, solver_options, kwds):
+    """
+    Solve a model in a worker process of SolverManager_ProcessPool.  The
+    model is either a Pyomo model or a callable that builds it.  The
+    solution is stored in the results object using component names, so
+    that it can be loaded into the model in the parent process.
+    """
+    from pyomo.core.base.PyomoModel import Model
+    if not isinstance(model, Model):
+        model = model()
+    sf_kwds = {}
+    if solver_io is not None:
+        sf_kwds['solver_io'] = solver_io
+    time_start = time.time()
+    with pyomo.opt.SolverFactory(solver, **sf_kwds) as opt:
+        opt.options.update(solver_options)
+        results = opt.solve(model, **kwds)
+    results.pyomo_solve_time = time.time()-time_start
+    model.solutions.store_to(results)
+    return results
+
+
+@SolverManagerFactory.register(
+    "process",
+    doc="Asynchronously execute solvers in a pool of local processes")
+class SolverManager_ProcessPool(AsynchronousSolverManager):
+    """
+    A solver manager that executes solves concurrently in a
+    concurrent.futures.ProcessPoolExecutor.
+
+    The first argument passed to queue() is either a Pyomo model,
+    which is pickled and sent to a worker, or a picklable callable
+    (e.g., a module-level function or a functools.partial) that builds
+    the model in the worker.  The solver is created in the worker from
+    its name (solver objects are replaced by their type and options).
+    When the solve completes, the solution is returned by component
+    name and loaded into the model passed to queue(), unless
+    load_solutions=False.
+
+    Keyword Arguments
+    -----------------
+    max_workers: int
+        The number of worker processes (defaults to the number of
+        processors on the machine)
+    """
+
+    def __init__(self, **kwds):
+        self._max_workers = kwds.pop('max_workers', None)
+        self._executor = None
+        AsynchronousSolverManager.__init__(self, **kwds)
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super(SolverManager_ProcessPool, self).clear()
+        self.results = OrderedDict()
+        self._pending = {}
+        self._instances = {}
+
+    def close(self):
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __exit__(self, t, v, traceback):
+        self.close()
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the ActionHandle,
+        and the ActionHandle status indicates whether the queue was successful.
+        """
+        from pyomo.core.base.PyomoModel import Model
+
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__) )
+        if len(args) != 1:
+            raise ActionManagerError(
+                "%s expects a single model or model factory, found %s "
+                "positional arguments" % (type(self).__name__, len(args)))
+        model = args[0]
+        if isinstance(model, Model):
+            instance = model
+        elif callable(model):
+            instance = None
+        else:
+            raise ActionManagerError(
+                "%s expects a Pyomo model or a callable that returns "
+                "one, found %s" % (type(self).__name__, type(model)))
+
+        solver_io = kwds.pop('solver_io', None)
+        if isinstance(opt, string_types):
+            solver_options = {}
+        else:
+            solver_options = dict(iteritems(opt.options))
+            opt = opt.type
+        load_solutions = kwds.pop('load_solutions', True)
+
+        if self._executor is None:
+            self._executor = futures.ProcessPoolExecutor(
+                max_workers=self._max_workers)
+        future = self._executor.submit(
+            _solve_in_subprocess, model, opt, solver_io, solver_options, kwds)
+        self._pending[future] = ah.id
+        self._instances[ah.id] = (instance, load_solutions)
+        return ah
+
+    def _perform_wait_any(self):
+        """
+        Perform the wait_any operation.  This method returns an
+        ActionHandle with the results of waiting.  If None is returned
+        then the ActionManager assumes that it can call this method again.
+        Note that an ActionHandle can be returned with a dummy value,
+        to indicate an error.
+        """
+        if len(self._pending) == 0:
+            return ActionHandle(error=True,
+                                explanation=("No queued evaluations available "
+                                             "in the 'process' solver "
+                                             "manager"))
+        done, not_done = futures.wait(list(self._pending),
+                                      return_when=futures.FIRST_COMPLETED)
+        # Complete the earliest queued action among those that finished
+        future = min(done, key=lambda f: self._pending[f])
+        ah = self.event_handle[self._pending.pop(future)]
+        instance, load_solutions = self._instances.pop(ah.id)
+        try:
+            results = future.result()
+        except Exception as e:
+            ah.status = ActionStatus.error
+            raise ActionManagerError(
+                "Solve for action %s failed in the worker process: %s"
+                % (ah.id, e))
+        if instance is not None and load_solutions:
+            instance.solutions.load_from(results)
+            results.solution.clear()
+        self.results[ah.id] = results
+        ah.status = ActionStatus.done
+        return ah
@@ -0,0 +1,237 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# asyncio support for SystemCallSolver.  This module uses the
+# async/await syntax and is only imported on Python 3.5 and newer (see
+# SystemCallSolver.solve_async).
+#
+
+import asyncio
+import codecs
+import logging
+import shlex
+import sys
+import threading
+import time
+
+from pyutilib.services import TempfileManager
+
+from pyomo.common.collections import Bunch
+from pyomo.common.errors import ApplicationError
+from pyomo.opt.solver.progress import ProgressMonitor, _interrupt
+
+logger = logging.getLogger('pyomo.opt')
+
+# Serializes the presolve and postsolve steps (and thus the use of the
+# TempfileManager context stack) of concurrent solves, which run in
+# executor threads
+_tempfile_lock = threading.Lock()
+
+
+class _DetachedTempfileContext(object):
+    """A TempfileManager context that is detached from the stack
+
+    The presolve of a shell solver pushes a TempfileManager context that
+    its postsolve pops.  While the solver runs, the context is detached
+    from the (global) context stack so that the presolve and postsolve
+    of concurrent solves can be interleaved.
+
+    Creating this object takes ownership of the innermost context of
+    the TempfileManager.  The owner must then either attach() the
+    context again (handing it back to the TempfileManager, e.g., for
+    the postsolve to pop) or discard() it (removing its files).  All
+    methods must be called with _tempfile_lock held.  This is the only
+    code that manipulates the TempfileManager context stack directly.
+    """
+
+    __slots__ = ('_files',)
+
+    def __init__(self):
+        self._files = TempfileManager._tempfiles.pop()
+
+    def attach(self):
+        """Push the context back onto the TempfileManager stack"""
+        TempfileManager._tempfiles.append(self._files)
+
+    def pop(self, keepfiles):
+        """Pop the context if it is (still) the innermost context of
+        the TempfileManager"""
+        if TempfileManager._tempfiles[-1] is self._files:
+            TempfileManager.pop(remove=not keepfiles)
+
+    def discard(self, keepfiles):
+        """Attach and immediately pop the context"""
+        self.attach()
+        self.pop(keepfiles)
+
+
+def _presolve(steps):
+    with _tempfile_lock:
+        cached = next(steps)
+        return cached, _DetachedTempfileContext()
+
+
+def _postsolve(steps, status, tempfiles, keepfiles):
+    with _tempfile_lock:
+        tempfiles.attach()
+        try:
+            return steps.send(status)
+        except:
+            # e.g., the solver returned a non-zero return code
+            tempfiles.pop(keepfiles)
+            raise
+
+
+def _discard(steps, tempfiles, keepfiles):
+    with _tempfile_lock:
+        tempfiles.discard(keepfiles)
+    steps.close()
+
+
+def _kill(process):
+    if process.returncode is not None:
+        return
+    try:
+        process.kill()
+    except OSError:
+        pass
+
+
+async def _read_output(process, output, tee, monitor, grace_period, timers):
+    stream = process.stdout
+    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    interrupted = False
+    while True:
+        data = await stream.read(4096)
+        if not data:
+            break
+        data = decoder.decode(data)
+        output.append(data)
+        if tee:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+        if monitor is not None:
+            monitor.write(data)
+            if monitor.stop_requested and not interrupted:
+                interrupted = True
+                _interrupt(process)
+                # As in run_with_progress, kill the solver if it has
+                # not exited after grace_period seconds
+                timers.append(asyncio.get_event_loop().call_later(
+                    grace_period, _kill, process))
+    if monitor is not None:
+        monitor.close()
+
+
+async def _run_command(command, timelimit, tee, monitor=None,
+                       grace_period=10):
+    """Execute a solver command line, returning [rc, log]"""
+    cmd = command.cmd
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
+    script = command.script if 'script' in command else None
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL if script is None
+            else asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=command.env)
+    except OSError:
+        err = sys.exc_info()[1]
+        msg = 'Could not execute the command: %s\tError message: %s'
+        raise ApplicationError(msg % (command.cmd, err))
+
+    output = []
+    timers = []
+    try:
+        if script is not None:
+            process.stdin.write(script.encode())
+            process.stdin.close()
+        await asyncio.wait_for(
+            _read_output(process, output, tee, monitor, grace_period,
+                         timers), timelimit)
+        rc = await process.wait()
+    except asyncio.TimeoutError:
+        # Match pyutilib.subprocess, which kills the solver and
+        # reports a return code of -1 when the time limit is exceeded
+        process.kill()
+        await process.wait()
+        rc = -1
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        raise
+    finally:
+        for timer in timers:
+            timer.cancel()
+    return [rc, ''.join(output)]
+
+
+async def _apply_solver(opt):
+    command = opt._command
+    if __debug__ and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running %s", command.cmd)
+    if opt._keepfiles:
+        if opt._log_file is not None:
+            print("Solver log file: '%s'" % opt._log_file)
+        if opt._soln_file is not None:
+            print("Solver solution file: '%s'" % opt._soln_file)
+        if opt._problem_files:
+            print("Solver problem files: %s" % str(opt._problem_files))
+
+    timelimit = opt._timelimit
+    if timelimit is not None:
+        timelimit += max(1, 0.01*timelimit)
+    if opt._progress_callback is not None:
+        opt._progress_monitor = ProgressMonitor(
+            opt._log_progress_parser(), opt._progress_callback)
+    start_time = time.time()
+    opt._rc, opt._log = await _run_command(
+        command, timelimit, opt._tee, opt._progress_monitor)
+    opt._last_solve_time = time.time() - start_time
+    return Bunch(rc=opt._rc, log=opt._log, interrupted=opt._interrupted())
+
+
+async def solve_async(opt, *args, **kwds):
+    """The implementation of SystemCallSolver.solve_async()"""
+    loop = asyncio.get_event_loop()
+    if kwds.get('result_cache') not in (None, False):
+        # The result cache key includes the solver version, which is
+        # probed with pyutilib.subprocess (which must run in the main
+        # thread rather than in the executor)
+        opt.version()
+    steps = opt._solve_steps(args, kwds)
+
+    presolve = loop.run_in_executor(None, _presolve, steps)
+    try:
+        cached, tempfiles = await asyncio.shield(presolve)
+    except asyncio.CancelledError:
+        # The problem is still being written; remove its files when
+        # the executor finishes
+        def _cleanup(future):
+            if not future.cancelled() and future.exception() is None:
+                _discard(steps, future.result()[1], False)
+        presolve.add_done_callback(_cleanup)
+        raise
+
+    if cached:
+        # The results were found in the result cache
+        status = None
+    else:
+        try:
+            status = await _apply_solver(opt)
+        except BaseException:
+            _discard(steps, tempfiles, opt._keepfiles)
+            raise
+
+    return await loop.run_in_executor(
+        None, _postsolve, steps, status, tempfiles, opt._keepfiles)
@@ -0,0 +1,180 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['SolverProbeCache', 'solver_probe_cache']
+
+import json
+import logging
+import os
+import tempfile
+import time
+
+import pyomo.common
+from pyomo.common.config import PYOMO_CONFIG_DIR
+
+logger = logging.getLogger('pyomo.opt')
+
+class SolverProbeCache(object):
+    """An on-disk cache of the results of probing solver executables
+
+    Determining the version of a shell solver (or whether its license
+    is valid) runs the solver executable in a subprocess.  This cache
+    stores the results of these probes in a JSON file so that they are
+    shared by all Python processes (e.g., short-lived worker
+    processes) and only repeated when the executable changes.
+
+    Entries are keyed on the real path of the executable and are
+    discarded when the executable's modification time or size changes.
+    Probes whose results depend on more than the executable (e.g.,
+    license checks) can also pass a maximum age.  The cache can be
+    cleared explicitly with invalidate().
+
+    Args:
+        filename (str): the JSON file that stores the cache
+    """
+
+    license_max_age = 3600
+    """The maximum age (in seconds) of cached license checks"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.enabled = True
+
+    def get(self, executable, probe, default=None, max_age=None):
+        """Return the cached result of a probe of an executable
+
+        Args:
+            executable (str): the executable (a name on the PATH or a
+                path)
+            probe (str): the name of the probe
+            default: the value returned if there is no valid entry
+            max_age (float): ignore entries older than this many
+                seconds
+        """
+        key = self._key(executable)
+        if key is None:
+            return default
+        path, stamp = key
+        entry = self._load().get(path)
+        if entry is None or entry.get('stamp') != stamp:
+            return default
+        result = entry.get('probes', {}).get(probe)
+        if result is None:
+            return default
+        if max_age is not None and time.time() - result['time'] > max_age:
+            return default
+        return result['value']
+
+    def set(self, executable, probe, value):
+        """Record the result of a probe of an executable
+
+        The value must be serializable to JSON.  Nothing is recorded
+        if the executable cannot be found or the cache file cannot be
+        written.
+        """
+        key = self._key(executable)
+        if key is None:
+            return
+        path, stamp = key
+        # Merge with entries written by other processes since this
+        # process last read the file
+        data = self._load()
+        entry = data.get(path)
+        if entry is None or entry.get('stamp') != stamp:
+            entry = data[path] = {'stamp': stamp, 'probes': {}}
+        entry['probes'][probe] = {'value': value, 'time': time.time()}
+        self._save(data)
+
+    def probe(self, executable, probe, fcn, max_age=None):
+        """Return the result of a probe, calling fcn() to compute (and
+        record) it if there is no valid entry in the cache.  A result
+        of None (i.e., the probe failed) is not recorded."""
+        ans = self.get(executable, probe, None, max_age)
+        if ans is None:
+            ans = fcn()
+            if ans is not None:
+                self.set(executable, probe, ans)
+        return ans
+
+    def invalidate(self, executable=None, probe=None):
+        """Remove entries from the cache
+
+        Args:
+            executable (str): only remove the entries for this
+                executable (default: all executables)
+            probe (str): only remove the results of this probe
+                (default: all probes)
+        """
+        if not self.enabled:
+            return
+        data = self._load()
+        if executable is None:
+            paths = list(data)
+        else:
+            key = self._key(executable)
+            if key is None:
+                return
+            paths = [key[0]] if key[0] in data else []
+        for path in paths:
+            if probe is None:
+                del data[path]
+            else:
+                data[path].get('probes', {}).pop(probe, None)
+        self._save(data)
+
+    def _key(self, executable):
+        if not self.enabled or not executable:
+            return None
+        if not os.path.isabs(executable):
+            executable = pyomo.common.Executable(executable).path()
+            if executable is None:
+                return None
+        path = os.path.realpath(executable)
+        try:
+            info = os.stat(path)
+        except OSError:
+            return None
+        return path, [info.st_mtime, info.st_size]
+
+    def _load(self):
+        try:
+            with open(self.filename) as FILE:
+                data = json.load(FILE)
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _save(self, data):
+        # Write to a temporary file and move it into place so that
+        # other processes never read a partially written file
+        dirname = os.path.dirname(os.path.abspath(self.filename))
+        tmpname = None
+        try:
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+            fd, tmpname = tempfile.mkstemp(
+                dir=dirname, prefix='.solver_probes', suffix='.tmp')
+            with os.fdopen(fd, 'w') as FILE:
+                json.dump(data, FILE, indent=1, sort_keys=True)
+            getattr(os, 'replace', os.rename)(tmpname, self.filename)
+            tmpname = None
+        except (IOError, OSError):
+            logger.debug("Could not write the solver probe cache '%s'"
+                         % (self.filename,), exc_info=True)
+        finally:
+            if tmpname is not None and os.path.exists(tmpname):
+                os.remove(tmpname)
+
+
+solver_probe_cache = SolverProbeCache(
+    os.path.join(PYOMO_CONFIG_DIR, 'solver_probes.json'))
+"""The solver probe cache used by the shell solver interfaces"""
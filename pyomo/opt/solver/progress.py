@@ -0,0 +1,225 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Support for monitoring the progress of shell solvers while they run
+#
+
+__all__ = ['LogProgressParser', 'ProgressMonitor', 'run_with_progress',
+           'relative_gap']
+
+import codecs
+import os
+import shlex
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from six import string_types
+
+
+def relative_gap(incumbent, bound):
+    """Return the relative gap |incumbent - bound| / |incumbent|"""
+    if incumbent is None or bound is None:
+        return None
+    diff = abs(incumbent - bound)
+    if not diff:
+        return 0.
+    if not incumbent:
+        return float('inf')
+    return diff / abs(incumbent)
+
+
+class LogProgressParser(object):
+    """Base class for parsers that extract the progress of a solver from
+    its log as it is written.
+
+    Subclasses implement parse_line(), which is called for each line
+    of the log and updates the time (in seconds), incumbent objective,
+    objective bound and relative gap reported by the solver (any of
+    which may be None if the solver has not reported them).
+    """
+
+    def __init__(self):
+        self.time = None
+        self.incumbent = None
+        self.bound = None
+        self.gap = None
+
+    def parse_line(self, line):
+        """Parse a line of the solver log, returning True if the
+        progress of the solver was updated"""
+        raise NotImplementedError
+
+    def _update(self, time=None, incumbent=None, bound=None, gap=None):
+        if time is not None:
+            self.time = time
+        if incumbent is not None:
+            self.incumbent = incumbent
+        if bound is not None:
+            self.bound = bound
+        if gap is not None:
+            self.gap = gap
+        elif incumbent is not None or bound is not None:
+            self.gap = None
+        return incumbent is not None or bound is not None
+
+
+class ProgressMonitor(object):
+    """A file-like object that collects the output of a solver, passes
+    each line to a LogProgressParser and calls callback(time,
+    incumbent, bound, gap) whenever the parser reports progress.
+
+    The time is the time reported by the solver (or the wall time since
+    the monitor was created if the solver does not report it) and the
+    gap is relative (e.g., 0.01 for 1%).  If the callback returns True,
+    stop_requested is set so that the solver can be interrupted (see
+    run_with_progress); the callback is not called again after that.
+    """
+
+    def __init__(self, parser, callback):
+        self.parser = parser
+        self.callback = callback
+        self.stop_requested = False
+        self._start_time = time.time()
+        self._partial = ''
+        self._output = []
+
+    def write(self, data):
+        self._output.append(data)
+        lines = (self._partial + data).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._parse_line(line)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self._partial:
+            self._parse_line(self._partial)
+            self._partial = ''
+
+    def getvalue(self):
+        return ''.join(self._output)
+
+    def _parse_line(self, line):
+        parser = self.parser
+        if not parser.parse_line(line.rstrip('\r')) or self.stop_requested:
+            return
+        t = parser.time
+        if t is None:
+            t = time.time() - self._start_time
+        gap = parser.gap
+        if gap is None:
+            gap = relative_gap(parser.incumbent, parser.bound)
+        if self.callback(t, parser.incumbent, parser.bound, gap):
+            self.stop_requested = True
+
+
+def _interrupt(process):
+    # Most solvers stop gracefully (reporting the best solution found
+    # so far) when they receive an interrupt signal.  Note that this is
+    # also used for asyncio processes (which do not support poll()).
+    if process.returncode is not None:
+        return
+    try:
+        if sys.platform.startswith('win'):
+            process.terminate()
+        else:
+            process.send_signal(signal.SIGINT)
+    except OSError:
+        pass
+
+
+def _kill(process):
+    if process.poll() is not None:
+        return
+    try:
+        process.kill()
+    except OSError:
+        pass
+
+
+def run_with_progress(cmd, monitor, stdin=None, timelimit=None, env=None,
+                      tee=False, grace_period=10):
+    """Run a solver command, streaming its output to a ProgressMonitor
+
+    If the monitor requests that the solver stop, the solver is sent an
+    interrupt signal (and killed if it has not exited after
+    grace_period seconds).  The output written before the solver exits
+    is returned so that partial results can be parsed.  As with
+    pyutilib.subprocess.run, the solver is killed and the return code
+    is -1 if the timelimit is exceeded.
+
+    Returns:
+        [rc, log]
+    """
+    if isinstance(cmd, string_types):
+        cmd = shlex.split(cmd)
+    devnull = None
+    if stdin is None:
+        devnull = stdin_arg = open(os.devnull)
+    else:
+        stdin_arg = subprocess.PIPE
+    try:
+        process = subprocess.Popen(
+            cmd, stdin=stdin_arg, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, env=env)
+    finally:
+        if devnull is not None:
+            devnull.close()
+
+    timers = []
+    timed_out = []
+    if timelimit is not None:
+        def _timeout():
+            timed_out.append(True)
+            _kill(process)
+        timers.append(threading.Timer(timelimit, _timeout))
+        timers[-1].daemon = True
+        timers[-1].start()
+    try:
+        if stdin is not None:
+            process.stdin.write(stdin.encode())
+            process.stdin.close()
+        fd = process.stdout.fileno()
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        interrupted = False
+        while True:
+            data = os.read(fd, 4096)
+            if not data:
+                break
+            data = decoder.decode(data)
+            if tee:
+                sys.stdout.write(data)
+                sys.stdout.flush()
+            monitor.write(data)
+            if monitor.stop_requested and not interrupted:
+                interrupted = True
+                _interrupt(process)
+                timers.append(threading.Timer(grace_period, _kill,
+                                              args=(process,)))
+                timers[-1].daemon = True
+                timers[-1].start()
+        monitor.close()
+        rc = process.wait()
+    except:
+        _kill(process)
+        process.wait()
+        raise
+    finally:
+        for timer in timers:
+            timer.cancel()
+        process.stdout.close()
+    if timed_out:
+        rc = -1
+    return [rc, monitor.getvalue()]
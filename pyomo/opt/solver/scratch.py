@@ -0,0 +1,318 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['SolverScratchSpace', 'solver_scratch']
+
+import atexit
+import errno
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from pyutilib.component.config.tempfiles import TempfileManagerPlugin
+from pyutilib.services import TempfileManager
+
+logger = logging.getLogger('pyomo.opt')
+
+
+def _default_base():
+    # /dev/shm is a memory-backed filesystem on most Linux systems
+    shm = '/dev/shm'
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
+def _process_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        return e.errno != errno.ESRCH
+    return True
+
+
+class _ScratchTempfileManager(TempfileManagerPlugin):
+    """The class of a TempfileManager while a scratch space is enabled
+
+    SolverScratchSpace.enable() switches the class of the
+    TempfileManager to this subclass (and disable() switches it back),
+    so that the files created with create_tempfile() are taken from,
+    and returned by pop() to, the scratch space in _scratch_space.
+    """
+
+    def create_tempfile(self, suffix=None, prefix=None, text=False,
+                        dir=None):
+        if dir is not None or self.tempdir is not None or self._ctr >= 0:
+            return TempfileManagerPlugin.create_tempfile(
+                self, suffix=suffix, prefix=prefix, text=text, dir=dir)
+        fname = self._scratch_space._acquire(suffix, prefix, text)
+        self._tempfiles[-1].append(fname)
+        return fname
+
+    def pop(self, remove=True):
+        scratch = self._scratch_space
+        start = time.time()
+        files = self._tempfiles[-1]
+        recycle = scratch._owned_files(files)
+        if recycle:
+            self._tempfiles[-1] = [
+                fname for fname in files if fname not in recycle]
+        TempfileManagerPlugin.pop(self, remove)
+        scratch._release(recycle, remove, start)
+
+
+class SolverScratchSpace(object):
+    """A scratch workspace for the temporary files of solvers
+
+    Shell solvers create (and then delete) several temporary files
+    through the TempfileManager for every solve: the problem file, the
+    solution file, the log file, etc.  When the scratch space is
+    enabled, the TempfileManager creates these files in a directory
+    owned by the current process in a fast location (by default
+    /dev/shm, a memory-backed filesystem, when it is available).
+    Files created with create_tempfile() are not deleted when their
+    TempfileManager context is popped: they are truncated and their
+    names are reused by later calls to create_tempfile() with the same
+    prefix and suffix, so repeated solves do not create and delete
+    directory entries.
+
+    Files created in an explicit directory (including the
+    TempfileManager.tempdir option) or with sequential names, and the
+    files declared with add_tempfile(), are handled by the
+    TempfileManager as usual.  The unused files (and the scratch
+    directory, once it is empty) are removed when the scratch space is
+    disabled or the process exits.  The scratch space can be used by
+    several threads (e.g., the executor threads of asynchronous
+    solves), although the TempfileManager context stack itself is not
+    thread safe.
+
+    Args:
+        base (str): the directory in which the per-process scratch
+            directories are created (default: /dev/shm if it is
+            writable, otherwise the system temporary directory)
+        max_free (int): the maximum number of unused files kept for
+            each prefix and suffix
+
+    Attributes:
+        created (int): the number of files created
+        recycled (int): the number of files whose name was reused
+        create_time (float): the time (in seconds) spent creating
+            temporary files
+        release_time (float): the time (in seconds) spent removing or
+            truncating the files of popped contexts
+    """
+
+    _dirname = re.compile(r'^pyomo-(\d+)-')
+
+    def __init__(self, base=None, max_free=64):
+        self.base = base
+        self.max_free = max_free
+        self._manager = None
+        self._pid = None
+        self._directory = None
+        # filename -> (prefix, suffix) for the files created here
+        self._owned = {}
+        # (prefix, suffix) -> list of unused files
+        self._free = {}
+        self._atexit = False
+        # Guards the files and counters of the scratch space
+        self._lock = threading.RLock()
+        self.reset_counters()
+
+    def reset_counters(self):
+        """Reset the file and timing counters"""
+        self.created = 0
+        self.recycled = 0
+        self.create_time = 0.
+        self.release_time = 0.
+
+    @property
+    def enabled(self):
+        return self._manager is not None
+
+    def enable(self, manager=None):
+        """Create the temporary files of a TempfileManager (by default,
+        the global TempfileManager) in the scratch space"""
+        if manager is None:
+            manager = TempfileManager
+        if self._manager is manager:
+            return
+        if self._manager is not None:
+            raise RuntimeError(
+                "The scratch space is already enabled for another "
+                "TempfileManager")
+        if manager.__class__ is _ScratchTempfileManager:
+            raise RuntimeError(
+                "The TempfileManager already uses another scratch space")
+        if manager.__class__ is not TempfileManagerPlugin:
+            raise TypeError(
+                "The scratch space cannot be enabled for a TempfileManager "
+                "of type %s" % (type(manager).__name__,))
+        manager._scratch_space = self
+        manager.__class__ = _ScratchTempfileManager
+        self._manager = manager
+
+    def disable(self):
+        """Restore the default behavior of the TempfileManager and
+        remove the unused files of the scratch space"""
+        manager = self._manager
+        if manager is None:
+            return
+        manager.__class__ = TempfileManagerPlugin
+        del manager._scratch_space
+        self._manager = None
+        self.cleanup()
+
+    def directory(self):
+        """Return the scratch directory of the current process
+        (creating it if necessary)"""
+        with self._lock:
+            return self._get_directory()
+
+    def _get_directory(self):
+        pid = os.getpid()
+        if self._pid != pid:
+            # A new (e.g., forked) process uses its own directory
+            self._pid = pid
+            self._directory = None
+            self._owned = {}
+            self._free = {}
+        if self._directory is None or not os.path.isdir(self._directory):
+            base = self.base
+            if base is None:
+                base = _default_base()
+            self._prune(base)
+            self._directory = tempfile.mkdtemp(
+                prefix='pyomo-%d-' % (pid,), dir=base)
+            self._owned = {}
+            self._free = {}
+            if not self._atexit:
+                atexit.register(self._exit)
+                self._atexit = True
+        return self._directory
+
+    def cleanup(self):
+        """Remove the unused files and, if it is empty, the scratch
+        directory of the current process"""
+        with self._lock:
+            self._cleanup()
+
+    def _cleanup(self):
+        if self._pid != os.getpid() or self._directory is None:
+            return
+        for files in self._free.values():
+            for fname in files:
+                self._owned.pop(fname, None)
+                if os.path.exists(fname):
+                    os.remove(fname)
+        self._free = {}
+        # Files that are still in use (or that were kept with
+        # pop(remove=False)) are not removed
+        try:
+            os.rmdir(self._directory)
+        except OSError:
+            return
+        self._directory = None
+
+    def _exit(self):
+        try:
+            self.cleanup()
+        except OSError:
+            pass
+
+    def _prune(self, base):
+        # Remove the (empty) files left by processes that did not exit
+        # cleanly (e.g., worker processes that exited with os._exit)
+        if os.name != 'posix':
+            return
+        try:
+            names = os.listdir(base)
+        except OSError:
+            return
+        for name in names:
+            match = self._dirname.match(name)
+            if match is None or _process_exists(int(match.group(1))):
+                continue
+            dirname = os.path.join(base, name)
+            try:
+                for fname in os.listdir(dirname):
+                    fname = os.path.join(dirname, fname)
+                    if os.path.isfile(fname) and not os.path.getsize(fname):
+                        os.remove(fname)
+                os.rmdir(dirname)
+            except OSError:
+                pass
+
+    def _acquire(self, suffix, prefix, text):
+        # Return a file for create_tempfile(), reusing an unused file
+        # with the same prefix and suffix if there is one
+        start = time.time()
+        if suffix is None:
+            suffix = ''
+        if prefix is None:
+            prefix = 'tmp'
+        with self._lock:
+            directory = self._get_directory()
+            free = self._free.get((prefix, suffix))
+            if free:
+                fname = free.pop()
+                if not os.path.exists(fname):
+                    open(fname, 'w').close()
+                self.recycled += 1
+            else:
+                fd, fname = tempfile.mkstemp(
+                    suffix=suffix, prefix=prefix, text=text, dir=directory)
+                os.close(fd)
+                self._owned[fname] = (prefix, suffix)
+                self.created += 1
+            self.create_time += time.time() - start
+        return fname
+
+    def _owned_files(self, files):
+        # The files created by _acquire() (in this process)
+        with self._lock:
+            if self._pid != os.getpid():
+                return set()
+            owned = self._owned
+            return set(fname for fname in files if fname in owned)
+
+    def _release(self, files, remove, start):
+        # Return the files of a popped TempfileManager context
+        with self._lock:
+            for fname in files:
+                if remove:
+                    self._recycle(fname)
+                else:
+                    # The caller keeps the file
+                    del self._owned[fname]
+            self.release_time += time.time() - start
+
+    def _recycle(self, fname):
+        key = self._owned[fname]
+        free = self._free.setdefault(key, [])
+        if len(free) < self.max_free and not os.path.isdir(fname):
+            try:
+                if os.path.exists(fname):
+                    # Truncating the file keeps its directory entry
+                    open(fname, 'w').close()
+                free.append(fname)
+                return
+            except (IOError, OSError):
+                logger.debug("Could not recycle the temporary file '%s'"
+                             % (fname,), exc_info=True)
+        del self._owned[fname]
+        if os.path.isfile(fname):
+            os.remove(fname)
+
+solver_scratch = SolverScratchSpace()
+"""The scratch space for the global TempfileManager (see enable())"""
@@ -15,15 +15,21 @@ import sys
 import time
 import logging
 
+from six import StringIO
+
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import Bunch
+from pyomo.common.log import LoggingIntercept
 from pyutilib.services import TempfileManager
 from pyutilib.subprocess import run
 
 import pyomo.common
 from pyomo.opt.base import ResultsFormat
 from pyomo.opt.base.solvers import OptSolver
-from pyomo.opt.results import SolverStatus, SolverResults
+from pyomo.opt.solver.probe_cache import solver_probe_cache
+from pyomo.opt.solver.progress import ProgressMonitor, run_with_progress
+from pyomo.opt.results import (SolverStatus, SolverResults,
+                               TerminationCondition)
 
 logger = logging.getLogger('pyomo.opt')
 
@@ -46,6 +52,8 @@ class SystemCallSolver(OptSolver):
         # a solver plugin may not report execution time.
         self._last_solve_time = None
         self._define_signal_handlers = None
+        self._progress_callback = None
+        self._progress_monitor = None
 
         if executable is not None:
             self.set_executable(name=executable, validate=validate)
@@ -118,12 +126,58 @@ class SystemCallSolver(OptSolver):
             return False
         return True
 
+    def version(self):
+        """
+        Returns a 4-tuple describing the solver executable version.
+
+        The version is recorded in the solver probe cache (see
+        pyomo.opt.solver.probe_cache), so the executable is only run
+        to determine its version once (across processes) until it
+        changes.
+        """
+        if self._version is None:
+            try:
+                executable = self._probe_executable()
+            except NotImplementedError:
+                self._version = self._get_version()
+                return self._version
+            if executable is None:
+                # Not installed: there is nothing to probe
+                return None
+            probe = '%s.%s.version' % (self.__class__.__module__,
+                                       self.__class__.__name__)
+            ans = solver_probe_cache.probe(
+                executable, probe, self._get_version)
+            if ans is not None:
+                ans = tuple(ans)
+            self._version = ans
+        return self._version
+
+    def _probe_executable(self):
+        """
+        Returns the executable used by this solver (or None), without
+        logging the warning that solvers issue when the default
+        executable cannot be found.
+        """
+        if self._user_executable is not None:
+            return self._user_executable
+        with LoggingIntercept(StringIO(), 'pyomo'):
+            return self._default_executable()
+
     def create_command_line(self,executable,problem_files):
         """
         Create the command line that is executed.
         """
         raise NotImplementedError       #pragma:nocover
 
+    def _log_progress_parser(self):
+        """
+        Returns a LogProgressParser (see pyomo.opt.solver.progress)
+        for the solver log, or None if progress callbacks are not
+        supported by this solver.
+        """
+        return None
+
     def process_logfile(self):
         """
         Process the logfile for information about the optimization process.
@@ -185,10 +239,39 @@ class SystemCallSolver(OptSolver):
         """
         raise NotImplementedError
 
+    def solve_async(self, *args, **kwds):
+        """
+        Solve the problem without blocking the asyncio event loop.
+
+        This method returns a coroutine (``results = await
+        opt.solve_async(model, ...)``) and accepts the same arguments as
+        solve().  The problem is written and the results are read in the
+        loop's default executor, and the solver runs under
+        asyncio.create_subprocess_exec.  The solver process is killed
+        if the timelimit is exceeded or the coroutine is cancelled.
+
+        A solver object runs a single solve at a time; concurrent
+        solves require separate solver objects.  Requires Python 3.5
+        or newer.
+        """
+        if sys.version_info[:2] < (3, 5):
+            raise RuntimeError(
+                "solve_async requires Python 3.5 or newer")
+        from pyomo.opt.solver.async_shellcmd import solve_async
+        return solve_async(self, *args, **kwds)
+
     def _presolve(self, *args, **kwds):
         """
         Peform presolves.
         """
+        self._progress_callback = kwds.pop('progress_callback', None)
+        self._progress_monitor = None
+        if self._progress_callback is not None and \
+           self._log_progress_parser() is None:
+            raise ValueError(
+                "Solver '%s' does not support the progress_callback "
+                "keyword" % (self.name,))
+
         TempfileManager.push()
 
         self._keepfiles = kwds.pop("keepfiles", False)
@@ -242,7 +325,13 @@ class SystemCallSolver(OptSolver):
         sys.stdout.flush()
         self._rc, self._log = self._execute_command(self._command)
         sys.stdout.flush()
-        return Bunch(rc=self._rc, log=self._log)
+        return Bunch(rc=self._rc, log=self._log,
+                     interrupted=self._interrupted())
+
+    def _interrupted(self):
+        """True if the solver was stopped by the progress callback"""
+        return self._progress_monitor is not None and \
+            self._progress_monitor.stop_requested
 
     def _postsolve(self):
 
@@ -286,6 +375,10 @@ class SystemCallSolver(OptSolver):
 
         return results
 
+    def _postsolve_cached(self, results):
+        TempfileManager.pop(remove=not self._keepfiles)
+        return results
+
     def _execute_command(self,command):
         """
         Execute the command
@@ -298,14 +391,27 @@ class SystemCallSolver(OptSolver):
                 _input = command.script
             else:
                 _input = None
-            [rc, log] = run(
-                command.cmd,
-                stdin = _input,
-                timelimit = self._timelimit if self._timelimit is None else self._timelimit + max(1, 0.01*self._timelimit),
-                env   = command.env,
-                tee   = self._tee,
-                define_signal_handlers = self._define_signal_handlers
-             )
+            timelimit = self._timelimit if self._timelimit is None else self._timelimit + max(1, 0.01*self._timelimit)
+            if self._progress_callback is not None:
+                self._progress_monitor = ProgressMonitor(
+                    self._log_progress_parser(), self._progress_callback)
+                [rc, log] = run_with_progress(
+                    command.cmd,
+                    self._progress_monitor,
+                    stdin = _input,
+                    timelimit = timelimit,
+                    env   = command.env,
+                    tee   = self._tee
+                 )
+            else:
+                [rc, log] = run(
+                    command.cmd,
+                    stdin = _input,
+                    timelimit = timelimit,
+                    env   = command.env,
+                    tee   = self._tee,
+                    define_signal_handlers = self._define_signal_handlers
+                 )
         except OSError:
             err = sys.exc_info()[1]
             msg = 'Could not execute the command: %s\tError message: %s'
@@ -354,6 +460,20 @@ class SystemCallSolver(OptSolver):
             results.solver.error_rc=rc
             if rc != 0:
                 results.solver.status=SolverStatus.error
+        if self._interrupted():
+            # The solver was stopped by the progress callback: report
+            # the partial results (solvers typically report that they
+            # stopped on a limit or an error)
+            if rc:
+                results.solver.status=SolverStatus.aborted
+            if results.solver.termination_condition in \
+               (TerminationCondition.unknown,
+                TerminationCondition.error,
+                TerminationCondition.other,
+                TerminationCondition.maxIterations,
+                TerminationCondition.internalSolverError):
+                results.solver.termination_condition = \
+                    TerminationCondition.userInterrupt
 
         if self._last_solve_time != None:
             results.solver.time=self._last_solve_time
@@ -0,0 +1,137 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the process pool solver manager
+#
+
+import functools
+import multiprocessing
+
+import pyutilib.th as unittest
+
+import pyomo.environ
+from pyomo.common.collections import Options
+from pyomo.core import ConcreteModel, Var, Constraint, Objective
+from pyomo.opt import (SolverFactory, SolverManagerFactory, SolverResults,
+                       SolverStatus, TerminationCondition, SolutionStatus)
+from pyomo.opt.parallel.local import futures_available
+from pyomo.opt.parallel.manager import ActionManagerError, ActionStatus
+
+# The mock solver is registered when this module is imported, so the
+# worker processes must be forked from the test process
+_fork_available = 'fork' in multiprocessing.get_all_start_methods() \
+    if hasattr(multiprocessing, 'get_all_start_methods') else False
+
+
+@SolverFactory.register('_mock_process_solver',
+                        doc='Sets x[i] to scale*i + offset')
+class MockProcessSolver(object):
+
+    def __init__(self, **kwds):
+        self.type = '_mock_process_solver'
+        self.options = Options(scale=1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, v, traceback):
+        pass
+
+    def solve(self, model, **kwds):
+        if kwds.pop('fail', False):
+            raise RuntimeError("forced failure")
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.optimal
+        soln = results.solution.add()
+        soln._cuid = False
+        soln.status = SolutionStatus.optimal
+        for i in model.x:
+            soln.variable[model.x[i].name] = {
+                'Value': self.options.scale * i + model.offset}
+        results._smap_id = None
+        model.solutions.load_from(results)
+        results.solution.clear()
+        return results
+
+
+def build_model(offset=0):
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3])
+    m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+    m.o = Objective(expr=m.x[1] + m.x[2] + m.x[3])
+    m.offset = offset
+    return m
+
+
+@unittest.skipIf(not futures_available, "concurrent.futures is not available")
+@unittest.skipIf(not _fork_available, "workers cannot be forked")
+class TestProcessPoolManager(unittest.TestCase):
+
+    def test_registered(self):
+        self.assertIn('process', SolverManagerFactory)
+
+    def test_solve_all(self):
+        instances = [build_model(k) for k in range(4)]
+        with SolverManagerFactory('process', max_workers=2) as mngr:
+            mngr.solve_all('_mock_process_solver', instances)
+        for k, m in enumerate(instances):
+            self.assertEqual([m.x[i].value for i in m.x],
+                             [1 + k, 2 + k, 3 + k])
+
+    def test_queue_and_wait(self):
+        opt = SolverFactory('_mock_process_solver')
+        opt.options.scale = 10
+        m1 = build_model()
+        m2 = build_model(1)
+        with SolverManagerFactory('process', max_workers=2) as mngr:
+            ah1 = mngr.queue(m1, opt=opt)
+            ah2 = mngr.queue(m2, opt=opt, load_solutions=False)
+            self.assertEqual(mngr.num_queued(), 2)
+            ah = mngr.wait_any()
+            self.assertIn(ah, (ah1, ah2))
+            mngr.wait_all()
+            self.assertEqual(mngr.num_queued(), 0)
+            self.assertEqual(ah1.status, ActionStatus.done)
+            self.assertEqual(ah2.status, ActionStatus.done)
+            results = mngr.get_results(ah1)
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertEqual([m1.x[i].value for i in m1.x], [10, 20, 30])
+            # the solution is returned by name and can be loaded later
+            self.assertIsNone(m2.x[1].value)
+            results = mngr.get_results(ah2)
+            m2.solutions.load_from(results)
+            self.assertEqual([m2.x[i].value for i in m2.x], [11, 21, 31])
+
+    def test_model_factory(self):
+        m = build_model(5)
+        with SolverManagerFactory('process') as mngr:
+            results = mngr.solve(functools.partial(build_model, 5),
+                                 opt='_mock_process_solver')
+        m.solutions.load_from(results)
+        self.assertEqual([m.x[i].value for i in m.x], [6, 7, 8])
+
+    def test_errors(self):
+        with SolverManagerFactory('process') as mngr:
+            with self.assertRaisesRegexp(ActionManagerError, 'No solver'):
+                mngr.queue(build_model())
+            with self.assertRaisesRegexp(ActionManagerError, 'Pyomo model'):
+                mngr.queue(5, opt='_mock_process_solver')
+            ah = mngr.queue(build_model(), opt='_mock_process_solver',
+                            fail=True)
+            with self.assertRaisesRegexp(ActionManagerError,
+                                         'forced failure'):
+                mngr.wait_all()
+            self.assertEqual(ah.status, ActionStatus.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the solver result cache
+#
+
+import os
+import sys
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+import pyomo.environ
+from pyomo.core import Constraint, Suffix
+from pyomo.opt import SolverFactory, SolverResults, TerminationCondition
+from pyomo.opt.base.result_cache import SolverResultCache
+from pyomo.opt.tests.stub_solver import create_stub_solver, build_model
+
+def _results(message):
+    results = SolverResults()
+    results.solver.message = message
+    return results
+
+
+class TestSolverResultCache(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+        self.dirname = TempfileManager.create_tempdir()
+        self.cache = SolverResultCache(os.path.join(self.dirname, 'cache'))
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def _age(self, key, mtime):
+        os.utime(self.cache._filename(key), (mtime, mtime))
+
+    def test_get_set(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.cache.set('a', _results('first'))
+        self.assertEqual(str(self.cache.get('a').solver.message), 'first')
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        self.assertEqual(len(self.cache), 1)
+
+        # The cache is shared through the directory (e.g., with other
+        # processes)
+        other = SolverResultCache(self.cache.directory)
+        self.assertEqual(str(other.get('a').solver.message), 'first')
+
+    def test_lru_eviction(self):
+        for key in 'abc':
+            self.cache.set(key, _results(key))
+        size = self.cache.size() // 3
+        self._age('a', 1000)
+        self._age('b', 2000)
+        self._age('c', 3000)
+        # Reading an entry makes it the most recently used
+        self.assertIsNotNone(self.cache.get('a'))
+
+        self.cache.max_size = 3 * size
+        self.cache.set('d', _results('d'))
+        self.assertIsNone(self.cache.get('b'))
+        self.assertIsNotNone(self.cache.get('a'))
+        self.assertIsNotNone(self.cache.get('c'))
+        self.assertIsNotNone(self.cache.get('d'))
+        self.assertLessEqual(self.cache.size(), self.cache.max_size)
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_corrupt_entry(self):
+        self.cache.set('a', _results('first'))
+        with open(self.cache._filename('a'), 'wb') as FILE:
+            FILE.write(b'not a pickle')
+        self.assertIsNone(self.cache.get('a'))
+
+    def test_missing_directory(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(len(self.cache), 0)
+        self.cache.clear()
+
+
+@unittest.skipIf(sys.platform.startswith('win'),
+                 "the stub solver is a python script")
+class TestSolveWithResultCache(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+        self.stub = create_stub_solver()
+        self.runs = TempfileManager.create_tempfile(suffix='.runs')
+        os.environ['STUB_SOLVER_RUNS'] = self.runs
+        self.cache = SolverResultCache(TempfileManager.create_tempdir())
+        self.ncontexts = len(TempfileManager._tempfiles)
+
+    def tearDown(self):
+        # all of the temporary file contexts were popped
+        self.assertEqual(len(TempfileManager._tempfiles), self.ncontexts)
+        del os.environ['STUB_SOLVER_RUNS']
+        TempfileManager.pop(remove=True)
+
+    def _num_runs(self):
+        with open(self.runs) as FILE:
+            return len(FILE.readlines())
+
+    def test_solve(self):
+        opt = SolverFactory('asl:' + self.stub)
+        for i in range(3):
+            m = build_model()
+            m.dual = Suffix(direction=Suffix.IMPORT)
+            results = opt.solve(m, result_cache=self.cache)
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertEqual(m.x.value, 1.5)
+            self.assertEqual(m.y.value, 1.5)
+            self.assertEqual(m.dual[m.c], 1)
+        self.assertEqual(self._num_runs(), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+        # Solves are only cached when requested
+        opt.solve(build_model())
+        self.assertEqual(self._num_runs(), 2)
+
+    def test_key(self):
+        opt = SolverFactory('asl:' + self.stub)
+        opt.solve(build_model(), result_cache=self.cache)
+        # A different problem
+        m = build_model()
+        m.c2 = Constraint(expr=m.x <= 2)
+        opt.solve(m, result_cache=self.cache)
+        self.assertEqual(self._num_runs(), 2)
+        # Different options
+        opt.solve(build_model(), result_cache=self.cache,
+                  options={'tol': 1e-8})
+        self.assertEqual(self._num_runs(), 3)
+        opt.solve(build_model(), result_cache=self.cache,
+                  options={'tol': 1e-8})
+        self.assertEqual(self._num_runs(), 3)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_load_solutions_false(self):
+        opt = SolverFactory('asl:' + self.stub)
+        opt.solve(build_model(), result_cache=self.cache)
+        m = build_model()
+        results = opt.solve(m, result_cache=self.cache,
+                            load_solutions=False)
+        self.assertEqual(self._num_runs(), 1)
+        self.assertIsNone(m.x.value)
+        m.solutions.load_from(results)
+        self.assertEqual(m.x.value, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for SystemCallSolver.solve_async
+#
+
+import re
+import sys
+import time
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+import pyomo.environ
+from pyomo.common.errors import ApplicationError
+from pyomo.common.collections import Bunch
+from pyomo.opt import SolverFactory, TerminationCondition
+from pyomo.opt.base.result_cache import SolverResultCache
+from pyomo.opt.solver.progress import LogProgressParser, ProgressMonitor
+from pyomo.opt.tests.stub_solver import create_stub_solver, build_model
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+# A solver that ignores interrupt signals
+_stubborn_solver = """
+import signal, sys, time
+signal.signal(signal.SIGINT, signal.SIG_IGN)
+sys.stdout.write('incumbent 1\\n')
+sys.stdout.flush()
+time.sleep(30)
+"""
+
+
+class _Parser(LogProgressParser):
+
+    _line = re.compile(r'^incumbent (\S+)')
+
+    def parse_line(self, line):
+        match = self._line.match(line)
+        if match is None:
+            return False
+        return self._update(incumbent=float(match.group(1)))
+
+
+@unittest.skipIf(asyncio is None or sys.version_info[:2] < (3, 5),
+                 "solve_async requires Python 3.5")
+@unittest.skipIf(sys.platform.startswith('win'),
+                 "the stub solver is a python script")
+class TestSolveAsync(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        TempfileManager.push()
+        cls.stub = create_stub_solver()
+
+    @classmethod
+    def tearDownClass(cls):
+        TempfileManager.pop(remove=True)
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.ncontexts = len(TempfileManager._tempfiles)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        # all of the temporary file contexts were popped
+        self.assertEqual(len(TempfileManager._tempfiles), self.ncontexts)
+
+    def _solver(self):
+        return SolverFactory('asl:' + self.stub)
+
+    def test_solve(self):
+        m = build_model()
+        results = self.loop.run_until_complete(
+            self._solver().solve_async(m))
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertEqual(m.x.value, 1.5)
+        self.assertEqual(m.y.value, 1.5)
+
+    def test_solve_sync(self):
+        m = build_model()
+        results = self._solver().solve(m)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertEqual(m.x.value, 1.5)
+
+    def test_result_cache(self):
+        cache = SolverResultCache(TempfileManager.create_tempdir())
+        for i in range(2):
+            m = build_model()
+            results = self.loop.run_until_complete(
+                self._solver().solve_async(m, result_cache=cache))
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertEqual(m.x.value, 1.5)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_concurrent(self):
+        models = [build_model() for i in range(4)]
+        opts = [self._solver() for m in models]
+        for opt in opts:
+            opt.options['sleep'] = 0.5
+        start = time.time()
+        results = self.loop.run_until_complete(asyncio.gather(
+            *[opt.solve_async(m) for opt, m in zip(opts, models)]))
+        # the solvers run concurrently
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(len(results), 4)
+        for m in models:
+            self.assertEqual(m.x.value, 1.5)
+        # the ephemeral options are reset
+        for opt in opts:
+            self.assertEqual(opt.options['sleep'], 0.5)
+
+    def test_timelimit(self):
+        m = build_model()
+        opt = self._solver()
+        opt.options['sleep'] = 30
+        start = time.time()
+        with self.assertRaisesRegexp(ApplicationError,
+                                     'did not exit normally'):
+            self.loop.run_until_complete(
+                opt.solve_async(m, timelimit=0.1))
+        self.assertLess(time.time() - start, 10)
+        self.assertIsNone(m.x.value)
+
+    def test_cancel(self):
+        m = build_model()
+        opt = self._solver()
+        opt.options['sleep'] = 30
+        task = self.loop.create_task(opt.solve_async(m))
+        self.loop.call_later(1, task.cancel)
+        start = time.time()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(task)
+        self.assertLess(time.time() - start, 10)
+        self.assertIsNone(m.x.value)
+        self.assertEqual(opt.options['sleep'], 30)
+
+    def test_stop_grace_period(self):
+        from pyomo.opt.solver.async_shellcmd import _run_command
+        fname = TempfileManager.create_tempfile(suffix='.py')
+        with open(fname, 'w') as f:
+            f.write(_stubborn_solver)
+        command = Bunch(cmd=[sys.executable, fname], env=None)
+        monitor = ProgressMonitor(_Parser(), lambda *args: True)
+        start = time.time()
+        # The solver is killed once the grace period after the
+        # interrupt expires
+        rc, log = self.loop.run_until_complete(
+            _run_command(command, None, False, monitor, grace_period=0.5))
+        self.assertLess(time.time() - start, 10)
+        self.assertTrue(monitor.stop_requested)
+        self.assertNotEqual(rc, 0)
+        self.assertEqual(log, 'incumbent 1\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
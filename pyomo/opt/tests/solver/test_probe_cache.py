@@ -0,0 +1,202 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the solver probe cache
+#
+
+import logging
+import os
+import stat
+
+from six import StringIO
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.common.log import LoggingIntercept
+from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.probe_cache import SolverProbeCache, solver_probe_cache
+
+logger = logging.getLogger('pyomo.opt')
+
+
+class _Counter(object):
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class _ProbedSolver(SystemCallSolver):
+
+    def __init__(self, executable, version):
+        SystemCallSolver.__init__(self, type='_probed_solver')
+        self._exe = executable
+        self._probe = _Counter(version)
+
+    def _default_executable(self):
+        if self._exe is None:
+            logger.warning("Could not locate the executable")
+        return self._exe
+
+    def _get_version(self):
+        return self._probe()
+
+
+class TestSolverProbeCache(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+        self.exe = TempfileManager.create_tempfile(prefix='solver')
+        with open(self.exe, 'w') as FILE:
+            FILE.write('#!/bin/sh\n')
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IEXEC)
+        self.cachefile = TempfileManager.create_tempfile(suffix='.json')
+        os.remove(self.cachefile)
+        self.cache = SolverProbeCache(self.cachefile)
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def test_probe(self):
+        fcn = _Counter([1, 2, 3, 4])
+        self.assertEqual(self.cache.probe(self.exe, 'version', fcn),
+                         [1, 2, 3, 4])
+        self.assertEqual(self.cache.probe(self.exe, 'version', fcn),
+                         [1, 2, 3, 4])
+        self.assertEqual(fcn.calls, 1)
+        self.assertTrue(os.path.exists(self.cachefile))
+
+        # The cache is shared through the file (e.g., with other
+        # processes)
+        other = SolverProbeCache(self.cachefile)
+        self.assertEqual(other.probe(self.exe, 'version', fcn), [1, 2, 3, 4])
+        self.assertEqual(fcn.calls, 1)
+        other.set(self.exe, 'license', True)
+        self.assertTrue(self.cache.get(self.exe, 'license'))
+        self.assertEqual(self.cache.get(self.exe, 'version'), [1, 2, 3, 4])
+
+    def test_executable_changed(self):
+        self.cache.set(self.exe, 'version', [1, 0, 0, 0])
+        with open(self.exe, 'a') as FILE:
+            FILE.write('exit 0\n')
+        self.assertIsNone(self.cache.get(self.exe, 'version'))
+        self.cache.set(self.exe, 'version', [2, 0, 0, 0])
+        self.assertEqual(self.cache.get(self.exe, 'version'), [2, 0, 0, 0])
+
+    def test_max_age(self):
+        self.cache.set(self.exe, 'license', True)
+        self.assertTrue(self.cache.get(self.exe, 'license', max_age=60))
+        self.assertIsNone(self.cache.get(self.exe, 'license', max_age=-1))
+
+    def test_failed_probe(self):
+        fcn = _Counter(None)
+        self.assertIsNone(self.cache.probe(self.exe, 'version', fcn))
+        self.assertIsNone(self.cache.probe(self.exe, 'version', fcn))
+        self.assertEqual(fcn.calls, 2)
+
+    def test_missing_executable(self):
+        fcn = _Counter(True)
+        missing = os.path.join(os.path.dirname(self.exe), 'no_such_solver')
+        self.assertTrue(self.cache.probe(missing, 'license', fcn))
+        self.assertTrue(self.cache.probe(missing, 'license', fcn))
+        self.assertEqual(fcn.calls, 2)
+        self.assertTrue(self.cache.probe(None, 'license', fcn))
+        self.assertFalse(os.path.exists(self.cachefile))
+
+    def test_invalidate(self):
+        self.cache.set(self.exe, 'version', [1, 0, 0, 0])
+        self.cache.set(self.exe, 'license', True)
+        self.cache.invalidate(self.exe, 'license')
+        self.assertIsNone(self.cache.get(self.exe, 'license'))
+        self.assertEqual(self.cache.get(self.exe, 'version'), [1, 0, 0, 0])
+        self.cache.set(self.exe, 'license', True)
+        self.cache.invalidate(self.exe)
+        self.assertIsNone(self.cache.get(self.exe, 'license'))
+        self.assertIsNone(self.cache.get(self.exe, 'version'))
+        self.cache.set(self.exe, 'version', [1, 0, 0, 0])
+        self.cache.invalidate()
+        self.assertIsNone(self.cache.get(self.exe, 'version'))
+
+    def test_disabled(self):
+        self.cache.enabled = False
+        fcn = _Counter(True)
+        self.cache.probe(self.exe, 'license', fcn)
+        self.cache.probe(self.exe, 'license', fcn)
+        self.assertEqual(fcn.calls, 2)
+        self.assertFalse(os.path.exists(self.cachefile))
+
+    def test_corrupt_file(self):
+        with open(self.cachefile, 'w') as FILE:
+            FILE.write('{"not json')
+        self.assertIsNone(self.cache.get(self.exe, 'version'))
+        self.cache.set(self.exe, 'version', [1, 0, 0, 0])
+        self.assertEqual(self.cache.get(self.exe, 'version'), [1, 0, 0, 0])
+
+    def test_solver_version(self):
+        filename = solver_probe_cache.filename
+        solver_probe_cache.filename = self.cachefile
+        try:
+            opt = _ProbedSolver(self.exe, (1, 2, 3, 0))
+            self.assertEqual(opt.version(), (1, 2, 3, 0))
+            self.assertEqual(opt._probe.calls, 1)
+            # A new solver object for the same executable does not
+            # run the probe
+            opt = _ProbedSolver(self.exe, (1, 2, 3, 0))
+            self.assertEqual(opt.version(), (1, 2, 3, 0))
+            self.assertEqual(opt._probe.calls, 0)
+
+            solver_probe_cache.invalidate(self.exe)
+            opt = _ProbedSolver(self.exe, (1, 2, 3, 0))
+            self.assertEqual(opt.version(), (1, 2, 3, 0))
+            self.assertEqual(opt._probe.calls, 1)
+        finally:
+            solver_probe_cache.filename = filename
+
+    def test_solver_version_missing_executable(self):
+        opt = _ProbedSolver(None, (1, 2, 3, 0))
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo'):
+            self.assertIsNone(opt.version())
+        # The executable is not probed (and no warning is logged)
+        self.assertEqual(opt._probe.calls, 0)
+        self.assertEqual(OUT.getvalue(), '')
+
+    @unittest.skipIf(os.name != 'posix', "the stub solver is a shell script")
+    def test_license_check(self):
+        from pyomo.solvers.plugins.solvers.GUROBI import GUROBISHELL
+        flag = TempfileManager.create_tempfile(suffix='.lic')
+        os.remove(flag)
+        with open(self.exe, 'a') as FILE:
+            FILE.write('test -f %s\n' % (flag,))
+        filename = solver_probe_cache.filename
+        solver_probe_cache.filename = self.cachefile
+        try:
+            self.assertFalse(GUROBISHELL.license_is_valid(self.exe))
+            # Failed checks are not recorded...
+            self.assertIsNone(solver_probe_cache.get(
+                self.exe, 'GUROBISHELL.license_is_valid'))
+            # ... so a license installed later is found
+            open(flag, 'w').close()
+            self.assertTrue(GUROBISHELL.license_is_valid(self.exe))
+            self.assertTrue(solver_probe_cache.get(
+                self.exe, 'GUROBISHELL.license_is_valid'))
+            os.remove(flag)
+            self.assertTrue(GUROBISHELL.license_is_valid(self.exe))
+        finally:
+            solver_probe_cache.filename = filename
+
+
+if __name__ == "__main__":
+    unittest.main()
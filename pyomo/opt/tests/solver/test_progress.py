@@ -0,0 +1,171 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for monitoring the progress of shell solvers
+#
+
+import re
+import sys
+import time
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.opt.solver.progress import (LogProgressParser, ProgressMonitor,
+                                       run_with_progress, relative_gap)
+
+is_windows = sys.platform.startswith('win')
+
+# A solver that reports an improving incumbent every 0.1 seconds and
+# reports the best solution when it is interrupted
+_stub_solver = """
+import sys, time
+incumbent = 100
+try:
+    for i in range(%d):
+        incumbent -= 1
+        sys.stdout.write('incumbent %%d bound 0\\n' %% incumbent)
+        sys.stdout.flush()
+        time.sleep(0.1)
+except KeyboardInterrupt:
+    sys.stdout.write('interrupted\\n')
+sys.stdout.write('best %%d\\n' %% incumbent)
+"""
+
+
+class _Parser(LogProgressParser):
+
+    _line = re.compile(r'^incumbent (\S+) bound (\S+)')
+
+    def parse_line(self, line):
+        match = self._line.match(line)
+        if match is None:
+            return False
+        inc, bound = match.groups()
+        return self._update(incumbent=float(inc), bound=float(bound))
+
+
+class _Callback(object):
+
+    def __init__(self, stop_at=None):
+        self.stop_at = stop_at
+        self.calls = []
+
+    def __call__(self, t, incumbent, bound, gap):
+        self.calls.append((incumbent, bound, gap))
+        return self.stop_at is not None and incumbent <= self.stop_at
+
+
+class TestProgressMonitor(unittest.TestCase):
+
+    def test_relative_gap(self):
+        self.assertIsNone(relative_gap(None, 1))
+        self.assertIsNone(relative_gap(1, None))
+        self.assertEqual(relative_gap(10, 9), 0.1)
+        self.assertEqual(relative_gap(-10, -11), 0.1)
+        self.assertEqual(relative_gap(0, 0), 0)
+        self.assertEqual(relative_gap(0, 1), float('inf'))
+
+    def test_partial_lines(self):
+        callback = _Callback()
+        monitor = ProgressMonitor(_Parser(), callback)
+        monitor.write('header\nincumbent 1')
+        self.assertEqual(callback.calls, [])
+        monitor.write('0 bound 5\r\nincumbent 8 bo')
+        self.assertEqual(callback.calls, [(10, 5, 0.5)])
+        monitor.write('und 6')
+        monitor.close()
+        self.assertEqual(callback.calls, [(10, 5, 0.5), (8, 6, 0.25)])
+        self.assertEqual(monitor.getvalue(),
+                         'header\nincumbent 10 bound 5\r\nincumbent 8 bound 6')
+        self.assertFalse(monitor.stop_requested)
+
+    def test_stop_requested(self):
+        callback = _Callback(stop_at=9)
+        monitor = ProgressMonitor(_Parser(), callback)
+        monitor.write('incumbent 10 bound 5\nincumbent 9 bound 5\n'
+                      'incumbent 8 bound 5\n')
+        self.assertTrue(monitor.stop_requested)
+        # The callback is not called after it requests a stop
+        self.assertEqual(callback.calls, [(10, 5, 0.5), (9, 5, 4./9)])
+
+    def test_time(self):
+        times = []
+        monitor = ProgressMonitor(_Parser(),
+                                  lambda t, *args: times.append(t))
+        monitor.write('incumbent 10 bound 5\n')
+        # The wall time is used when the solver does not report it
+        self.assertGreaterEqual(times[-1], 0)
+        self.assertLess(times[-1], 10)
+        monitor.parser.time = 42.
+        monitor.write('incumbent 9 bound 5\n')
+        self.assertEqual(times[-1], 42.)
+
+
+@unittest.skipIf(is_windows, "the stub solver relies on SIGINT")
+class TestRunWithProgress(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def _stub(self, iterations):
+        fname = TempfileManager.create_tempfile(suffix='.py')
+        with open(fname, 'w') as FILE:
+            FILE.write(_stub_solver % (iterations,))
+        return [sys.executable, fname]
+
+    def test_run(self):
+        callback = _Callback()
+        monitor = ProgressMonitor(_Parser(), callback)
+        rc, log = run_with_progress(self._stub(3), monitor)
+        self.assertEqual(rc, 0)
+        self.assertEqual(log, 'incumbent 99 bound 0\nincumbent 98 bound 0\n'
+                         'incumbent 97 bound 0\nbest 97\n')
+        self.assertEqual([c[0] for c in callback.calls], [99, 98, 97])
+
+    def test_stop(self):
+        callback = _Callback(stop_at=97)
+        monitor = ProgressMonitor(_Parser(), callback)
+        start = time.time()
+        rc, log = run_with_progress(self._stub(1000), monitor)
+        self.assertLess(time.time() - start, 30)
+        self.assertTrue(monitor.stop_requested)
+        # The solver reports its partial results after the interrupt
+        self.assertEqual(rc, 0)
+        self.assertIn('interrupted\nbest 9', log)
+        self.assertEqual([c[0] for c in callback.calls], [99, 98, 97])
+
+    def test_stdin(self):
+        fname = TempfileManager.create_tempfile(suffix='.py')
+        with open(fname, 'w') as FILE:
+            FILE.write("import sys\n"
+                       "sys.stdout.write(sys.stdin.read())\n")
+        callback = _Callback()
+        monitor = ProgressMonitor(_Parser(), callback)
+        rc, log = run_with_progress([sys.executable, fname], monitor,
+                                    stdin='incumbent 3 bound 1\n')
+        self.assertEqual(rc, 0)
+        self.assertEqual(log, 'incumbent 3 bound 1\n')
+        self.assertEqual(callback.calls, [(3, 1, 2./3)])
+
+    def test_timelimit(self):
+        monitor = ProgressMonitor(_Parser(), _Callback())
+        start = time.time()
+        rc, log = run_with_progress(self._stub(1000), monitor, timelimit=0.5)
+        self.assertLess(time.time() - start, 30)
+        self.assertEqual(rc, -1)
+        self.assertTrue(log.startswith('incumbent 99 bound 0\n'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the solver scratch space
+#
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pyutilib.th as unittest
+from pyutilib.component.config.tempfiles import TempfileManagerPlugin
+from pyutilib.services import TempfileManager
+
+import pyomo.environ
+from pyomo.opt import SolverFactory, TerminationCondition
+from pyomo.opt.solver.scratch import SolverScratchSpace
+from pyomo.opt.tests.stub_solver import create_stub_solver, build_model
+
+class TestSolverScratchSpace(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+        self.base = TempfileManager.create_tempdir()
+        self.scratch = SolverScratchSpace(base=self.base)
+        self.scratch.enable()
+
+    def tearDown(self):
+        self.scratch.disable()
+        TempfileManager.pop(remove=True)
+
+    def _files(self):
+        return sorted(os.listdir(self.scratch.directory()))
+
+    def test_recycle(self):
+        with TempfileManager.push():
+            fname = TempfileManager.create_tempfile(suffix='.nl')
+            with open(fname, 'w') as FILE:
+                FILE.write('problem')
+        self.assertEqual(os.path.dirname(fname), self.scratch.directory())
+        self.assertEqual(os.path.dirname(self.scratch.directory()),
+                         self.base)
+        # The file is truncated (not removed)
+        self.assertEqual(os.path.getsize(fname), 0)
+
+        with TempfileManager.push():
+            self.assertEqual(TempfileManager.create_tempfile(suffix='.nl'),
+                             fname)
+            other = TempfileManager.create_tempfile(suffix='.sol')
+            self.assertNotEqual(other, fname)
+            # The name is reused if the file was removed
+            os.remove(other)
+        with TempfileManager.push():
+            self.assertEqual(TempfileManager.create_tempfile(suffix='.sol'),
+                             other)
+            self.assertTrue(os.path.exists(other))
+        self.assertEqual((self.scratch.created, self.scratch.recycled),
+                         (2, 2))
+        self.assertGreater(self.scratch.create_time, 0)
+        self.assertGreater(self.scratch.release_time, 0)
+        self.assertEqual(len(self._files()), 2)
+
+        self.scratch.reset_counters()
+        self.assertEqual((self.scratch.created, self.scratch.recycled),
+                         (0, 0))
+
+    def test_keep_files(self):
+        TempfileManager.push()
+        fname = TempfileManager.create_tempfile(suffix='.nl')
+        TempfileManager.pop(remove=False)
+        with TempfileManager.push():
+            self.assertNotEqual(
+                TempfileManager.create_tempfile(suffix='.nl'), fname)
+        self.assertTrue(os.path.exists(fname))
+        # Kept files are not removed
+        self.scratch.disable()
+        self.assertTrue(os.path.exists(fname))
+        os.remove(fname)
+
+    def test_max_free(self):
+        self.scratch.max_free = 1
+        with TempfileManager.push():
+            f1 = TempfileManager.create_tempfile(suffix='.nl')
+            f2 = TempfileManager.create_tempfile(suffix='.nl')
+        self.assertEqual(len(self._files()), 1)
+
+    def test_default_behavior(self):
+        # Files in an explicit directory, sequential files and declared
+        # files are removed as usual
+        dirname = TempfileManager.create_tempdir()
+        with TempfileManager.push():
+            f1 = TempfileManager.create_tempfile(dir=dirname)
+            TempfileManager.sequential_files(0)
+            try:
+                f2 = TempfileManager.create_tempfile(dir=dirname)
+            finally:
+                TempfileManager.unique_files()
+            f3 = os.path.join(self.scratch.directory(), 'extra.txt')
+            open(f3, 'w').close()
+            TempfileManager.add_tempfile(f3)
+            d1 = TempfileManager.create_tempdir(dir=dirname)
+        for name in (f1, f2, f3, d1):
+            self.assertFalse(os.path.exists(name))
+        self.assertEqual(self.scratch.created, 0)
+
+    def test_disable(self):
+        with TempfileManager.push():
+            fname = TempfileManager.create_tempfile(suffix='.nl')
+        dirname = self.scratch.directory()
+        self.scratch.disable()
+        self.assertFalse(self.scratch.enabled)
+        self.assertFalse(os.path.exists(fname))
+        self.assertFalse(os.path.exists(dirname))
+        with TempfileManager.push():
+            fname = TempfileManager.create_tempfile(suffix='.nl')
+            self.assertNotEqual(os.path.dirname(fname), self.base)
+        self.assertFalse(os.path.exists(fname))
+
+        self.scratch.enable()
+        with self.assertRaisesRegexp(RuntimeError, 'already enabled'):
+            self.scratch.enable(object())
+
+    def test_manager_class(self):
+        self.assertIsNot(type(TempfileManager), TempfileManagerPlugin)
+        self.assertIsInstance(TempfileManager, TempfileManagerPlugin)
+        other = SolverScratchSpace(base=self.base)
+        with self.assertRaisesRegexp(RuntimeError, 'another scratch space'):
+            other.enable()
+        self.scratch.disable()
+        self.assertIs(type(TempfileManager), TempfileManagerPlugin)
+        self.assertFalse(hasattr(TempfileManager, '_scratch_space'))
+
+    def test_threads(self):
+        # Files are created and recycled concurrently (as by the
+        # executor threads of asynchronous solves)
+        names = []
+        errors = []
+        def _worker():
+            try:
+                for i in range(20):
+                    fname = self.scratch._acquire('.nl', 'tmp', False)
+                    names.append(fname)
+                    self.scratch._release([fname], True, time.time())
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=_worker) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.scratch.created + self.scratch.recycled, 80)
+        self.assertEqual(len(set(names)), self.scratch.created)
+        self.assertLessEqual(self.scratch.created, 4)
+        self.assertEqual(len(self._files()), self.scratch.created)
+
+    @unittest.skipIf(os.name != 'posix', "pruning requires POSIX")
+    def test_prune(self):
+        # The directory of a process that no longer exists
+        proc = subprocess.Popen([sys.executable, '-c', 'pass'])
+        proc.wait()
+        dirname = os.path.join(self.base, 'pyomo-%d-abc' % (proc.pid,))
+        os.mkdir(dirname)
+        open(os.path.join(dirname, 'empty.nl'), 'w').close()
+        self.scratch.directory()
+        self.assertFalse(os.path.exists(dirname))
+
+        # Files that are not empty are kept
+        os.mkdir(dirname)
+        with open(os.path.join(dirname, 'kept.nl'), 'w') as FILE:
+            FILE.write('problem')
+        open(os.path.join(dirname, 'empty.nl'), 'w').close()
+        other = SolverScratchSpace(base=self.base)
+        other.directory()
+        self.assertEqual(os.listdir(dirname), ['kept.nl'])
+        other.cleanup()
+
+
+@unittest.skipIf(sys.platform.startswith('win'),
+                 "the stub solver is a python script")
+class TestSolveWithScratchSpace(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+        self.stub = create_stub_solver()
+        self.scratch = SolverScratchSpace(
+            base=TempfileManager.create_tempdir())
+        self.scratch.enable()
+
+    def tearDown(self):
+        self.scratch.disable()
+        TempfileManager.pop(remove=True)
+
+    def test_solve(self):
+        opt = SolverFactory('asl:' + self.stub)
+        for i in range(3):
+            m = build_model()
+            results = opt.solve(m)
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertEqual(m.x.value, 1.5)
+            if not i:
+                created = self.scratch.created
+        # Later solves reuse the files of the first solve
+        self.assertGreater(created, 0)
+        self.assertEqual(self.scratch.created, created)
+        self.assertEqual(self.scratch.recycled, 2*created)
+        # Only the (empty) recycled files remain
+        dirname = self.scratch.directory()
+        for fname in os.listdir(dirname):
+            self.assertEqual(os.path.getsize(os.path.join(dirname, fname)),
+                             0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# A stand-in for an AMPL solver, shared by the solver interface tests
+#
+
+import os
+import stat
+import sys
+
+from pyutilib.services import TempfileManager
+
+from pyomo.core import ConcreteModel, Var, Constraint, Objective
+
+# The solution of build_model(): x = y = 1.5 (and the dual of c)
+stub_solution = """stub solver: optimal
+
+Options
+3
+1
+1
+0
+1
+1
+2
+2
+1
+1.5
+1.5
+objno 0 0
+"""
+
+# The stub solver script.  It prints a version string for "-v" and
+# otherwise writes stub_solution next to the .nl file passed on the
+# command line, after sleeping for sleep=<sec> (if given).  Each solve
+# is recorded in $STUB_SOLVER_RUNS (if set).
+_stub_solver = """#!%s
+import os, sys, time
+if len(sys.argv) > 1 and sys.argv[1] == '-v':
+    print('stub solver 1.0')
+    sys.exit(0)
+if len(sys.argv) < 2 or not sys.argv[1].endswith('.nl'):
+    sys.exit(0)
+for arg in sys.argv[2:]:
+    if arg.startswith('sleep='):
+        time.sleep(float(arg[6:]))
+if os.environ.get('STUB_SOLVER_RUNS'):
+    with open(os.environ['STUB_SOLVER_RUNS'], 'a') as f:
+        f.write('run\\n')
+print('stub solver: optimal')
+with open(sys.argv[1][:-3] + '.sol', 'w') as f:
+    f.write(%r)
+"""
+
+
+def create_stub_solver():
+    """Write the (executable) stub solver script to a new tempfile
+
+    The file is managed by the current TempfileManager context.  As the
+    stub is a python script, tests using it should be skipped on
+    Windows.
+    """
+    fname = TempfileManager.create_tempfile(prefix='stubsolver')
+    with open(fname, 'w') as FILE:
+        FILE.write(_stub_solver % (sys.executable, stub_solution))
+    os.chmod(fname, os.stat(fname).st_mode | stat.S_IEXEC)
+    return fname
+
+
+def build_model():
+    """Return the model that stub_solution is the solution of"""
+    m = ConcreteModel()
+    m.x = Var(bounds=(0, None))
+    m.y = Var(bounds=(0, None))
+    m.c = Constraint(expr=m.x + m.y >= 3)
+    m.o = Objective(expr=m.x + m.y)
+    return m
@@ -37,6 +37,7 @@ from pyomo.core.expr.numvalue import (NumericConstant,
 from pyomo.core.base import SymbolMap, NameLabeler, _ExpressionData, SortComponents, var, param, Var, ExternalFunction, ComponentMap, Objective, Constraint, SOSConstraint, Suffix
 import pyomo.core.base.suffix
 from pyomo.repn.standard_repn import generate_standard_repn
+from pyomo.repn.util import canonical_form_data_objects
 
 import pyomo.core.kernel.suffix
 from pyomo.core.kernel.block import IBlock
@@ -139,6 +140,13 @@ def _get_bound(exp):
         return value(exp)
     raise ValueError("non-fixed bound or weight: " + str(exp))
 
+def _suffix_items(suffix):
+    """Iterate over the (component, value) pairs of a suffix (in bulk
+    for the Suffix component; see Suffix.bulk_items())"""
+    if hasattr(suffix, 'bulk_items'):
+        return suffix.bulk_items()
+    return iteritems(suffix)
+
 class StopWatch(object):
 
     def __init__(self):
@@ -934,10 +942,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
             block_repn = block._repn
 
             # Initializing the constraint dictionary
-            for constraint_data in block.component_data_objects(Constraint,
-                                                                active=True,
-                                                                sort=sorter,
-                                                                descend_into=False):
+            for constraint_data, repn in canonical_form_data_objects(
+                    block,
+                    active=True,
+                    sort=sorter,
+                    descend_into=False):
 
                 if (not constraint_data.has_lb()) and \
                    (not constraint_data.has_ub()):
@@ -949,8 +958,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     if len(conname) > max_rowname_len:
                         max_rowname_len = len(conname)
 
-                if constraint_data._linear_canonical_form:
-                    repn = constraint_data.canonical_form()
+                if repn is not None:
                     linear_vars = repn.linear_vars
                     nonlinear_vars = repn.nonlinear_vars
                 else:
@@ -1443,7 +1451,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
             obj_s_lines = []
             mod_s_lines = []
             for suffix in suffixes:
-                for component_data, suffix_value in iteritems(suffix):
+                for component_data, suffix_value in _suffix_items(suffix):
 
                     try:
                         symbol = symbol_map_byObject[id(component_data)]
@@ -1607,7 +1615,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
             s_lines = []
             for dual_suffix in suffix_dict['dual']:
 
-                for constraint_data, suffix_value in iteritems(dual_suffix):
+                for constraint_data, suffix_value in \
+                        _suffix_items(dual_suffix):
                     try:
                         # a constraint might not be referenced
                         # (inactive / on inactive block)
@@ -27,6 +27,7 @@ from pyomo.core.base import \
      SOSConstraint, Objective,
      ComponentMap, is_fixed)
 from pyomo.repn import generate_standard_repn
+from pyomo.repn.util import canonical_form_data_objects
 
 logger = logging.getLogger('pyomo.core')
 
@@ -426,8 +427,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     block._repn = ComponentMap()
                 block_repn = block._repn
 
-                for constraint_data in block.component_data_objects(
-                        Constraint,
+                for constraint_data, repn in canonical_form_data_objects(
+                        block,
                         active=True,
                         sort=sortOrder,
                         descend_into=False):
@@ -437,13 +438,13 @@ class ProblemWriter_mps(AbstractProblemWriter):
                         assert not constraint_data.equality
                         continue # non-binding, so skip
 
-                    if constraint_data._linear_canonical_form:
-                        repn = constraint_data.canonical_form()
-                    elif gen_con_repn:
-                        repn = generate_standard_repn(constraint_data.body)
-                        block_repn[constraint_data] = repn
-                    else:
-                        repn = block_repn[constraint_data]
+                    if repn is None:
+                        if gen_con_repn:
+                            repn = generate_standard_repn(
+                                constraint_data.body)
+                            block_repn[constraint_data] = repn
+                        else:
+                            repn = block_repn[constraint_data]
 
                     yield constraint_data, repn
 
@@ -108,6 +108,51 @@ class TestSuffix(unittest.TestCase):
         self.assertFileEqualsBaseline(join(currdir,"EXPORT_suffixes.test.nl"),
                                       join(currdir,"EXPORT_suffixes_float.baseline.nl"))
 
+    # test that EXPORT suffix values stored with set_values()
+    # (in dense arrays) end up in the NL file
+    def test_EXPORT_suffixes_dense(self):
+        def _model():
+            model = ConcreteModel()
+            model.junk = Suffix(direction=Suffix.EXPORT,datatype=Suffix.FLOAT)
+            model.dual = Suffix(direction=Suffix.EXPORT,datatype=Suffix.FLOAT)
+            model.x = Var()
+            model.y = Var([1,2], dense=True)
+            model.obj = Objective(expr=model.x+sum_product(model.y))
+            model.conx = Constraint(expr=model.x>=1)
+            model.cony = Constraint([1,2],rule=lambda model,i: model.y[i]>=1)
+            components = [model.x, model.y[1], model.y[2],
+                          model.conx, model.cony[1], model.cony[2]]
+            values = [1.5, 2.5, -2.5, 4.5, 5.5, 0.25]
+            return model, components, values
+
+        model, components, values = _model()
+        for obj, val in zip(components, values):
+            model.junk[obj] = val
+        for obj, val in zip(components[3:], values[3:]):
+            model.dual[obj] = val
+        model.junk[model.obj] = 3.5
+        model.junk[model] = 6.5
+        model.write(filename=join(currdir,"EXPORT_suffixes_sparse.test.nl"),
+                    format=ProblemFormat.nl,
+                    io_options={"symbolic_solver_labels" : False})
+
+        model, components, values = _model()
+        model.junk.set_values(components, values)
+        model.dual.set_values(components[3:], values[3:])
+        # These values are not in the dense storage
+        model.junk[model.obj] = 3.5
+        model.junk[model] = 6.5
+        model.write(filename=join(currdir,"EXPORT_suffixes.test.nl"),
+                    format=ProblemFormat.nl,
+                    io_options={"symbolic_solver_labels" : False})
+
+        try:
+            self.assertFileEqualsBaseline(
+                join(currdir,"EXPORT_suffixes.test.nl"),
+                join(currdir,"EXPORT_suffixes_sparse.test.nl"))
+        finally:
+            os.remove(join(currdir,"EXPORT_suffixes_sparse.test.nl"))
+
     # Test that user defined ref suffixes fail to
     # merge with those created from translating the SOSConstraint
     # component when variables get assigned duplicate values for ref
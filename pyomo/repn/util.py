@@ -10,6 +10,8 @@
 
 from pyomo.core.base import Var, Param, Expression, Objective, Block, \
     Constraint, Suffix
+from pyomo.core.base.matrix_constraint import _MatrixConstraintData
+from pyomo.common.timing import start_stage, stop_stage, record_counts
 from pyomo.core.expr.numvalue import native_numeric_types, is_fixed, value
 import logging
 
@@ -72,3 +74,43 @@ def ftoa(val):
             "Converting %s to string resulted in loss of precision" % val)
     #
     return a[:i]
+
+
+def canonical_form_data(constraints):
+    """Generate the canonical forms for a sequence of constraint data
+
+    Yields (constraint_data, repn) tuples in the order of the
+    constraints argument.  For constraints with a linear canonical
+    form, repn is the StandardRepn returned by canonical_form() (the
+    rows of a MatrixConstraint are processed in bulk for the whole
+    component).  For all other constraints, repn is None and the
+    caller must generate the representation of the body.
+    """
+    matrix_repns = {}
+    n = 0
+    for n, constraint_data in enumerate(constraints, 1):
+        if constraint_data.__class__ is _MatrixConstraintData:
+            comp = constraint_data.parent_component()
+            repns = matrix_repns.get(id(comp))
+            if repns is None:
+                stage = start_stage("repn %s" % (comp.name,))
+                repns = matrix_repns[id(comp)] = comp.canonical_forms()
+                stop_stage(stage, constraints=len(repns))
+            yield constraint_data, repns[constraint_data.index()]
+        elif constraint_data._linear_canonical_form:
+            yield constraint_data, constraint_data.canonical_form()
+        else:
+            yield constraint_data, None
+    record_counts(constraints=n)
+
+
+def canonical_form_data_objects(block, active=True, sort=False,
+                                descend_into=True):
+    """Generate the constraint data on a block with their canonical forms
+
+    Yields (constraint_data, repn) tuples in the same order as
+    block.component_data_objects(Constraint, ...).  See
+    canonical_form_data().
+    """
+    return canonical_form_data(block.component_data_objects(
+        Constraint, active=active, sort=sort, descend_into=descend_into))
@@ -11,6 +11,8 @@
 def load():
     import pyomo.solvers.plugins.converter
     import pyomo.solvers.plugins.smanager
-    import pyomo.solvers.plugins.solvers
     import pyomo.solvers.plugins.testdriver
+    # Note: the solver interfaces (pyomo.solvers.plugins.solvers) are
+    # registered lazily by pyomo.environ (see
+    # pyomo.environ.plugin_manifest)
 
@@ -23,6 +23,7 @@ from pyomo.opt.base import ProblemFormat, ResultsFormat, OptSolver
 from pyomo.opt.base.solvers import _extract_version, SolverFactory
 from pyomo.opt.results import SolverResults, Solution, SolverStatus, TerminationCondition, SolutionStatus 
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.probe_cache import solver_probe_cache
 
 from six.moves import zip
 
@@ -124,7 +125,16 @@ class BARONSHELL(SystemCallSolver):
         given executable (default is 'baron'). All output is
         hidden. If the test fails for any reason (including
         the executable being invalid), then this function
-        will return False."""
+        will return False. A valid license is recorded in
+        the solver probe cache (for up to license_max_age
+        seconds)."""
+        return bool(solver_probe_cache.probe(
+            executable, 'BARONSHELL.license_is_valid',
+            lambda: BARONSHELL._check_license(executable) or None,
+            max_age=solver_probe_cache.license_max_age))
+
+    @staticmethod
+    def _check_license(executable):
         fnames= BARONSHELL._get_dummy_input_files(check_license=True)
         try:
             process = subprocess.Popen([executable, fnames[0]],
@@ -29,6 +29,7 @@ from pyomo.opt.base import ProblemFormat, ResultsFormat, OptSolver
 from pyomo.opt.base.solvers import _extract_version, SolverFactory
 from pyomo.opt.results import SolverResults, SolverStatus, TerminationCondition, SolutionStatus, ProblemSense, Solution
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.progress import LogProgressParser
 from pyomo.solvers.mockmip import MockMIP
 
 logger = logging.getLogger('pyomo.solvers')
@@ -124,6 +125,59 @@ class CBC(OptSolver):
 
 
 
+class CBCProgressParser(LogProgressParser):
+    """Extracts the progress of CBC from its log"""
+
+    # CBC reports an objective of 1e50 when there is no solution
+    _infinity = 1e50
+
+    _continuous = re.compile(
+        r'Continuous objective value is (\S+) - (\S+) seconds')
+    _root_cuts = re.compile(
+        r'Cbc0013I At root node, .* objective from \S+ to (\S+) in')
+    _solution = re.compile(
+        r'Cbc00(?:04|12)I Integer solution of (\S+) found .*'
+        r'\((\S+) seconds\)')
+    _nodes = re.compile(
+        r'Cbc0010I After \d+ nodes, \d+ on tree, (\S+) best solution, '
+        r'best possible (\S+) \((\S+) seconds\)')
+    _search = re.compile(
+        r'Cbc000[15]I .*best objective (\S+?),? '
+        r'(?:\(best possible (\S+)\), )?took .*\((\S+) seconds\)')
+
+    def _value(self, value):
+        if value is None:
+            return None
+        value = float(value)
+        if abs(value) >= self._infinity:
+            return None
+        return value
+
+    def parse_line(self, line):
+        match = self._nodes.search(line)
+        if match:
+            inc, bound, t = match.groups()
+            return self._update(time=float(t), incumbent=self._value(inc),
+                                bound=self._value(bound))
+        match = self._solution.search(line)
+        if match:
+            inc, t = match.groups()
+            return self._update(time=float(t), incumbent=self._value(inc))
+        match = self._search.search(line)
+        if match:
+            inc, bound, t = match.groups()
+            return self._update(time=float(t), incumbent=self._value(inc),
+                                bound=self._value(bound))
+        match = self._root_cuts.search(line)
+        if match:
+            return self._update(bound=self._value(match.group(1)))
+        match = self._continuous.search(line)
+        if match:
+            bound, t = match.groups()
+            return self._update(time=float(t), bound=self._value(bound))
+        return False
+
+
 @SolverFactory.register('_cbc_shell',  doc='Shell interface to the CBC LP/MIP solver')
 class CBCSHELL(SystemCallSolver):
     """Shell interface to the CBC LP/MIP solver
@@ -288,6 +342,9 @@ class CBCSHELL(SystemCallSolver):
                     print("Warm start write time=%.2f seconds" % (end_time-start_time))
 
 
+    def _log_progress_parser(self):
+        return CBCProgressParser()
+
     def _default_executable(self):
         executable = Executable("cbc")
         if not executable:
@@ -30,6 +30,7 @@ from pyomo.opt.results import (
     ProblemSense, Solution,
 )
 from pyomo.opt.solver import ILMLicensedSystemCallSolver
+from pyomo.opt.solver.progress import LogProgressParser
 from pyomo.solvers.mockmip import MockMIP
 from pyomo.core.base import Var, Suffix, active_export_suffix_generator
 from pyomo.core.kernel.suffix import export_suffix_generator
@@ -145,6 +146,69 @@ class ORDFileSchema(object):
             return ""
 
 
+class CPLEXProgressParser(LogProgressParser):
+    """Extracts the progress of CPLEX from its log
+
+    The columns of the CPLEX node log are not always filled in (e.g.,
+    there is no incumbent before a solution is found and the bound
+    is replaced by the cuts added at the root node), so the
+    incumbent and bound are identified by the objective values
+    (which CPLEX always prints with a decimal point) that precede the
+    gap.  CPLEX does not report the time in its node log, so the wall
+    time is used.
+    """
+
+    _node = re.compile(r'^\*?\s*\d+\+?\s+\d+\+?\s+(.*)$')
+    _value = re.compile(r'^-?\d+\.\d*(?:e[-+]?\d+)?$')
+    _cuts = re.compile(r'[A-Za-z]+: \d+')
+    _incumbent = re.compile(
+        r'^Found incumbent of value (\S+) after')
+    _final = re.compile(
+        r'^MIP - .*Objective\s*=\s*(\S+)')
+    _final_bound = re.compile(
+        r'^Current MIP best bound\s*=\s*(\S+) \(gap = \S+, (\S+)%\)')
+
+    def parse_line(self, line):
+        match = self._node.match(line)
+        if match:
+            return self._parse_node(match.group(1))
+        match = self._incumbent.match(line)
+        if match:
+            return self._update(incumbent=float(match.group(1)))
+        match = self._final.match(line)
+        if match:
+            return self._update(incumbent=float(match.group(1)))
+        match = self._final_bound.match(line)
+        if match:
+            bound, gap = match.groups()
+            return self._update(bound=float(bound), gap=float(gap)/100.)
+        return False
+
+    def _parse_node(self, line):
+        tokens = line.split()
+        if not tokens:
+            return False
+        # The gap is only reported once there is an incumbent
+        gap = tokens[-1]
+        has_incumbent = gap.endswith('%') or gap == '---'
+        if gap.endswith('%'):
+            gap = float(gap[:-1])/100.
+        else:
+            gap = None
+        values = [float(x) for x in tokens if self._value.match(x)]
+        inc = bound = None
+        if has_incumbent:
+            if not values:
+                return False
+            if self._cuts.search(line) or len(values) == 1:
+                inc = values[-1]
+            else:
+                inc, bound = values[-2:]
+        elif len(values) >= 2 and not self._cuts.search(line):
+            bound = values[-1]
+        return self._update(incumbent=inc, bound=bound, gap=gap)
+
+
 @SolverFactory.register('_cplex_shell', doc='Shell interface to the CPLEX LP/MIP solver')
 class CPLEXSHELL(ILMLicensedSystemCallSolver):
     """Shell interface to the CPLEX LP/MIP solver
@@ -380,6 +444,9 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
                         % (end_time - start_time)
                     )
 
+    def _log_progress_parser(self):
+        return CPLEXProgressParser()
+
     def _default_executable(self):
         executable = Executable("cplex")
         if not executable:
@@ -24,6 +24,8 @@ from pyomo.opt.base import ProblemFormat, ResultsFormat, OptSolver
 from pyomo.opt.base.solvers import _extract_version, SolverFactory
 from pyomo.opt.results import SolverStatus, TerminationCondition, SolutionStatus, ProblemSense, Solution
 from pyomo.opt.solver import ILMLicensedSystemCallSolver
+from pyomo.opt.solver.probe_cache import solver_probe_cache
+from pyomo.opt.solver.progress import LogProgressParser
 from pyomo.core.kernel.block import IBlock
 
 logger = logging.getLogger('pyomo.solvers')
@@ -81,6 +83,51 @@ class GUROBI(OptSolver):
 
 
 
+class GurobiProgressParser(LogProgressParser):
+    """Extracts the progress of Gurobi from its log"""
+
+    # e.g., "H   12     4   11.00000    5    2   12.00000   11.75000  2.08%   1.2    0s"
+    # (the incumbent and gap are "-" before a solution is found)
+    _node = re.compile(
+        r'^[\sH*]\s*\d+\+?\s+\d+\+?\s.*?(-|\S+)\s+(\S+)\s+(-|\S+%)'
+        r'\s+(?:-|\S+)\s+(\d+)s$')
+    _heuristic = re.compile(
+        r'^Found heuristic solution: objective (\S+)')
+    _final = re.compile(
+        r'^Best objective (\S+), best bound (\S+), gap (\S+)%')
+
+    @staticmethod
+    def _value(value):
+        if value == '-':
+            return None
+        return float(value)
+
+    def parse_line(self, line):
+        match = self._node.match(line)
+        if match:
+            inc, bound, gap, t = match.groups()
+            try:
+                inc = self._value(inc)
+                bound = self._value(bound)
+                gap = self._value(gap.rstrip('%'))
+            except ValueError:
+                return False
+            if gap is not None:
+                gap /= 100.
+            return self._update(time=float(t), incumbent=inc, bound=bound,
+                                gap=gap)
+        match = self._heuristic.match(line)
+        if match:
+            return self._update(incumbent=float(match.group(1)))
+        match = self._final.match(line)
+        if match:
+            inc, bound, gap = match.groups()
+            return self._update(incumbent=self._value(inc),
+                                bound=self._value(bound),
+                                gap=float(gap)/100.)
+        return False
+
+
 @SolverFactory.register('_gurobi_shell',  doc='Shell interface to the GUROBI LP/MIP solver')
 class GUROBISHELL(ILMLicensedSystemCallSolver):
     """Shell interface to the GUROBI LP/MIP solver
@@ -125,8 +172,19 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
         given executable (default is 'gurobi_cl'). All
         output is hidden. If the test fails for any reason
         (including the executable being invalid), then this
-        function will return False.
+        function will return False. A valid license is
+        recorded in the solver probe cache (for up to
+        license_max_age seconds).
         """
+        # Only valid licenses are recorded (None is not cached), so
+        # that a license installed after a failed check is detected
+        return bool(solver_probe_cache.probe(
+            executable, 'GUROBISHELL.license_is_valid',
+            lambda: GUROBISHELL._check_license(executable) or None,
+            max_age=solver_probe_cache.license_max_age))
+
+    @staticmethod
+    def _check_license(executable):
         try:
             rc = subprocess.call([executable, "--license"],
                                  stdout=subprocess.PIPE,
@@ -244,6 +302,9 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
                 if self._report_timing is True:
                     print("Warm start write time=%.2f seconds" % (end_time-start_time))
 
+    def _log_progress_parser(self):
+        return GurobiProgressParser()
+
     def _default_executable(self):
         if sys.platform == 'win32':
             executable = Executable("gurobi.bat")
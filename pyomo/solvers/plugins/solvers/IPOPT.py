@@ -9,16 +9,24 @@
 #  ___________________________________________________________________________
 
 import os
+import re
+import weakref
+
+from six import iteritems
 
 from pyomo.common import Executable
 from pyomo.common.collections import Options, Bunch
+from pyomo.common.dependencies import numpy
 from pyutilib.services import TempfileManager
 from pyutilib.subprocess import run
 
+from pyomo.core.base.block import _BlockData
+from pyomo.core.base.suffix import Suffix
 from pyomo.opt.base import ProblemFormat, ResultsFormat
 from pyomo.opt.base.solvers import _extract_version, SolverFactory
 from pyomo.opt.results import SolverStatus, SolverResults, TerminationCondition
 from pyomo.opt.solver import  SystemCallSolver
+from pyomo.opt.solver.progress import LogProgressParser
 
 import logging
 logger = logging.getLogger('pyomo.solvers')
@@ -29,12 +37,49 @@ except:
     basestring = str
 
 
+class IpoptProgressParser(LogProgressParser):
+    """Extracts the progress of Ipopt from its iteration log
+
+    The incumbent is the objective of the current iterate (which may
+    not be feasible); Ipopt does not report a bound.
+    """
+
+    # e.g., "   5r 1.2345678e+01 1.00e-01 2.00e+00  -1.0 3.00e-01    -  1.00e+00 1.00e+00f  1"
+    _iteration = re.compile(
+        r'^\s*\d+r?\s+(-?\d\.\d+e[-+]\d+)\s+\d\.\d+e[-+]\d+\s+'
+        r'\d\.\d+e[-+]\d+\s')
+
+    def parse_line(self, line):
+        match = self._iteration.match(line)
+        if match:
+            return self._update(incumbent=float(match.group(1)))
+        return False
+
+
 @SolverFactory.register('ipopt', doc='The Ipopt NLP solver')
 class IPOPT(SystemCallSolver):
     """
     An interface to the Ipopt optimizer that uses the AMPL Solver Library.
+
+    Solving with warmstart=True warm starts Ipopt from the last solution
+    of the same model: the bound multipliers (ipopt_zL_out and
+    ipopt_zU_out) and constraint duals of each such solve are stored
+    (as arrays), and the next solve with warmstart=True sends them to
+    Ipopt (as the ipopt_zL_in, ipopt_zU_in and dual suffixes) along
+    with the warm start options in _warm_start_options (unless they are
+    set by the user).  The primal starting point is the current value
+    of the variables, i.e., the last solution if it was loaded into
+    the model.
     """
 
+    # The Ipopt options for a warm start
+    _warm_start_options = (
+        ('warm_start_init_point', 'yes'),
+        ('warm_start_bound_push', 1e-6),
+        ('warm_start_mult_bound_push', 1e-6),
+        ('mu_init', 1e-6),
+    )
+
     def __init__(self, **kwds):
         #
         # Call base constructor
@@ -59,9 +104,30 @@ class IPOPT(SystemCallSolver):
         self._capabilities.sos1 = False
         self._capabilities.sos2 = False
 
+        self._warm_start_solve = False
+        self._warm_start_model = None
+        # model -> (variables, zL, zU, constraints, duals)
+        self._warm_start_points = weakref.WeakKeyDictionary()
+
+    def warm_start_capable(self):
+        return True
+
+    def clear_warm_start(self, model=None):
+        """
+        Discard the solution stored to warm start a model (or all
+        models).
+        """
+        if model is None:
+            self._warm_start_points.clear()
+        else:
+            self._warm_start_points.pop(model, None)
+
     def _default_results_format(self, prob_format):
         return ResultsFormat.sol
 
+    def _log_progress_parser(self):
+        return IpoptProgressParser()
+
     def _default_executable(self):
         executable = Executable("ipopt")
         if not executable:
@@ -81,6 +147,113 @@ class IPOPT(SystemCallSolver):
         results = run( [solver_exec,"-v"], timelimit=1 )
         return _extract_version(results[1])
 
+    def _presolve(self, *args, **kwds):
+        self._warm_start_solve = kwds.pop('warmstart', False)
+        self._warm_start_model = None
+        if not self._warm_start_solve:
+            return super(IPOPT, self)._presolve(*args, **kwds)
+
+        if len(args) != 1 or not isinstance(args[0], _BlockData):
+            raise ValueError(
+                "The warmstart keyword of solver '%s' requires a single "
+                "Pyomo model" % (self.name,))
+        model = self._warm_start_model = args[0]
+        # Import the multipliers to warm start the next solve
+        suffixes = list(kwds.pop('suffixes', []))
+        for name in ('dual', 'ipopt_zL_out', 'ipopt_zU_out'):
+            if name not in suffixes:
+                suffixes.append(name)
+        kwds['suffixes'] = suffixes
+
+        point = self._warm_start_points.get(model)
+        if point is None:
+            return super(IPOPT, self)._presolve(*args, **kwds)
+        for key, val in self._warm_start_options:
+            if key not in self.options and 'OF_'+key not in self.options:
+                self.options[key] = val
+        restore = self._export_warm_start_point(model, point)
+        try:
+            super(IPOPT, self)._presolve(*args, **kwds)
+        finally:
+            for undo in reversed(restore):
+                undo()
+
+    def _export_warm_start_point(self, model, point):
+        """
+        Store the multipliers of a warm start point on the export
+        suffixes of the model, declaring any missing suffixes.  Returns
+        a list of functions that undo the changes to the model.
+        """
+        variables, zL, zU, constraints, duals = point
+        suffix_values = (('ipopt_zL_in', variables, zL),
+                         ('ipopt_zU_in', variables, zU),
+                         ('dual', constraints, duals))
+        for name, components, values in suffix_values:
+            suffix = model.component(name)
+            if suffix is not None and suffix.ctype is not Suffix:
+                raise ValueError(
+                    "Cannot warm start model '%s' with solver '%s': the "
+                    "model component '%s' is not a Suffix"
+                    % (model.name, self.name, name))
+        restore = []
+        for name, components, values in suffix_values:
+            suffix = model.component(name)
+            if suffix is None:
+                suffix = Suffix(direction=Suffix.EXPORT,
+                                datatype=Suffix.FLOAT)
+                model.add_component(name, suffix)
+                restore.append(lambda s=suffix: model.del_component(s))
+            elif not suffix.export_enabled():
+                restore.append(
+                    lambda s=suffix, d=suffix.get_direction():
+                    s.set_direction(d))
+                suffix.set_direction(Suffix.IMPORT_EXPORT)
+            suffix.set_values(components, values)
+        return restore
+
+    def _postsolve(self):
+        results = super(IPOPT, self)._postsolve()
+        self._store_warm_start_point(results)
+        return results
+
+    def _postsolve_cached(self, results):
+        results = super(IPOPT, self)._postsolve_cached(results)
+        self._store_warm_start_point(results)
+        return results
+
+    def _store_warm_start_point(self, results):
+        """
+        Store the multipliers of an optimal solution to warm start the
+        next solve of the model.
+        """
+        model = self._warm_start_model
+        self._warm_start_model = None
+        if model is None or len(results.solution) == 0 or \
+           results.solver.termination_condition not in \
+           (TerminationCondition.optimal,
+            TerminationCondition.locallyOptimal):
+            # Keep the last point
+            return
+        bySymbol = model.solutions.symbol_map[self._smap_id].bySymbol
+        soln = results.solution(0)
+        variables = []
+        zL = []
+        zU = []
+        for symbol, entry in iteritems(soln.variable):
+            variables.append(bySymbol[symbol]())
+            zL.append(entry.get('ipopt_zL_out', 0))
+            zU.append(entry.get('ipopt_zU_out', 0))
+        constraints = []
+        duals = []
+        for symbol, entry in iteritems(soln.constraint):
+            if 'Dual' in entry:
+                constraints.append(bySymbol[symbol]())
+                duals.append(entry['Dual'])
+        self._warm_start_points[model] = (
+            tuple(variables), numpy.array(zL, dtype=float),
+            numpy.array(zU, dtype=float), tuple(constraints),
+            numpy.array(duals, dtype=float))
+
     def create_command_line(self, executable, problem_files):
 
         assert(self._problem_format == ProblemFormat.nl)
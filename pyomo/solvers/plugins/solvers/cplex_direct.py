@@ -8,6 +8,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import itertools
 import logging
 import re
 import six
@@ -19,6 +20,7 @@ from pyomo.core.base import Suffix, Var, Constraint, SOSConstraint, Objective
 from pyomo.core.expr.numvalue import is_fixed
 from pyomo.core.expr.numvalue import value
 from pyomo.repn import generate_standard_repn
+from pyomo.repn.util import canonical_form_data, canonical_form_data_objects
 from pyomo.solvers.plugins.solvers.direct_solver import DirectSolver
 from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import DirectOrPersistentSolver
 from pyomo.core.kernel.objective import minimize, maximize
@@ -377,8 +379,8 @@ class CPLEXDirect(DirectSolver):
 
         lin_con_data = _LinearConstraintData(self._solver_model)
         for sub_block in block.block_data_objects(descend_into=True, active=True):
-            for con in sub_block.component_data_objects(
-                ctype=Constraint,
+            for con, repn in canonical_form_data_objects(
+                sub_block,
                 descend_into=False,
                 active=True,
                 sort=True,
@@ -387,7 +389,7 @@ class CPLEXDirect(DirectSolver):
                     assert not con.equality
                     continue  # non-binding, so skip
 
-                self._add_constraint(con, lin_con_data)
+                self._add_constraint(con, lin_con_data, repn)
 
             for con in sub_block.component_data_objects(
                 ctype=SOSConstraint,
@@ -411,18 +413,35 @@ class CPLEXDirect(DirectSolver):
                 self._set_objective(obj)
         lin_con_data.store_in_cplex()
 
-    def _add_constraint(self, con, lin_con_data=None):
+    def _add_vars(self, var_seq):
+        var_data = _VariableData(self._solver_model)
+        for var in var_seq:
+            self._add_var(var, var_data)
+        var_data.store_in_cplex()
+
+    def _add_constraints(self, con_seq):
+        lin_con_data = _LinearConstraintData(self._solver_model)
+        for con, repn in canonical_form_data(con_seq):
+            self._add_constraint(con, lin_con_data, repn)
+        lin_con_data.store_in_cplex()
+
+    def _add_constraint(self, con, lin_con_data=None, repn=None):
         if not con.active:
             return None
 
-        if self._skip_trivial_constraints and is_fixed(con.body):
+        if con._linear_canonical_form:
+            if repn is None:
+                repn = con.canonical_form()
+            if self._skip_trivial_constraints and repn.is_fixed():
+                return None
+        elif self._skip_trivial_constraints and is_fixed(con.body):
             return None
 
         conname = self._symbol_map.getSymbol(con, self._labeler)
 
         if con._linear_canonical_form:
             cplex_expr, referenced_vars = self._get_expr_from_pyomo_repn(
-                con.canonical_form(), self._max_constraint_degree
+                repn, self._max_constraint_degree
             )
         else:
             cplex_expr, referenced_vars = self._get_expr_from_pyomo_expr(
@@ -824,14 +843,38 @@ class CPLEXDirect(DirectSolver):
                     [var_names, var_values],
                     self._solver_model.MIP_starts.effort_level.auto)
 
+    def _get_var_load_order(self):
+        if self._var_load_order is None:
+            var_map = self._pyomo_var_to_ndx_map
+            ref_vars = self._referenced_variables
+            pyomo_vars = tuple(var for var in var_map if ref_vars[var] > 0)
+            self._var_load_order = (
+                pyomo_vars, [var_map[var] for var in pyomo_vars])
+        return self._var_load_order
+
+    def _get_con_load_order(self):
+        """Return a tuple (pyomo_cons, linear_cons, quadratic_cons) where
+        pyomo_cons is aligned with the names of the cplex linear
+        constraints followed by the cplex quadratic constraints"""
+        if self._con_load_order is None:
+            reverse_con_map = self._solver_con_to_pyomo_con_map
+            linear_cons = self._solver_model.linear_constraints.get_names()
+            quadratic_cons = self._solver_model.quadratic_constraints.get_names()
+            pyomo_cons = tuple(reverse_con_map[cplex_con] for cplex_con
+                               in itertools.chain(linear_cons, quadratic_cons))
+            self._con_load_order = (pyomo_cons, linear_cons, quadratic_cons)
+        return self._con_load_order
+
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_ndx_map
         if vars_to_load is None:
-            vals = self._solver_model.solution.get_values()
-            vars_to_load = var_map.keys()
-        else:
-            cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-            vals = self._solver_model.solution.get_values(cplex_vars_to_load)
+            pyomo_vars, cplex_vars = self._get_var_load_order()
+            vals = self._solver_model.solution.get_values(cplex_vars)
+            self._load_var_values(pyomo_vars, vals)
+            return
+
+        var_map = self._pyomo_var_to_ndx_map
+        cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
+        vals = self._solver_model.solution.get_values(cplex_vars_to_load)
 
         for pyomo_var, val in zip(vars_to_load, vals):
             if self._referenced_variables[pyomo_var] > 0:
@@ -841,12 +884,15 @@ class CPLEXDirect(DirectSolver):
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         rc = self._pyomo_model.rc
         if vars_to_load is None:
-            vars_to_load = var_map.keys()
+            pyomo_vars, cplex_vars = self._get_var_load_order()
+            vals = self._solver_model.solution.get_reduced_costs(cplex_vars)
+            self._load_suffix_values(rc, pyomo_vars, vals)
+            return
 
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
         cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.solution.get_reduced_costs(cplex_vars_to_load)
 
@@ -862,17 +908,33 @@ class CPLEXDirect(DirectSolver):
         dual = self._pyomo_model.dual
 
         if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.linear_constraints.get_names()
+            pyomo_cons, linear_cons, quadratic_cons = \
+                self._get_con_load_order()
+            if quadratic_cons:
+                pyomo_cons = pyomo_cons[:len(linear_cons)]
             vals = self._solver_model.solution.get_dual_values()
-        else:
-            cplex_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.linear_constraints.get_names()))
-            vals = self._solver_model.solution.get_dual_values(linear_cons_to_load)
+            self._load_suffix_values(dual, pyomo_cons, vals)
+            return
+
+        cplex_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
+        linear_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.linear_constraints.get_names()))
+        vals = self._solver_model.solution.get_dual_values(linear_cons_to_load)
 
         for i, cplex_con in enumerate(linear_cons_to_load):
             pyomo_con = reverse_con_map[cplex_con]
             dual[pyomo_con] = vals[i]
 
+    def _get_range_slack(self, cplex_con, linear_slack):
+        R_ = self._solver_model.linear_constraints.get_range_values(cplex_con)
+        if R_ == 0:
+            return linear_slack
+        Ls_ = linear_slack
+        Us_ = R_ - Ls_
+        if abs(Us_) > abs(Ls_):
+            return Us_
+        else:
+            return -Ls_
+
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
             self._pyomo_model.slack = Suffix(direction=Suffix.IMPORT)
@@ -881,30 +943,29 @@ class CPLEXDirect(DirectSolver):
         slack = self._pyomo_model.slack
 
         if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.linear_constraints.get_names()
-            linear_vals = self._solver_model.solution.get_linear_slacks()
-            quadratic_cons_to_load = self._solver_model.quadratic_constraints.get_names()
-            quadratic_vals = self._solver_model.solution.get_quadratic_slacks()
-        else:
-            cplex_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.linear_constraints.get_names()))
-            linear_vals = self._solver_model.solution.get_linear_slacks(linear_cons_to_load)
-            quadratic_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.quadratic_constraints.get_names()))
-            quadratic_vals = self._solver_model.solution.get_quadratic_slacks(quadratic_cons_to_load)
+            pyomo_cons, linear_cons, quadratic_cons = \
+                self._get_con_load_order()
+            vals = self._solver_model.solution.get_linear_slacks()
+            if quadratic_cons:
+                vals += self._solver_model.solution.get_quadratic_slacks()
+            self._load_suffix_values(slack, pyomo_cons, vals)
+            for pyomo_con in self._range_constraints:
+                if pyomo_con in con_map:
+                    slack[pyomo_con] = self._get_range_slack(
+                        con_map[pyomo_con], slack[pyomo_con])
+            return
+
+        cplex_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
+        linear_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.linear_constraints.get_names()))
+        linear_vals = self._solver_model.solution.get_linear_slacks(linear_cons_to_load)
+        quadratic_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.quadratic_constraints.get_names()))
+        quadratic_vals = self._solver_model.solution.get_quadratic_slacks(quadratic_cons_to_load)
 
         for i, cplex_con in enumerate(linear_cons_to_load):
             pyomo_con = reverse_con_map[cplex_con]
             if pyomo_con in self._range_constraints:
-                R_ = self._solver_model.linear_constraints.get_range_values(cplex_con)
-                if R_ == 0:
-                    slack[pyomo_con] = linear_vals[i]
-                else:
-                    Ls_ = linear_vals[i]
-                    Us_ = R_ - Ls_
-                    if abs(Us_) > abs(Ls_):
-                        slack[pyomo_con] = Us_
-                    else:
-                        slack[pyomo_con] = -Ls_
+                slack[pyomo_con] = self._get_range_slack(
+                    cplex_con, linear_vals[i])
             else:
                 slack[pyomo_con] = linear_vals[i]
 
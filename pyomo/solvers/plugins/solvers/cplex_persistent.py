@@ -55,6 +55,17 @@ class CPLEXPersistent(PersistentSolver, CPLEXDirect):
             except self._cplex.exceptions.CplexError:
                 raise ValueError('Failed to find the cplex constraint {0}'.format(solver_con))
 
+    def _remove_constraints(self, solver_cons):
+        if not solver_cons:
+            return
+        try:
+            # CPLEX resolves all of the names before deleting any rows
+            self._solver_model.linear_constraints.delete(solver_cons)
+        except self._cplex.exceptions.CplexError:
+            # at least one of the constraints is quadratic
+            for solver_con in solver_cons:
+                self._remove_constraint(solver_con)
+
     def _remove_sos_constraint(self, solver_sos_con):
         self._solver_model.SOS.delete(solver_sos_con)
 
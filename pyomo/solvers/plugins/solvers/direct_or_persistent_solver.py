@@ -19,6 +19,8 @@ from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import ComponentMap, ComponentSet, Options
 import pyomo.opt.base.solvers
 from pyomo.opt.base.formats import ResultsFormat
+from pyomo.repn.util import canonical_form_data, \
+    canonical_form_data_objects
 
 
 class DirectOrPersistentSolver(OptSolver):
@@ -106,6 +108,15 @@ class DirectOrPersistentSolver(OptSolver):
         self._referenced_variables = ComponentMap()
         """dict: {var: count} where count is the number of constraints/objective referencing the var"""
 
+        self._var_load_order = None
+        """A tuple (pyomo_vars, solver_vars) of the referenced variables, used to load variable values and
+        reduced costs in bulk. This is built on the first load and reused until the solver model changes
+        (see _get_var_load_order)."""
+
+        self._con_load_order = None
+        """The constraint order used to load duals and slacks in bulk. The contents are specific to each
+        solver interface (see _get_con_load_order)."""
+
         self._keepfiles = False
         """A bool. If True, then the solver log will be saved."""
 
@@ -169,6 +180,13 @@ class DirectOrPersistentSolver(OptSolver):
     def _postsolve(self):
         return OptSolver._postsolve(self)
 
+    def _postsolve_cached(self, results):
+        # Pop the temporary file context pushed by _presolve (which is
+        # otherwise popped by the _postsolve of the subclass)
+        pyutilib.services.TempfileManager.pop(remove=not self._keepfiles)
+        self.results = results
+        return results
+
     """ This method should be implemented by subclasses."""
     def _set_instance(self, model, kwds={}):
         if not isinstance(model, (Model, IBlock, Block, _BlockData)):
@@ -187,6 +205,7 @@ class DirectOrPersistentSolver(OptSolver):
         self._vars_referenced_by_con = ComponentMap()
         self._vars_referenced_by_obj = ComponentSet()
         self._referenced_variables = ComponentMap()
+        self._clear_load_order()
         self._objective_label = None
         self._objective = None
 
@@ -207,8 +226,8 @@ class DirectOrPersistentSolver(OptSolver):
 
         for sub_block in block.block_data_objects(descend_into=True,
                                                   active=True):
-            for con in sub_block.component_data_objects(
-                    ctype=pyomo.core.base.constraint.Constraint,
+            for con, repn in canonical_form_data_objects(
+                    sub_block,
                     descend_into=False,
                     active=True,
                     sort=True):
@@ -216,7 +235,7 @@ class DirectOrPersistentSolver(OptSolver):
                    (not con.has_ub()):
                     assert not con.equality
                     continue  # non-binding, so skip
-                self._add_constraint(con)
+                self._add_constraint(con, repn)
 
             for con in sub_block.component_data_objects(
                     ctype=pyomo.core.base.sos.SOSConstraint,
@@ -242,7 +261,7 @@ class DirectOrPersistentSolver(OptSolver):
                                   "by subclasses")
 
     """ This method should be implemented by subclasses."""
-    def _add_constraint(self, con):
+    def _add_constraint(self, con, repn=None):
         raise NotImplementedError("This method should be implemented "
                                   "by subclasses")
 
@@ -256,6 +275,22 @@ class DirectOrPersistentSolver(OptSolver):
         raise NotImplementedError("This method should be implemented "
                                   "by subclasses")
 
+    def _add_vars(self, var_seq):
+        """Add a sequence of variables to the solver model. Subclasses
+        whose solver interface can add many columns in one call should
+        override this method."""
+        for var in var_seq:
+            self._add_var(var)
+
+    def _add_constraints(self, con_seq):
+        """Add a sequence of constraints to the solver model. The
+        canonical forms are generated in bulk (see
+        pyomo.repn.util.canonical_form_data); subclasses whose solver
+        interface can add many rows in one call should override this
+        method."""
+        for con, repn in canonical_form_data(con_seq):
+            self._add_constraint(con, repn)
+
     """ This method should be implemented by subclasses."""
     def _get_expr_from_pyomo_repn(self, repn, max_degree=None):
         raise NotImplementedError("This method should be implemented "
@@ -266,6 +301,54 @@ class DirectOrPersistentSolver(OptSolver):
         raise NotImplementedError("This method should be implemented "
                                   "by subclasses")
 
+    def _clear_load_order(self):
+        """Discard the cached variable and constraint load orders. This
+        must be called whenever variables or constraints are added to or
+        removed from the solver model."""
+        self._var_load_order = None
+        self._con_load_order = None
+
+    def _get_var_load_order(self):
+        """Return a tuple (pyomo_vars, solver_vars) of the variables
+        referenced by the solver model (in the same order) so that
+        solution values can be retrieved from the solver and loaded into
+        the pyomo variables with one call each."""
+        if self._var_load_order is None:
+            var_map = self._pyomo_var_to_solver_var_map
+            ref_vars = self._referenced_variables
+            pyomo_vars = tuple(var for var in var_map if ref_vars[var] > 0)
+            self._var_load_order = (
+                pyomo_vars, [var_map[var] for var in pyomo_vars])
+        return self._var_load_order
+
+    """ This method should be implemented by subclasses."""
+    def _get_con_load_order(self):
+        raise NotImplementedError("This method should be implemented "
+                                  "by subclasses")
+
+    @staticmethod
+    def _load_var_values(pyomo_vars, vals):
+        """Set the values of a sequence of pyomo variables from a list
+        or array of values (in the same order)"""
+        if hasattr(vals, 'tolist'):
+            # store python floats, not numpy scalars
+            vals = vals.tolist()
+        for var, val in zip(pyomo_vars, vals):
+            var.stale = False
+            var.value = val
+
+    @staticmethod
+    def _load_suffix_values(suffix, components, vals):
+        """Set the values of a suffix for a sequence of components from a
+        list or array of values (in the same order)"""
+        if hasattr(suffix, 'set_values'):
+            # Suffix stores the values in an array aligned with
+            # components, which is overwritten in place when the same
+            # load order is used for the next solve
+            suffix.set_values(components, vals)
+        else:
+            suffix.update(zip(components, vals))
+
     """ This method should be implemented by subclasses."""
     def _load_vars(self, vars_to_load):
         raise NotImplementedError("This method should be implemented "
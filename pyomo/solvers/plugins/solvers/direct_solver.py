@@ -10,6 +10,7 @@
 
 import time
 import logging
+from operator import itemgetter
 
 from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import DirectOrPersistentSolver
 from pyomo.core.base.block import _BlockData
@@ -18,6 +19,10 @@ from pyomo.core.base.suffix import active_import_suffix_generator
 from pyomo.core.kernel.suffix import import_suffix_generator
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import Options
+from pyomo.common.timing import start_stage, stop_stage
+from pyomo.core.expr.numvalue import value
+from pyomo.opt.base.result_cache import solver_result_cache, update_digest
+from pyomo.repn import generate_standard_repn
 
 logger = logging.getLogger('pyomo.solvers')
 
@@ -67,6 +72,11 @@ class DirectSolver(DirectOrPersistentSolver):
         """ Solve the problem """
 
         self.available(exception_flag=True)
+        result_cache = kwds.pop('result_cache', None)
+        if result_cache is True:
+            result_cache = solver_result_cache
+        elif result_cache is False:
+            result_cache = None
         #
         # If the inputs are models, then validate that they have been
         # constructed! Collect suffix names to try and import from solution.
@@ -111,12 +121,15 @@ class DirectSolver(DirectOrPersistentSolver):
         self.options.update(kwds.pop('options', {}))
         self.options.update(
             self._options_string_to_dict(kwds.pop('options_string', '')))
+        solve_stage = start_stage("solve %s" % (self.name,))
         try:
 
             # we're good to go.
             initial_time = time.time()
 
+            stage = start_stage("presolve")
             self._presolve(*args, **kwds)
+            stop_stage(stage)
 
             presolve_completion_time = time.time()
             if self._report_timing:
@@ -125,10 +138,21 @@ class DirectSolver(DirectOrPersistentSolver):
             if not _model is None:
                 self._initialize_callbacks(_model)
 
-            _status = self._apply_solver()
+            cache_key = cached = None
+            if result_cache is not None:
+                cache_key = self._result_cache_key()
+                if cache_key is not None:
+                    cached = result_cache.get(cache_key)
+
+            stage = start_stage("apply_solver")
+            if cached is None:
+                _status = self._apply_solver()
+            stop_stage(stage)
             if hasattr(self, '_transformation_data'):
                 del self._transformation_data
-            if not hasattr(_status, 'rc'):
+            if cached is not None:
+                pass
+            elif not hasattr(_status, 'rc'):
                 logger.warning(
                     "Solver (%s) did not return a solver status code.\n"
                     "This is indicative of an internal solver plugin error.\n"
@@ -148,7 +172,15 @@ class DirectSolver(DirectOrPersistentSolver):
             if self._report_timing:
                 print("      %6.2f seconds required for solver" % (solve_completion_time - presolve_completion_time))
 
-            result = self._postsolve()
+            stage = start_stage("postsolve")
+            if cached is not None:
+                result = self._postsolve_cached(cached)
+            else:
+                result = self._postsolve()
+                if cache_key is not None and \
+                   self._cacheable_results(_status, result):
+                    result_cache.set(cache_key, result)
+            stop_stage(stage)
             # ***********************************************************
             # The following code is only needed for backwards compatability of load_solutions=False.
             # If we ever only want to support the load_vars, load_duals, etc. methods, then this can be deleted.
@@ -177,10 +209,12 @@ class DirectSolver(DirectOrPersistentSolver):
                             logger.error("No solution is available")
                     else:
                         if self._load_solutions:
+                            stage = start_stage("load_results")
                             _model.solutions.load_from(
                                 result,
                                 select=self._select_index,
                                 default_variable_value=self._default_variable_value)
+                            stop_stage(stage)
                             result._smap_id = None
                             result.solution.clear()
                         else:
@@ -197,7 +231,64 @@ class DirectSolver(DirectOrPersistentSolver):
             # Reset the options dict
             #
             self.options = orig_options
+            stop_stage(solve_stage)
 
         return result
 
+    def _result_cache_key(self):
+        """
+        Direct interfaces do not write a problem file, so the key
+        hashes the canonical representation of the variables,
+        constraints and objective passed to the solver.  The results
+        can only be cached when they are saved (save_results=True).
+        """
+        if not self._save_results:
+            return None
+        symbols = self._symbol_map.byObject
+        def _name(obj):
+            return symbols.get(id(obj), obj.name)
+
+        digest = self._result_cache_digest()
+        for name, var in sorted(((_name(v), v) for v in
+                                 self._pyomo_var_to_solver_var_map),
+                                key=itemgetter(0)):
+            update_digest(digest, (
+                name, value(var.lb), value(var.ub), var.is_binary(),
+                var.is_integer(), var.fixed and value(var)))
+        for name, con in sorted(((_name(c), c) for c in
+                                 self._pyomo_con_to_solver_con_map),
+                                key=itemgetter(0)):
+            if hasattr(con, 'level'):
+                # SOS constraint
+                if hasattr(con, 'get_items'):
+                    items = con.get_items()
+                else:
+                    items = zip(con.variables, con.weights)
+                update_digest(digest, (
+                    name, con.level,
+                    [(_name(v), value(w)) for v, w in items]))
+                continue
+            if con._linear_canonical_form:
+                repn = con.canonical_form()
+            else:
+                repn = generate_standard_repn(con.body, quadratic=True)
+            update_digest(digest, (
+                name, value(con.lower), value(con.upper),
+                self._repn_digest_data(repn, _name)))
+        obj = self._objective
+        if obj is not None:
+            update_digest(digest, (
+                obj.sense, self._repn_digest_data(
+                    generate_standard_repn(obj.expr, quadratic=True), _name)))
+        return digest.hexdigest()
 
+    @staticmethod
+    def _repn_digest_data(repn, name):
+        return (
+            value(repn.constant),
+            [(name(v), value(c)) for v, c in
+             zip(repn.linear_vars, repn.linear_coefs)],
+            [(name(v1), name(v2), value(c)) for (v1, v2), c in
+             zip(repn.quadratic_vars, repn.quadratic_coefs)],
+            None if repn.nonlinear_expr is None
+            else str(repn.nonlinear_expr))
@@ -8,6 +8,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import itertools
 import logging
 import re
 import sys
@@ -267,11 +268,17 @@ class GurobiDirect(DirectSolver):
     def _add_block(self, block):
         DirectOrPersistentSolver._add_block(self, block)
 
-    def _add_constraint(self, con):
+    def _add_constraint(self, con, repn=None):
         if not con.active:
             return None
 
-        if is_fixed(con.body):
+        if con._linear_canonical_form:
+            if repn is None:
+                repn = con.canonical_form()
+            if repn.is_fixed():
+                if self._skip_trivial_constraints:
+                    return None
+        elif is_fixed(con.body):
             if self._skip_trivial_constraints:
                 return None
 
@@ -279,7 +286,7 @@ class GurobiDirect(DirectSolver):
 
         if con._linear_canonical_form:
             gurobi_expr, referenced_vars = self._get_expr_from_pyomo_repn(
-                con.canonical_form(),
+                repn,
                 self._max_constraint_degree)
         #elif isinstance(con, LinearCanonicalRepn):
         #    gurobi_expr, referenced_vars = self._get_expr_from_pyomo_repn(
@@ -704,12 +711,31 @@ class GurobiDirect(DirectSolver):
                 gurobipy_var.setAttr(self._gurobipy.GRB.Attr.Start, value(pyomo_var))
         self._needs_updated = True
 
+    def _get_con_load_order(self):
+        """Return a tuple (pyomo_cons, linear_cons, quadratic_cons) where
+        pyomo_cons is aligned with the gurobi linear constraints followed
+        by the gurobi quadratic constraints"""
+        if self._con_load_order is None:
+            reverse_con_map = self._solver_con_to_pyomo_con_map
+            linear_cons = self._solver_model.getConstrs()
+            if self._version_major >= 5:
+                quadratic_cons = self._solver_model.getQConstrs()
+            else:
+                quadratic_cons = []
+            pyomo_cons = tuple(reverse_con_map[gurobi_con] for gurobi_con
+                               in itertools.chain(linear_cons, quadratic_cons))
+            self._con_load_order = (pyomo_cons, linear_cons, quadratic_cons)
+        return self._con_load_order
+
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         if vars_to_load is None:
-            vars_to_load = var_map.keys()
+            pyomo_vars, gurobi_vars = self._get_var_load_order()
+            vals = self._solver_model.getAttr("X", gurobi_vars)
+            self._load_var_values(pyomo_vars, vals)
+            return
 
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
         gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.getAttr("X", gurobi_vars_to_load)
 
@@ -721,12 +747,15 @@ class GurobiDirect(DirectSolver):
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         rc = self._pyomo_model.rc
         if vars_to_load is None:
-            vars_to_load = var_map.keys()
+            pyomo_vars, gurobi_vars = self._get_var_load_order()
+            vals = self._solver_model.getAttr("Rc", gurobi_vars)
+            self._load_suffix_values(rc, pyomo_vars, vals)
+            return
 
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
         gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.getAttr("Rc", gurobi_vars_to_load)
 
@@ -742,14 +771,18 @@ class GurobiDirect(DirectSolver):
         dual = self._pyomo_model.dual
 
         if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.getConstrs()
-            if self._version_major >= 5:
-                quadratic_cons_to_load = self._solver_model.getQConstrs()
-        else:
-            gurobi_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getConstrs()))
-            if self._version_major >= 5:
-                quadratic_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getQConstrs()))
+            pyomo_cons, linear_cons, quadratic_cons = \
+                self._get_con_load_order()
+            vals = self._solver_model.getAttr("Pi", linear_cons)
+            if quadratic_cons:
+                vals += self._solver_model.getAttr("QCPi", quadratic_cons)
+            self._load_suffix_values(dual, pyomo_cons, vals)
+            return
+
+        gurobi_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
+        linear_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getConstrs()))
+        if self._version_major >= 5:
+            quadratic_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getQConstrs()))
         linear_vals = self._solver_model.getAttr("Pi", linear_cons_to_load)
         if self._version_major >= 5:
             quadratic_vals = self._solver_model.getAttr("QCPi", quadratic_cons_to_load)
@@ -762,6 +795,18 @@ class GurobiDirect(DirectSolver):
                 pyomo_con = reverse_con_map[gurobi_con]
                 dual[pyomo_con] = val
 
+    def _get_range_slack(self, gurobi_con, gurobi_range_con_vars):
+        lin_expr = self._solver_model.getRow(gurobi_con)
+        for i in reversed(range(lin_expr.size())):
+            v = lin_expr.getVar(i)
+            if v in gurobi_range_con_vars:
+                Us_ = v.X
+                Ls_ = v.UB - v.X
+                if Us_ > Ls_:
+                    return Us_
+                else:
+                    return -Ls_
+
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
             self._pyomo_model.slack = Suffix(direction=Suffix.IMPORT)
@@ -772,14 +817,24 @@ class GurobiDirect(DirectSolver):
         gurobi_range_con_vars = set(self._solver_model.getVars()) - set(self._pyomo_var_to_solver_var_map.values())
 
         if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.getConstrs()
-            if self._version_major >= 5:
-                quadratic_cons_to_load = self._solver_model.getQConstrs()
-        else:
-            gurobi_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getConstrs()))
-            if self._version_major >= 5:
-                quadratic_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getQConstrs()))
+            pyomo_cons, linear_cons, quadratic_cons = \
+                self._get_con_load_order()
+            vals = self._solver_model.getAttr("Slack", linear_cons)
+            if quadratic_cons:
+                vals += self._solver_model.getAttr("QCSlack", quadratic_cons)
+            self._load_suffix_values(slack, pyomo_cons, vals)
+            # the slack of a range constraint is recovered from the
+            # auxiliary range variable
+            for pyomo_con in self._range_constraints:
+                if pyomo_con in con_map:
+                    slack[pyomo_con] = self._get_range_slack(
+                        con_map[pyomo_con], gurobi_range_con_vars)
+            return
+
+        gurobi_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
+        linear_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getConstrs()))
+        if self._version_major >= 5:
+            quadratic_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getQConstrs()))
         linear_vals = self._solver_model.getAttr("Slack", linear_cons_to_load)
         if self._version_major >= 5:
             quadratic_vals = self._solver_model.getAttr("QCSlack", quadratic_cons_to_load)
@@ -787,17 +842,8 @@ class GurobiDirect(DirectSolver):
         for gurobi_con, val in zip(linear_cons_to_load, linear_vals):
             pyomo_con = reverse_con_map[gurobi_con]
             if pyomo_con in self._range_constraints:
-                lin_expr = self._solver_model.getRow(gurobi_con)
-                for i in reversed(range(lin_expr.size())):
-                    v = lin_expr.getVar(i)
-                    if v in gurobi_range_con_vars:
-                        Us_ = v.X
-                        Ls_ = v.UB - v.X
-                        if Us_ > Ls_:
-                            slack[pyomo_con] = Us_
-                        else:
-                            slack[pyomo_con] = -Ls_
-                        break
+                slack[pyomo_con] = self._get_range_slack(
+                    gurobi_con, gurobi_range_con_vars)
             else:
                 slack[pyomo_con] = val
         if self._version_major >= 5:
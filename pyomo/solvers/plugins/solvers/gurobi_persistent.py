@@ -75,6 +75,14 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
         self._solver_model.remove(solver_con)
         self._needs_updated = True
 
+    def _remove_constraints(self, solver_cons):
+        # update once rather than checking each constraint for
+        # pending additions
+        if self._needs_updated:
+            self._update()
+        self._solver_model.remove(list(solver_cons))
+        self._needs_updated = True
+
     def _remove_sos_constraint(self, solver_sos_con):
         self._remove_constraint(solver_sos_con)
         self._needs_updated = True
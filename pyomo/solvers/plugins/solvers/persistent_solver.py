@@ -17,9 +17,14 @@ from pyomo.core.expr.numvalue import native_numeric_types
 from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.var import Var
 from pyomo.core.base.sos import SOSConstraint
+from pyomo.core.base.objective import Objective
+from pyomo.core.base.matrix_constraint import _MatrixConstraintData
+from pyomo.core.expr.visitor import (identify_variables,
+                                     identify_mutable_parameters)
 
 from pyomo.common.errors import ApplicationError
-from pyomo.common.collections import Options
+from pyomo.common.collections import ComponentMap, ComponentSet, Options
+from pyomo.common.timing import start_stage, stop_stage
 
 import time
 import logging
@@ -34,13 +39,110 @@ def _convert_to_const(val):
     else:
         return value(val)
 
+def _var_state(var):
+    """The properties of a variable that are passed to the solver"""
+    if var.fixed:
+        return (var.lb, var.ub, var.is_binary(), var.is_integer(),
+                True, var.value)
+    return (var.lb, var.ub, var.is_binary(), var.is_integer(), False, None)
+
+def _constraint_exprs(con):
+    """The expressions defining a constraint"""
+    if con.__class__ is _MatrixConstraintData:
+        # The body is generated on access, so only the bounds can
+        # be compared
+        return (None, con.lower, con.upper)
+    return (con.body, con.lower, con.upper)
+
+def _constraint_snapshot(con):
+    if con.__class__ is _MatrixConstraintData:
+        # The fixed columns of the row are folded into its constant
+        return _ExpressionSnapshot(_constraint_exprs(con),
+                                   con.body.linear_vars)
+    return _ExpressionSnapshot(_constraint_exprs(con))
+
+def _named_expressions(expr, seen):
+    """The named expressions (e.g., Expression components) appearing
+    in an expression that are not in seen"""
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if node.__class__ in native_numeric_types or \
+           not node.is_expression_type():
+            continue
+        if node.is_named_expression_type():
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            yield node
+        stack.extend(node.args)
+
+def _same_expr(old, new):
+    if old is new:
+        return True
+    return old.__class__ in native_numeric_types and \
+        new.__class__ in native_numeric_types and old == new
+
+class _ExpressionSnapshot(object):
+    """A record of the expressions defining a constraint or objective
+    when it was passed to the solver.
+
+    Along with the expression objects themselves, the snapshot holds
+    the mutable parameters and fixed variables appearing in them, as
+    the solver interfaces fold their current values into constants,
+    and the named expressions appearing in them with their bodies, as
+    the body of a named expression can be replaced (with set_value())
+    without changing the expression object referencing it.  Comparing
+    a snapshot with the component only compares object identities and
+    the values of these parameters and variables; the expressions are
+    not walked again.  The fixed variables of a body that is not stored
+    as an expression (e.g., a MatrixConstraint row) are passed in
+    variables.
+    """
+
+    __slots__ = ('exprs', 'named', 'named_exprs', 'params', 'fixed_vars',
+                 'values')
+
+    def __init__(self, exprs, variables=()):
+        self.exprs = exprs
+        params = ComponentSet()
+        fixed_vars = ComponentSet(v for v in variables if v.fixed)
+        named = []
+        seen = set()
+        for expr in exprs:
+            if expr is None or expr.__class__ in native_numeric_types:
+                continue
+            named.extend(_named_expressions(expr, seen))
+            params.update(identify_mutable_parameters(expr))
+            fixed_vars.update(v for v in identify_variables(expr)
+                              if v.fixed)
+        self.named = tuple(named)
+        self.named_exprs = tuple(e.expr for e in named)
+        self.params = tuple(params)
+        self.fixed_vars = tuple(fixed_vars)
+        self.values = self._current_values()
+
+    def _current_values(self):
+        return (tuple(p.value for p in self.params),
+                tuple(v.value if v.fixed else None for v in self.fixed_vars))
+
+    def changed(self, exprs):
+        for old, new in zip(self.exprs, exprs):
+            if not _same_expr(old, new):
+                return True
+        for e, old in zip(self.named, self.named_exprs):
+            if not _same_expr(old, e.expr):
+                return True
+        return self._current_values() != self.values
+
 class PersistentSolver(DirectOrPersistentSolver):
     """
     A base class for persistent solvers. Direct solver interfaces do not use any file io.
     Rather, they interface directly with the python bindings for the specific solver. Persistent solver interfaces
     are similar except that they "remember" their model. Thus, persistent solver interfaces allow incremental changes
     to the solver model (e.g., the gurobi python model or the cplex python model). Note that users are responsible
-    for notifying the persistent solver interfaces when changes are made to the corresponding pyomo model.
+    for notifying the persistent solver interfaces when changes are made to the corresponding pyomo model,
+    unless the instance was set with auto_update=True (see sync_instance).
 
     Keyword Arguments
     -----------------
@@ -54,6 +156,9 @@ class PersistentSolver(DirectOrPersistentSolver):
         Dictionary of solver options
     """
 
+    auto_update = False
+    """If True, solve() calls sync_instance() to pass the changes made to the Pyomo model to the solver."""
+
     def _presolve(self, **kwds):
         DirectOrPersistentSolver._presolve(self, **kwds)
 
@@ -80,8 +185,130 @@ class PersistentSolver(DirectOrPersistentSolver):
             If False then an error will be raised if a fixed variable is used in one of the solver constraints.
             This is useful for catching bugs. Ordinarily a fixed variable should appear as a constant value in the
             solver constraints. If True, then the error will not be raised.
+        auto_update: bool
+            If True, the solver interface records the state of the model and each call to solve() passes the
+            changes made since then to the solver (see sync_instance).
+        """
+        self.auto_update = kwds.pop('auto_update', self.auto_update)
+        self._var_states = None
+        self._con_snapshots = None
+        self._obj_snapshot = None
+        result = self._set_instance(model, kwds)
+        if self.auto_update:
+            self._record_instance_state()
+        return result
+
+    def _record_instance_state(self):
+        self._var_states = ComponentMap(
+            (var, _var_state(var))
+            for var in self._pyomo_var_to_solver_var_map)
+        # Active constraints that were not passed to the solver (e.g.,
+        # non-binding or trivial constraints) are recorded as well so
+        # that sync_instance does not try to add them again.
+        self._con_snapshots = ComponentMap(
+            (con, _constraint_snapshot(con))
+            for con in self._pyomo_model.component_data_objects(
+                ctype=Constraint, descend_into=True, active=True))
+        if self._objective is not None:
+            self._obj_snapshot = _ExpressionSnapshot(
+                (self._objective.expr, self._objective.sense))
+
+    def sync_instance(self):
+        """Pass the changes made to the Pyomo model to the solver's model.
+
+        Compares the model with the state recorded when the instance was
+        set (or last synchronized) and passes only the differences to the
+        solver:
+
+        - new variables are added and variables whose bounds, domain or
+          fixed status changed are updated
+        - new active constraints are added and constraints that were
+          deactivated or deleted are removed
+        - constraints and the objective are rebuilt when their
+          expressions are replaced or when the value of a mutable Param
+          or fixed Var appearing in them changes
+        - a newly activated objective replaces the current one
+
+        Variables and constraints the user added or removed through the
+        solver interface are respected. Variables are never removed from
+        the solver's model, and SOS constraints are not tracked.
+
+        This method requires the instance to be set with
+        auto_update=True, in which case it is called by solve().
         """
-        return self._set_instance(model, kwds)
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling sync_instance.')
+        if self._con_snapshots is None:
+            raise RuntimeError('The instance must be set with auto_update=True to use sync_instance.')
+        model = self._pyomo_model
+
+        var_states = self._var_states
+        new_vars = []
+        changed_vars = []
+        for var in model.component_data_objects(
+                ctype=Var, descend_into=True, active=True):
+            if var not in self._pyomo_var_to_solver_var_map:
+                new_vars.append(var)
+                continue
+            state = _var_state(var)
+            old_state = var_states.get(var)
+            if state != old_state:
+                if old_state is not None:
+                    changed_vars.append(var)
+                var_states[var] = state
+
+        con_snapshots = self._con_snapshots
+        solver_cons = self._pyomo_con_to_solver_con_map
+        active_cons = ComponentSet()
+        new_cons = []
+        stale_cons = []
+        for con in model.component_data_objects(
+                ctype=Constraint, descend_into=True, active=True):
+            active_cons.add(con)
+            snapshot = con_snapshots.get(con)
+            if snapshot is None:
+                if con in solver_cons:
+                    # added through add_constraint
+                    con_snapshots[con] = _constraint_snapshot(con)
+                else:
+                    new_cons.append(con)
+            elif snapshot.changed(_constraint_exprs(con)):
+                if con in solver_cons:
+                    stale_cons.append(con)
+                new_cons.append(con)
+        for con in list(con_snapshots):
+            if con not in active_cons:
+                del con_snapshots[con]
+                if con in solver_cons:
+                    stale_cons.append(con)
+
+        if stale_cons:
+            self.remove_constraints(*stale_cons)
+        if new_vars:
+            self.add_vars(new_vars)
+            for var in new_vars:
+                var_states[var] = _var_state(var)
+        if changed_vars:
+            self.update_vars(*changed_vars)
+        binding_cons = [con for con in new_cons
+                        if con.has_lb() or con.has_ub()]
+        if binding_cons:
+            self.add_constraints(binding_cons)
+        for con in new_cons:
+            con_snapshots[con] = _constraint_snapshot(con)
+
+        objs = list(model.component_data_objects(
+            ctype=Objective, descend_into=True, active=True))
+        if len(objs) > 1:
+            raise ValueError(
+                "Solver interface does not support multiple objectives.")
+        if objs:
+            obj = objs[0]
+            exprs = (obj.expr, obj.sense)
+            if obj is not self._objective or self._obj_snapshot is None \
+               or self._obj_snapshot.changed(exprs):
+                self.set_objective(obj)
+                self._obj_snapshot = _ExpressionSnapshot(exprs)
 
     def add_block(self, block):
         """Add a single Pyomo Block to the solver's model.
@@ -103,6 +330,7 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_block(block)
         #    return
         self._add_block(block)
+        self._clear_load_order()
 
     def set_objective(self, obj):
         """
@@ -115,6 +343,7 @@ class PersistentSolver(DirectOrPersistentSolver):
         """
         if self._pyomo_model is None:
             raise RuntimeError('You must call set_instance before calling set_objective.')
+        self._clear_load_order()
         return self._set_objective(obj)
 
     def add_constraint(self, con):
@@ -137,6 +366,7 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_constraint(child_con)
         #else:
         self._add_constraint(con)
+        self._clear_load_order()
 
     def add_var(self, var):
         """Add a single variable to the solver's model.
@@ -160,6 +390,49 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_var(child_var)
         #else:
         self._add_var(var)
+        self._clear_load_order()
+
+    def add_constraints(self, con_seq):
+        """Add multiple constraints to the solver's model in one call.
+
+        The canonical forms of the constraints are generated in bulk and
+        solver interfaces that support it pass all rows to the solver at
+        once. This will keep any existing model components intact.
+
+        Parameters
+        ----------
+        con_seq: tuple/list of Constraint (scalar Constraint or single _ConstraintData)
+
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling add_constraints.')
+        con_seq = tuple(con_seq)
+        for con in con_seq:
+            if id(self._pyomo_model) != id(con.model()):
+                raise RuntimeError('The pyomo constraint must be attached to the solver model')
+        self._add_constraints(con_seq)
+        self._clear_load_order()
+
+    def add_vars(self, var_seq):
+        """Add multiple variables to the solver's model in one call.
+
+        Solver interfaces that support it pass all columns to the
+        solver at once. This will keep any existing model components
+        intact.
+
+        Parameters
+        ----------
+        var_seq: tuple/list of Var (scalar Var or single _VarData)
+
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling add_vars.')
+        var_seq = tuple(var_seq)
+        for var in var_seq:
+            if id(self._pyomo_model) != id(var.model()):
+                raise RuntimeError('The pyomo var must be attached to the solver model')
+        self._add_vars(var_seq)
+        self._clear_load_order()
 
     def add_sos_constraint(self, con):
         """Add a single SOS constraint to the solver's model (if supported).
@@ -181,6 +454,7 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_sos_constraint(child_con)
         #else:
         self._add_sos_constraint(con)
+        self._clear_load_order()
 
     def add_column(self, model, var, obj_coef, constraints, coefficients):
         """Add a column to the solver's and Pyomo model
@@ -218,6 +492,7 @@ class PersistentSolver(DirectOrPersistentSolver):
         obj_coef, constraints, coefficients = self._add_and_collect_column_data(
                 var, obj_coef, constraints, coefficients)
         self._add_column(var, obj_coef, constraints, coefficients)
+        self._clear_load_order()
 
     """ This method should be implemented by subclasses."""
     def _add_column(self, var, obj_coef, constraints, coefficients):
@@ -256,6 +531,13 @@ class PersistentSolver(DirectOrPersistentSolver):
     def _remove_constraint(self, solver_con):
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    def _remove_constraints(self, solver_cons):
+        """Remove a list of solver constraints from the solver model.
+        Subclasses whose solver interface can remove many rows in one
+        call should override this method."""
+        for solver_con in solver_cons:
+            self._remove_constraint(solver_con)
+
     """ This method should be implemented by subclasses."""
     def _remove_sos_constraint(self, solver_sos_con):
         raise NotImplementedError('This method should be implemented by subclasses.')
@@ -284,8 +566,10 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self.remove_block(sub_block)
         #    return
         for sub_block in block.block_data_objects(descend_into=True, active=True):
-            for con in sub_block.component_data_objects(ctype=Constraint, descend_into=False, active=True):
-                self.remove_constraint(con)
+            cons = tuple(sub_block.component_data_objects(
+                ctype=Constraint, descend_into=False, active=True))
+            if cons:
+                self.remove_constraints(*cons)
 
             for con in sub_block.component_data_objects(ctype=SOSConstraint, descend_into=False, active=True):
                 self.remove_sos_constraint(con)
@@ -310,15 +594,29 @@ class PersistentSolver(DirectOrPersistentSolver):
         #    for child_con in con.values():
         #        self.remove_constraint(child_con)
         #    return
-        solver_con = self._pyomo_con_to_solver_con_map[con]
-        self._remove_constraint(solver_con)
-        self._symbol_map.removeSymbol(con)
-        self._labeler.remove_obj(con)
-        for var in self._vars_referenced_by_con[con]:
-            self._referenced_variables[var] -= 1
-        del self._vars_referenced_by_con[con]
-        del self._pyomo_con_to_solver_con_map[con]
-        del self._solver_con_to_pyomo_con_map[solver_con]
+        self.remove_constraints(con)
+
+    def remove_constraints(self, *cons):
+        """Remove multiple constraints from the solver's model in one call.
+
+        This will keep any other model components intact.
+
+        Parameters
+        ----------
+        *cons: Constraint (scalar Constraint or single _ConstraintData)
+
+        """
+        solver_cons = [self._pyomo_con_to_solver_con_map[con] for con in cons]
+        self._remove_constraints(solver_cons)
+        self._clear_load_order()
+        for con, solver_con in zip(cons, solver_cons):
+            self._symbol_map.removeSymbol(con)
+            self._labeler.remove_obj(con)
+            for var in self._vars_referenced_by_con[con]:
+                self._referenced_variables[var] -= 1
+            del self._vars_referenced_by_con[con]
+            del self._pyomo_con_to_solver_con_map[con]
+            del self._solver_con_to_pyomo_con_map[solver_con]
 
     def remove_sos_constraint(self, con):
         """Remove a single SOS constraint from the solver's model.
@@ -339,6 +637,7 @@ class PersistentSolver(DirectOrPersistentSolver):
         #    return
         solver_con = self._pyomo_con_to_solver_con_map[con]
         self._remove_sos_constraint(solver_con)
+        self._clear_load_order()
         self._symbol_map.removeSymbol(con)
         self._labeler.remove_obj(con)
         for var in self._vars_referenced_by_con[con]:
@@ -369,6 +668,7 @@ class PersistentSolver(DirectOrPersistentSolver):
                              'objective or one or more constraints')
         solver_var = self._pyomo_var_to_solver_var_map[var]
         self._remove_var(solver_var)
+        self._clear_load_order()
         self._symbol_map.removeSymbol(var)
         self._labeler.remove_obj(var)
         del self._referenced_variables[var]
@@ -387,6 +687,16 @@ class PersistentSolver(DirectOrPersistentSolver):
         """
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    def update_vars(self, *var_seq):
+        """Update multiple variables in the solver's model.
+
+        Parameters
+        ----------
+        *var_seq: Var (scalar Var or single _VarData)
+        """
+        for var in var_seq:
+            self.update_var(var)
+
     def solve(self, *args, **kwds):
         """
         Solve the model.
@@ -452,12 +762,20 @@ class PersistentSolver(DirectOrPersistentSolver):
         self.options.update(orig_options)
         self.options.update(kwds.pop('options', {}))
         self.options.update(self._options_string_to_dict(kwds.pop('options_string', '')))
+        solve_stage = start_stage("solve %s" % (self.name,))
         try:
 
+            if self.auto_update:
+                stage = start_stage("sync_instance")
+                self.sync_instance()
+                stop_stage(stage)
+
             # we're good to go.
             initial_time = time.time()
 
+            stage = start_stage("presolve")
             self._presolve(**kwds)
+            stop_stage(stage)
 
             presolve_completion_time = time.time()
             if self._report_timing:
@@ -466,7 +784,9 @@ class PersistentSolver(DirectOrPersistentSolver):
             if self._pyomo_model is not None:
                 self._initialize_callbacks(self._pyomo_model)
 
+            stage = start_stage("apply_solver")
             _status = self._apply_solver()
+            stop_stage(stage)
             if hasattr(self, '_transformation_data'):
                 del self._transformation_data
             if not hasattr(_status, 'rc'):
@@ -489,7 +809,9 @@ class PersistentSolver(DirectOrPersistentSolver):
             if self._report_timing:
                 print("      %6.2f seconds required for solver" % (solve_completion_time - presolve_completion_time))
 
+            stage = start_stage("postsolve")
             result = self._postsolve()
+            stop_stage(stage)
             # ***********************************************************
             # The following code is only needed for backwards compatability of load_solutions=False.
             # If we ever only want to support the load_vars, load_duals, etc. methods, then this can be deleted.
@@ -519,10 +841,12 @@ class PersistentSolver(DirectOrPersistentSolver):
                             logger.error("No solution is available")
                     else:
                         if self._load_solutions:
+                            stage = start_stage("load_results")
                             _model.solutions.load_from(
                                 result,
                                 select=self._select_index,
                                 default_variable_value=self._default_variable_value)
+                            stop_stage(stage)
                             result._smap_id = None
                             result.solution.clear()
                         else:
@@ -540,6 +864,7 @@ class PersistentSolver(DirectOrPersistentSolver):
             # Reset the options dict
             #
             self.options = orig_options
+            stop_stage(solve_stage)
 
         return result
 
@@ -258,11 +258,17 @@ class XpressDirect(DirectSolver):
     def _add_block(self, block):
         DirectOrPersistentSolver._add_block(self, block)
 
-    def _add_constraint(self, con):
+    def _add_constraint(self, con, repn=None):
         if not con.active:
             return None
 
-        if is_fixed(con.body):
+        if con._linear_canonical_form:
+            if repn is None:
+                repn = con.canonical_form()
+            if repn.is_fixed():
+                if self._skip_trivial_constraints:
+                    return None
+        elif is_fixed(con.body):
             if self._skip_trivial_constraints:
                 return None
 
@@ -270,7 +276,7 @@ class XpressDirect(DirectSolver):
 
         if con._linear_canonical_form:
             xpress_expr, referenced_vars = self._get_expr_from_pyomo_repn(
-                con.canonical_form(),
+                repn,
                 self._max_constraint_degree)
         else:
             xpress_expr, referenced_vars = self._get_expr_from_pyomo_expr(
@@ -693,12 +699,25 @@ class XpressDirect(DirectSolver):
                 mipsolcol.append(xpress_var)
         self._solver_model.addmipsol(mipsolval, mipsolcol)
 
+    def _get_con_load_order(self):
+        """Return a tuple (pyomo_cons, xpress_cons) of the constraints in
+        the solver model (in the same order)"""
+        if self._con_load_order is None:
+            con_map = self._pyomo_con_to_solver_con_map
+            pyomo_cons = tuple(con_map)
+            self._con_load_order = (
+                pyomo_cons, [con_map[pyomo_con] for pyomo_con in pyomo_cons])
+        return self._con_load_order
+
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         if vars_to_load is None:
-            vars_to_load = var_map.keys()
+            pyomo_vars, xpress_vars = self._get_var_load_order()
+            vals = self._solver_model.getSolution(xpress_vars)
+            self._load_var_values(pyomo_vars, vals)
+            return
 
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
         xpress_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.getSolution(xpress_vars_to_load)
 
@@ -710,12 +729,15 @@ class XpressDirect(DirectSolver):
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         rc = self._pyomo_model.rc
         if vars_to_load is None:
-            vars_to_load = var_map.keys()
+            pyomo_vars, xpress_vars = self._get_var_load_order()
+            vals = self._solver_model.getRCost(xpress_vars)
+            self._load_suffix_values(rc, pyomo_vars, vals)
+            return
 
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
         xpress_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.getRCost(xpress_vars_to_load)
 
@@ -730,7 +752,10 @@ class XpressDirect(DirectSolver):
         dual = self._pyomo_model.dual
 
         if cons_to_load is None:
-            cons_to_load = con_map.keys()
+            pyomo_cons, xpress_cons = self._get_con_load_order()
+            vals = self._solver_model.getDual(xpress_cons)
+            self._load_suffix_values(dual, pyomo_cons, vals)
+            return
 
         xpress_cons_to_load = [con_map[pyomo_con] for pyomo_con in cons_to_load]
         vals = self._solver_model.getDual(xpress_cons_to_load)
@@ -738,6 +763,19 @@ class XpressDirect(DirectSolver):
         for pyomo_con, val in zip(cons_to_load, vals):
             dual[pyomo_con] = val
 
+    @staticmethod
+    def _get_range_slack(pyomo_con, ub_s):
+        ## for xpress, the slack on a range constraint
+        ## is based on the upper bound
+        lb = pyomo_con.lb
+        ub = pyomo_con.ub
+        expr_val = ub-ub_s
+        lb_s = lb-expr_val
+        if abs(ub_s) > abs(lb_s):
+            return ub_s
+        else:
+            return lb_s
+
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
             self._pyomo_model.slack = Suffix(direction=Suffix.IMPORT)
@@ -745,24 +783,23 @@ class XpressDirect(DirectSolver):
         slack = self._pyomo_model.slack
 
         if cons_to_load is None:
-            cons_to_load = con_map.keys()
+            pyomo_cons, xpress_cons = self._get_con_load_order()
+            vals = self._solver_model.getSlack(xpress_cons)
+            self._load_suffix_values(slack, pyomo_cons, vals)
+            reverse_con_map = self._solver_con_to_pyomo_con_map
+            for xpress_con in self._range_constraints:
+                pyomo_con = reverse_con_map.get(xpress_con)
+                if pyomo_con is not None:
+                    slack[pyomo_con] = self._get_range_slack(
+                        pyomo_con, slack[pyomo_con])
+            return
 
         xpress_cons_to_load = [con_map[pyomo_con] for pyomo_con in cons_to_load]
         vals = self._solver_model.getSlack(xpress_cons_to_load)
 
         for pyomo_con, xpress_con, val in zip(cons_to_load, xpress_cons_to_load, vals):
             if xpress_con in self._range_constraints:
-                ## for xpress, the slack on a range constraint
-                ## is based on the upper bound
-                lb = con.lb
-                ub = con.ub
-                ub_s = val
-                expr_val = ub-ub_s
-                lb_s = lb-expr_val
-                if abs(ub_s) > abs(lb_s):
-                    slack[pyomo_con] = ub_s
-                else:
-                    slack[pyomo_con] = lb_s
+                slack[pyomo_con] = self._get_range_slack(pyomo_con, val)
             else:
                 slack[pyomo_con] = val
 
@@ -51,6 +51,9 @@ class XpressPersistent(PersistentSolver, XpressDirect):
     def _remove_constraint(self, solver_con):
         self._solver_model.delConstraint(solver_con)
 
+    def _remove_constraints(self, solver_cons):
+        self._solver_model.delConstraint(list(solver_cons))
+
     def _remove_sos_constraint(self, solver_sos_con):
         self._solver_model.delSOS(solver_sos_con)
 
@@ -0,0 +1,160 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+import pyomo.environ
+from pyomo.core import (ConcreteModel, Var, Constraint, Objective,
+                        SOSConstraint, Binary)
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.common.collections import Bunch, ComponentSet
+from pyomo.opt import (SolverResults, SolverStatus, TerminationCondition,
+                       Solution, SolutionStatus)
+from pyomo.opt.base.result_cache import SolverResultCache
+from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import \
+    DirectOrPersistentSolver
+from pyomo.solvers.plugins.solvers.direct_solver import DirectSolver
+
+
+class CannedDirect(DirectSolver):
+    """A direct solver that reports a canned solution"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'canned_direct'
+        DirectSolver.__init__(self, **kwds)
+        self._python_api_exists = True
+        self.solution = {}
+        self.num_solves = 0
+
+    def _set_instance(self, model, kwds={}):
+        DirectOrPersistentSolver._set_instance(self, model, kwds)
+        self._add_block(model)
+
+    def _add_var(self, var):
+        varname = self._symbol_map.getSymbol(var, self._labeler)
+        self._pyomo_var_to_solver_var_map[var] = varname
+        self._solver_var_to_pyomo_var_map[varname] = var
+        self._referenced_variables[var] = 0
+
+    def _add_constraint(self, con, repn=None):
+        conname = self._symbol_map.getSymbol(con, self._labeler)
+        referenced_vars = ComponentSet(
+            identify_variables(con.body, include_fixed=False))
+        for var in referenced_vars:
+            self._referenced_variables[var] += 1
+        self._vars_referenced_by_con[con] = referenced_vars
+        self._pyomo_con_to_solver_con_map[con] = conname
+        self._solver_con_to_pyomo_con_map[conname] = con
+
+    def _add_sos_constraint(self, con):
+        conname = self._symbol_map.getSymbol(con, self._labeler)
+        self._pyomo_con_to_solver_con_map[con] = conname
+        self._solver_con_to_pyomo_con_map[conname] = con
+
+    def _set_objective(self, obj):
+        self._objective = obj
+
+    def _apply_solver(self):
+        self.num_solves += 1
+        return Bunch(rc=None, log=None)
+
+    def _postsolve(self):
+        self.results = SolverResults()
+        self.results.solver.status = SolverStatus.ok
+        self.results.solver.termination_condition = \
+            TerminationCondition.optimal
+        soln = Solution()
+        soln.status = SolutionStatus.optimal
+        for var, name in self._pyomo_var_to_solver_var_map.items():
+            soln.variable[name] = {'Value': self.solution[var.name]}
+        self.results.solution.insert(soln)
+        TempfileManager.pop(remove=not self._keepfiles)
+        return DirectOrPersistentSolver._postsolve(self)
+
+
+def _build_model(coef=1):
+    m = ConcreteModel()
+    m.x = Var([1, 2], bounds=(0, 4))
+    m.y = Var(within=Binary)
+    m.c1 = Constraint(expr=m.x[1] + coef*m.x[2] >= 1)
+    m.c2 = Constraint(expr=m.x[1]*m.x[2] + m.y <= 4)
+    m.s = SOSConstraint(var=m.x, sos=1)
+    m.o = Objective(expr=m.x[1] + 2*m.x[2] + m.y)
+    return m
+
+
+class TestDirectResultCache(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+        self.cache = SolverResultCache(TempfileManager.create_tempdir())
+        self.opt = CannedDirect()
+        self.opt.solution = {'x[1]': 1, 'x[2]': 0, 'y': 0}
+        self.ncontexts = len(TempfileManager._tempfiles)
+
+    def tearDown(self):
+        # all of the temporary file contexts were popped
+        self.assertEqual(len(TempfileManager._tempfiles), self.ncontexts)
+        TempfileManager.pop(remove=True)
+
+    def test_solve(self):
+        for i in range(3):
+            m = _build_model()
+            results = self.opt.solve(m, result_cache=self.cache)
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertEqual(m.x[1].value, 1)
+            self.assertEqual(m.x[2].value, 0)
+            self.assertEqual(m.y.value, 0)
+        self.assertEqual(self.opt.num_solves, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+    def test_key(self):
+        self.opt.solve(_build_model(), result_cache=self.cache)
+        # A different coefficient
+        self.opt.solve(_build_model(2), result_cache=self.cache)
+        self.assertEqual(self.opt.num_solves, 2)
+        # A different variable bound
+        m = _build_model()
+        m.x[2].setub(3)
+        self.opt.solve(m, result_cache=self.cache)
+        self.assertEqual(self.opt.num_solves, 3)
+        # A fixed variable
+        m = _build_model()
+        m.y.fix(1)
+        self.opt.solve(m, result_cache=self.cache)
+        self.assertEqual(self.opt.num_solves, 4)
+        m = _build_model()
+        m.y.fix(1)
+        self.opt.solve(m, result_cache=self.cache)
+        self.assertEqual(self.opt.num_solves, 4)
+        # A different objective sense
+        m = _build_model()
+        m.o.sense = -1
+        self.opt.solve(m, result_cache=self.cache)
+        self.assertEqual(self.opt.num_solves, 5)
+        # Different labels
+        self.opt.solve(_build_model(), result_cache=self.cache,
+                       symbolic_solver_labels=True)
+        self.assertEqual(self.opt.num_solves, 6)
+
+    def test_save_results_false(self):
+        # The results are not cached if they are loaded directly
+        self.opt.solve(_build_model(), result_cache=self.cache,
+                       save_results=False)
+        self.opt.solve(_build_model(), result_cache=self.cache,
+                       save_results=False)
+        self.assertEqual(self.opt.num_solves, 2)
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Tests for warm starting Ipopt from the last solution of a model
+#
+
+import json
+import os
+import stat
+import sys
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.environ import (ConcreteModel, Var, Constraint, Objective, Suffix,
+                           SolverFactory, TerminationCondition)
+
+# A stand-in for Ipopt: records the options and the suffixes (and dual
+# initial guess) in the NL file in $STUB_IPOPT_LOG and writes a canned
+# solution with bound multipliers
+_stub_ipopt = """#!%s
+import json, os, sys
+if sys.argv[1] == '-v':
+    print('Ipopt 3.12.13 (Linux x86_64), ASL(20190605)')
+    sys.exit(0)
+suffixes = {}
+with open(sys.argv[1]) as f:
+    lines = f.read().splitlines()
+for i, line in enumerate(lines):
+    tokens = line.split()
+    if line.startswith('S'):
+        n, name = int(tokens[1]), tokens[2]
+    elif line.startswith('d'):
+        n, name = int(tokens[0][1:]), 'dual'
+    else:
+        continue
+    suffixes[name] = [[int(l.split()[0]), float(l.split()[1])]
+                      for l in lines[i+1:i+1+n]]
+with open(os.environ['STUB_IPOPT_LOG'], 'a') as f:
+    f.write(json.dumps({'options': sys.argv[3:], 'suffixes': suffixes}))
+    f.write('\\n')
+print('EXIT: Optimal Solution Found.')
+with open(sys.argv[1][:-3] + '.sol', 'w') as f:
+    f.write('''Optimal Solution Found
+
+Options
+3
+1
+1
+0
+1
+1
+2
+2
+0.75
+1.5
+1.5
+objno 0 0
+suffix 4 2 13 0 0
+ipopt_zU_out
+0 -0.25
+1 -0.5
+suffix 4 1 13 0 0
+ipopt_zL_out
+1 0.125
+''')
+"""
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var(bounds=(None, 4))
+    m.y = Var(bounds=(0, 4))
+    m.c = Constraint(expr=m.x + m.y >= 3)
+    m.o = Objective(expr=m.x**2 + m.y**2)
+    return m
+
+
+@unittest.skipIf(sys.platform.startswith('win'),
+                 "the stub solver is a python script")
+class TestIpoptWarmStart(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+        self.stub = TempfileManager.create_tempfile(prefix='ipopt')
+        with open(self.stub, 'w') as FILE:
+            FILE.write(_stub_ipopt % (sys.executable,))
+        os.chmod(self.stub, os.stat(self.stub).st_mode | stat.S_IEXEC)
+        self.log = TempfileManager.create_tempfile(suffix='.log')
+        os.environ['STUB_IPOPT_LOG'] = self.log
+        self.opt = SolverFactory('ipopt', executable=self.stub)
+
+    def tearDown(self):
+        del os.environ['STUB_IPOPT_LOG']
+        TempfileManager.pop(remove=True)
+
+    def _runs(self):
+        with open(self.log) as FILE:
+            return [json.loads(line) for line in FILE]
+
+    def test_warmstart(self):
+        self.assertTrue(self.opt.warm_start_capable())
+        m = _model()
+        results = self.opt.solve(m, warmstart=True)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertEqual(m.x.value, 1.5)
+        self.opt.solve(m, warmstart=True)
+        first, second = self._runs()
+        self.assertEqual(first, {'options': [], 'suffixes': {}})
+        # The multipliers of the first solve are sent to Ipopt
+        self.assertEqual(sorted(second['options']),
+                         ['mu_init=1e-06',
+                          'warm_start_bound_push=1e-06',
+                          'warm_start_init_point=yes',
+                          'warm_start_mult_bound_push=1e-06'])
+        self.assertEqual(second['suffixes'],
+                         {'ipopt_zL_in': [[0, 0], [1, 0.125]],
+                          'ipopt_zU_in': [[0, -0.25], [1, -0.5]],
+                          'dual': [[0, 0.75]]})
+        # The model is not modified
+        self.assertIsNone(m.component('ipopt_zL_in'))
+        self.assertIsNone(m.component('ipopt_zU_in'))
+        self.assertIsNone(m.component('dual'))
+
+    def test_user_options(self):
+        m = _model()
+        self.opt.solve(m, warmstart=True)
+        self.opt.options['mu_init'] = 1e-4
+        self.opt.solve(m, warmstart=True,
+                       options={'warm_start_bound_push': 1e-8})
+        self.assertEqual(sorted(self._runs()[1]['options']),
+                         ['mu_init=0.0001',
+                          'warm_start_bound_push=1e-08',
+                          'warm_start_init_point=yes',
+                          'warm_start_mult_bound_push=1e-06'])
+        # The options are only set for the warm started solve
+        self.assertEqual(dict(self.opt.options), {'mu_init': 1e-4})
+
+    def test_user_suffixes(self):
+        m = _model()
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        self.opt.solve(m, warmstart=True)
+        self.assertEqual(m.dual[m.c], 0.75)
+        self.opt.solve(m, warmstart=True)
+        self.assertEqual(self._runs()[1]['suffixes']['dual'], [[0, 0.75]])
+        self.assertEqual(m.dual.get_direction(), Suffix.IMPORT)
+        self.assertEqual(m.dual[m.c], 0.75)
+
+        m.ipopt_zU_in = Var()
+        with self.assertRaisesRegexp(ValueError, "the model component "
+                                     "'ipopt_zU_in' is not a Suffix"):
+            self.opt.solve(m, warmstart=True)
+        self.assertIsNone(m.component('ipopt_zL_in'))
+
+    def test_per_model(self):
+        m1 = _model()
+        m2 = _model()
+        self.opt.solve(m1, warmstart=True)
+        self.opt.solve(m2, warmstart=True)
+        self.opt.solve(m1)
+        self.opt.solve(m1, warmstart=True)
+        self.opt.clear_warm_start(m1)
+        self.opt.solve(m1, warmstart=True)
+        self.opt.solve(m2, warmstart=True)
+        self.assertEqual([bool(run['suffixes']) for run in self._runs()],
+                         [False, False, False, True, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Tests for the progress callbacks of the shell solver interfaces
+#
+
+import os
+import stat
+import sys
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.environ import (ConcreteModel, Var, Constraint, Objective,
+                           SolverFactory, TerminationCondition)
+from pyomo.opt.solver.progress import ProgressMonitor
+from pyomo.solvers.plugins.solvers.CBCplugin import CBCProgressParser
+from pyomo.solvers.plugins.solvers.CPLEX import CPLEXProgressParser
+from pyomo.solvers.plugins.solvers.GUROBI import GurobiProgressParser
+from pyomo.solvers.plugins.solvers.IPOPT import IpoptProgressParser
+
+datadir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# A stand-in for Ipopt: reports 100 iterations (one every 0.1 seconds)
+# and writes a .sol file for the last iterate when it finishes or is
+# interrupted
+_stub_ipopt = """#!%s
+import sys, time
+if sys.argv[1] == '-v':
+    print('Ipopt 3.12.13 (Linux x86_64), ASL(20190605)')
+    sys.exit(0)
+print('iter    objective    inf_pr   inf_du lg(mu)  ||d||  lg(rg) alpha_du alpha_pr  ls')
+x = 3.0
+code, msg = 0, 'Optimal Solution Found'
+try:
+    for i in range(100):
+        print('%%4d  %%.7e 0.00e+00 1.00e-01  -1.0 1.00e-01    -  1.00e+00 1.00e+00f  1'
+              %% (i, x + x))
+        sys.stdout.flush()
+        time.sleep(0.1)
+        x = 1.5 + (x - 1.5) / 2
+except KeyboardInterrupt:
+    code, msg = 400, 'Stopping optimization at current point as requested by user'
+print('EXIT: ' + msg)
+with open(sys.argv[1][:-3] + '.sol', 'w') as f:
+    f.write('''%%s
+
+Options
+3
+1
+1
+0
+1
+1
+1
+1
+%%r
+%%r
+objno 0 %%d
+''' %% (msg, x, x, code))
+"""
+
+
+def _progress(parser, log):
+    calls = []
+    monitor = ProgressMonitor(parser, lambda *args: calls.append(args))
+    with open(os.path.join(datadir, log)) as FILE:
+        monitor.write(FILE.read())
+    monitor.close()
+    # Drop the (wall) time
+    return [tuple(None if x is None else round(x, 6) for x in c[1:])
+            for c in calls]
+
+
+class TestLogProgressParsers(unittest.TestCase):
+
+    def test_cbc(self):
+        self.assertEqual(
+            _progress(CBCProgressParser(), os.path.join('cbc', 'optimal.out')),
+            [(None, 0.925437, None),
+             (1.35482, 0.925437, 0.31693),
+             (1.20646, 0.925437, 0.232932),
+             (1.20646, 1.198428, 0.006657),
+             (1.20646, 1.205222, 0.001026),
+             (1.20646, 1.205222, 0.001026)])
+        # CBC reports an incumbent of 1e50 when there is no solution
+        self.assertEqual(
+            _progress(CBCProgressParser(),
+                      os.path.join('cbc', 'intermediate_non_integer.out')),
+            [(None, 0.925437, None), (None, 0.925437, None)])
+
+    def test_cbc_time(self):
+        times = []
+        monitor = ProgressMonitor(CBCProgressParser(),
+                                  lambda t, *args: times.append(t))
+        with open(os.path.join(datadir, 'cbc', 'optimal.out')) as FILE:
+            monitor.write(FILE.read())
+        self.assertEqual(times, [0, 0.16, 0.27, 0.27, 0.32, 0.32])
+
+    def test_gurobi(self):
+        self.assertEqual(
+            _progress(GurobiProgressParser(),
+                      os.path.join('progress', 'gurobi.log')),
+            [(25, None, None),
+             (25, 10, 0.6),
+             (14, 10, 0.286),
+             (14, 10.5, 0.25),
+             (12, 11.75, 0.0208),
+             (12, 12, 0),
+             (12, 12, 0)])
+        self.assertEqual(
+            _progress(GurobiProgressParser(),
+                      os.path.join('progress', 'gurobi_nosolution.log')),
+            [(None, 10, None), (None, 10.25, None)])
+
+    def test_cplex(self):
+        self.assertEqual(
+            _progress(CPLEXProgressParser(),
+                      os.path.join('progress', 'cplex.log')),
+            [(25, None, None),
+             (25, None, None),
+             (25, 10, 0.6),
+             (14, 10, 0.2857),
+             (14, 10, 0.25),
+             (12, 11.75, 0.0208),
+             (12, 12, 0),
+             (12, 12, 0)])
+        self.assertEqual(
+            _progress(CPLEXProgressParser(),
+                      os.path.join('progress', 'cplex_nosolution.log')),
+            [(None, 10, None), (None, 10.25, None)])
+
+    def test_ipopt(self):
+        self.assertEqual(
+            _progress(IpoptProgressParser(),
+                      os.path.join('progress', 'ipopt.log')),
+            [(0.02, None, None),
+             (2.991175, None, None),
+             (3.001896, None, None),
+             (3.00002, None, None),
+             (3.0, None, None)])
+
+
+@unittest.skipIf(sys.platform.startswith('win'),
+                 "the stub solver is a python script")
+class TestProgressCallback(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        TempfileManager.push()
+        cls.stub = TempfileManager.create_tempfile(prefix='ipopt')
+        with open(cls.stub, 'w') as FILE:
+            FILE.write(_stub_ipopt % (sys.executable,))
+        os.chmod(cls.stub, os.stat(cls.stub).st_mode | stat.S_IEXEC)
+
+    @classmethod
+    def tearDownClass(cls):
+        TempfileManager.pop(remove=True)
+
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, None))
+        m.c = Constraint(expr=m.x >= 1.5)
+        m.o = Objective(expr=2*m.x)
+        return m
+
+    def test_stop(self):
+        m = self._model()
+        opt = SolverFactory('ipopt', executable=self.stub)
+        calls = []
+        def callback(t, incumbent, bound, gap):
+            calls.append(incumbent)
+            return incumbent < 3.1
+        results = opt.solve(m, progress_callback=callback)
+        self.assertEqual(calls, [6, 4.5, 3.75, 3.375, 3.1875, 3.09375])
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.userInterrupt)
+        # The solution reported after the interrupt is loaded
+        self.assertAlmostEqual(m.x.value, 1.546875)
+
+    @unittest.skipIf(sys.version_info[:2] < (3, 5),
+                     "solve_async requires Python 3.5")
+    def test_stop_async(self):
+        import asyncio
+        m = self._model()
+        opt = SolverFactory('ipopt', executable=self.stub)
+        calls = []
+        def callback(t, incumbent, bound, gap):
+            calls.append(incumbent)
+            return incumbent < 3.1
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(
+                opt.solve_async(m, progress_callback=callback))
+        finally:
+            loop.close()
+        self.assertEqual(calls, [6, 4.5, 3.75, 3.375, 3.1875, 3.09375])
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.userInterrupt)
+        self.assertAlmostEqual(m.x.value, 1.546875)
+
+    def test_unsupported(self):
+        m = self._model()
+        opt = SolverFactory('asl:' + self.stub)
+        with self.assertRaisesRegexp(ValueError, 'does not support the '
+                                     'progress_callback keyword'):
+            opt.solve(m, progress_callback=lambda *args: False)
+
+
+if __name__ == "__main__":
+    unittest.main()
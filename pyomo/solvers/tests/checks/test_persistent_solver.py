@@ -0,0 +1,428 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+import pyomo.environ
+from pyomo.core import (ConcreteModel, Var, Param, Constraint, Objective,
+                        Expression, Block, Suffix, Binary, NonNegativeReals)
+from pyomo.core.base.matrix_constraint import MatrixConstraint
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy, numpy_available
+from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import \
+    DirectOrPersistentSolver
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+
+
+class RecordingPersistent(PersistentSolver):
+    """A persistent solver that records the calls made to its backend"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'recording_persistent'
+        PersistentSolver.__init__(self, **kwds)
+        self.calls = []
+
+    def _set_instance(self, model, kwds={}):
+        DirectOrPersistentSolver._set_instance(self, model, kwds)
+        self._add_block(model)
+
+    def _add_var(self, var):
+        varname = self._symbol_map.getSymbol(var, self._labeler)
+        self.calls.append(('add_var', varname))
+        self._pyomo_var_to_solver_var_map[var] = varname
+        self._solver_var_to_pyomo_var_map[varname] = var
+        self._referenced_variables[var] = 0
+
+    def _add_constraint(self, con, repn=None):
+        conname = self._symbol_map.getSymbol(con, self._labeler)
+        self.calls.append(('add_constraint', conname, repn))
+        if repn is None:
+            referenced_vars = ComponentSet(
+                identify_variables(con.body, include_fixed=False))
+        else:
+            referenced_vars = ComponentSet(repn.linear_vars)
+        for var in referenced_vars:
+            self._referenced_variables[var] += 1
+        self._vars_referenced_by_con[con] = referenced_vars
+        self._pyomo_con_to_solver_con_map[con] = conname
+        self._solver_con_to_pyomo_con_map[conname] = con
+
+    def _remove_constraint(self, solver_con):
+        self.calls.append(('remove_constraint', solver_con))
+
+    def _set_objective(self, obj):
+        self.calls.append(('set_objective', obj.name))
+        self._objective = obj
+
+    def update_var(self, var):
+        self.calls.append(('update_var', var.name))
+
+
+class BatchRecordingPersistent(RecordingPersistent):
+    """A recording solver whose backend removes rows in bulk"""
+
+    def _add_vars(self, var_seq):
+        self.calls.append(('add_vars', len(var_seq)))
+        RecordingPersistent._add_vars(self, var_seq)
+
+    def _remove_constraints(self, solver_cons):
+        self.calls.append(('remove_constraints', tuple(solver_cons)))
+
+
+def _build_model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3])
+    m.c1 = Constraint(expr=m.x[1] + m.x[2] >= 1)
+    m.c2 = Constraint(expr=m.x[2] * m.x[3] <= 4)
+    return m
+
+
+class LoadingPersistent(RecordingPersistent):
+    """A recording solver that loads a canned solution in bulk"""
+
+    def __init__(self, **kwds):
+        RecordingPersistent.__init__(self, **kwds)
+        self.solution = {}
+        self.num_orders = 0
+
+    def _get_var_load_order(self):
+        if self._var_load_order is None:
+            self.num_orders += 1
+        return RecordingPersistent._get_var_load_order(self)
+
+    def _load_vars(self, vars_to_load=None):
+        pyomo_vars, solver_vars = self._get_var_load_order()
+        vals = numpy.array([self.solution[name] for name in solver_vars])
+        self._load_var_values(pyomo_vars, vals)
+
+    def _load_rc(self, vars_to_load=None):
+        if not hasattr(self._pyomo_model, 'rc'):
+            self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
+        pyomo_vars, solver_vars = self._get_var_load_order()
+        vals = [-self.solution[name] for name in solver_vars]
+        self._load_suffix_values(self._pyomo_model.rc, pyomo_vars, vals)
+
+
+class TestPersistentBatchAPI(unittest.TestCase):
+
+    def test_add_before_set_instance(self):
+        m = _build_model()
+        opt = RecordingPersistent()
+        with self.assertRaisesRegexp(RuntimeError, 'set_instance'):
+            opt.add_vars([m.x[1]])
+        with self.assertRaisesRegexp(RuntimeError, 'set_instance'):
+            opt.add_constraints([m.c1])
+
+    def test_add_vars(self):
+        m = _build_model()
+        opt = BatchRecordingPersistent(symbolic_solver_labels=True)
+        opt.set_instance(m, symbolic_solver_labels=True)
+        m.y = Var([1, 2])
+        opt.calls = []
+        opt.add_vars(m.y.values())
+        self.assertEqual(opt.calls[0], ('add_vars', 2))
+        self.assertEqual(sorted(opt.calls[1:]),
+                         [('add_var', 'y(1)'), ('add_var', 'y(2)')])
+        self.assertIn(m.y[1], opt._pyomo_var_to_solver_var_map)
+        self.assertIn(m.y[2], opt._pyomo_var_to_solver_var_map)
+
+        other = ConcreteModel()
+        other.z = Var()
+        with self.assertRaisesRegexp(RuntimeError, 'attached'):
+            opt.add_vars([other.z])
+
+    def test_add_constraints(self):
+        m = _build_model()
+        opt = RecordingPersistent()
+        opt.set_instance(m, symbolic_solver_labels=True)
+        m.c3 = Constraint(expr=m.x[1] - m.x[3] == 0)
+        m.c4 = Constraint(expr=m.x[1] ** 2 <= 2)
+        m.A = MatrixConstraint([[1, 2, 0], [0, 1, 1]], lb=0, ub=5,
+                               x=[m.x[1], m.x[2], m.x[3]])
+        opt.calls = []
+        opt.add_constraints([m.c3, m.c4] + list(m.A.values()))
+
+        self.assertEqual([call[1] for call in opt.calls],
+                         ['c3', 'c4', 'A(0)', 'A(1)'])
+        repns = [call[2] for call in opt.calls]
+        self.assertIsNone(repns[0])
+        self.assertIsNone(repns[1])
+        # the MatrixConstraint rows are generated in bulk
+        self.assertIsNotNone(repns[2])
+        matrix_repns = m.A.canonical_forms()
+        for repn, expected in zip(repns[2:], matrix_repns):
+            self.assertEqual(list(repn.linear_coefs),
+                             list(expected.linear_coefs))
+        self.assertEqual(opt._referenced_variables[m.x[1]], 4)
+        self.assertEqual(opt._referenced_variables[m.x[2]], 4)
+        self.assertEqual(opt._referenced_variables[m.x[3]], 3)
+
+        other = ConcreteModel()
+        other.c = Constraint(expr=m.x[1] >= 0)
+        opt.calls = []
+        with self.assertRaisesRegexp(RuntimeError, 'attached'):
+            opt.add_constraints([m.c3, other.c])
+        self.assertEqual(opt.calls, [])
+
+    def test_remove_constraints(self):
+        m = _build_model()
+        opt = RecordingPersistent()
+        opt.set_instance(m, symbolic_solver_labels=True)
+        opt.calls = []
+        opt.remove_constraints(m.c1, m.c2)
+        self.assertEqual(opt.calls, [('remove_constraint', 'c1'),
+                                     ('remove_constraint', 'c2')])
+        self.assertEqual(opt._pyomo_con_to_solver_con_map, {})
+        self.assertEqual(opt._solver_con_to_pyomo_con_map, {})
+        for v in m.x.values():
+            self.assertEqual(opt._referenced_variables[v], 0)
+
+        # the constraints can be added back under the same names
+        opt.calls = []
+        opt.add_constraints([m.c1, m.c2])
+        self.assertEqual([call[1] for call in opt.calls], ['c1', 'c2'])
+
+    def test_remove_constraints_batch(self):
+        m = _build_model()
+        m.b = Block()
+        m.b.c = Constraint(expr=m.x[3] >= 0)
+        opt = BatchRecordingPersistent()
+        opt.set_instance(m, symbolic_solver_labels=True)
+        opt.calls = []
+        opt.remove_constraint(m.c1)
+        self.assertEqual(opt.calls, [('remove_constraints', ('c1',))])
+
+        m.b.d = Constraint(expr=m.x[1] >= 0)
+        opt.add_constraint(m.b.d)
+        opt.calls = []
+        opt.remove_block(m.b)
+        self.assertEqual(len(opt.calls), 1)
+        self.assertEqual(opt.calls[0][0], 'remove_constraints')
+        self.assertEqual(sorted(opt.calls[0][1]), ['b_c', 'b_d'])
+        self.assertEqual(list(opt._pyomo_con_to_solver_con_map), [m.c2])
+
+
+@unittest.skipIf(not numpy_available, "NumPy is not available")
+class TestPersistentBulkLoad(unittest.TestCase):
+
+    def _build(self):
+        m = _build_model()
+        m.z = Var()
+        opt = LoadingPersistent()
+        opt.set_instance(m, symbolic_solver_labels=True)
+        opt.solution = {'x(1)': 1.0, 'x(2)': 2.0, 'x(3)': 3.0, 'z': 4.0}
+        return m, opt
+
+    def test_load_vars(self):
+        m, opt = self._build()
+        opt.load_vars()
+        self.assertEqual([m.x[i].value for i in m.x], [1, 2, 3])
+        self.assertIs(type(m.x[1].value), float)
+        self.assertFalse(m.x[1].stale)
+        # z is not referenced by the solver model
+        self.assertIsNone(m.z.value)
+        self.assertTrue(m.z.stale)
+
+    def test_load_order_reused(self):
+        m, opt = self._build()
+        opt.load_vars()
+        opt._load_rc()
+        self.assertEqual(opt.num_orders, 1)
+        # the suffix values are stored in an array aligned with the
+        # load order
+        pyomo_vars = opt._var_load_order[0]
+        self.assertIs(m.rc._dense_order, pyomo_vars)
+        self.assertEqual(m.rc[m.x[2]], -2)
+
+        opt.solution['x(2)'] = 5.0
+        opt.load_vars()
+        opt._load_rc()
+        self.assertEqual(opt.num_orders, 1)
+        self.assertIs(m.rc._dense_order, pyomo_vars)
+        self.assertEqual(m.x[2].value, 5)
+        self.assertEqual(m.rc[m.x[2]], -5)
+
+    def test_load_order_cleared(self):
+        m, opt = self._build()
+        opt.load_vars()
+        m.c3 = Constraint(expr=m.z >= 1)
+        opt.add_constraint(m.c3)
+        opt.load_vars()
+        self.assertEqual(opt.num_orders, 2)
+        self.assertEqual(m.z.value, 4)
+
+        opt.remove_constraint(m.c1)
+        opt.remove_constraint(m.c3)
+        for v in m.component_data_objects(Var):
+            v.value = None
+        opt.load_vars()
+        self.assertEqual(opt.num_orders, 3)
+        self.assertEqual([m.x[i].value for i in m.x], [None, 2, 3])
+        self.assertIsNone(m.z.value)
+
+        opt.set_instance(m)
+        self.assertIsNone(opt._var_load_order)
+
+
+class TestPersistentAutoUpdate(unittest.TestCase):
+
+    def _build(self):
+        m = ConcreteModel()
+        m.p = Param(initialize=1, mutable=True)
+        m.x = Var([1, 2, 3], bounds=(0, 10))
+        m.y = Var()
+        m.y.fix(2)
+        m.c1 = Constraint(expr=m.x[1] + m.p * m.x[2] >= 1)
+        m.c2 = Constraint(expr=m.x[2] + m.x[3] <= 4)
+        m.c3 = Constraint(expr=m.x[3] + m.y <= 5)
+        m.o = Objective(expr=m.x[1] + m.x[2])
+        opt = RecordingPersistent()
+        opt.set_instance(m, symbolic_solver_labels=True, auto_update=True)
+        opt.calls = []
+        return m, opt
+
+    def test_requires_auto_update(self):
+        m = _build_model()
+        opt = RecordingPersistent()
+        with self.assertRaisesRegexp(RuntimeError, 'set_instance'):
+            opt.sync_instance()
+        opt.set_instance(m)
+        with self.assertRaisesRegexp(RuntimeError, 'auto_update=True'):
+            opt.sync_instance()
+
+    def test_no_changes(self):
+        m, opt = self._build()
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [])
+
+    def test_var_changes(self):
+        m, opt = self._build()
+        m.x[1].setub(5)
+        m.x[2].domain = Binary
+        m.x[3].fix(1)
+        opt.sync_instance()
+        self.assertEqual(sorted(opt.calls), [('update_var', 'x[1]'),
+                                             ('update_var', 'x[2]'),
+                                             ('update_var', 'x[3]')])
+        opt.calls = []
+        m.x[3].fix(2)
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('update_var', 'x[3]')])
+        opt.calls = []
+        # changes that are undone before the next solve are ignored
+        m.x[1].setub(10)
+        m.x[1].setub(5)
+        m.x[2].domain = NonNegativeReals
+        m.x[2].domain = Binary
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [])
+
+    def test_param_and_fixed_var_changes(self):
+        m, opt = self._build()
+        m.p = 3
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('remove_constraint', 'c1'),
+                                     ('add_constraint', 'c1', None)])
+        opt.calls = []
+        # y was fixed when c3 was added
+        m.y.unfix()
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('remove_constraint', 'c3'),
+                                     ('update_var', 'y'),
+                                     ('add_constraint', 'c3', None)])
+        self.assertEqual(opt._referenced_variables[m.y], 1)
+
+    def test_constraint_changes(self):
+        m, opt = self._build()
+        m.c2.deactivate()
+        m.z = Var()
+        m.c4 = Constraint(expr=m.z + m.x[1] >= 0)
+        m.c1.set_value(m.x[1] >= 2)
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('remove_constraint', 'c1'),
+                                     ('remove_constraint', 'c2'),
+                                     ('add_var', 'z'),
+                                     ('add_constraint', 'c1', None),
+                                     ('add_constraint', 'c4', None)])
+        self.assertNotIn(m.c2, opt._pyomo_con_to_solver_con_map)
+        opt.calls = []
+        m.c2.activate()
+        del m.c4
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('remove_constraint', 'c4'),
+                                     ('add_constraint', 'c2', None)])
+
+        # constraints removed through the interface stay removed
+        opt.calls = []
+        opt.remove_constraint(m.c2)
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('remove_constraint', 'c2')])
+
+    def test_objective_changes(self):
+        m, opt = self._build()
+        m.o.expr = m.x[1] + m.p * m.x[3]
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('set_objective', 'o')])
+        opt.calls = []
+        m.p = 2
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('remove_constraint', 'c1'),
+                                     ('add_constraint', 'c1', None),
+                                     ('set_objective', 'o')])
+        opt.calls = []
+        m.o.deactivate()
+        m.o2 = Objective(expr=m.x[2])
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('set_objective', 'o2')])
+
+    def test_matrix_constraint_changes(self):
+        m = ConcreteModel()
+        m.x = Var([0, 1])
+        m.x[1].fix(1)
+        m.A = MatrixConstraint([[1, 2]], ub=5, x=[m.x[0], m.x[1]])
+        m.c = Constraint(expr=m.x[0] + 2*m.x[1] <= 5)
+        opt = RecordingPersistent()
+        opt.set_instance(m, symbolic_solver_labels=True, auto_update=True)
+        opt.calls = []
+        # The value of the fixed column is folded into the row
+        m.x[1].fix(2)
+        opt.sync_instance()
+        self.assertEqual([call[:2] for call in opt.calls],
+                         [('remove_constraint', 'A(0)'),
+                          ('remove_constraint', 'c'),
+                          ('update_var', 'x[1]'),
+                          ('add_constraint', 'A(0)'),
+                          ('add_constraint', 'c')])
+        self.assertEqual(opt.calls[3][2].constant, 4)
+        opt.calls = []
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [])
+
+    def test_named_expression_changes(self):
+        m, opt = self._build()
+        m.e = Expression(expr=m.x[1] + m.x[2])
+        m.c4 = Constraint(expr=m.e <= 6)
+        m.o.expr = 2 * m.e
+        opt.sync_instance()
+        opt.calls = []
+        # The body of the named expression is replaced in place
+        m.e.set_value(m.x[1] + m.x[3])
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [('remove_constraint', 'c4'),
+                                     ('add_constraint', 'c4', None),
+                                     ('set_objective', 'o')])
+        opt.calls = []
+        opt.sync_instance()
+        self.assertEqual(opt.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,8 +22,10 @@ from pyomo.dae import ContinuousSet, DerivativeVar
 from pyomo.network import Port, Arc
 from pyomo.mpec import Complementarity
 from pyomo.gdp import Disjunct, Disjunction
-from pyomo.core.expr.template_expr import IndexTemplate
-from pyomo.core.expr.numvalue import native_types
+from pyomo.core.expr.template_expr import (
+    IndexTemplate, templatize_constraint,
+)
+from pyomo.core.expr.numvalue import native_types, native_numeric_types
 from pyomo.util.components import iter_component
 
 def check_units_equivalent(*args):
@@ -65,16 +67,20 @@ def assert_units_equivalent(*args):
     ------
     :py:class:`pyomo.core.base.units_container.UnitsError`, :py:class:`pyomo.core.base.units_container.InconsistentUnitsError`
     """
+    _assert_units_equivalent(args, UnitExtractionVisitor(units))
+
+def _assert_units_equivalent(args, visitor):
     # this call will raise an exception if an inconsistency is found
-    pyomo_unit_compare, pint_unit_compare = units._get_units_tuple(args[0])
+    pyomo_unit_compare, pint_unit_compare = units._get_units_tuple(
+        args[0], visitor)
     for expr in args[1:]:
         # this call will raise an exception if an inconsistency is found
-        pyomo_unit, pint_unit = units._get_units_tuple(expr)
-        if not UnitExtractionVisitor(units)._pint_units_equivalent(pint_unit_compare, pint_unit):
+        pyomo_unit, pint_unit = units._get_units_tuple(expr, visitor)
+        if not visitor._pint_units_equivalent(pint_unit_compare, pint_unit):
             raise UnitsError \
                 ("Units between {} and {} are not consistent.".format(str(pyomo_unit_compare), str(pyomo_unit)))
 
-def _assert_units_consistent_constraint_data(condata):
+def _assert_units_consistent_constraint_data(condata, visitor):
     """
     Raise an exception if the any units in lower, body, upper on a
     ConstraintData object are not consistent or are not equivalent
@@ -94,11 +100,51 @@ def _assert_units_consistent_constraint_data(condata):
         args.append(condata.upper)
 
     if len(args) == 1:
-        assert_units_consistent(*args)
+        _assert_units_consistent_expression(args[0], visitor)
     else:
-        assert_units_equivalent(*args)
+        _assert_units_equivalent(args, visitor)
+
+def _assert_units_consistent_constraint_template(con, visitor):
+    """
+    Check the units of an indexed constraint using a single templatized
+    expression generated from the constraint rule (see
+    :py:func:`templatize_constraint`).  Returns False if the rule could
+    not be templatized (e.g., it depends on the index values), in which
+    case the individual constraint data objects must be checked.
+    """
+    if con.rule is None:
+        return False
+    try:
+        template, indices = templatize_constraint(con)
+    except Exception:
+        return False
+    if type(template) is tuple:
+        args = template
+    elif getattr(template, 'is_relational', None) is not None \
+            and template.is_relational():
+        args = template.args
+    else:
+        # e.g., Constraint.Skip or a constant expression
+        return False
+    # As in _assert_units_consistent_constraint_data, constant 0
+    # bounds are allowed to be unitless
+    try:
+        args = [arg for arg in args if arg is not None and not (
+            (type(arg) in native_numeric_types or arg.is_constant())
+            and value(arg) == 0)]
+        if len(args) == 1:
+            _assert_units_consistent_expression(args[0], visitor)
+        else:
+            _assert_units_equivalent(args, visitor)
+    except UnitsError:
+        raise
+    except Exception:
+        # The template contains something the units visitor cannot
+        # handle; fall back on checking each constraint data object
+        return False
+    return True
 
-def _assert_units_consistent_arc_data(arcdata):
+def _assert_units_consistent_arc_data(arcdata, visitor):
     """
     Raise an exception if the any units do not match for the connected ports
     """
@@ -118,24 +164,24 @@ def _assert_units_consistent_arc_data(arcdata):
             for k in svar:
                 svardata = svar[k]
                 dvardata = dvar[k]
-                assert_units_equivalent(svardata, dvardata)
+                _assert_units_equivalent((svardata, dvardata), visitor)
         else:
-            assert_units_equivalent(svar, dvar)
+            _assert_units_equivalent((svar, dvar), visitor)
 
-def _assert_units_consistent_property_expr(obj):
+def _assert_units_consistent_property_expr(obj, visitor):
     """
     Check the .expr property of the object and raise
     an exception if the units are not consistent
     """
-    _assert_units_consistent_expression(obj.expr)
+    _assert_units_consistent_expression(obj.expr, visitor)
 
-def _assert_units_consistent_expression(expr):
+def _assert_units_consistent_expression(expr, visitor):
     """
     Raise an exception if any units in expr are inconsistent.
     # this call will raise an error if an inconsistency is found
     pyomo_unit, pint_unit = units._get_units_tuple(expr=expr)
     """
-    pyomo_unit, pint_unit = units._get_units_tuple(expr)
+    pyomo_unit, pint_unit = units._get_units_tuple(expr, visitor)
 
 # Complementarities that are not in standard form do not
 # current work with the checking code. The Units container
@@ -153,14 +199,14 @@ def _assert_units_consistent_expression(expr):
 #        pyomo_unit, pint_unit = units._get_units_tuple(cdata._args[1])
 #    _assert_units_consistent_block(cdata)
 
-def _assert_units_consistent_block(obj):
+def _assert_units_consistent_block(obj, visitor, representative=False):
     """
     This method gets all the components from the block
     and checks if the units are consistent on each of them
     """
     # check all the component objects
     for component in obj.component_objects(descend_into=False, active=True):
-        assert_units_consistent(component)
+        _assert_units_consistent(component, visitor, representative)
 
 _component_data_handlers = {
     Objective: _assert_units_consistent_property_expr,
@@ -185,7 +231,7 @@ _component_data_handlers = {
     # Complementarity: _assert_units_complementarity
     }
 
-def assert_units_consistent(obj):
+def assert_units_consistent(obj, representative=False):
     """
     This method raises an exception if the units are not
     consistent on the passed in object.  Argument obj can be one
@@ -193,21 +239,37 @@ def assert_units_consistent(obj):
     Constraint, Objective, Expression, or it can be a Pyomo
     expression object
 
+    The units of Vars, Params, and named Expressions are only
+    extracted once for each call to this method.
+
     Parameters
     ----------
     obj : Pyomo component (e.g., Block, Model, Constraint, Objective, or Expression) or Pyomo expression
        The object or expression to test
 
+    representative : bool (default False)
+       If True, indexed Constraints that were constructed from a rule
+       are checked using a single templatized expression (see
+       :py:func:`pyomo.core.expr.template_expr.templatize_constraint`)
+       instead of checking every constraint data object.  Constraints
+       whose rules cannot be templatized (e.g., rules that branch on
+       the index values) are checked in full.  Note that constraint
+       data objects that were modified after construction are not
+       checked in this mode.
+
     Raises
     ------
     :py:class:`pyomo.core.base.units_container.UnitsError`, :py:class:`pyomo.core.base.units_container.InconsistentUnitsError`
     """
+    _assert_units_consistent(obj, UnitExtractionVisitor(units), representative)
+
+def _assert_units_consistent(obj, visitor, representative=False):
     objtype = type(obj)
     if objtype in native_types:
         return
     elif obj.is_expression_type() or objtype is IndexTemplate:
         try:
-            _assert_units_consistent_expression(obj)
+            _assert_units_consistent_expression(obj, visitor)
         except UnitsError:
             print('Units problem with expression {}'.format(obj))
             raise
@@ -222,17 +284,28 @@ def assert_units_consistent(obj):
     if handler is None:
         return
 
+    if handler is _assert_units_consistent_block:
+        handler = lambda _obj, _visitor: _assert_units_consistent_block(
+            _obj, _visitor, representative)
+
     if obj.is_indexed():
+        if representative and obj.ctype is Constraint:
+            try:
+                if _assert_units_consistent_constraint_template(obj, visitor):
+                    return
+            except UnitsError:
+                print('Error in units when checking {}'.format(obj))
+                raise
         # check all the component data objects
         for cdata in obj.values():
             try:
-                handler(cdata)
+                handler(cdata, visitor)
             except UnitsError:
                 print('Error in units when checking {}'.format(cdata))
                 raise
     else:
         try:
-            handler(obj)
+            handler(obj, visitor)
         except UnitsError:
                 print('Error in units when checking {}'.format(obj))
                 raise
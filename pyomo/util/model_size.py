@@ -10,10 +10,15 @@
 
 """This module contains functions to interrogate the size of a Pyomo model."""
 import logging
+import multiprocessing
+from collections import defaultdict
 
-from pyomo.common.collections import ComponentSet, Container
-from pyomo.core import Block, Constraint, Var
-from pyomo.core.expr import current as EXPR
+from six import iteritems, itervalues
+
+from pyomo.common.collections import Container
+from pyomo.core import Block, Constraint, Objective, Var
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.numvalue import nonpyomo_leaf_types, value
 from pyomo.gdp import Disjunct, Disjunction
 
 
@@ -44,93 +49,92 @@ class ModelSizeReport(Container):
     pass
 
 
+class ModelStatistics(Container):
+    """Stores model statistics collected in a single pass over the model.
+
+    The ``overall`` and ``activated`` sections follow the same rules for
+    activation as :py:class:`ModelSizeReport`, and each contain:
+
+    - ``variables``, broken down by domain (``binary_variables``,
+      ``integer_variables``, ``continuous_variables``), by bound status
+      (``unbounded_variables``, ``lower_bounded_variables``,
+      ``upper_bounded_variables``, ``bounded_variables``) and
+      ``fixed_variables``
+    - ``constraints``, broken down by sense (``equality_constraints``,
+      ``inequality_constraints``, ``ranged_constraints``) and polynomial
+      degree of the body (``linear_constraints``,
+      ``quadratic_constraints``, ``polynomial_constraints``,
+      ``general_nonlinear_constraints``); ``nonlinear_constraints`` is
+      everything that is not linear
+    - ``nonzeros``: the number of (unfixed) variables appearing in each
+      constraint body, summed over all constraints
+    - ``expression_nodes``: the number of nodes in all constraint bodies
+    - ``objectives`` and ``nonlinear_objectives``
+    - ``blocks``, ``disjuncts`` and ``disjunctions``
+
+    """
+    pass
+
+
+_size_report_fields = (
+    'variables', 'binary_variables', 'integer_variables',
+    'continuous_variables', 'disjunctions', 'disjuncts', 'constraints',
+    'nonlinear_constraints',
+)
+
+_statistics_fields = (
+    'variables', 'binary_variables', 'integer_variables',
+    'continuous_variables', 'fixed_variables', 'unbounded_variables',
+    'lower_bounded_variables', 'upper_bounded_variables',
+    'bounded_variables',
+    'constraints', 'equality_constraints', 'inequality_constraints',
+    'ranged_constraints', 'linear_constraints', 'quadratic_constraints',
+    'polynomial_constraints', 'general_nonlinear_constraints',
+    'nonlinear_constraints', 'nonzeros', 'expression_nodes',
+    'objectives', 'nonlinear_objectives',
+    'blocks', 'disjuncts', 'disjunctions',
+)
+
+
+def build_model_statistics(model, processes=None):
+    """Collect model statistics in a single pass over the model.
+
+    Every block, variable, constraint and objective on the model is
+    visited exactly once, and each constraint body is walked once to
+    determine its polynomial degree, (unfixed) variables and number of
+    expression nodes.  Only counters are accumulated; the only
+    per-component state retained is the ids of the variables that
+    appear in active constraints (needed to count distinct activated
+    variables).
+
+    Args:
+        model (Block): the model to interrogate
+        processes (int): if greater than 1, the sub-blocks of ``model``
+            are processed in parallel using (up to) this many forked
+            worker processes.  Ignored on platforms that do not
+            support ``fork``.
+
+    Returns:
+        ModelStatistics
+
+    """
+    collector = _ModelStatisticsCollector(id(model))
+    scope_id = id(model) if model.active else None
+    if processes and processes > 1 and _fork_available():
+        _collect_in_parallel(collector, model, scope_id, processes)
+    else:
+        collector.collect(model, scope_id)
+    return collector.finalize()
+
+
 def build_model_size_report(model):
     """Build a model size report object."""
+    stats = build_model_statistics(model)
     report = ModelSizeReport()
-    activated_disjunctions = ComponentSet()
-    activated_disjuncts = ComponentSet()
-    fixed_true_disjuncts = ComponentSet()
-    activated_constraints = ComponentSet()
-    activated_vars = ComponentSet()
-    new_containers = (model,)
-
-    while new_containers:
-        new_activated_disjunctions = ComponentSet()
-        new_activated_disjuncts = ComponentSet()
-        new_fixed_true_disjuncts = ComponentSet()
-        new_activated_constraints = ComponentSet()
-
-        for container in new_containers:
-            (next_activated_disjunctions,
-             next_fixed_true_disjuncts,
-             next_activated_disjuncts,
-             next_activated_constraints
-             ) = _process_activated_container(container)
-            new_activated_disjunctions.update(next_activated_disjunctions)
-            new_activated_disjuncts.update(next_activated_disjuncts)
-            new_fixed_true_disjuncts.update(next_fixed_true_disjuncts)
-            new_activated_constraints.update(next_activated_constraints)
-
-        new_containers = ((new_activated_disjuncts - activated_disjuncts) |
-                          (new_fixed_true_disjuncts - fixed_true_disjuncts))
-
-        activated_disjunctions.update(new_activated_disjunctions)
-        activated_disjuncts.update(new_activated_disjuncts)
-        fixed_true_disjuncts.update(new_fixed_true_disjuncts)
-        activated_constraints.update(new_activated_constraints)
-
-    activated_vars.update(
-        var for constr in activated_constraints
-        for var in EXPR.identify_variables(
-            constr.body, include_fixed=False))
-    activated_vars.update(
-        disj.indicator_var for disj in activated_disjuncts)
-
-    report.activated = Container()
-    report.activated.variables = len(activated_vars)
-    report.activated.binary_variables = sum(
-        1 for v in activated_vars if v.is_binary())
-    report.activated.integer_variables = sum(
-        1 for v in activated_vars if v.is_integer() and not v.is_binary())
-    report.activated.continuous_variables = sum(
-        1 for v in activated_vars if v.is_continuous())
-    report.activated.disjunctions = len(activated_disjunctions)
-    report.activated.disjuncts = len(activated_disjuncts)
-    report.activated.constraints = len(activated_constraints)
-    report.activated.nonlinear_constraints = sum(
-        1 for c in activated_constraints
-        if c.body.polynomial_degree() not in (1, 0))
-
-    report.overall = Container()
-    block_like = (Block, Disjunct)
-    all_vars = ComponentSet(
-        model.component_data_objects(Var, descend_into=block_like))
-    report.overall.variables = len(all_vars)
-    report.overall.binary_variables = sum(1 for v in all_vars if v.is_binary())
-    report.overall.integer_variables = sum(
-        1 for v in all_vars if v.is_integer() and not v.is_binary())
-    report.overall.continuous_variables = sum(
-        1 for v in all_vars if v.is_continuous())
-    report.overall.disjunctions = sum(
-        1 for d in model.component_data_objects(
-            Disjunction, descend_into=block_like))
-    report.overall.disjuncts = sum(
-        1 for d in model.component_data_objects(
-            Disjunct, descend_into=block_like))
-    report.overall.constraints = sum(
-        1 for c in model.component_data_objects(
-            Constraint, descend_into=block_like))
-    report.overall.nonlinear_constraints = sum(
-        1 for c in model.component_data_objects(
-            Constraint, descend_into=block_like)
-        if c.body.polynomial_degree() not in (1, 0))
-
-    report.warning = Container()
-    report.warning.unassociated_disjuncts = sum(
-        1 for d in model.component_data_objects(
-            Disjunct, descend_into=block_like)
-        if not d.indicator_var.fixed and d not in activated_disjuncts)
-
+    for section in ('activated', 'overall'):
+        report[section] = Container(**dict(
+            (key, stats[section][key]) for key in _size_report_fields))
+    report.warning = Container(**stats.warning)
     return report
 
 
@@ -139,27 +143,392 @@ def log_model_size_report(model, logger=default_logger):
     logger.info(build_model_size_report(model))
 
 
-def _process_activated_container(blk):
-    """Process a container object, returning the new components found."""
-    new_fixed_true_disjuncts = ComponentSet(
-        disj for disj in blk.component_data_objects(Disjunct, active=True)
-        if disj.indicator_var.value == 1 and disj.indicator_var.fixed)
-    new_activated_disjunctions = ComponentSet(
-        blk.component_data_objects(Disjunction, active=True))
-    new_activated_disjuncts = ComponentSet(
-        disj for disjtn in new_activated_disjunctions
-        for disj in _activated_disjuncts_in_disjunction(disjtn))
-    new_activated_constraints = ComponentSet(
-        blk.component_data_objects(Constraint, active=True))
-    return (
-        new_activated_disjunctions,
-        new_fixed_true_disjuncts,
-        new_activated_disjuncts,
-        new_activated_constraints
+def log_model_statistics(model, logger=default_logger, processes=None):
+    """Generate a report logging the model statistics."""
+    logger.info(build_model_statistics(model, processes=processes))
+
+
+_BINARY = 1
+_INTEGER = 2
+_CONTINUOUS = 4
+_FIXED = 8
+_HAS_LB = 16
+_HAS_UB = 32
+
+
+def _domain_code(domain, cache):
+    """Return (domain, domain code, domain has lb, domain has ub)"""
+    ans = cache.get(id(domain), None)
+    if ans is not None:
+        return ans
+    interval = domain.get_interval()
+    if interval == (0, 1, 1):
+        code = _BINARY
+    elif interval is not None and interval[2] == 1:
+        code = _INTEGER
+    elif interval is not None and interval[2] == 0:
+        code = _CONTINUOUS
+    else:
+        code = 0
+    dlb, dub = domain.bounds()
+    ans = cache[id(domain)] = (
+        domain, code,
+        dlb is not None and dlb != float('-inf'),
+        dub is not None and dub != float('inf'),
     )
+    return ans
+
+
+def _var_code(var, domain_cache):
+    """Encode the domain and bound status of a variable as an int"""
+    _, code, has_lb, has_ub = _domain_code(var.domain, domain_cache)
+    if var.fixed:
+        code |= _FIXED
+    # Equivalent to var.has_lb() / var.has_ub(), without recomputing the
+    # domain bounds for every variable
+    if has_lb or (var._lb is not None and value(var._lb) != float('-inf')):
+        code |= _HAS_LB
+    if has_ub or (var._ub is not None and value(var._ub) != float('inf')):
+        code |= _HAS_UB
+    return code
+
+
+def _count_var_code(counts, code, n=1):
+    counts['variables'] += n
+    if code & _BINARY:
+        counts['binary_variables'] += n
+    elif code & _INTEGER:
+        counts['integer_variables'] += n
+    elif code & _CONTINUOUS:
+        counts['continuous_variables'] += n
+    if code & _FIXED:
+        counts['fixed_variables'] += n
+    bounds = code & (_HAS_LB | _HAS_UB)
+    if bounds == _HAS_LB | _HAS_UB:
+        counts['bounded_variables'] += n
+    elif bounds == _HAS_LB:
+        counts['lower_bounded_variables'] += n
+    elif bounds == _HAS_UB:
+        counts['upper_bounded_variables'] += n
+    else:
+        counts['unbounded_variables'] += n
+
+
+def _expression_statistics(expr, variables):
+    """Walk an expression once, returning its (polynomial degree, nodes)
+
+    Unfixed variables are added to the ``variables`` dict (id -> var).
+    """
+    if expr.__class__ in nonpyomo_leaf_types:
+        return 0, 1
+    if not expr.is_expression_type():
+        if expr.is_variable_type():
+            if expr.fixed:
+                return 0, 1
+            variables[id(expr)] = expr
+            return 1, 1
+        return (0 if expr.is_fixed() else 1), 1
+
+    nodes = 0
+    stack = [(expr, expr._args_, 0, expr.nargs(), [])]
+    while 1:
+        node, args, idx, nargs, degrees = stack.pop()
+        while idx < nargs:
+            child = args[idx]
+            idx += 1
+            if child.__class__ in nonpyomo_leaf_types:
+                nodes += 1
+                degrees.append(0)
+            elif child.is_expression_type():
+                stack.append((node, args, idx, nargs, degrees))
+                node, args, idx, nargs, degrees = \
+                    child, child._args_, 0, child.nargs(), []
+            elif child.is_variable_type():
+                nodes += 1
+                if child.fixed:
+                    degrees.append(0)
+                else:
+                    variables[id(child)] = child
+                    degrees.append(1)
+            else:
+                nodes += 1
+                degrees.append(0 if child.is_fixed() else 1)
+        nodes += 1
+        if node.__class__ is LinearExpression:
+            nodes += len(node.linear_vars)
+            for v in node.linear_vars:
+                if not v.fixed:
+                    variables[id(v)] = v
+        degree = node._compute_polynomial_degree(degrees)
+        if not stack:
+            return degree, nodes
+        stack[-1][4].append(degree)
+
+
+class _ScopeStatistics(object):
+    """Statistics for the active components in one activation scope.
+
+    A scope is either the model itself, or a single Disjunct (together
+    with the active Blocks beneath it).  Whether a Disjunct scope is
+    activated is only known once all Disjunctions have been seen, so the
+    counts are kept per scope and merged in
+    :py:meth:`_ModelStatisticsCollector.finalize`.  All state is plain
+    data (ints and object ids) so that it may be returned from worker
+    processes.
+    """
+    __slots__ = ('counts', 'variables', 'disjunctions', 'disjuncts',
+                 'fixed_true_disjuncts')
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+        # id(var) -> var code for unfixed vars in active constraints
+        self.variables = {}
+        self.disjunctions = 0
+        # (id(disjunct), id(indicator_var), indicator_var code) for the
+        # active, unfixed disjuncts in active disjunctions
+        self.disjuncts = []
+        self.fixed_true_disjuncts = []
+
+    def update(self, other):
+        for key, val in iteritems(other.counts):
+            self.counts[key] += val
+        self.variables.update(other.variables)
+        self.disjunctions += other.disjunctions
+        self.disjuncts.extend(other.disjuncts)
+        self.fixed_true_disjuncts.extend(other.fixed_true_disjuncts)
+
+
+class _ModelStatisticsCollector(object):
+
+    def __init__(self, root_id):
+        self.root_id = root_id
+        self.overall = defaultdict(int)
+        self.scopes = defaultdict(_ScopeStatistics)
+        self.unfixed_disjuncts = set()
+        # id(domain) -> _domain_code() (holding a reference to the
+        # domain keeps the id valid for the life of the collector)
+        self.domain_cache = {}
+
+    def collect(self, block, scope_id, descend_into=True):
+        """Accumulate statistics for a block and its sub-blocks
+
+        ``scope_id`` is the activation scope of ``block`` (None if the
+        block is not active).  If ``descend_into`` is False, the
+        sub-blocks are not processed, and are returned as a list of
+        ``(block, scope_id)`` tuples.
+        """
+        stack = [(block, scope_id)]
+        sub_blocks = []
+        while stack:
+            blk, scope_id = stack.pop()
+            scope = None if scope_id is None else self.scopes[scope_id]
+            if scope_id != id(blk) or scope_id == self.root_id:
+                # Disjuncts are counted separately
+                self.overall['blocks'] += 1
+                if scope is not None:
+                    scope.counts['blocks'] += 1
+            for comp in blk.component_objects(descend_into=False):
+                ctype = comp.ctype
+                if ctype is Var:
+                    self._process_vars(comp)
+                elif ctype is Constraint:
+                    self._process_constraints(comp, scope)
+                elif ctype is Objective:
+                    self._process_objectives(comp, scope)
+                elif ctype is Disjunction:
+                    self._process_disjunctions(comp, scope)
+                elif ctype is Block:
+                    active = scope is not None and comp.active
+                    for data in itervalues(comp):
+                        if data.parent_component() is comp:
+                            sub_blocks.append((
+                                data, scope_id if active and data.active
+                                else None))
+                elif ctype is Disjunct:
+                    for data in itervalues(comp):
+                        if data.parent_component() is comp:
+                            self._process_disjunct(comp, data, scope)
+                            # Each Disjunct is its own activation scope
+                            sub_blocks.append((data, id(data)))
+            if not descend_into:
+                return sub_blocks
+            stack.extend(reversed(sub_blocks))
+            sub_blocks = []
+        return sub_blocks
+
+    def _process_vars(self, comp):
+        counts = self.overall
+        for v in itervalues(comp):
+            if v.parent_component() is not comp:
+                continue
+            _count_var_code(counts, _var_code(v, self.domain_cache))
+
+    def _process_constraints(self, comp, scope):
+        counts = self.overall
+        active = scope is not None and comp.active
+        for c in itervalues(comp):
+            if c.parent_component() is not comp:
+                continue
+            variables = {}
+            degree, nodes = _expression_statistics(c.body, variables)
+            self._count_constraint(counts, c, degree, nodes, len(variables))
+            if active and c.active:
+                self._count_constraint(
+                    scope.counts, c, degree, nodes, len(variables))
+                scope_vars = scope.variables
+                for vid, v in iteritems(variables):
+                    if vid not in scope_vars:
+                        scope_vars[vid] = _var_code(v, self.domain_cache)
+
+    @staticmethod
+    def _count_constraint(counts, con, degree, nodes, nonzeros):
+        counts['constraints'] += 1
+        counts['nonzeros'] += nonzeros
+        counts['expression_nodes'] += nodes
+        if con.equality:
+            counts['equality_constraints'] += 1
+        elif con.has_lb() and con.has_ub():
+            counts['ranged_constraints'] += 1
+        else:
+            counts['inequality_constraints'] += 1
+        if degree in (0, 1):
+            counts['linear_constraints'] += 1
+            return
+        counts['nonlinear_constraints'] += 1
+        if degree is None:
+            counts['general_nonlinear_constraints'] += 1
+        elif degree == 2:
+            counts['quadratic_constraints'] += 1
+        else:
+            counts['polynomial_constraints'] += 1
+
+    def _process_objectives(self, comp, scope):
+        active = scope is not None and comp.active
+        for obj in itervalues(comp):
+            if obj.parent_component() is not comp:
+                continue
+            nonlinear = obj.expr.polynomial_degree() not in (0, 1)
+            self.overall['objectives'] += 1
+            self.overall['nonlinear_objectives'] += nonlinear
+            if active and obj.active:
+                scope.counts['objectives'] += 1
+                scope.counts['nonlinear_objectives'] += nonlinear
+
+    def _process_disjunctions(self, comp, scope):
+        active = scope is not None and comp.active
+        for disjtn in itervalues(comp):
+            if disjtn.parent_component() is not comp:
+                continue
+            self.overall['disjunctions'] += 1
+            if not (active and disjtn.active):
+                continue
+            scope.disjunctions += 1
+            for disj in disjtn.disjuncts:
+                indicator = disj.indicator_var
+                if disj.active and not indicator.fixed:
+                    scope.disjuncts.append((
+                        id(disj), id(indicator),
+                        _var_code(indicator, self.domain_cache)))
+
+    def _process_disjunct(self, comp, disj, scope):
+        self.overall['disjuncts'] += 1
+        indicator = disj.indicator_var
+        if not indicator.fixed:
+            self.unfixed_disjuncts.add(id(disj))
+        elif scope is not None and comp.active and disj.active \
+                and indicator.value == 1:
+            scope.fixed_true_disjuncts.append(id(disj))
+
+    def update(self, other):
+        for key, val in iteritems(other.overall):
+            self.overall[key] += val
+        for scope_id, scope in iteritems(other.scopes):
+            self.scopes[scope_id].update(scope)
+        self.unfixed_disjuncts.update(other.unfixed_disjuncts)
+
+    def finalize(self):
+        """Resolve the activated scopes and build the ModelStatistics"""
+        activated = defaultdict(int)
+        activated_vars = {}
+        activated_disjuncts = set()
+        visited = set()
+        pending = [self.root_id] if self.root_id in self.scopes else []
+        while pending:
+            scope_id = pending.pop()
+            if scope_id in visited:
+                continue
+            visited.add(scope_id)
+            scope = self.scopes.get(scope_id, None)
+            if scope is None:
+                continue
+            for key, val in iteritems(scope.counts):
+                activated[key] += val
+            activated['disjunctions'] += scope.disjunctions
+            activated_vars.update(scope.variables)
+            for disj_id, indicator_id, indicator_code in scope.disjuncts:
+                activated_disjuncts.add(disj_id)
+                activated_vars[indicator_id] = indicator_code
+                pending.append(disj_id)
+            pending.extend(scope.fixed_true_disjuncts)
+        activated['disjuncts'] = len(activated_disjuncts)
+
+        code_counts = defaultdict(int)
+        for code in itervalues(activated_vars):
+            code_counts[code] += 1
+        for code, n in iteritems(code_counts):
+            _count_var_code(activated, code, n)
+
+        stats = ModelStatistics()
+        stats.activated = Container(**dict(
+            (key, activated[key]) for key in _statistics_fields))
+        stats.overall = Container(**dict(
+            (key, self.overall[key]) for key in _statistics_fields))
+        stats.warning = Container()
+        stats.warning.unassociated_disjuncts = len(
+            self.unfixed_disjuncts - activated_disjuncts)
+        return stats
+
+
+def _fork_available():
+    try:
+        return 'fork' in multiprocessing.get_all_start_methods()
+    except AttributeError:
+        # Python 2 (no start methods)
+        return False
+
+
+# The sub-blocks of the model shared with forked worker processes
+_parallel_blocks = None
+
+
+def _collect_parallel_chunk(indices):
+    # Note: forked workers share the parent's object ids, so the ids
+    # recorded here are consistent with those in the parent process
+    collector = _ModelStatisticsCollector(None)
+    for i in indices:
+        block, scope_id = _parallel_blocks[i]
+        collector.collect(block, scope_id)
+    # Only plain data is returned to the parent process
+    collector.domain_cache = {}
+    return collector
 
 
-def _activated_disjuncts_in_disjunction(disjtn):
-    """Retrieve generator of activated disjuncts on disjunction."""
-    return (disj for disj in disjtn.disjuncts
-            if disj.active and not disj.indicator_var.fixed)
+def _collect_in_parallel(collector, model, scope_id, processes):
+    global _parallel_blocks
+    sub_blocks = collector.collect(model, scope_id, descend_into=False)
+    if not sub_blocks:
+        return
+    n = min(processes, len(sub_blocks))
+    chunks = [list(range(i, len(sub_blocks), n)) for i in range(n)]
+    _parallel_blocks = sub_blocks
+    try:
+        pool = multiprocessing.get_context('fork').Pool(n)
+        try:
+            for partial in pool.imap_unordered(
+                    _collect_parallel_chunk, chunks):
+                collector.update(partial)
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _parallel_blocks = None
@@ -0,0 +1,140 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Reverse index from mutable Params to the components that use them."""
+
+from pyomo.common.collections import ComponentMap, ComponentSet
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.objective import Objective
+from pyomo.core.expr.visitor import identify_mutable_parameters
+
+
+class MutableParamIndex(object):
+    """Map mutable Params to the constraints and objectives that reference them
+
+    After changing the value of a mutable Param (e.g., ``m.p[t] = v``),
+    writers and persistent solvers only need to regenerate the
+    constraint and objective data objects that actually reference that
+    Param.  This class records that relationship so the affected rows
+    can be looked up directly instead of regenerating the whole model.
+
+    The index is built on demand by walking the expressions of every
+    Constraint and Objective on a block (using
+    :py:func:`identify_mutable_parameters`), and may then be maintained
+    incrementally through :py:meth:`add_component` and
+    :py:meth:`remove_component`.
+
+    Args:
+        block (Block): the block to index (optional).  If provided, the
+            index is built immediately.
+        active (bool): if True (default), only index active components.
+            If None, index all components.
+        descend_into (bool): if True (default), also index components
+            on sub-blocks.
+
+    Example:
+        >>> idx = MutableParamIndex(m)
+        >>> m.p[1] = 5
+        >>> for c in idx.dependents(m.p[1]):
+        ...     solver.update_constraint(c)
+    """
+
+    def __init__(self, block=None, active=True, descend_into=True):
+        # mutable _ParamData -> ComponentSet of constraint / objective data
+        self._dependents = ComponentMap()
+        # constraint / objective data -> tuple of mutable _ParamData
+        self._params = ComponentMap()
+        if block is not None:
+            self.build(block, active=active, descend_into=descend_into)
+
+    def __len__(self):
+        """The number of mutable Params that appear in indexed components"""
+        return len(self._dependents)
+
+    def __contains__(self, param):
+        return param in self._dependents
+
+    def __iter__(self):
+        return iter(self._dependents)
+
+    def build(self, block, active=True, descend_into=True):
+        """(Re)build the index from all constraints and objectives on a block"""
+        self.clear()
+        for comp in block.component_data_objects(
+                (Constraint, Objective), active=active,
+                descend_into=descend_into):
+            self.add_component(comp)
+
+    def clear(self):
+        """Remove all entries from the index"""
+        self._dependents = ComponentMap()
+        self._params = ComponentMap()
+
+    def add_component(self, comp):
+        """Add (or refresh) a single constraint or objective data object
+
+        Returns:
+            tuple: the mutable Params referenced by the component
+        """
+        if comp in self._params:
+            self.remove_component(comp)
+        params = tuple(
+            p for p in identify_mutable_parameters(comp.expr)
+            if p.is_parameter_type())
+        self._params[comp] = params
+        for p in params:
+            deps = self._dependents.get(p, None)
+            if deps is None:
+                deps = self._dependents[p] = ComponentSet()
+            deps.add(comp)
+        return params
+
+    def remove_component(self, comp):
+        """Remove a single constraint or objective data object from the index"""
+        params = self._params.pop(comp, None)
+        if params is None:
+            return
+        for p in params:
+            deps = self._dependents[p]
+            deps.discard(comp)
+            if not deps:
+                del self._dependents[p]
+
+    def dependents(self, param):
+        """Return the components whose expressions reference a mutable Param
+
+        If ``param`` is an indexed Param, the dependents of all of its
+        data objects are returned.
+
+        Returns:
+            ComponentSet: constraint and objective data objects, in the
+            order they were added to the index
+        """
+        if param.is_indexed():
+            return self.affected_by(param.values())
+        deps = self._dependents.get(param, None)
+        if deps is None:
+            return ComponentSet()
+        return ComponentSet(deps)
+
+    def affected_by(self, params):
+        """Return the union of the dependents of an iterable of Params"""
+        ans = ComponentSet()
+        for p in params:
+            if p.is_indexed():
+                for pd in p.values():
+                    ans.update(self._dependents.get(pd, ()))
+            else:
+                ans.update(self._dependents.get(p, ()))
+        return ans
+
+    def params(self, comp):
+        """Return the mutable Params referenced by an indexed component"""
+        return self._params.get(comp, ())
@@ -193,5 +193,62 @@ class TestUnitsChecking(unittest.TestCase):
 
         assert_units_consistent(m)
 
+    def test_assert_units_consistent_representative(self):
+        u = units
+        m = ConcreteModel()
+        m.T = Set(initialize=[1, 2, 3])
+        m.x = Var(m.T, units=u.m)
+        m.v = Var(m.T, units=u.m/u.s)
+        m.dt = Param(initialize=2.0, units=u.s)
+        m.p = Param(m.T, initialize=1.0, units=u.m)
+        m.e = Expression(m.T, rule=lambda m, t: m.v[t]*m.dt)
+
+        def ok_rule(m, t):
+            return m.x[t] == m.p[t] + m.v[t]*m.dt
+        m.ok = Constraint(m.T, rule=ok_rule)
+        m.s = Constraint(m.T, rule=lambda m, t: sum(
+            m.x[i] for i in m.T) >= 0)
+        assert_units_consistent(m, representative=True)
+        assert_units_consistent(m.ok, representative=True)
+
+        # an inconsistent rule is detected from the template
+        m.bad = Constraint(m.T, rule=lambda m, t: m.x[t] == m.v[t])
+        with self.assertRaises(UnitsError):
+            assert_units_consistent(m.bad, representative=True)
+        with self.assertRaises(UnitsError):
+            assert_units_consistent(m, representative=True)
+        m.del_component(m.bad)
+
+        # rules that cannot be templatized are checked in full
+        def branch_rule(m, t):
+            if t == 1:
+                return m.x[t] == m.v[t]
+            return m.x[t] == m.p[t]
+        m.branch = Constraint(m.T, rule=branch_rule)
+        with self.assertRaises(UnitsError):
+            assert_units_consistent(m.branch, representative=True)
+        m.del_component(m.branch)
+
+        # rules that reference indexed Expressions are checked in full
+        m.ex = Constraint(m.T, rule=lambda m, t: m.x[t] == m.e[t])
+        assert_units_consistent(m, representative=True)
+        m.ex[2].set_value(m.x[2] == m.v[2])
+        with self.assertRaises(UnitsError):
+            assert_units_consistent(m)
+
+    def test_named_expression_units(self):
+        u = units
+        m = ConcreteModel()
+        m.x = Var(units=u.m)
+        m.t = Var(units=u.s)
+        m.e = Expression(expr=m.x/m.t)
+        m.c1 = Constraint(expr=m.e <= 2*u.m/u.s)
+        m.c2 = Constraint(expr=m.e*m.t == m.x)
+        assert_units_consistent(m)
+        # named expressions are re-evaluated by each call
+        m.e.set_value(m.x*m.t)
+        with self.assertRaises(UnitsError):
+            assert_units_consistent(m)
+
 if __name__ == "__main__":
     unittest.main()
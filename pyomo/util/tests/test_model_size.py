@@ -6,10 +6,13 @@ from six import StringIO
 
 import pyutilib.th as unittest
 from pyomo.common.log import LoggingIntercept
-from pyomo.core import Binary, Block, ConcreteModel, Constraint, Integers, Var
+from pyomo.core import (Binary, Block, ConcreteModel, Constraint, Integers,
+                        NonNegativeReals, Objective, Var, exp)
 from pyomo.gdp import Disjunct, Disjunction
 from pyomo.util.model_size import (build_model_size_report,
-                                   log_model_size_report)
+                                   build_model_statistics,
+                                   log_model_size_report,
+                                   _fork_available)
 from pyutilib.misc import import_file
 
 currdir = dirname(abspath(__file__))
@@ -191,5 +194,101 @@ warning:
         self.assertEqual(output.getvalue().strip(), expected_output)
 
 
+class TestModelStatistics(unittest.TestCase):
+    """Tests for the single-pass model statistics."""
+
+    def _build_model(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 5))
+        m.y = Var(domain=NonNegativeReals)
+        m.z = Var(domain=Integers, bounds=(None, 10))
+        m.w = Var()
+        m.w.fix(2)
+        m.c1 = Constraint(expr=m.x + m.y == 1)
+        m.c2 = Constraint(expr=(0, m.x * m.y, 4))
+        m.c3 = Constraint(expr=m.x ** 3 + m.w * m.z <= 10)
+        m.c4 = Constraint(expr=exp(m.y) >= m.w)
+        m.c4.deactivate()
+        m.o = Objective(expr=m.x ** 2)
+        m.b = Block()
+        m.b.v = Var(domain=Binary)
+        m.b.c = Constraint(expr=m.b.v + m.z >= 1)
+        m.b.deactivate()
+        m.d = Disjunct()
+        m.d.c = Constraint(expr=m.x <= 2)
+        m.d2 = Disjunct()
+        m.disj = Disjunction(expr=[m.d, m.d2])
+        return m
+
+    def test_statistics(self):
+        m = self._build_model()
+        stats = build_model_statistics(m)
+        self.assertEqual(stats.overall.variables, 7)
+        self.assertEqual(stats.overall.fixed_variables, 1)
+        self.assertEqual(stats.overall.binary_variables, 3)
+        self.assertEqual(stats.overall.integer_variables, 1)
+        self.assertEqual(stats.overall.continuous_variables, 3)
+        # w is fixed and unbounded; the indicator_vars are bounded
+        self.assertEqual(stats.overall.unbounded_variables, 1)
+        self.assertEqual(stats.overall.bounded_variables, 4)
+        self.assertEqual(stats.overall.lower_bounded_variables, 1)
+        self.assertEqual(stats.overall.upper_bounded_variables, 1)
+        self.assertEqual(stats.overall.constraints, 6)
+        self.assertEqual(stats.overall.equality_constraints, 1)
+        self.assertEqual(stats.overall.ranged_constraints, 1)
+        self.assertEqual(stats.overall.inequality_constraints, 4)
+        self.assertEqual(stats.overall.linear_constraints, 3)
+        self.assertEqual(stats.overall.quadratic_constraints, 1)
+        self.assertEqual(stats.overall.polynomial_constraints, 1)
+        self.assertEqual(stats.overall.general_nonlinear_constraints, 1)
+        self.assertEqual(stats.overall.nonlinear_constraints, 3)
+        self.assertEqual(stats.overall.objectives, 1)
+        self.assertEqual(stats.overall.nonlinear_objectives, 1)
+        self.assertEqual(stats.overall.blocks, 2)
+        self.assertEqual(stats.overall.disjuncts, 2)
+        self.assertEqual(stats.overall.disjunctions, 1)
+
+        # x, y, z and the two indicator_vars
+        self.assertEqual(stats.activated.variables, 5)
+        self.assertEqual(stats.activated.fixed_variables, 0)
+        self.assertEqual(stats.activated.binary_variables, 2)
+        self.assertEqual(stats.activated.upper_bounded_variables, 1)
+        self.assertEqual(stats.activated.constraints, 4)
+        self.assertEqual(stats.activated.nonlinear_constraints, 2)
+        self.assertEqual(stats.activated.blocks, 1)
+        self.assertEqual(stats.activated.disjuncts, 2)
+        self.assertEqual(stats.activated.disjunctions, 1)
+        # c1: 2, c2: 2, c3: 2 (w is fixed), d.c: 1
+        self.assertEqual(stats.activated.nonzeros, 7)
+        self.assertEqual(stats.overall.nonzeros, 10)
+        self.assertEqual(stats.warning.unassociated_disjuncts, 0)
+
+    def test_expression_nodes(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.c = Constraint(expr=2 * m.x + m.x * m.y <= 1)
+        stats = build_model_statistics(m)
+        # sum(prod(2, x), prod(x, y))
+        self.assertEqual(stats.overall.expression_nodes, 7)
+        self.assertEqual(stats.overall.nonzeros, 2)
+
+    @unittest.skipUnless(_fork_available(), "fork is not available")
+    def test_parallel(self):
+        m = self._build_model()
+        m.b.activate()
+        m.blocks = Block([1, 2, 3])
+        for i, b in m.blocks.items():
+            b.x = Var([1, 2], domain=Binary)
+            b.c = Constraint(expr=b.x[1] * m.x + b.x[2] >= i)
+            b.d = Disjunct()
+            b.d.c = Constraint(expr=b.x[1] == 1)
+            b.d2 = Disjunct()
+            b.disj = Disjunction(expr=[b.d, b.d2])
+        m.blocks[2].d.indicator_var.fix(1)
+        self.assertEqual(str(build_model_statistics(m, processes=2)),
+                         str(build_model_statistics(m)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,98 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+import pyomo.environ as pyo
+from pyomo.util.param_dependencies import MutableParamIndex
+
+
+class TestMutableParamIndex(unittest.TestCase):
+
+    def assertSameComponents(self, obj, other_obj):
+        self.assertEqual([id(i) for i in obj], [id(j) for j in other_obj])
+
+    def _build_model(self):
+        m = pyo.ConcreteModel()
+        m.T = pyo.Set(initialize=[1, 2, 3])
+        m.x = pyo.Var(m.T)
+        m.price = pyo.Param(m.T, initialize=1, mutable=True)
+        m.cap = pyo.Param(initialize=10, mutable=True)
+        m.fixed = pyo.Param(initialize=2)
+        m.c = pyo.Constraint(
+            m.T, rule=lambda m, t: m.x[t] * m.fixed <= m.cap)
+        m.d = pyo.Constraint(expr=m.x[1] >= m.price[1])
+        m.b = pyo.Block()
+        m.b.e = pyo.Constraint(expr=m.x[2] + m.x[3] >= m.price[2])
+        m.obj = pyo.Objective(
+            expr=sum(m.price[t] * m.x[t] for t in m.T))
+        return m
+
+    def test_build(self):
+        m = self._build_model()
+        idx = MutableParamIndex(m)
+        self.assertEqual(len(idx), 4)
+        self.assertNotIn(m.fixed, idx)
+        self.assertSameComponents(idx.dependents(m.cap),
+            [m.c[1], m.c[2], m.c[3]])
+        self.assertSameComponents(idx.dependents(m.price[1]), [m.d, m.obj])
+        self.assertSameComponents(
+            idx.dependents(m.price[2]), [m.obj, m.b.e])
+        self.assertSameComponents(idx.dependents(m.price[3]), [m.obj])
+        self.assertSameComponents(idx.params(m.b.e), [m.price[2]])
+        self.assertEqual(idx.params(m.x), ())
+
+    def test_no_descend(self):
+        m = self._build_model()
+        idx = MutableParamIndex(m, descend_into=False)
+        self.assertSameComponents(idx.dependents(m.price[2]), [m.obj])
+
+    def test_active(self):
+        m = self._build_model()
+        m.d.deactivate()
+        idx = MutableParamIndex(m)
+        self.assertSameComponents(idx.dependents(m.price[1]), [m.obj])
+        idx = MutableParamIndex(m, active=None)
+        self.assertSameComponents(idx.dependents(m.price[1]), [m.d, m.obj])
+
+    def test_indexed_param(self):
+        m = self._build_model()
+        idx = MutableParamIndex(m)
+        self.assertSameComponents(idx.dependents(m.price),
+            [m.d, m.obj, m.b.e])
+        self.assertSameComponents(idx.affected_by([m.cap, m.price[3]]),
+            [m.c[1], m.c[2], m.c[3], m.obj])
+
+    def test_incremental(self):
+        m = self._build_model()
+        idx = MutableParamIndex(m)
+        idx.remove_component(m.obj)
+        self.assertSameComponents(idx.dependents(m.price[3]), [])
+        self.assertNotIn(m.price[3], idx)
+        # Removing a component that is not indexed is a no-op
+        idx.remove_component(m.obj)
+
+        m.f = pyo.Constraint(expr=m.x[3] <= m.price[3] + m.cap)
+        self.assertSameComponents(
+            idx.add_component(m.f), [m.price[3], m.cap])
+        self.assertSameComponents(idx.dependents(m.price[3]), [m.f])
+
+        # Re-adding a modified component refreshes its entries
+        m.f.set_value(m.x[3] <= m.cap)
+        idx.add_component(m.f)
+        self.assertNotIn(m.price[3], idx)
+        self.assertIn(m.f, idx.dependents(m.cap))
+
+        idx.clear()
+        self.assertEqual(len(idx), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
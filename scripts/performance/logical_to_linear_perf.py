@@ -0,0 +1,73 @@
+#
+# This script compares the performance of the CNF conversion methods
+# used by the core.logical_to_linear transformation
+#
+#   python logical_to_linear_perf.py [-n N] [--sympy]
+#
+
+from pyomo.environ import (
+    ConcreteModel, RangeSet, BooleanVar, LogicalConstraint,
+    TransformationFactory, land, lor, atleast, exactly,
+)
+from pyomo.core.expr.sympy_tools import sympy_available
+
+import argparse
+import time
+
+
+def create_model(N, K=4):
+    """Build N implications, cardinality constraints and nested DNFs
+    over blocks of K Boolean variables"""
+    model = ConcreteModel()
+    model.S = RangeSet(N)
+    model.K = RangeSet(K)
+    model.Y = BooleanVar(model.S, model.K)
+
+    def imp_rule(m, i):
+        return m.Y[i, 1].implies(lor(*[m.Y[i, k] for k in m.K if k > 1]))
+    model.imp = LogicalConstraint(model.S, rule=imp_rule)
+
+    def card_rule(m, i):
+        return atleast(2, *[m.Y[i, k] for k in m.K])
+    model.card = LogicalConstraint(model.S, rule=card_rule)
+
+    def nested_rule(m, i):
+        j = i % N + 1
+        return lor(land(m.Y[i, 1], m.Y[j, 2]),
+                   land(m.Y[i, 3], m.Y[j, 4]),
+                   exactly(1, m.Y[i, 2], m.Y[j, 1]))
+    model.nested = LogicalConstraint(model.S, rule=nested_rule)
+
+    def dnf_rule(m, i):
+        # Distributing this into CNF produces 2**K clauses
+        j = i % N + 1
+        return lor(*[land(m.Y[i, k], m.Y[j, k]) for k in m.K])
+    model.dnf = LogicalConstraint(model.S, rule=dnf_rule)
+    return model
+
+
+def run(N, method):
+    model = create_model(N)
+    start = time.time()
+    TransformationFactory('core.logical_to_linear').apply_to(
+        model, cnf_method=method)
+    elapsed = time.time() - start
+    nconstr = sum(len(b.transformed_constraints)
+                  for b in model.component_objects(descend_into=True)
+                  if b.local_name == 'logic_to_linear')
+    print("%-8s N=%-6d %8.3f sec  %8d constraints" % (
+        method, N, elapsed, nconstr))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', type=int, nargs='+', default=[100, 1000, 5000],
+                        help="Number of blocks of Boolean variables")
+    parser.add_argument('--sympy', action='store_true', default=False,
+                        help="Also time the sympy-based conversion")
+    args = parser.parse_args()
+
+    for N in args.n:
+        run(N, 'tseitin')
+        if args.sympy and sympy_available:
+            run(N, 'sympy')